@@ -284,36 +284,48 @@ build_container() {
 
 check_health() {
     local url="$PROD_DOMAIN$SERVICE_PREFIX/health"
-    local http_code=$(curl -f -s -o /dev/null -w "%{http_code}" "$url" 2>/dev/null)
+    local http_code=$(curl -s --max-time 5 -o /dev/null -w "%{http_code}" "$url" 2>/dev/null)
     [ "$http_code" = "200" ]
 }
 
-wait_for_health() {
-    echo ""
-    log INFO "Проверка работоспособности сервиса"
-    log INFO "Ожидание 15 секунд перед проверкой..."
-    sleep 15
-
-    local max_attempts=5
+# Опрос health с растущей паузой и джиттером до дедлайна в секундах ($1).
+# Первые проверки идут раз в ~1 сек, поэтому поднявшийся сервис замечаем сразу
+poll_health() {
+    local deadline=$(( $(date +%s) + $1 ))
+    local interval_ms=1000
     local attempt=1
 
-    while [ $attempt -le $max_attempts ]; do
-        log INFO "Попытка $attempt/$max_attempts"
-
+    while true; do
         if check_health; then
-            log SUCCESS "Сервис работает корректно (HTTP 200)"
+            log INFO "Health check пройден с попытки $attempt"
             return 0
         fi
 
-        if [ $attempt -lt $max_attempts ]; then
-            log WARN "Сервис не готов, ожидание 20 сек..."
-            sleep 20
+        if [ "$(date +%s)" -ge "$deadline" ]; then
+            return 1
         fi
 
-        ((attempt++))
+        # Случайная пауза во второй половине интервала
+        local sleep_ms=$(( interval_ms / 2 + RANDOM % (interval_ms / 2 + 1) ))
+        sleep "$(( sleep_ms / 1000 )).$(printf '%03d' $(( sleep_ms % 1000 )))"
+
+        interval_ms=$(( interval_ms * 3 / 2 ))
+        if [ $interval_ms -gt 10000 ]; then
+            interval_ms=10000
+        fi
+        attempt=$(( attempt + 1 ))
     done
+}
+
+wait_for_health() {
+    echo ""
+    log INFO "Проверка работоспособности сервиса"
+    if poll_health 120; then
+        log SUCCESS "Сервис работает корректно (HTTP 200)"
+        return 0
+    fi
 
-    log ERROR "Сервис не прошел проверку после $max_attempts попыток"
+    log ERROR "Сервис не прошел проверку за 120 секунд"
     echo ""
     echo "Логи контейнера (последние 50 строк):"
     docker logs --tail 50 $SERVICE_NAME 2>&1 | tee -a "$LOG_FILE"
@@ -414,27 +426,10 @@ rollback_to_previous() {
     # Проверка работоспособности после отката
     echo ""
     log INFO "Проверка работоспособности после отката"
-    log INFO "Ожидание 15 секунд..."
-    sleep 15
-
-    local rollback_attempts=3
-    local rollback_attempt=1
-
-    while [ $rollback_attempt -le $rollback_attempts ]; do
-        log INFO "Проверка $rollback_attempt/$rollback_attempts"
-
-        if check_health; then
-            log SUCCESS "Откат выполнен успешно, сервис работает"
-            return 0
-        fi
-
-        if [ $rollback_attempt -lt $rollback_attempts ]; then
-            log WARN "Ожидание 10 секунд..."
-            sleep 10
-        fi
-
-        ((rollback_attempt++))
-    done
+    if poll_health 60; then
+        log SUCCESS "Откат выполнен успешно, сервис работает"
+        return 0
+    fi
 
     log ERROR "Откат выполнен, но health check не прошел"
     log ERROR "Требуется ручное вмешательство"
@@ -0,0 +1,65 @@
+"""Пропускная способность AsyncHTTPClient с circuit breaker и без него.
+
+1000 одновременных GET к локальному stub-серверу; отдельно — накладные
+расходы CircuitBreaker.call без сети. Запуск из каталога сервиса:
+
+    python -m benchmarks.circuit_breaker
+"""
+import argparse
+import asyncio
+import time
+
+from benchmarks.stub import serve
+from pkg.client.client import AsyncHTTPClient, CircuitBreaker
+
+
+async def _noop():
+    return None
+
+
+async def bench_breaker_call(calls: int) -> float:
+    breaker = CircuitBreaker()
+    started_at = time.perf_counter()
+    for _ in range(calls):
+        await breaker.call(_noop)
+    return calls / (time.perf_counter() - started_at)
+
+
+async def bench_client(port: int, breaker: bool, concurrency: int, rounds: int) -> float:
+    client = AsyncHTTPClient(
+        "127.0.0.1",
+        port,
+        retry_count=0,
+        circuit_breaker_enabled=breaker,
+        max_connections=concurrency,
+        max_keepalive_connections=concurrency,
+    )
+    try:
+        # Первый раунд прогревает пул соединений и в замер не входит
+        await asyncio.gather(*(client.get("/") for _ in range(concurrency)))
+
+        started_at = time.perf_counter()
+        for _ in range(rounds):
+            await asyncio.gather(*(client.get("/") for _ in range(concurrency)))
+        return concurrency * rounds / (time.perf_counter() - started_at)
+    finally:
+        await client.close()
+
+
+async def main(concurrency: int, rounds: int, calls: int):
+    print(f"CircuitBreaker.call без сети: {await bench_breaker_call(calls):,.0f} вызовов/с")
+
+    async with serve() as port:
+        for breaker in (False, True):
+            rps = await bench_client(port, breaker, concurrency, rounds)
+            print(f"breaker={'on' if breaker else 'off'}: {concurrency} одновременных запросов, {rps:,.0f} запросов/с")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--concurrency", type=int, default=1000)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--calls", type=int, default=200_000)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.concurrency, args.rounds, args.calls))
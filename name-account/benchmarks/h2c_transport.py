@@ -0,0 +1,111 @@
+"""HTTP/1.1 против h2c для вызовов name-account -> name-authorization.
+
+NameAuthorizationClient с боевыми настройками ходит в заглушку /check и
+/authorization. HTTP/1.1 — через uvicorn и hypercorn, h2c — через hypercorn
+(uvicorn h2c не умеет). Запуск из каталога сервиса:
+
+    python -m benchmarks.h2c_transport
+"""
+import argparse
+import asyncio
+import statistics
+import time
+from typing import Awaitable, Callable
+
+from opentelemetry import metrics, trace
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+from benchmarks.stub import serve, serve_hypercorn
+from pkg.client.internal.name_authorization.client import NameAuthorizationClient
+
+
+async def _authorization(request: Request) -> JSONResponse:
+    await request.body()
+    return JSONResponse({"access_token": "access", "refresh_token": "refresh"})
+
+
+async def _check(request: Request) -> JSONResponse:
+    return JSONResponse({"account_id": 1, "message": "ok", "code": 200})
+
+
+async def _health(request: Request) -> JSONResponse:
+    return JSONResponse({"status": "ok"})
+
+
+authorization_stub = Starlette(routes=[
+    Route("/api/authorization", _authorization, methods=["POST"]),
+    Route("/api/authorization/check", _check),
+    Route("/api/authorization/health", _health),
+])
+
+
+class _Telemetry:
+    def tracer(self) -> trace.Tracer:
+        return trace.NoOpTracer()
+
+    def meter(self) -> metrics.Meter:
+        return metrics.NoOpMeter("benchmark")
+
+    def logger(self):
+        return None
+
+
+async def _load(call: Callable[[int], Awaitable], requests: int, concurrency: int) -> tuple[float, list[float]]:
+    latencies: list[float] = []
+    counter = iter(range(requests))
+
+    async def worker():
+        for i in counter:
+            started_at = time.perf_counter()
+            await call(i)
+            latencies.append(time.perf_counter() - started_at)
+
+    started_at = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return requests / (time.perf_counter() - started_at), latencies
+
+
+def _report(name: str, rps: float, latencies: list[float]):
+    latencies.sort()
+    p99 = latencies[min(int(len(latencies) * 0.99), len(latencies) - 1)]
+    print(
+        f"{name:<34} {rps:8,.0f} запросов/с  "
+        f"p50 {statistics.median(latencies) * 1e3:6.2f} мс  p99 {p99 * 1e3:6.2f} мс"
+    )
+
+
+async def _run(server: str, port: int, use_h2c: bool, requests: int, concurrency: int):
+    client = NameAuthorizationClient(_Telemetry(), "127.0.0.1", port, use_h2c=use_h2c)
+    try:
+        await client.prewarm()
+        transport = f"{server} {'h2c' if use_h2c else 'HTTP/1.1'}"
+
+        # Разные токены, чтобы singleflight не склеивал /check и замер шел по сети
+        rps, latencies = await _load(lambda i: client.check_authorization(f"token-{i}"), requests, concurrency)
+        _report(f"{transport} GET /check", rps, latencies)
+
+        rps, latencies = await _load(lambda i: client.authorization(i, False, "user"), requests, concurrency)
+        _report(f"{transport} POST /authorization", rps, latencies)
+    finally:
+        await client.client.close()
+
+
+async def main(requests: int, concurrency: int):
+    async with serve(authorization_stub) as port:
+        await _run("uvicorn", port, False, requests, concurrency)
+
+    async with serve_hypercorn(authorization_stub) as port:
+        await _run("hypercorn", port, False, requests, concurrency)
+        await _run("hypercorn", port, True, requests, concurrency)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=20)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.requests, args.concurrency))
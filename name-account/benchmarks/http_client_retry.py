@@ -0,0 +1,92 @@
+"""Накладные расходы пути запроса AsyncHTTPClient: повторы, дедлайн, singleflight.
+
+Клиент ходит в ASGI-заглушку в том же процессе через httpx.ASGITransport,
+поэтому в замер не попадают сеть и пул соединений. Запуск из каталога сервиса:
+
+    python -m benchmarks.http_client_retry
+"""
+import argparse
+import asyncio
+import itertools
+import time
+
+import httpx
+from starlette.types import Receive, Scope, Send
+
+from pkg.client.client import AsyncHTTPClient
+
+_ports = itertools.count(30000)
+
+
+class _FlakyApp:
+    """Отвечает 503 на каждый fail_every-й запрос, остальным — 200"""
+
+    def __init__(self, fail_every: int = 0):
+        self.fail_every = fail_every
+        self.requests = 0
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        self.requests += 1
+        status = 503 if self.fail_every and self.requests % self.fail_every == 0 else 200
+
+        await send({"type": "http.response.start", "status": status, "headers": [(b"content-type", b"application/json")]})
+        await send({"type": "http.response.body", "body": b"{}"})
+
+
+def _client(app: _FlakyApp, **kwargs) -> AsyncHTTPClient:
+    client = AsyncHTTPClient("127.0.0.1", next(_ports), retry_wait_min=0, retry_wait_max=0, **kwargs)
+    client.session = httpx.AsyncClient(base_url=client.base_url, transport=httpx.ASGITransport(app))
+    return client
+
+
+async def _sequential(client: AsyncHTTPClient, requests: int, **kwargs) -> float:
+    started_at = time.perf_counter()
+    for _ in range(requests):
+        await client.get("/item", **kwargs)
+    return (time.perf_counter() - started_at) / requests
+
+
+async def _concurrent(client: AsyncHTTPClient, requests: int, concurrency: int) -> float:
+    started_at = time.perf_counter()
+    for _ in range(requests // concurrency):
+        await asyncio.gather(*(client.get("/item") for _ in range(concurrency)))
+    return (time.perf_counter() - started_at) / requests
+
+
+async def main(requests: int, concurrency: int):
+    scenarios = [
+        ("raw httpx (baseline)", None, {}),
+        ("без повторов", _client(_FlakyApp(), retry_count=0), {}),
+        ("повторы, ответы 200", _client(_FlakyApp(), retry_count=2), {}),
+        ("повторы, каждый 10-й 503", _client(_FlakyApp(fail_every=10), retry_count=2, retry_budget_ratio=1), {}),
+        ("дедлайн 5с", _client(_FlakyApp(), retry_count=2), {"deadline": 5}),
+    ]
+
+    for name, client, kwargs in scenarios:
+        if client is None:
+            async with httpx.AsyncClient(base_url="http://stub", transport=httpx.ASGITransport(_FlakyApp())) as raw:
+                started_at = time.perf_counter()
+                for _ in range(requests):
+                    await raw.get("/item")
+                per_request = (time.perf_counter() - started_at) / requests
+        else:
+            per_request = await _sequential(client, requests, **kwargs)
+        print(f"{name:<28} {per_request * 1e6:8.1f} мкс/запрос")
+
+    for enabled in (False, True):
+        app = _FlakyApp()
+        client = _client(app, singleflight_enabled=enabled)
+        per_request = await _concurrent(client, requests, concurrency)
+        print(
+            f"{'singleflight ' + ('on' if enabled else 'off'):<28} {per_request * 1e6:8.1f} мкс/запрос, "
+            f"до хоста дошло {app.requests}/{requests}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.requests, args.concurrency))
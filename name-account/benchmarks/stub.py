@@ -0,0 +1,80 @@
+import asyncio
+import socket
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+import uvicorn
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+
+async def ok_app(scope: Scope, receive: Receive, send: Send) -> None:
+    """Минимальный ASGI-хост: на любой запрос отвечает 200 без работы в обработчике"""
+    if scope["type"] != "http":
+        return
+
+    await send({"type": "http.response.start", "status": 200, "headers": [(b"content-type", b"application/json")]})
+    await send({"type": "http.response.body", "body": b"{}"})
+
+
+@asynccontextmanager
+async def serve(app: ASGIApp = ok_app) -> AsyncIterator[int]:
+    """Поднимает app в uvicorn на свободном локальном порту и отдает порт"""
+    server = uvicorn.Server(uvicorn.Config(
+        app,
+        host="127.0.0.1",
+        port=0,
+        log_level="warning",
+        access_log=False,
+        backlog=4096,
+    ))
+    serve_task = asyncio.create_task(server.serve())
+    while not server.started:
+        await asyncio.sleep(0.01)
+
+    try:
+        yield server.servers[0].sockets[0].getsockname()[1]
+    finally:
+        server.should_exit = True
+        await serve_task
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@asynccontextmanager
+async def serve_hypercorn(app: ASGIApp = ok_app) -> AsyncIterator[int]:
+    """Как serve, но через hypercorn: он принимает и HTTP/1.1, и h2c с prior knowledge на одном порту"""
+    try:
+        from hypercorn.asyncio import serve as hypercorn_serve
+        from hypercorn.config import Config
+    except ImportError:
+        raise SystemExit("Для h2c нужен hypercorn: pip install hypercorn")
+
+    port = _free_port()
+    config = Config()
+    config.bind = [f"127.0.0.1:{port}"]
+    config.loglevel = "WARNING"
+    config.accesslog = None
+    # После keep_alive_max_requests hypercorn закрывает соединение посреди h2c-потоков
+    # с незачитанным телом и падает на их DATA-фреймах; в бенчмарке соединение одно на весь прогон
+    config.keep_alive_max_requests = 10 ** 9
+
+    shutdown = asyncio.Event()
+    serve_task = asyncio.create_task(hypercorn_serve(app, config, shutdown_trigger=shutdown.wait))
+    while True:
+        try:
+            _, writer = await asyncio.open_connection("127.0.0.1", port)
+        except OSError:
+            await asyncio.sleep(0.01)
+            continue
+        writer.close()
+        break
+
+    try:
+        yield port
+    finally:
+        shutdown.set()
+        await serve_task
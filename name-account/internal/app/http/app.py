@@ -1,4 +1,5 @@
 from fastapi import FastAPI
+from fastapi.responses import JSONResponse
 
 from starlette.responses import StreamingResponse
 
@@ -8,6 +9,8 @@ from internal.controller.http.handler.account.model import *
 
 def NewHTTP(
         db: interface.IDB,
+        readiness_service: interface.IReadinessService,
+        name_authorization_client: interface.INameAuthorizationClient,
         account_controller: interface.IAccountController,
         http_middleware: interface.IHttpMiddleware,
         prefix: str
@@ -19,6 +22,8 @@ def NewHTTP(
     )
     include_middleware(app, http_middleware)
     include_db_handler(app, db, prefix)
+    include_client_prewarm(app, name_authorization_client)
+    include_readiness_handler(app, readiness_service, prefix)
 
     include_account_handlers(app, account_controller, prefix)
 
@@ -30,9 +35,15 @@ def include_middleware(
         http_middleware: interface.IHttpMiddleware,
 ):
     http_middleware.authorization_middleware04(app)
-    http_middleware.logger_middleware03(app)
-    http_middleware.metrics_middleware02(app)
-    http_middleware.trace_middleware01(app)
+    http_middleware.instrumentation_middleware01(app)
+
+
+def include_client_prewarm(
+        app: FastAPI,
+        name_authorization_client: interface.INameAuthorizationClient,
+):
+    # До прогрева готовности: проверки /ready уже пойдут по открытым соединениям
+    app.add_event_handler("startup", name_authorization_client.prewarm)
 
 
 def include_account_handlers(
@@ -124,14 +135,26 @@ def include_account_handlers(
 def include_db_handler(app: FastAPI, db: interface.IDB, prefix: str):
     app.add_api_route(prefix + "/table/create", create_table_handler(db), methods=["GET"])
     app.add_api_route(prefix + "/table/drop", drop_table_handler(db), methods=["GET"])
-    app.add_api_route(prefix + "/health", heath_check_handler(), methods=["GET"])
 
 
-def heath_check_handler():
-    async def heath_check():
-        return "ok"
+def include_readiness_handler(app: FastAPI, readiness_service: interface.IReadinessService, prefix: str):
+    # Прогрев в startup завершается до того, как uvicorn начнет принимать соединения
+    app.add_event_handler("startup", readiness_service.warmup)
+    app.add_api_route(prefix + "/ready", ready_check_handler(readiness_service), methods=["GET"])
+    # /health опрашивают деплой и мониторинг: он отдает тот же кешированный результат, что и /ready,
+    # чтобы частые пробы не ходили в зависимости каждая сама по себе
+    app.add_api_route(prefix + "/health", ready_check_handler(readiness_service), methods=["GET"])
+
+
+def ready_check_handler(readiness_service: interface.IReadinessService):
+    async def ready_check():
+        ready, checks = await readiness_service.check()
+        return JSONResponse(
+            status_code=200 if ready else 503,
+            content={"status": "ok" if ready else "unavailable", **checks},
+        )
 
-    return heath_check
+    return ready_check
 
 
 def create_table_handler(db: interface.IDB):
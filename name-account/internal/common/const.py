@@ -18,6 +18,8 @@ TRACEBACK_KEY = "traceback"
 HTTP_METHOD_KEY = "http.request.method"
 HTTP_STATUS_KEY = "http.response.status_code"
 HTTP_ROUTE_KEY = "http.route"
+HTTP_STATUS_CLASS_KEY = "http.response.status_class"
+METRIC_OVERFLOW_KEY = "otel.metric.overflow"
 HTTP_REQUEST_DURATION_KEY = "http.server.request.duration"
 
 TELEGRAM_USERBOT_USER_ID_KEY = "organization.userbot.user_id"
@@ -33,10 +33,39 @@ class Config:
         # Настройки OpenTelemetry
         self.otlp_host = os.getenv("NAME_OTEL_COLLECTOR_CONTAINER_NAME", "name-otel-collector")
         self.otlp_port = int(os.getenv("NAME_OTEL_COLLECTOR_GRPC_PORT", "4317"))
+        # Экспорт телеметрии из отдельного потока через кольцевой буфер; при переполнении
+        # drop_oldest вытесняет старые записи, sample прореживает новые (ошибки сохраняются)
+        self.otel_export_worker = os.getenv("NAME_OTEL_EXPORT_WORKER", "false").lower() == "true"
+        self.otel_export_queue_size = int(os.getenv("NAME_OTEL_EXPORT_QUEUE_SIZE", "8192"))
+        self.otel_export_overflow_policy = os.getenv("NAME_OTEL_EXPORT_OVERFLOW_POLICY", "drop_oldest")
+        # Доля сохраняемых трейсов: на prod по умолчанию 10%, в остальных окружениях все.
+        # Решение принимается в начале трейса (head) и передается соседним сервисам в traceparent.
+        # Хвостовой сэмплинг включается явно: он дополнительно сохраняет трейсы с ошибками и дольше
+        # порога в секундах, но записывает и держит в памяти все спаны до завершения корня
+        self.otel_trace_sample_ratio = float(os.getenv(
+            "NAME_OTEL_TRACE_SAMPLE_RATIO",
+            "0.1" if self.environment == "prod" else "1.0"
+        ))
+        self.otel_tail_sampling = os.getenv(
+            "NAME_OTEL_TAIL_SAMPLING",
+            "false"
+        ).lower() == "true"
+        self.otel_slow_trace_threshold = float(os.getenv("NAME_OTEL_SLOW_TRACE_THRESHOLD", "1.0"))
+        # Шаблоны имен служебных спанов, которые не записываются; по умолчанию приватные хелперы Class.__method
+        self.otel_suppressed_spans = [
+            pattern.strip()
+            for pattern in os.getenv("NAME_OTEL_SUPPRESSED_SPANS", "*.__*").split(",")
+            if pattern.strip()
+        ]
+
+        # Предел числа серий HTTP метрик; новые комбинации атрибутов сверх него уходят в overflow-серию
+        self.http_metrics_max_series = int(os.getenv("NAME_HTTP_METRICS_MAX_SERIES", "1000"))
 
         # Настройки авторизации
         self.name_authorization_host = os.getenv("NAME_AUTHORIZATION_CONTAINER_NAME", "name-authorization-postgres")
         self.name_authorization_port = os.getenv("NAME_AUTHORIZATION_PORT", "8001")
+        # h2c к сервису авторизации — только если его сервер умеет HTTP/2 (uvicorn не умеет)
+        self.name_authorization_h2c = os.getenv("NAME_AUTHORIZATION_H2C", "false").lower() == "true"
         self.password_secret_key = os.getenv("NAME_PASSWORD_SECRET_KEY", "default-secret-key-change-me")
 
         self.openai_api_key = os.getenv("OPENAI_API_KEY", None)
\ No newline at end of file
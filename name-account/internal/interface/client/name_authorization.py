@@ -22,4 +22,10 @@ class INameAuthorizationClient(Protocol):
     ) -> model.JWTTokens: pass
 
     @abstractmethod
-    async def check_authorization(self, access_token: str) -> model.AuthorizationData: pass
\ No newline at end of file
+    async def check_authorization(self, access_token: str) -> model.AuthorizationData: pass
+
+    @abstractmethod
+    async def check_health(self) -> None: pass
+
+    @abstractmethod
+    async def prewarm(self) -> None: pass
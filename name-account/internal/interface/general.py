@@ -45,13 +45,7 @@ class ITelemetry(Protocol):
 
 class IHttpMiddleware(Protocol):
     @abstractmethod
-    def trace_middleware01(self, app: FastAPI): pass
-
-    @abstractmethod
-    def metrics_middleware02(self, app: FastAPI): pass
-
-    @abstractmethod
-    def logger_middleware03(self, app: FastAPI): pass
+    def instrumentation_middleware01(self, app: FastAPI): pass
 
     @abstractmethod
     def authorization_middleware04(self, app: FastAPI): pass
@@ -81,3 +75,11 @@ class IDB(Protocol):
 
     @abstractmethod
     async def multi_query(self, queries: list[str]) -> None: pass
+
+
+class IReadinessService(Protocol):
+    @abstractmethod
+    async def warmup(self) -> None: pass
+
+    @abstractmethod
+    async def check(self) -> tuple[bool, dict[str, str]]: pass
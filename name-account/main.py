@@ -10,6 +10,7 @@ from internal.controller.http.middlerware.middleware import HttpMiddleware
 from internal.controller.http.handler.account.handler import AccountController
 
 from internal.service.account.service import AccountService
+from internal.service.readiness.service import ReadinessService
 
 from internal.repo.account.repo import AccountRepo
 
@@ -40,7 +41,14 @@ tel = Telemetry(
     cfg.service_version,
     cfg.otlp_host,
     cfg.otlp_port,
-    alert_manager
+    alert_manager,
+    cfg.otel_export_worker,
+    cfg.otel_export_queue_size,
+    cfg.otel_export_overflow_policy,
+    cfg.otel_trace_sample_ratio,
+    cfg.otel_tail_sampling,
+    cfg.otel_slow_trace_threshold,
+    cfg.otel_suppressed_spans,
 )
 
 # Инициализация клиентов
@@ -51,6 +59,16 @@ name_authorization_client = NameAuthorizationClient(
     tel=tel,
     host=cfg.name_authorization_host,
     port=cfg.name_authorization_port,
+    use_h2c=cfg.name_authorization_h2c,
+)
+
+# Готовность к трафику: БД и сервис авторизации, без которого не работают вход и регистрация
+readiness_service = ReadinessService(
+    tel,
+    {
+        "db": lambda: db.select("SELECT 1", {}),
+        "name_authorization": name_authorization_client.check_health,
+    },
 )
 
 # Инициализация репозиториев
@@ -69,11 +87,13 @@ account_service = AccountService(
 account_controller = AccountController(tel, account_service)
 
 # Инициализация middleware
-http_middleware = HttpMiddleware(tel, name_authorization_client, cfg.prefix)
+http_middleware = HttpMiddleware(tel, name_authorization_client, cfg.prefix, cfg.http_metrics_max_series)
 
 if __name__ == "__main__":
     app = NewHTTP(
         db=db,
+        readiness_service=readiness_service,
+        name_authorization_client=name_authorization_client,
         account_controller=account_controller,
         http_middleware=http_middleware,
         prefix=cfg.prefix,
@@ -10,7 +10,8 @@ class NameAuthorizationClient(interface.INameAuthorizationClient):
             self,
             tel: interface.ITelemetry,
             host: str,
-            port: int
+            port: int,
+            use_h2c: bool = False,
     ):
         logger = tel.logger()
         self.client = AsyncHTTPClient(
@@ -18,7 +19,16 @@ class NameAuthorizationClient(interface.INameAuthorizationClient):
             port,
             prefix="/api/authorization",
             use_tracing=True,
+            http2_prior_knowledge=use_h2c,
+            # Пачка запросов одного пользователя дает одинаковые /check — отправляем один
+            singleflight_enabled=True,
+            singleflight_cookies=("Access-Token",),
+            # Медленный под авторизации не должен подвешивать вход: общий дедлайн на вызов
+            # и дублирующий запрос, если ответа нет дольше p95 по этому маршруту
+            deadline=5,
+            hedging_enabled=True,
             logger=logger,
+            meter=tel.meter(),
         )
         self.tracer = tel.tracer()
 
@@ -41,7 +51,9 @@ class NameAuthorizationClient(interface.INameAuthorizationClient):
                     "two_fa_status": two_fa_status,
                     "role": role
                 }
-                response = await self.client.post("", json=body)
+                # httpx дописывает к base_url слэш, и "" превратился бы в /api/authorization/ —
+                # сервер отвечает на него 307 и каждый вход стоит двух запросов. Идем по полному URL
+                response = await self.client.post(self.client.base_url, json=body)
                 json_response = response.json()
 
                 span.set_status(Status(StatusCode.OK))
@@ -96,3 +108,20 @@ class NameAuthorizationClient(interface.INameAuthorizationClient):
                 span.record_exception(e)
                 span.set_status(Status(StatusCode.ERROR, str(e)))
                 raise
+
+    async def check_health(self) -> None:
+        with self.tracer.start_as_current_span(
+                "NameAuthorizationClient.check_health",
+                kind=SpanKind.CLIENT,
+        ) as span:
+            try:
+                await self.client.get("/health")
+
+                span.set_status(Status(StatusCode.OK))
+            except Exception as e:
+                span.record_exception(e)
+                span.set_status(Status(StatusCode.ERROR, str(e)))
+                raise
+
+    async def prewarm(self) -> None:
+        await self.client.prewarm("/health")
@@ -0,0 +1,67 @@
+import itertools
+from typing import Awaitable, Callable
+
+import httpx
+import pytest
+from opentelemetry import metrics, trace
+
+from internal import interface
+from pkg.client.client import AsyncHTTPClient
+
+# Каждый тест получает собственный экземпляр клиента: экземпляры переиспользуются по base_url и настройкам
+_ports = itertools.count(20000)
+
+
+class FakeLogger(interface.IOtelLogger):
+    def __init__(self):
+        self.records: list[tuple[str, str, dict]] = []
+
+    def debug(self, message: str, fields: dict = None) -> None:
+        self.records.append(("debug", message, fields or {}))
+
+    def info(self, message: str, fields: dict = None) -> None:
+        self.records.append(("info", message, fields or {}))
+
+    def warning(self, message: str, fields: dict = None) -> None:
+        self.records.append(("warning", message, fields or {}))
+
+    def error(self, message: str, fields: dict = None) -> None:
+        self.records.append(("error", message, fields or {}))
+
+
+class FakeTelemetry(interface.ITelemetry):
+    def __init__(self):
+        self._logger = FakeLogger()
+
+    def tracer(self) -> trace.Tracer:
+        return trace.NoOpTracer()
+
+    def meter(self) -> metrics.Meter:
+        return metrics.NoOpMeter("test")
+
+    def logger(self) -> FakeLogger:
+        return self._logger
+
+
+@pytest.fixture
+def tel() -> FakeTelemetry:
+    return FakeTelemetry()
+
+
+@pytest.fixture
+def logger(tel) -> FakeLogger:
+    return tel.logger()
+
+
+@pytest.fixture
+def http_client(logger):
+    """Клиент поверх httpx.MockTransport: handler получает запросы вместо сети"""
+
+    def create(handler: Callable[[httpx.Request], httpx.Response | Awaitable[httpx.Response]], **kwargs) -> AsyncHTTPClient:
+        kwargs.setdefault("retry_wait_min", 0.001)
+        kwargs.setdefault("retry_wait_max", 0.01)
+        client = AsyncHTTPClient("127.0.0.1", next(_ports), logger=logger, **kwargs)
+        client.session = httpx.AsyncClient(base_url=client.base_url, transport=httpx.MockTransport(handler))
+        return client
+
+    return create
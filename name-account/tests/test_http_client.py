@@ -0,0 +1,275 @@
+import asyncio
+import time
+
+import httpx
+import pytest
+from opentelemetry.sdk.metrics import MeterProvider
+from opentelemetry.sdk.metrics.export import InMemoryMetricReader
+
+from pkg.client.client import (
+    AsyncHTTPClient,
+    CircuitBreaker,
+    CircuitBreakerOpenError,
+    DeadlineExceededError,
+    CONNECTION_POOL_SIZE_METRIC,
+)
+
+
+class _Host:
+    """Отвечает заданной последовательностью статусов, последний повторяется"""
+
+    def __init__(self, *statuses: int, delay: float = 0):
+        self.statuses = list(statuses) or [200]
+        self.delay = delay
+        self.requests: list[httpx.Request] = []
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if self.delay:
+            await asyncio.sleep(self.delay)
+
+        status = self.statuses[min(len(self.requests), len(self.statuses)) - 1]
+        return httpx.Response(status, json={"attempt": len(self.requests)})
+
+
+async def _failing():
+    raise httpx.ConnectError("refused")
+
+
+async def _ok(delay: float = 0):
+    await asyncio.sleep(delay)
+    return "ok"
+
+
+def test_idempotent_request_is_retried_until_success(http_client):
+    host = _Host(503, 503, 200)
+    client = http_client(host, retry_count=2)
+
+    response = asyncio.run(client.get("/item"))
+
+    assert response.status_code == 200
+    assert len(host.requests) == 3
+
+
+def test_non_idempotent_request_is_not_retried_after_it_was_sent(http_client):
+    host = _Host(503, 200)
+    client = http_client(host, retry_count=2)
+
+    with pytest.raises(httpx.HTTPStatusError):
+        asyncio.run(client.post("/item", json={}))
+
+    assert len(host.requests) == 1
+
+
+def test_zero_retries_makes_single_attempt_and_raises_server_error(http_client):
+    host = _Host(500)
+    client = http_client(host, retry_count=0)
+
+    with pytest.raises(httpx.HTTPStatusError) as err:
+        asyncio.run(client.get("/item"))
+
+    assert err.value.response.status_code == 500
+    assert len(host.requests) == 1
+
+
+def test_retry_budget_stops_retry_storm(http_client):
+    host = _Host(503)
+    client = http_client(host, retry_count=3, retry_budget_ratio=0, retry_budget_min=1, circuit_breaker_enabled=False)
+
+    async def scenario():
+        for _ in range(3):
+            with pytest.raises(httpx.HTTPStatusError):
+                await client.get("/item")
+
+    asyncio.run(scenario())
+
+    # Единственный токен бюджета ушел на повтор первого запроса, остальные идут без повторов
+    assert len(host.requests) == 4
+
+
+def test_deadline_covers_whole_call(http_client):
+    host = _Host(200, delay=1)
+    client = http_client(host, retry_count=2)
+
+    started_at = time.monotonic()
+    with pytest.raises(DeadlineExceededError):
+        asyncio.run(client.get("/slow", deadline=0.1))
+
+    assert time.monotonic() - started_at < 0.5
+    assert len(host.requests) == 1
+
+
+def test_singleflight_coalesces_identical_requests(http_client):
+    host = _Host(200, delay=0.05)
+    client = http_client(host, singleflight_enabled=True, singleflight_headers=("Authorization",))
+
+    async def scenario():
+        same = await asyncio.gather(*(client.get("/item", headers={"Authorization": "a"}) for _ in range(10)))
+        other = await client.get("/item", headers={"Authorization": "b"})
+        return same, other
+
+    same, other = asyncio.run(scenario())
+
+    assert {response.json()["attempt"] for response in same} == {1}
+    assert other.json()["attempt"] == 2
+    assert len(host.requests) == 2
+
+
+def test_disabled_circuit_breaker_does_not_break_requests(http_client):
+    client = http_client(_Host(200), circuit_breaker_enabled=False)
+
+    assert asyncio.run(client.get("/item")).status_code == 200
+    client.reset_circuit_breaker()
+
+
+def test_clients_with_different_settings_are_not_shared():
+    first = AsyncHTTPClient("127.0.0.1", 19999, timeout=1)
+    second = AsyncHTTPClient("127.0.0.1", 19999, timeout=2)
+    same = AsyncHTTPClient("127.0.0.1", 19999, timeout=1)
+
+    assert first is not second
+    assert first is same
+    assert second.timeout == 2
+
+
+def test_breaker_half_open_lets_single_probe_through():
+    breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=0)
+
+    async def scenario():
+        for _ in range(2):
+            with pytest.raises(httpx.ConnectError):
+                await breaker.call(_failing)
+        assert breaker.state == "open"
+
+        probe = asyncio.create_task(breaker.call(_ok, 0.05))
+        await asyncio.sleep(0)
+        assert breaker.state == "half-open"
+
+        with pytest.raises(CircuitBreakerOpenError):
+            await breaker.call(_ok)
+
+        assert await probe == "ok"
+        assert breaker.state == "closed"
+
+    asyncio.run(scenario())
+
+
+def test_breaker_failed_probe_reopens_circuit():
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=60)
+
+    async def scenario():
+        with pytest.raises(httpx.ConnectError):
+            await breaker.call(_failing)
+
+        with pytest.raises(CircuitBreakerOpenError):
+            await breaker.call(_ok)
+
+        breaker.recovery_timeout = 0
+        with pytest.raises(httpx.ConnectError):
+            await breaker.call(_failing)
+        assert breaker.state == "open"
+
+    asyncio.run(scenario())
+
+
+def test_hedged_request_answers_before_slow_primary(http_client):
+    slow_requests = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal slow_requests
+        if request.url.params.get("slow") and slow_requests == 0:
+            slow_requests += 1
+            await asyncio.sleep(1)
+            return httpx.Response(200, json={"copy": "primary"})
+        return httpx.Response(200, json={"copy": "hedge"})
+
+    client = http_client(handler, hedging_enabled=True, hedge_min_delay=0.01)
+
+    async def scenario():
+        # Набираем историю длительностей маршрута, без нее порог дублирования не считается
+        for _ in range(20):
+            await client.get("/item")
+
+        started_at = time.monotonic()
+        response = await client.get("/item", params={"slow": "1"})
+        return response, time.monotonic() - started_at
+
+    response, elapsed = asyncio.run(scenario())
+
+    assert response.json() == {"copy": "hedge"}
+    assert elapsed < 0.5
+    # Отмененный оригинал попадает в окно длительностью до победы копии — это нижняя оценка
+    assert max(client._latency._samples["GET /item"]) >= 0.01
+
+
+def test_hedge_rate_is_bounded_under_sustained_slowness(http_client):
+    requests = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal requests
+        requests += 1
+        # После разогрева каждый нечетный запрос медленный: оригинал тормозит, а копия отвечает сразу,
+        # поэтому без бюджета дублировался бы каждый вызов
+        if requests > 20 and requests % 2 == 1:
+            await asyncio.sleep(0.02)
+        return httpx.Response(200)
+
+    client = http_client(
+        handler,
+        hedging_enabled=True,
+        hedge_min_delay=0.002,
+        hedge_budget_ratio=0.1,
+        hedge_budget_min=5,
+    )
+    calls = 200
+
+    async def scenario():
+        for _ in range(20):
+            await client.get("/item")
+        for _ in range(calls):
+            await client.get("/item")
+
+    asyncio.run(scenario())
+
+    hedges = requests - 20 - calls
+    assert 5 <= hedges <= 5 + 0.1 * (20 + calls)
+
+
+async def _serve_ok(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+    try:
+        while await reader.readuntil(b"\r\n\r\n"):
+            writer.write(b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\n\r\nok")
+            await writer.drain()
+    except asyncio.IncompleteReadError:
+        writer.close()
+
+
+def test_pool_gauge_reports_every_client():
+    reader = InMemoryMetricReader()
+    meter = MeterProvider(metric_readers=[reader]).get_meter("test")
+
+    async def scenario():
+        server = await asyncio.start_server(_serve_ok, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        # Один base_url, но разные настройки — это два клиента со своими пулами
+        clients = [AsyncHTTPClient("127.0.0.1", port, timeout=timeout, meter=meter) for timeout in (5, 10)]
+        try:
+            for client in clients:
+                await client.get("/")
+            return reader.get_metrics_data(), clients
+        finally:
+            for client in clients:
+                await client.close()
+            server.close()
+
+    metrics_data, clients = asyncio.run(scenario())
+
+    points = [
+        point
+        for resource_metrics in metrics_data.resource_metrics
+        for scope_metrics in resource_metrics.scope_metrics
+        for metric in scope_metrics.metrics if metric.name == CONNECTION_POOL_SIZE_METRIC
+        for point in metric.data.data_points
+    ]
+    idle = {point.attributes["client_id"]: point.value for point in points if point.attributes["state"] == "idle"}
+    assert idle == {client._client_id: 1 for client in clients}
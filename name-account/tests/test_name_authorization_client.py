@@ -0,0 +1,27 @@
+import asyncio
+
+import httpx
+
+from pkg.client.internal.name_authorization.client import NameAuthorizationClient
+
+
+def test_authorization_posts_to_route_without_redirect(tel):
+    paths: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        paths.append(request.url.path)
+        if request.url.path != "/api/authorization":
+            return httpx.Response(307, headers={"Location": "/api/authorization"})
+        return httpx.Response(200, json={"access_token": "access", "refresh_token": "refresh"})
+
+    client = NameAuthorizationClient(tel, "127.0.0.1", 18000)
+    client.client.session = httpx.AsyncClient(
+        base_url=client.client.base_url,
+        transport=httpx.MockTransport(handler),
+        follow_redirects=True,
+    )
+
+    tokens = asyncio.run(client.authorization(1, False, "user"))
+
+    assert tokens.access_token == "access"
+    assert paths == ["/api/authorization"]
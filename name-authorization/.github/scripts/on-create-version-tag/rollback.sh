@@ -185,36 +185,48 @@ rebuild_container_for_rollback() {
 
 check_health() {
     local url="$STAGE_DOMAIN$SERVICE_PREFIX/health"
-    local http_code=$(curl -f -s -o /dev/null -w "%{http_code}" "$url" 2>/dev/null)
+    local http_code=$(curl -s --max-time 5 -o /dev/null -w "%{http_code}" "$url" 2>/dev/null)
     [ "$http_code" = "200" ]
 }
 
-wait_for_health_after_rollback() {
-    echo ""
-    log INFO "Проверка работоспособности после отката"
-    log INFO "Ожидание 10 секунд перед проверкой..."
-    sleep 10
-
-    local max_attempts=5
+# Опрос health с растущей паузой и джиттером до дедлайна в секундах ($1).
+# Первые проверки идут раз в ~1 сек, поэтому поднявшийся сервис замечаем сразу
+poll_health() {
+    local deadline=$(( $(date +%s) + $1 ))
+    local interval_ms=1000
     local attempt=1
 
-    while [ $attempt -le $max_attempts ]; do
-        log INFO "Попытка $attempt/$max_attempts"
-
+    while true; do
         if check_health; then
-            log SUCCESS "Сервис работает после отката (HTTP 200)"
+            log INFO "Health check пройден с попытки $attempt"
             return 0
         fi
 
-        if [ $attempt -lt $max_attempts ]; then
-            log WARN "Сервис не готов, ожидание 20 сек..."
-            sleep 20
+        if [ "$(date +%s)" -ge "$deadline" ]; then
+            return 1
         fi
 
-        ((attempt++))
+        # Случайная пауза во второй половине интервала
+        local sleep_ms=$(( interval_ms / 2 + RANDOM % (interval_ms / 2 + 1) ))
+        sleep "$(( sleep_ms / 1000 )).$(printf '%03d' $(( sleep_ms % 1000 )))"
+
+        interval_ms=$(( interval_ms * 3 / 2 ))
+        if [ $interval_ms -gt 10000 ]; then
+            interval_ms=10000
+        fi
+        attempt=$(( attempt + 1 ))
     done
+}
+
+wait_for_health_after_rollback() {
+    echo ""
+    log INFO "Проверка работоспособности после отката"
+    if poll_health 120; then
+        log SUCCESS "Сервис работает после отката (HTTP 200)"
+        return 0
+    fi
 
-    log ERROR "Проверка не пройдена после $max_attempts попыток"
+    log ERROR "Проверка не пройдена за 120 секунд"
     echo ""
     echo "Логи контейнера (последние 30 строк):"
     docker logs --tail 30 $SERVICE_NAME 2>&1 | tee -a "$LOG_FILE"
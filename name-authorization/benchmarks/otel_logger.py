@@ -0,0 +1,103 @@
+"""Стоимость одного вызова OtelLogger до и после fast path.
+
+"До" — logger.py из исходного коммита репозитория (git show), "после" —
+текущий файл сервиса. Копии infrastructure/telemetry/logger.py в сервисах
+одинаковые, поэтому скрипт лежит в каждом сервисе и меряет свою копию.
+Запуск из каталога сервиса:
+
+    python -m benchmarks.otel_logger
+"""
+import argparse
+import logging
+import subprocess
+import time
+import types
+from typing import Callable
+
+from opentelemetry import trace
+from opentelemetry.sdk._logs import LoggerProvider
+from opentelemetry.sdk.trace import TracerProvider
+
+from infrastructure.telemetry import logger as current_logger
+
+_LOGGER_PATH = "infrastructure/telemetry/logger.py"
+
+
+def _git(*args: str) -> str:
+    return subprocess.run(["git", *args], check=True, capture_output=True, text=True).stdout
+
+
+def _load_before(rev: str) -> types.ModuleType:
+    if not rev:
+        rev = _git("rev-list", "--max-parents=0", "HEAD").split()[0]
+
+    source = _git("show", f"{rev}:{_git('rev-parse', '--show-prefix').strip()}{_LOGGER_PATH}")
+
+    # Исполняем в пакете infrastructure.telemetry, чтобы сработал относительный импорт alertmanger
+    module = types.ModuleType("infrastructure.telemetry._logger_before")
+    module.__package__ = "infrastructure.telemetry"
+    exec(compile(source, f"{rev}:{_LOGGER_PATH}", "exec"), module.__dict__)
+    return module
+
+
+class _NullLogger:
+    """Подменяет logging.Logger, чтобы в замере осталась только работа самого OtelLogger"""
+
+    def log(self, level: int, message: str, extra: dict = None) -> None:
+        pass
+
+
+def _per_call(call: Callable[[], None], calls: int, repeat: int) -> float:
+    # Лучший из нескольких прогонов: на загруженной машине среднее слишком шумное
+    best = float("inf")
+    for _ in range(repeat):
+        started_at = time.perf_counter()
+        for _ in range(calls):
+            call()
+        best = min(best, time.perf_counter() - started_at)
+    return best / calls
+
+
+def _scenarios(otel_logger, bare_logger) -> dict[str, Callable[[], None]]:
+    fields = {"http.method": "GET", "http.route": "/api/release", "http.status": 200, "duration": 0.0123}
+    return {
+        "info с полями": lambda: otel_logger.info("Обработка HTTP запроса завершена успешно", fields),
+        "info без LoggingHandler": lambda: bare_logger.info("Обработка HTTP запроса завершена успешно", fields),
+        "debug при уровне INFO": lambda: otel_logger.debug("Отладочная запись", fields),
+    }
+
+
+def main(calls: int, repeat: int, rev: str):
+    before = _load_before(rev)
+    # Без процессоров: меряется сам логгер и LoggingHandler, а не экспорт
+    logger_provider = LoggerProvider()
+    tracer = TracerProvider().get_tracer("benchmark")
+
+    loggers = {
+        "до": lambda: before.OtelLogger(None, logger_provider, "benchmark"),
+        "после": lambda: current_logger.OtelLogger(None, logger_provider, "benchmark", "INFO"),
+    }
+
+    with tracer.start_as_current_span("request"):
+        for version, create in loggers.items():
+            # Каждый OtelLogger вешает обработчик на общий logging.getLogger("main"): оставляем один
+            bare_logger = create()
+            bare_logger.logger = _NullLogger()
+            logging.getLogger("main").handlers.clear()
+            otel_logger = create()
+
+            for name, call in _scenarios(otel_logger, bare_logger).items():
+                call()
+                print(f"{version:<6} {name:<24} {_per_call(call, calls, repeat) * 1e6:7.2f} мкс/вызов")
+
+    logging.getLogger("main").handlers.clear()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=20_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--before", default="", help="ревизия для версии 'до', по умолчанию исходный коммит")
+    args = parser.parse_args()
+
+    main(args.calls, args.repeat, args.before)
@@ -0,0 +1,159 @@
+import random
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Sequence
+
+from opentelemetry._logs import SeverityNumber
+from opentelemetry.sdk._logs import LogData, LogRecordProcessor
+from opentelemetry.sdk.trace import ReadableSpan, SpanProcessor
+from opentelemetry.trace import StatusCode
+
+DROP_OLDEST_POLICY = "drop_oldest"
+SAMPLE_POLICY = "sample"
+OVERFLOW_POLICIES = (DROP_OLDEST_POLICY, SAMPLE_POLICY)
+
+
+class ExportWorker:
+    """Экспорт телеметрии в отдельном потоке. Вызывающий поток только кладет запись
+    в кольцевой буфер: append/popleft у deque атомарны, блокировок на горячем пути нет"""
+
+    def __init__(
+            self,
+            name: str,
+            export: Callable[[Sequence[Any]], Any],
+            shutdown: Callable[[], Any],
+            capacity: int = 8192,
+            policy: str = DROP_OLDEST_POLICY,
+            max_batch_size: int = 512,
+            interval: float = 1,
+    ):
+        # Политика приходит из env, опечатка должна валить старт, а не первое переполнение буфера
+        if policy not in OVERFLOW_POLICIES:
+            raise ValueError(
+                f"Неизвестная политика переполнения буфера {policy!r}, ожидается одна из: {', '.join(OVERFLOW_POLICIES)}"
+            )
+
+        self.name = name
+        self.capacity = capacity
+        self.policy = policy
+        self.max_batch_size = max_batch_size
+        self.interval = interval
+
+        self._export = export
+        self._shutdown = shutdown
+
+        # При drop_oldest переполненный deque сам вытесняет старейшую запись
+        self._buffer: deque = deque(maxlen=capacity)
+        self._wakeup = threading.Event()
+        self._stopped = threading.Event()
+        # Поднимается до того, как пачка покидает буфер, и снимается после ее экспорта
+        self._in_flight = False
+
+        # Счетчики читает метрика из другого потока, точность +-1 здесь не важна
+        self.dropped = {overflow_policy: 0 for overflow_policy in OVERFLOW_POLICIES}
+        self.export_failed = 0
+
+        self._thread = threading.Thread(target=self._run, name=f"telemetry-export-{name}", daemon=True)
+        self._thread.start()
+
+    def submit(self, item: Any, important: bool = False) -> None:
+        size = len(self._buffer)
+
+        if self.policy == SAMPLE_POLICY and not important and size * 2 >= self.capacity:
+            # Выше половины буфера доля принятых записей линейно падает до нуля к его заполнению
+            if random.random() >= (self.capacity - size) * 2 / self.capacity:
+                self.dropped[SAMPLE_POLICY] += 1
+                return
+
+        if size >= self.capacity:
+            # Важная запись при sample тоже вытесняет старейшую — считаем под активной политикой
+            self.dropped[self.policy] += 1
+
+        self._buffer.append(item)
+
+        if size + 1 >= self.max_batch_size:
+            self._wakeup.set()
+
+    def queue_size(self) -> int:
+        return len(self._buffer)
+
+    def force_flush(self, timeout_millis: int = 30000) -> bool:
+        deadline = time.monotonic() + timeout_millis / 1000
+        self._wakeup.set()
+        while (self._buffer or self._in_flight) and time.monotonic() < deadline:
+            time.sleep(0.01)
+        return not (self._buffer or self._in_flight)
+
+    def shutdown(self, timeout: float = 5) -> None:
+        self._stopped.set()
+        self._wakeup.set()
+        self._thread.join(timeout)
+        self._shutdown()
+
+    def _run(self) -> None:
+        while not self._stopped.is_set():
+            self._wakeup.wait(self.interval)
+            self._wakeup.clear()
+            self._drain()
+        self._drain()
+
+    def _drain(self) -> None:
+        while self._buffer:
+            self._in_flight = True
+            try:
+                batch = []
+                while len(batch) < self.max_batch_size:
+                    try:
+                        batch.append(self._buffer.popleft())
+                    except IndexError:
+                        break
+
+                if not batch:
+                    return
+
+                try:
+                    self._export(batch)
+                except Exception:
+                    # Логировать отсюда нельзя — запись вернулась бы в этот же буфер
+                    self.export_failed += len(batch)
+            finally:
+                self._in_flight = False
+
+
+class WorkerSpanProcessor(SpanProcessor):
+    def __init__(self, worker: ExportWorker):
+        self.worker = worker
+
+    def on_start(self, span, parent_context=None) -> None:
+        pass
+
+    def on_end(self, span: ReadableSpan) -> None:
+        if not span.context.trace_flags.sampled:
+            return
+        self.worker.submit(span, important=span.status.status_code == StatusCode.ERROR)
+
+    def shutdown(self) -> None:
+        self.worker.shutdown()
+
+    def force_flush(self, timeout_millis: int = 30000) -> bool:
+        return self.worker.force_flush(timeout_millis)
+
+
+class WorkerLogRecordProcessor(LogRecordProcessor):
+    def __init__(self, worker: ExportWorker):
+        self.worker = worker
+
+    def emit(self, log_data: LogData) -> None:
+        severity = log_data.log_record.severity_number
+        important = severity is not None and severity.value >= SeverityNumber.ERROR.value
+        self.worker.submit(log_data, important=important)
+
+    # Новые версии SDK вызывают on_emit вместо emit
+    on_emit = emit
+
+    def shutdown(self) -> None:
+        self.worker.shutdown()
+
+    def force_flush(self, timeout_millis: int = 30000) -> bool:
+        return self.worker.force_flush(timeout_millis)
@@ -2,8 +2,9 @@ from opentelemetry import trace, metrics, propagate
 from opentelemetry.sdk.trace import TracerProvider, SpanLimits
 from opentelemetry._logs import set_logger_provider
 from opentelemetry.sdk.trace.export import BatchSpanProcessor
-from opentelemetry.sdk.trace.sampling import TraceIdRatioBased, ALWAYS_ON
-from opentelemetry.sdk.metrics import MeterProvider
+from opentelemetry.sdk.trace.sampling import TraceIdRatioBased, ParentBased, ALWAYS_ON
+from opentelemetry.metrics import CallbackOptions, Observation
+from opentelemetry.sdk.metrics import MeterProvider, TraceBasedExemplarFilter, AlwaysOffExemplarFilter
 from opentelemetry.sdk.metrics.export import PeriodicExportingMetricReader
 from opentelemetry.sdk._logs import LoggerProvider
 from opentelemetry.sdk._logs.export import BatchLogRecordProcessor
@@ -17,6 +18,8 @@ from opentelemetry.baggage.propagation import W3CBaggagePropagator
 from opentelemetry.propagators.composite import CompositePropagator
 
 from .logger import OtelLogger
+from .export import ExportWorker, WorkerSpanProcessor, WorkerLogRecordProcessor, DROP_OLDEST_POLICY
+from .sampling import SuppressingSampler, TailSamplingSpanProcessor
 from .alertmanger import AlertManager
 from internal import interface
 
@@ -30,7 +33,14 @@ class Telemetry(interface.ITelemetry):
             service_version: str,
             otlp_host: str,
             otlp_port: int,
-            alert_manager: AlertManager = None
+            alert_manager: AlertManager = None,
+            export_worker: bool = False,
+            export_queue_size: int = 8192,
+            export_overflow_policy: str = DROP_OLDEST_POLICY,
+            trace_sample_ratio: float = 1.0,
+            tail_sampling: bool = False,
+            slow_trace_threshold: float = 1.0,
+            suppressed_spans: list[str] = None,
     ):
 
         self.log_level = log_level
@@ -41,6 +51,17 @@ class Telemetry(interface.ITelemetry):
         self.otlp_endpoint = f"{otlp_host}:{otlp_port}"
         self.alert_manager = alert_manager
 
+        # Режим выделенного потока экспорта вместо Batch*Processor из SDK
+        self.export_worker = export_worker
+        self.export_queue_size = export_queue_size
+        self.export_overflow_policy = export_overflow_policy
+        self._export_workers: list[ExportWorker] = []
+
+        self.trace_sample_ratio = trace_sample_ratio
+        self.tail_sampling = tail_sampling
+        self.slow_trace_threshold = slow_trace_threshold
+        self.suppressed_spans = suppressed_spans or []
+
         self._setup_telemetry()
 
     def _setup_telemetry(self) -> None:
@@ -48,6 +69,7 @@ class Telemetry(interface.ITelemetry):
         self._setup_tracing(resource)
         self._setup_metrics(resource)
         self._setup_logging(resource)
+        self._setup_export_metrics()
         self._setup_propagators()
         self._setup_logger()
 
@@ -66,10 +88,15 @@ class Telemetry(interface.ITelemetry):
             insecure=True
         )
 
-        if self.environment == "prod":
-            sampler = ALWAYS_ON
+        if self.tail_sampling:
+            # Решение принимает TailSamplingSpanProcessor по завершении корня, поэтому записываем все,
+            # кроме трейсов, от которых уже отказался вызывающий сервис
+            sampler = ParentBased(ALWAYS_ON)
         else:
-            sampler = ALWAYS_ON
+            sampler = ParentBased(TraceIdRatioBased(self.trace_sample_ratio))
+
+        if self.suppressed_spans:
+            sampler = SuppressingSampler(sampler, self.suppressed_spans)
 
         span_limits = SpanLimits(
             max_span_attributes=256,
@@ -85,12 +112,23 @@ class Telemetry(interface.ITelemetry):
             span_limits=span_limits,
         )
 
-        span_processor = BatchSpanProcessor(
-            otlp_exporter,
-            max_export_batch_size=512,
-            max_queue_size=2048,
-            export_timeout_millis=5000
-        )
+        if self.export_worker:
+            span_processor = WorkerSpanProcessor(self._create_export_worker("spans", otlp_exporter))
+        else:
+            span_processor = BatchSpanProcessor(
+                otlp_exporter,
+                max_export_batch_size=512,
+                max_queue_size=2048,
+                export_timeout_millis=5000
+            )
+
+        if self.tail_sampling:
+            span_processor = TailSamplingSpanProcessor(
+                span_processor,
+                self.trace_sample_ratio,
+                self.slow_trace_threshold,
+            )
+
         self._tracer_provider.add_span_processor(span_processor)
         trace.set_tracer_provider(self._tracer_provider)
 
@@ -110,9 +148,19 @@ class Telemetry(interface.ITelemetry):
             export_interval_millis=30000
         )
 
+        # Exemplar берет trace_id из активного спана, поэтому трейс не нужен в атрибутах метрик.
+        # При хвостовом сэмплинге записываются все спаны, а судьба трейса решается позже, по
+        # завершении корня: exemplar указывал бы на трейс, который в итоге не экспортирован. Поэтому
+        # в этом режиме exemplars отключены, а ссылка метрика -> трейс есть только при head-сэмплинге
+        if self.tail_sampling:
+            exemplar_filter = AlwaysOffExemplarFilter()
+        else:
+            exemplar_filter = TraceBasedExemplarFilter()
+
         self._meter_provider = MeterProvider(
             resource=resource,
-            metric_readers=[reader]
+            metric_readers=[reader],
+            exemplar_filter=exemplar_filter,
         )
 
         metrics.set_meter_provider(self._meter_provider)
@@ -128,17 +176,67 @@ class Telemetry(interface.ITelemetry):
             insecure=True
         )
 
-        processor = BatchLogRecordProcessor(
-            otlp_exporter,
-            max_export_batch_size=512,
-            export_timeout_millis=5000
-        )
+        if self.export_worker:
+            processor = WorkerLogRecordProcessor(self._create_export_worker("logs", otlp_exporter))
+        else:
+            processor = BatchLogRecordProcessor(
+                otlp_exporter,
+                max_export_batch_size=512,
+                export_timeout_millis=5000
+            )
 
         self._logger_provider = LoggerProvider(resource=resource)
         self._logger_provider.add_log_record_processor(processor)
 
         set_logger_provider(self._logger_provider)
 
+    def _create_export_worker(self, name: str, exporter) -> ExportWorker:
+        worker = ExportWorker(
+            name,
+            exporter.export,
+            exporter.shutdown,
+            capacity=self.export_queue_size,
+            policy=self.export_overflow_policy,
+        )
+        self._export_workers.append(worker)
+        return worker
+
+    def _setup_export_metrics(self) -> None:
+        if not self._export_workers:
+            return
+
+        def observe_dropped(options: CallbackOptions):
+            return [
+                Observation(count, {"signal": worker.name, "policy": policy})
+                for worker in self._export_workers
+                for policy, count in worker.dropped.items()
+            ]
+
+        def observe_failed(options: CallbackOptions):
+            return [Observation(worker.export_failed, {"signal": worker.name}) for worker in self._export_workers]
+
+        def observe_queue(options: CallbackOptions):
+            return [Observation(worker.queue_size(), {"signal": worker.name}) for worker in self._export_workers]
+
+        self._meter.create_observable_counter(
+            name="telemetry.export.dropped.total",
+            callbacks=[observe_dropped],
+            description="Total count of telemetry items dropped on export queue overflow",
+            unit="1"
+        )
+        self._meter.create_observable_counter(
+            name="telemetry.export.failed.total",
+            callbacks=[observe_failed],
+            description="Total count of telemetry items lost on failed export",
+            unit="1"
+        )
+        self._meter.create_observable_gauge(
+            name="telemetry.export.queue.size",
+            callbacks=[observe_queue],
+            description="Count of telemetry items waiting for export",
+            unit="1"
+        )
+
     @staticmethod
     def _setup_propagators() -> None:
         propagate.set_global_textmap(
@@ -149,7 +247,7 @@ class Telemetry(interface.ITelemetry):
         )
 
     def _setup_logger(self) -> None:
-        self._logger = OtelLogger(self.alert_manager, self._logger_provider, self.service_name)
+        self._logger = OtelLogger(self.alert_manager, self._logger_provider, self.service_name, self.log_level)
 
     def logger(self) -> interface.IOtelLogger:
         return self._logger
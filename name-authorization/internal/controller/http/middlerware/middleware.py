@@ -1,232 +1,261 @@
 import time
 import traceback
-from typing import Callable
-from fastapi import FastAPI, Request
+
+from fastapi import FastAPI
 from fastapi.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from opentelemetry import propagate
 from opentelemetry.semconv.trace import SpanAttributes
 from opentelemetry.trace import SpanKind, Status, StatusCode
 
-from internal import interface, common, model
+from internal import interface
+from internal import common
+
+_TRACE_ID_HEADER = common.TRACE_ID_HEADER.lower().encode("latin-1")
+_SPAN_ID_HEADER = common.SPAN_ID_HEADER.lower().encode("latin-1")
+
+_KNOWN_METHODS = frozenset({"GET", "HEAD", "POST", "PUT", "PATCH", "DELETE", "OPTIONS", "TRACE", "CONNECT"})
+_OTHER_VALUE = "_OTHER"
 
 
 class HttpMiddleware(interface.IHttpMiddleware):
+    """Трейсинг, метрики и access-лог HTTP запроса за один проход на уровне ASGI"""
+
     def __init__(
             self,
             tel: interface.ITelemetry,
             prefix: str,
+            metrics_max_series: int = 1000,
     ):
         self.tracer = tel.tracer()
         self.meter = tel.meter()
         self.logger = tel.logger()
         self.prefix = prefix
+        self.cardinality_limiter = _CardinalityLimiter(self.logger, metrics_max_series)
 
-    def trace_middleware01(self, app: FastAPI):
-        @app.middleware("http")
-        async def _trace_middleware01(request: Request, call_next: Callable):
-            if self.prefix not in request.url.path:
-                return JSONResponse(
-                    status_code=404,
-                    content={"error": "not found"}
-                )
-            with self.tracer.start_as_current_span(
-                    f"{request.method} {request.url.path}",
-                    context=propagate.extract(dict(request.headers)),
-                    kind=SpanKind.SERVER,
-                    attributes={
-                        SpanAttributes.HTTP_ROUTE: str(request.url.path),
-                        SpanAttributes.HTTP_METHOD: request.method,
-                    }
-            ) as root_span:
-                span_ctx = root_span.get_span_context()
-                trace_id = format(span_ctx.trace_id, '032x')
-                span_id = format(span_ctx.span_id, '016x')
-
-                request.state.trace_id = trace_id
-                request.state.span_id = span_id
-                try:
-                    response = await call_next(request)
-
-                    status_code = response.status_code
-                    response_size = response.headers.get("content-length")
-
-                    root_span.set_attributes({
-                        SpanAttributes.HTTP_STATUS_CODE: status_code,
-                    })
-
-                    if response_size:
-                        try:
-                            root_span.set_attribute(SpanAttributes.HTTP_RESPONSE_BODY_SIZE, int(response_size))
-                        except ValueError:
-                            pass
-
-                    response.headers[common.TRACE_ID_HEADER] = trace_id
-                    response.headers[common.SPAN_ID_HEADER] = span_id
-
-                    if status_code >= 500:
-                        err = Exception("Internal server error")
-                        root_span.record_exception(err)
-                        root_span.set_status(Status(StatusCode.ERROR, str(err)))
-                        root_span.set_attribute(common.ERROR_KEY, True)
-                        raise err
-                    elif status_code >= 400:
-                        err = Exception("Client error")
-                        root_span.record_exception(err)
-                        root_span.set_status(Status(StatusCode.ERROR, str(err)))
-                        root_span.set_attribute(common.ERROR_KEY, True)
-                        raise err
-                    else:
-                        root_span.set_status(Status(StatusCode.OK))
-
-                    return response
-
-                except Exception as err:
-                    root_span.record_exception(err)
-                    root_span.set_status(Status(StatusCode.ERROR, str(err)))
-                    root_span.set_attribute(common.ERROR_KEY, True)
-                    return JSONResponse(
-                        status_code=500,
-                        content={"message": "Internal Server Error"},
-                    )
-
-        return _trace_middleware01
-
-    def metrics_middleware02(self, app: FastAPI):
-        ok_request_counter = self.meter.create_counter(
+        self.ok_request_counter = self.meter.create_counter(
             name=common.OK_REQUEST_TOTAL_METRIC,
             description="Total count of 200 HTTP requests",
             unit="1"
         )
 
-        error_request_counter = self.meter.create_counter(
+        self.error_request_counter = self.meter.create_counter(
             name=common.ERROR_REQUEST_TOTAL_METRIC,
             description="Total count of 500 HTTP requests",
             unit="1"
         )
 
-        request_duration = self.meter.create_histogram(
+        self.request_duration = self.meter.create_histogram(
             name=common.REQUEST_DURATION_METRIC,
             description="HTTP request duration in seconds",
             unit="s"
         )
 
-        request_size = self.meter.create_histogram(
+        self.request_size = self.meter.create_histogram(
             name=common.REQUEST_BODY_SIZE_METRIC,
             description="HTTP request size in bytes",
             unit="by"
         )
 
-        response_size = self.meter.create_histogram(
+        self.response_size = self.meter.create_histogram(
             name=common.RESPONSE_BODY_SIZE_METRIC,
             description="HTTP response size in bytes",
             unit="by"
         )
 
-        active_requests = self.meter.create_up_down_counter(
+        self.active_requests = self.meter.create_up_down_counter(
             name=common.ACTIVE_REQUESTS_METRIC,
             description="Number of active HTTP requests",
             unit="1"
         )
 
-        @app.middleware("http")
-        async def _metrics_middleware02(request: Request, call_next: Callable):
-            start_time = time.time()
-            active_requests.add(1)
+    def instrumentation_middleware01(self, app: FastAPI):
+        # Добавляется последним, чтобы оказаться внешним слоем стека
+        app.add_middleware(_InstrumentationASGIMiddleware, http_middleware=self)
+
+    async def handle(self, app: ASGIApp, scope: Scope, receive: Receive, send: Send) -> None:
+        method = scope["method"]
+        path = scope["path"]
+
+        if self.prefix not in path:
+            response = JSONResponse(status_code=404, content={"error": "not found"})
+            await response(scope, receive, send)
+            return
+
+        headers = {
+            key.decode("latin-1"): value.decode("latin-1")
+            for key, value in scope["headers"]
+        }
+
+        with self.tracer.start_as_current_span(
+                f"{method} {path}",
+                context=propagate.extract(headers),
+                kind=SpanKind.SERVER,
+                attributes={
+                    SpanAttributes.HTTP_TARGET: path,
+                    SpanAttributes.HTTP_METHOD: method,
+                }
+        ) as root_span:
+            span_ctx = root_span.get_span_context()
+            trace_id = format(span_ctx.trace_id, '032x')
+            span_id = format(span_ctx.span_id, '016x')
 
-            trace_id = request.state.trace_id
-            span_id = request.state.span_id
+            # request.state в обработчиках читает этот же словарь
+            state = scope.setdefault("state", {})
+            state["trace_id"] = trace_id
+            state["span_id"] = span_id
 
-            content_length = request.headers.get("content-length")
-            request_attrs = {
-                SpanAttributes.HTTP_METHOD: request.method,
-                SpanAttributes.HTTP_ROUTE: request.url.path,
-                common.SPAN_ID_KEY: span_id,
+            start_time = time.perf_counter()
+            self.active_requests.add(1)
+
+            extra_log = {
+                common.HTTP_METHOD_KEY: method,
+                common.HTTP_ROUTE_KEY: path,
                 common.TRACE_ID_KEY: trace_id,
+                common.SPAN_ID_KEY: span_id,
             }
-            try:
-                if content_length and int(content_length) > 0:
-                    request_size.record(int(content_length), attributes=request_attrs)
 
-                response = await call_next(request)
+            self.logger.info("Началась обработка HTTP запроса", extra_log)
 
-                duration_seconds = time.time() - start_time
-                status_code = response.status_code
+            status_code = 500
+            response_started = False
+            response_body_size = 0
 
-                request_attrs[common.HTTP_STATUS_KEY] = status_code
-                request_attrs[common.HTTP_REQUEST_DURATION_KEY] = duration_seconds
+            async def send_wrapper(message: Message) -> None:
+                nonlocal status_code, response_started, response_body_size
 
-                if status_code >= 500:
-                    error_request_counter.add(1, attributes=request_attrs)
-                else:
-                    ok_request_counter.add(1, attributes=request_attrs)
-
-                request_duration.record(duration_seconds, attributes=request_attrs)
-                response_content_length = response.headers.get("content-length")
-
-                if response_content_length:
-                    try:
-                        response_size.record(int(response_content_length), attributes=request_attrs)
-                    except ValueError:
-                        pass
-
-                return response
-            except Exception as err:
-                duration_seconds = time.time() - start_time
-                request_attrs[common.HTTP_STATUS_KEY] = 500
-                request_attrs[common.ERROR_KEY] = str(err)
-
-                error_request_counter.add(1, attributes=request_attrs)
-                request_duration.record(duration_seconds, attributes=request_attrs)
-                raise
+                if message["type"] == "http.response.start":
+                    response_started = True
+                    status_code = message["status"]
+                    message["headers"] = [
+                        *message.get("headers", []),
+                        (_TRACE_ID_HEADER, trace_id.encode("latin-1")),
+                        (_SPAN_ID_HEADER, span_id.encode("latin-1")),
+                    ]
+                elif message["type"] == "http.response.body":
+                    # Тело не буферизуется: считаем только размер проходящих чанков
+                    response_body_size += len(message.get("body", b""))
+
+                await send(message)
+
+            err = None
+            try:
+                await app(scope, receive, send_wrapper)
+            except Exception as e:
+                err = e
+                status_code = 500
+                if not response_started:
+                    response = JSONResponse(
+                        status_code=500,
+                        content={"message": "Internal Server Error"},
+                    )
+                    await response(scope, receive, send_wrapper)
             finally:
-                active_requests.add(-1)
+                self.active_requests.add(-1)
 
-        return _metrics_middleware02
+            duration_seconds = time.perf_counter() - start_time
 
-    def logger_middleware03(self, app: FastAPI):
-        @app.middleware("http")
-        async def _logger_middleware03(request: Request, call_next: Callable):
-            start_time = time.time()
+            # Шаблон маршрута FastAPI кладет в scope при роутинге; без него путь в метрики не попадает
+            route = getattr(scope.get("route"), "path", None)
+            if route is not None:
+                root_span.update_name(f"{method} {route}")
+                root_span.set_attribute(SpanAttributes.HTTP_ROUTE, route)
 
-            trace_id = request.state.trace_id
-            span_id = request.state.span_id
+            root_span.set_attributes({
+                SpanAttributes.HTTP_STATUS_CODE: status_code,
+                SpanAttributes.HTTP_RESPONSE_BODY_SIZE: response_body_size,
+            })
+
+            # Только атрибуты с конечным числом значений: иначе каждый запрос порождает новую серию.
+            # Запись идет внутри серверного спана, поэтому trace_id попадает в exemplar, а не в атрибуты
+            metric_attrs = self.cardinality_limiter.limit({
+                common.HTTP_METHOD_KEY: method if method in _KNOWN_METHODS else _OTHER_VALUE,
+                common.HTTP_ROUTE_KEY: route or _OTHER_VALUE,
+                common.HTTP_STATUS_CLASS_KEY: f"{status_code // 100}xx",
+            })
+
+            self.request_duration.record(duration_seconds, attributes=metric_attrs)
+            self.response_size.record(response_body_size, attributes=metric_attrs)
+
+            content_length = headers.get("content-length")
+            if content_length and content_length.isdigit() and int(content_length) > 0:
+                self.request_size.record(int(content_length), attributes=metric_attrs)
 
             extra_log = {
-                common.HTTP_METHOD_KEY: request.method,
-                common.HTTP_ROUTE_KEY: request.url.path,
-                common.TRACE_ID_KEY: trace_id,
-                common.SPAN_ID_KEY: span_id,
+                **extra_log,
+                common.HTTP_REQUEST_DURATION_KEY: duration_seconds,
+                common.HTTP_STATUS_KEY: status_code,
             }
-            try:
-                self.logger.info("Началась обработка HTTP запроса", extra_log)
-                response = await call_next(request)
 
-                status_code = response.status_code
-
-                extra_log = {
+            if err is not None:
+                self.error_request_counter.add(1, attributes=metric_attrs)
+                self.logger.error("Обработка HTTP запроса завершена с ошибкой", {
                     **extra_log,
-                    common.HTTP_REQUEST_DURATION_KEY: time.time() - start_time,
-                    common.HTTP_STATUS_KEY: response.status_code,
-                }
+                    common.ERROR_KEY: str(err),
+                    common.TRACEBACK_KEY: "".join(traceback.format_exception(type(err), err, err.__traceback__)),
+                })
+
+                root_span.record_exception(err)
+                root_span.set_status(Status(StatusCode.ERROR, str(err)))
+                root_span.set_attribute(common.ERROR_KEY, True)
+
+                if response_started:
+                    raise err
 
-                if 400 <= status_code < 500:
+            elif status_code >= 500:
+                self.error_request_counter.add(1, attributes=metric_attrs)
+                self.logger.error("Обработка HTTP запроса завершена с ошибкой", extra_log)
+
+                root_span.set_status(Status(StatusCode.ERROR, "Internal server error"))
+                root_span.set_attribute(common.ERROR_KEY, True)
+
+            else:
+                self.ok_request_counter.add(1, attributes=metric_attrs)
+                if status_code >= 400:
+                    # Ошибка клиента не ошибка сервера: статус спана по семантике OTel не выставляется
                     self.logger.warning("Обработка HTTP запроса завершена с ошибкой клиента", extra_log)
                 else:
                     self.logger.info("Обработка HTTP запроса завершена успешно", extra_log)
+                    root_span.set_status(Status(StatusCode.OK))
 
-                return response
 
-            except Exception as err:
-                extra_log = {
-                    **extra_log,
-                    common.HTTP_REQUEST_DURATION_KEY: time.time() - start_time,
-                    common.HTTP_STATUS_KEY: 500,
-                    common.ERROR_KEY: str(err),
-                    common.TRACEBACK_KEY: traceback.format_exc()
-                }
+class _InstrumentationASGIMiddleware:
+    def __init__(self, app: ASGIApp, http_middleware: HttpMiddleware):
+        self.app = app
+        self.http_middleware = http_middleware
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        await self.http_middleware.handle(self.app, scope, receive, send)
+
+
+class _CardinalityLimiter:
+    """Ограничивает число различных наборов атрибутов метрик: сверх max_series
+    измерения сворачиваются в одну overflow-серию"""
+
+    def __init__(self, logger: interface.IOtelLogger, max_series: int):
+        self.logger = logger
+        self.max_series = max_series
+        self._series: set[frozenset] = set()
+        self._overflowed = False
+
+    def limit(self, attributes: dict) -> dict:
+        series = frozenset(attributes.items())
+        if series in self._series:
+            return attributes
 
-                self.logger.error(f"Обработка HTTP запроса завершена с ошибкой", extra_log)
-                raise
+        if len(self._series) < self.max_series:
+            self._series.add(series)
+            return attributes
 
-        return _logger_middleware03
\ No newline at end of file
+        if not self._overflowed:
+            self._overflowed = True
+            self.logger.warning(
+                "Достигнут предел числа серий HTTP метрик, новые серии сворачиваются в overflow",
+                {"max_series": self.max_series}
+            )
+        return {common.METRIC_OVERFLOW_KEY: True}
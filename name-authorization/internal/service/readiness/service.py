@@ -0,0 +1,77 @@
+import asyncio
+import time
+from typing import Any, Awaitable, Callable
+
+from opentelemetry.trace import SpanKind, Status, StatusCode
+
+from internal import interface
+
+
+class ReadinessService(interface.IReadinessService):
+    """Готовность принимать трафик: прогрев пулов при старте и кешированная проверка зависимостей"""
+
+    def __init__(
+            self,
+            tel: interface.ITelemetry,
+            checks: dict[str, Callable[[], Awaitable[Any]]],
+            cache_ttl: float = 2,
+            check_timeout: float = 2,
+            warmup_concurrency: int = 5,
+    ):
+        self.tracer = tel.tracer()
+        self.logger = tel.logger()
+
+        self.checks = checks
+        self.cache_ttl = cache_ttl
+        self.check_timeout = check_timeout
+        self.warmup_concurrency = warmup_concurrency
+
+        self.warmed_up = False
+        self._checked_at = 0.0
+        self._results: dict[str, str] = {}
+        # Параллельные запросы /ready ждут одну общую проверку, а не нагружают пулы каждый своей
+        self._lock = asyncio.Lock()
+
+    async def warmup(self) -> None:
+        with self.tracer.start_as_current_span(
+                "ReadinessService.warmup",
+                kind=SpanKind.INTERNAL
+        ) as span:
+            started_at = time.monotonic()
+
+            # Одновременные проверки заставляют каждый пул открыть несколько соединений заранее,
+            # иначе установку соединений оплатят первые запросы после деплоя
+            for name, check in self.checks.items():
+                results = await asyncio.gather(
+                    *(self._run_check(check) for _ in range(self.warmup_concurrency))
+                )
+                failed = [result for result in results if result != "ok"]
+                if failed:
+                    self.logger.warning(f"Прогрев {name} завершился ошибкой", {"error": failed[0]})
+
+            self.warmed_up = True
+            self.logger.info(f"Пулы соединений прогреты за {time.monotonic() - started_at:.2f}с")
+            span.set_status(Status(StatusCode.OK))
+
+    async def check(self) -> tuple[bool, dict[str, str]]:
+        if not self.warmed_up:
+            return False, {"warmup": "in progress"}
+
+        async with self._lock:
+            if time.monotonic() - self._checked_at > self.cache_ttl:
+                names = list(self.checks)
+                results = await asyncio.gather(*(self._run_check(self.checks[name]) for name in names))
+
+                self._results = dict(zip(names, results))
+                self._checked_at = time.monotonic()
+
+            results = dict(self._results)
+
+        return all(result == "ok" for result in results.values()), results
+
+    async def _run_check(self, check: Callable[[], Awaitable[Any]]) -> str:
+        try:
+            await asyncio.wait_for(check(), timeout=self.check_timeout)
+            return "ok"
+        except Exception as err:
+            return str(err) or type(err).__name__
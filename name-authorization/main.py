@@ -7,6 +7,7 @@ from internal.controller.http.middlerware.middleware import HttpMiddleware
 from internal.controller.http.handler.account.handler import AuthorizationController
 
 from internal.service.account.service import AuthorizationService
+from internal.service.readiness.service import ReadinessService
 
 from internal.repo.account.repo import AccountRepo
 
@@ -39,12 +40,26 @@ tel = Telemetry(
     cfg.service_version,
     cfg.otlp_host,
     cfg.otlp_port,
-    alert_manager
+    alert_manager,
+    cfg.otel_export_worker,
+    cfg.otel_export_queue_size,
+    cfg.otel_export_overflow_policy,
+    cfg.otel_trace_sample_ratio,
+    cfg.otel_tail_sampling,
+    cfg.otel_slow_trace_threshold,
+    cfg.otel_suppressed_spans,
 )
 
 # Инициализация инфраструктуры
 db = PG(tel, cfg.db_user, cfg.db_pass, cfg.db_host, cfg.db_port, cfg.db_name)
 
+readiness_service = ReadinessService(
+    tel,
+    {
+        "db": lambda: db.select("SELECT 1", {}),
+    },
+)
+
 # Инициализация репозиториев
 authorization_repo = AccountRepo(tel, db)
 
@@ -66,11 +81,13 @@ authorization_controller = AuthorizationController(
 http_middleware = HttpMiddleware(
     tel,
     cfg.prefix,
+    cfg.http_metrics_max_series,
 )
 
 if __name__ == "__main__":
     app = NewHTTP(
         db,
+        readiness_service,
         authorization_controller,
         http_middleware,
         cfg.prefix,
@@ -1,121 +1,260 @@
 import httpx
+import time
 import asyncio
 import random
 import weakref
+import itertools
 from pathlib import Path
-from collections import deque
-from datetime import datetime, timedelta
-from typing import Optional, Any, AsyncIterator, Callable
-from tenacity import stop_after_attempt, AsyncRetrying, retry_if_exception_type
+from collections import OrderedDict, deque
+from typing import Optional, Any, AsyncIterator, Awaitable, Callable, Hashable
 
 from opentelemetry import propagate
+from opentelemetry.metrics import Meter, Observation, CallbackOptions
 
 from internal import interface
 
+CIRCUIT_BREAKER_STATE_CHANGE_TOTAL_METRIC = "http.client.circuit_breaker.state_change.total"
+CIRCUIT_BREAKER_REJECTED_TOTAL_METRIC = "http.client.circuit_breaker.rejected.total"
+SINGLEFLIGHT_COALESCED_TOTAL_METRIC = "http.client.singleflight.coalesced.total"
+HEDGE_TOTAL_METRIC = "http.client.hedge.total"
+HEDGE_WON_TOTAL_METRIC = "http.client.hedge.won.total"
+RETRY_TOTAL_METRIC = "http.client.retry.total"
+CONNECTION_POOL_SIZE_METRIC = "http.client.connection_pool.size"
+
+# Дублировать можно только идемпотентные запросы
+HEDGE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+
+class CircuitBreakerOpenError(Exception):
+    """Запрос отклонен без обращения к хосту: breaker открыт или занят пробным запросом"""
+    pass
+
 
 class CircuitBreaker:
+    """Breaker без блокировок: переходы состояний — синхронный код между await,
+    поэтому в пределах event loop они атомарны. Ошибки считаются в скользящем
+    окне из последних window_size вызовов, время — монотонное"""
+
     def __init__(
             self,
             failure_threshold: int = 5,
             recovery_timeout: int = 60,
             expected_exceptions: tuple[type[Exception], ...] = (httpx.HTTPError,),
-            logger: interface.IOtelLogger = None
+            window_size: int = 20,
+            logger: interface.IOtelLogger = None,
+            meter: Meter = None,
+            name: str = "",
     ):
         self.failure_threshold = failure_threshold
         self.recovery_timeout = recovery_timeout
         self.expected_exceptions = expected_exceptions
-        self._failures: deque[datetime] = deque(maxlen=failure_threshold)
-        self._last_failure_time: Optional[datetime] = None
-        self._state = "closed"  # closed, open, half-open
-        self._lock = asyncio.Lock()
         self.logger = logger
+        self.name = name
+
+        # True — неуспешный вызов; сумма поддерживается инкрементально
+        self._window: deque[bool] = deque(maxlen=max(window_size, failure_threshold))
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._state = "closed"  # closed, open, half-open
+
+        self._state_change_counter = None
+        self._rejected_counter = None
+        if meter is not None:
+            self._state_change_counter = meter.create_counter(
+                name=CIRCUIT_BREAKER_STATE_CHANGE_TOTAL_METRIC,
+                description="Total count of circuit breaker state changes",
+                unit="1"
+            )
+            self._rejected_counter = meter.create_counter(
+                name=CIRCUIT_BREAKER_REJECTED_TOTAL_METRIC,
+                description="Total count of requests rejected by circuit breaker",
+                unit="1"
+            )
 
     @property
     def state(self) -> str:
         return self._state
 
-    def _log_state_change(self, old_state: str, new_state: str, context: str = ""):
-        self.logger.warning(
-            f"Circuit Breaker изменил состояние: {old_state} -> {new_state}. "
-            f"количество ошибок: {len(self._failures)}/{self.failure_threshold}. "
-            f"Подробности: {context}"
-        )
+    def _set_state(self, new_state: str, context: str = ""):
+        old_state = self._state
+        if old_state == new_state:
+            return
 
-    async def call(self, func: Callable, *args, **kwargs) -> Any:
-        async with self._lock:
-            current_state = self._state
-
-            if self._state == "open":
-                time_since_failure = (datetime.now() - self._last_failure_time
-                                      if self._last_failure_time else timedelta(0))
-
-                if (self._last_failure_time and
-                        time_since_failure > timedelta(seconds=self.recovery_timeout)):
-                    old_state = self._state
-                    self._state = "half-open"
-                    if self.logger is not None:
-                        self._log_state_change(
-                            old_state,
-                            self._state,
-                            f"Восстановление после {time_since_failure.total_seconds()} секунд"
-                        )
-                else:
-                    remaining_time = self.recovery_timeout - time_since_failure.total_seconds()
-                    if self.logger is not None:
-                        self.logger.warning(
-                            f"Circuit breaker включен. Ошибок: {len(self._failures)}/{self.failure_threshold}. "
-                            f"Восстановление через {remaining_time:.1f} секунд"
-                        )
-                    raise Exception(f"Circuit breaker is OPEN (failures: {len(self._failures)})")
+        self._state = new_state
+        if self._state_change_counter is not None:
+            self._state_change_counter.add(1, attributes={"name": self.name, "from": old_state, "to": new_state})
 
-        try:
-            if current_state == "half-open":
-                if self.logger is not None:
-                    self.logger.debug("Circuit breaker в HALF-OPEN состоянии. Проверка состояния")
+        if self.logger is not None:
+            self.logger.warning(
+                f"Circuit Breaker изменил состояние: {old_state} -> {new_state}. "
+                f"количество ошибок: {self._failures}/{self.failure_threshold}. "
+                f"Подробности: {context}"
+            )
 
-            result = await func(*args, **kwargs)
+    def _reject(self, reason: str):
+        if self._rejected_counter is not None:
+            self._rejected_counter.add(1, attributes={"name": self.name, "state": self._state})
+        raise CircuitBreakerOpenError(reason)
+
+    def _before_call(self) -> bool:
+        """Возвращает True, если вызов — пробный запрос в half-open"""
+        if self._state == "closed":
+            return False
+
+        if self._state == "open":
+            elapsed = time.monotonic() - self._opened_at
+            if elapsed < self.recovery_timeout:
+                self._reject(
+                    f"Circuit breaker is OPEN (failures: {self._failures}), "
+                    f"восстановление через {self.recovery_timeout - elapsed:.1f} секунд"
+                )
+            self._set_state("half-open", f"Восстановление после {elapsed:.1f} секунд")
+
+        # В half-open пропускаем ровно один пробный запрос, остальные отклоняем до его исхода
+        if self._probe_in_flight:
+            self._reject("Circuit breaker is HALF-OPEN, пробный запрос еще выполняется")
+
+        self._probe_in_flight = True
+        return True
+
+    def _record(self, failed: bool):
+        if len(self._window) == self._window.maxlen and self._window[0]:
+            self._failures -= 1
+        self._window.append(failed)
+        if failed:
+            self._failures += 1
+
+    def _on_success(self, is_probe: bool):
+        if is_probe:
+            self._window.clear()
+            self._failures = 0
+            self._set_state("closed", "Восстановились. Circuit breaker выключен")
+        elif self._state == "closed":
+            self._record(False)
+
+    def _on_failure(self, is_probe: bool):
+        if is_probe:
+            self._opened_at = time.monotonic()
+            self._set_state("open", "Пробный запрос неуспешен")
+            return
 
-            async with self._lock:
-                if self._state == "half-open":
-                    old_state = self._state
-                    self._state = "closed"
-                    self._failures.clear()
-                    if self.logger is not None:
-                        self._log_state_change(
-                            old_state, self._state,
-                            "Восстановились. Circuit breaker выключен"
-                        )
+        if self._state != "closed":
+            return
 
-            return result
+        self._record(True)
+        if self.logger is not None:
+            self.logger.warning(
+                f"Circuit breaker обнаружил проблему. Количество ошибок: {self._failures}/{self.failure_threshold}"
+            )
 
-        except self.expected_exceptions as e:
-            await self._record_failure()
-            raise
+        if self._failures >= self.failure_threshold:
+            self._opened_at = time.monotonic()
+            self._set_state("open", f"{self._failures} ошибок за последние {len(self._window)} запросов")
 
-    async def _record_failure(self):
-        async with self._lock:
-            self._failures.append(datetime.now())
-            self._last_failure_time = datetime.now()
-            old_state = self._state
-            if self.logger is not None:
-                self.logger.warning(
-                    f"Circuit breaker обнаружил проблему. Количество ошибок: {len(self._failures)}/{self.failure_threshold}"
-                )
+    async def call(self, func: Callable, *args, **kwargs) -> Any:
+        is_probe = self._before_call()
+        try:
+            result = await func(*args, **kwargs)
+        except self.expected_exceptions:
+            self._on_failure(is_probe)
+            raise
+        finally:
+            # Отмена или неожиданная ошибка не должны навсегда занять слот пробного запроса
+            if is_probe:
+                self._probe_in_flight = False
 
-            if len(self._failures) >= self.failure_threshold:
-                self._state = "open"
-                if self.logger is not None:
-                    self._log_state_change(old_state, self._state)
+        self._on_success(is_probe)
+        return result
 
     def reset(self):
-        old_state = self._state
-        self._failures.clear()
-        self._last_failure_time = None
-        self._state = "closed"
+        self._window.clear()
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._set_state("closed", "Ручное выключение")
+
+
+class SingleFlight:
+    """Склеивает одинаковые запросы в полете: пока первый не завершился,
+    остальные ждут его результат вместо собственного обращения к хосту"""
+
+    def __init__(self, meter: Meter = None, name: str = ""):
+        self.name = name
+        self._calls: dict[Hashable, asyncio.Task] = {}
+
+        self._coalesced_counter = None
+        if meter is not None:
+            self._coalesced_counter = meter.create_counter(
+                name=SINGLEFLIGHT_COALESCED_TOTAL_METRIC,
+                description="Total count of requests served by an identical in-flight request",
+                unit="1"
+            )
 
-        if old_state != "closed":
-            if self.logger is not None:
-                self._log_state_change(old_state, self._state, "Ручное выключение")
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[Any]]) -> Any:
+        task = self._calls.get(key)
+        if task is None:
+            # Запрос идет отдельной задачей: отмена одного из ожидающих не отменяет его для остальных
+            task = asyncio.ensure_future(func())
+            self._calls[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+        elif self._coalesced_counter is not None:
+            self._coalesced_counter.add(1, attributes={"name": self.name})
+
+        return await asyncio.shield(task)
+
+    def _forget(self, key: Hashable, task: asyncio.Task):
+        if self._calls.get(key) is task:
+            del self._calls[key]
+
+        # Ошибку могли не забрать, если все ожидающие отменились
+        if not task.cancelled():
+            task.exception()
+
+
+class DeadlineExceededError(httpx.TimeoutException):
+    """Общий дедлайн вызова истек — с учетом всех повторов и дублирующих запросов"""
+    pass
+
+
+class LatencyTracker:
+    """Гистограмма последних длительностей по маршрутам: скользящее окно на
+    window_size ответов, по которому считается порог дублирования запроса"""
+
+    def __init__(
+            self,
+            quantile: float = 0.95,
+            window_size: int = 200,
+            min_samples: int = 20,
+            max_routes: int = 256,
+    ):
+        self.quantile = quantile
+        self.window_size = window_size
+        self.min_samples = min_samples
+        self.max_routes = max_routes
+
+        self._samples: OrderedDict[str, deque[float]] = OrderedDict()
+
+    def record(self, route: str, seconds: float):
+        samples = self._samples.get(route)
+        if samples is None:
+            samples = self._samples[route] = deque(maxlen=self.window_size)
+            while len(self._samples) > self.max_routes:
+                self._samples.popitem(last=False)
+        else:
+            self._samples.move_to_end(route)
+
+        samples.append(seconds)
+
+    def threshold(self, route: str) -> float | None:
+        samples = self._samples.get(route)
+        # Пока данных мало, порог случаен — не дублируем вовсе
+        if samples is None or len(samples) < self.min_samples:
+            return None
+
+        ordered = sorted(samples)
+        return ordered[min(int(len(ordered) * self.quantile), len(ordered) - 1)]
 
 
 class ExponentialBackoffWithJitter:
@@ -124,9 +263,9 @@ class ExponentialBackoffWithJitter:
         self.max_delay = max_delay
         self.jitter = jitter
 
-    def __call__(self, retry_state) -> float:
+    def __call__(self, attempt_number: int) -> float:
         delay = min(
-            self.base_delay * (2 ** (retry_state.attempt_number - 1)),
+            self.base_delay * (2 ** (attempt_number - 1)),
             self.max_delay
         )
 
@@ -134,40 +273,121 @@ class ExponentialBackoffWithJitter:
         return delay + jitter_value
 
 
+class RetryPolicy:
+    """Решает, можно ли повторить запрос после ошибки, с учетом идемпотентности метода"""
+
+    # Запрос гарантированно не дошел до сервера — повтор безопасен для любого метода
+    NOT_SENT_EXCEPTIONS = (
+        httpx.ConnectError,
+        httpx.ConnectTimeout,
+        httpx.PoolTimeout,
+    )
+
+    def __init__(
+            self,
+            retry_statuses: frozenset[int] = frozenset({502, 503, 504}),
+            idempotent_methods: frozenset[str] = IDEMPOTENT_METHODS,
+    ):
+        self.retry_statuses = retry_statuses
+        self.idempotent_methods = idempotent_methods
+
+    def should_retry(self, method: str, err: Exception) -> bool:
+        # Дедлайн и открытый breaker повтором не лечатся
+        if isinstance(err, (DeadlineExceededError, CircuitBreakerOpenError)):
+            return False
+
+        if isinstance(err, self.NOT_SENT_EXCEPTIONS):
+            return True
+
+        if method not in self.idempotent_methods:
+            return False
+
+        if isinstance(err, httpx.HTTPStatusError):
+            return err.response.status_code in self.retry_statuses
+
+        return isinstance(err, httpx.TransportError)
+
+
+class RetryBudget:
+    """Бюджет повторов на клиент: каждый исходный запрос пополняет его на ratio,
+    каждый повтор тратит единицу. При деградации хоста повторы не умножают нагрузку"""
+
+    def __init__(self, ratio: float = 0.2, min_tokens: float = 10, max_tokens: float = 100):
+        self.ratio = ratio
+        self.max_tokens = max(max_tokens, min_tokens)
+        self._tokens = float(min_tokens)
+
+    def deposit(self):
+        self._tokens = min(self._tokens + self.ratio, self.max_tokens)
+
+    def withdraw(self) -> bool:
+        if self._tokens < 1:
+            return False
+        self._tokens -= 1
+        return True
+
+
+class HedgeBudget(RetryBudget):
+    """Бюджет дублирующих запросов: при устойчивой деградации хоста дублируется
+    не больше доли ratio запросов, иначе копии удваивают нагрузку на него"""
+
+    def __init__(self, ratio: float = 0.1, min_tokens: float = 10, max_tokens: float = 100):
+        super().__init__(ratio=ratio, min_tokens=min_tokens, max_tokens=max_tokens)
+
+
+def _freeze(value: Any) -> Hashable:
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+_client_ids = itertools.count(1)
+_pool_gauge_meters: list[Meter] = []
+
+
+def _register_pool_gauge(meter: Meter):
+    # SDK оставляет только первую регистрацию инструмента с данным именем, поэтому gauge
+    # один на meter, а его колбэк обходит все живые клиенты, а не только создавший его
+    if any(registered is meter for registered in _pool_gauge_meters):
+        return
+    _pool_gauge_meters.append(meter)
+
+    def observe_pools(options: CallbackOptions) -> list[Observation]:
+        observations = []
+        # Колбэк зовется из потока экспорта: valuerefs() копирует словарь целиком, а не обходит его
+        for ref in AsyncHTTPClient._instances.valuerefs():
+            client = ref()
+            if client is not None and client._meter is meter:
+                observations.extend(client._observe_pool())
+        return observations
+
+    meter.create_observable_gauge(
+        name=CONNECTION_POOL_SIZE_METRIC,
+        callbacks=[observe_pools],
+        description="Count of pooled connections by state",
+        unit="1"
+    )
+
+
 class AsyncHTTPClient:
     _instances: weakref.WeakValueDictionary = weakref.WeakValueDictionary()
     _lock = asyncio.Lock()
 
-    def __new__(
-            cls,
-            host: str,
-            port: int,
-            prefix: str = "",
-            headers: dict = None,
-            cookies: dict = None,
-            use_tracing: bool = False,
-            use_http2: bool = True,
-            use_https: bool = False,
-            timeout: float = 30,
-            max_connections: int = 100,
-            max_keepalive_connections: int = 20,
-            retry_count: int = 3,
-            retry_wait_multiplier: float = 0.3,
-            retry_wait_min: float = 0.1,
-            retry_wait_max: float = 10,
-            circuit_breaker_enabled: bool = True,
-            circuit_breaker_failure_threshold: int = 5,
-            circuit_breaker_recovery_timeout: int = 60,
-            logger: interface.IOtelLogger = None,
-    ):
-        protocol = "https" if use_https else "http"
+    def __new__(cls, host: str, port: int, prefix: str = "", *args, **kwargs):
+        # Экземпляр переиспользуется только при полностью совпадающих настройках:
+        # клиент с другим таймаутом или политикой повторов не должен молча получить чужие
+        protocol = "https" if kwargs.get("use_https") else "http"
         base_url = f"{protocol}://{host}:{port}{prefix}"
+        key = (base_url, _freeze(args), _freeze(kwargs))
 
-        if base_url in cls._instances:
-            return cls._instances[base_url]
+        instance = cls._instances.get(key)
+        if instance is not None:
+            return instance
 
         instance = super().__new__(cls)
-        cls._instances[base_url] = instance
+        cls._instances[key] = instance
         return instance
 
     def __init__(
@@ -179,18 +399,32 @@ class AsyncHTTPClient:
             cookies: dict = None,
             use_tracing: bool = False,
             use_http2: bool = False,
+            http2_prior_knowledge: bool = False,
             use_https: bool = False,
             timeout: float = 30,
             max_connections: int = 100,
             max_keepalive_connections: int = 20,
-            retry_count: int = 3,
+            retry_count: int = 2,
             retry_wait_multiplier: float = 0.3,
             retry_wait_min: float = 0.1,
             retry_wait_max: float = 10,
+            retry_statuses: frozenset[int] = frozenset({502, 503, 504}),
+            retry_budget_ratio: float = 0.2,
+            retry_budget_min: float = 10,
             circuit_breaker_enabled: bool = True,
             circuit_breaker_failure_threshold: int = 5,
             circuit_breaker_recovery_timeout: int = 60,
+            singleflight_enabled: bool = False,
+            singleflight_headers: tuple[str, ...] = (),
+            singleflight_cookies: tuple[str, ...] = (),
+            deadline: float = None,
+            hedging_enabled: bool = False,
+            hedge_quantile: float = 0.95,
+            hedge_min_delay: float = 0.05,
+            hedge_budget_ratio: float = 0.1,
+            hedge_budget_min: float = 10,
             logger: interface.IOtelLogger = None,
+            meter: Meter = None,
     ):
         if hasattr(self, "_initialized"):
             return
@@ -204,30 +438,86 @@ class AsyncHTTPClient:
         self.default_cookies = cookies or {}
 
         self.logger = logger
+        self._meter = meter
+        # base_url у клиентов с разными настройками совпадает, в метриках их различает client_id
+        self._client_id = next(_client_ids)
         self.use_tracing = use_tracing
 
         self.session: Optional[httpx.AsyncClient] = None
         self.session_lock = asyncio.Lock()
 
-        self.circuit_breaker: Optional[CircuitBreaker] = None
+        # Экземпляр клиента один на base_url, поэтому и breaker у каждого хоста свой
+        self._circuit_breaker: Optional[CircuitBreaker] = None
         if circuit_breaker_enabled:
             self._circuit_breaker = CircuitBreaker(
                 failure_threshold=circuit_breaker_failure_threshold,
-                recovery_timeout=circuit_breaker_recovery_timeout
+                recovery_timeout=circuit_breaker_recovery_timeout,
+                logger=logger,
+                meter=meter,
+                name=self.base_url,
             )
 
+        # Одинаковые GET склеиваются по методу, URL, параметрам и перечисленным заголовкам/cookies.
+        # Остальные заголовки в ключ не входят, поэтому перечислить нужно все, что влияет на ответ
+        self._singleflight: Optional[SingleFlight] = None
+        if singleflight_enabled:
+            self._singleflight = SingleFlight(meter=meter, name=self.base_url)
+        self.singleflight_headers = tuple(header.lower() for header in singleflight_headers)
+        self.singleflight_cookies = singleflight_cookies
+
+        # Дедлайн по умолчанию на весь вызов вместе с повторами, переопределяется аргументом deadline
+        self.deadline = deadline
+
+        # Если ответа нет дольше квантиля hedge_quantile по маршруту, отправляем копию и берем первый ответ
+        self._latency: Optional[LatencyTracker] = None
+        self._hedge_budget: Optional[HedgeBudget] = None
+        self._hedge_counter = None
+        self._hedge_won_counter = None
+        if hedging_enabled:
+            self._latency = LatencyTracker(quantile=hedge_quantile)
+            self._hedge_budget = HedgeBudget(ratio=hedge_budget_ratio, min_tokens=hedge_budget_min)
+            if meter is not None:
+                self._hedge_counter = meter.create_counter(
+                    name=HEDGE_TOTAL_METRIC,
+                    description="Total count of hedged requests sent",
+                    unit="1"
+                )
+                self._hedge_won_counter = meter.create_counter(
+                    name=HEDGE_WON_TOTAL_METRIC,
+                    description="Total count of hedged requests that answered first",
+                    unit="1"
+                )
+        self.hedge_min_delay = hedge_min_delay
+
         self.timeout = timeout
         self.max_connections = max_connections
         self.max_keepalive_connections = max_keepalive_connections
+        # Число повторов после первой попытки, 0 — без повторов
         self.retry_count = retry_count
         self.retry_wait_multiplier = retry_wait_multiplier
         self.retry_wait_min = retry_wait_min
         self.retry_wait_max = retry_wait_max
         self.use_http2 = use_http2
+        # h2c: HTTP/2 без TLS и без Upgrade, для внутренних вызовов к серверу, который его понимает.
+        # Все запросы мультиплексируются в одном соединении вместо пула keep-alive
+        self.http2_prior_knowledge = http2_prior_knowledge and not use_https
+
+        if meter is not None:
+            _register_pool_gauge(meter)
         self.backoff = ExponentialBackoffWithJitter(
             base_delay=self.retry_wait_min,
             max_delay=self.retry_wait_max
         )
+        self.retry_policy = RetryPolicy(retry_statuses=retry_statuses)
+        self.retry_budget = RetryBudget(ratio=retry_budget_ratio, min_tokens=retry_budget_min)
+
+        self._retry_counter = None
+        if meter is not None:
+            self._retry_counter = meter.create_counter(
+                name=RETRY_TOTAL_METRIC,
+                description="Total count of request retries by outcome",
+                unit="1"
+            )
 
     async def _get_session(self) -> httpx.AsyncClient:
         if self.session is None or self.session.is_closed:
@@ -242,7 +532,8 @@ class AsyncHTTPClient:
             headers=self.default_headers,
             cookies=self.default_cookies,
             timeout=self.timeout,
-            http2=self.use_http2,
+            http1=not self.http2_prior_knowledge,
+            http2=self.use_http2 or self.http2_prior_knowledge,
             limits=httpx.Limits(
                 max_connections=self.max_connections,
                 max_keepalive_connections=self.max_keepalive_connections
@@ -250,11 +541,46 @@ class AsyncHTTPClient:
             follow_redirects=True
         )
 
+    async def prewarm(self, url: str = "/health", connections: int = None):
+        """Открывает соединения заранее, чтобы первые запросы не платили за handshake"""
+        if connections is None:
+            connections = 1 if self.http2_prior_knowledge else self.max_keepalive_connections
+
+        session = await self._get_session()
+        results = await asyncio.gather(
+            *(session.get(url) for _ in range(connections)),
+            return_exceptions=True
+        )
+
+        errors = [result for result in results if isinstance(result, Exception)]
+        if errors and self.logger is not None:
+            self.logger.warning(
+                f"Прогрев соединений с {self.base_url}: неуспешно {len(errors)}/{connections}",
+                {"error": str(errors[0])}
+            )
+
+    def _observe_pool(self) -> list[Observation]:
+        if self.session is None or self.session.is_closed:
+            return []
+
+        # httpx не отдает состояние пула публично, берем его у httpcore-пула транспорта
+        pool = getattr(getattr(self.session, "_transport", None), "_pool", None)
+        if pool is None:
+            return []
+
+        idle = sum(1 for connection in pool.connections if connection.is_idle())
+        attributes = {"name": self.base_url, "client_id": self._client_id}
+        return [
+            Observation(idle, {**attributes, "state": "idle"}),
+            Observation(len(pool.connections) - idle, {**attributes, "state": "active"}),
+        ]
+
     async def close(self):
         if self.session and not self.session.is_closed:
             await self.session.aclose()
             self.session = None
-            self.logger.info("session_closed")
+            if self.logger is not None:
+                self.logger.info("session_closed")
 
     async def __aenter__(self) -> 'AsyncHTTPClient':
         await self._get_session()
@@ -268,14 +594,6 @@ class AsyncHTTPClient:
         for instance in list(cls._instances.values()):
             await instance.close()
 
-    def _create_retry_strategy(self) -> AsyncRetrying:
-        return AsyncRetrying(
-            stop=stop_after_attempt(self.retry_count),
-            wait=self.backoff,
-            retry=retry_if_exception_type(httpx.HTTPError),
-            reraise=True
-        )
-
     async def _execute_request(
             self,
             method: str,
@@ -285,6 +603,7 @@ class AsyncHTTPClient:
         try:
             session = await self._get_session()
 
+            started_at = time.monotonic()
             headers = {**self.default_headers, **kwargs.pop('headers', {})}
             cookies = {**self.default_cookies, **kwargs.pop('cookies', {})}
 
@@ -309,6 +628,9 @@ class AsyncHTTPClient:
                     **kwargs
                 )
 
+            if self._latency is not None:
+                self._latency.record(f"{method} {url}", time.monotonic() - started_at)
+
             response.raise_for_status()
             return response
 
@@ -320,61 +642,172 @@ class AsyncHTTPClient:
             method: str,
             url: str,
             **kwargs
-    ) -> httpx.Response | None:
-        start_time = datetime.now()
-
-        last_exception = None
-        retry_count = 0
-
-        async for attempt in self._create_retry_strategy():
-            with attempt:
-                retry_count = attempt.retry_state.attempt_number - 1
+    ) -> httpx.Response:
+        deadline = kwargs.pop('deadline', self.deadline)
+        started_at = time.monotonic()
+        deadline_at = started_at + deadline if deadline is not None else None
+
+        self.retry_budget.deposit()
+
+        attempt = 1
+        while True:
+            try:
+                response = await self._attempt(method, url, deadline_at, **kwargs)
+            except Exception as err:
+                elapsed = time.monotonic() - started_at
+                delay = self._retry_delay(method, err, attempt, deadline_at)
+                if delay is None:
+                    if attempt > 1 and self.logger is not None:
+                        self.logger.error(
+                            f"Запрос {method} {url} окончательно провален "
+                            f"после {attempt} попыток за {elapsed:.2f}с. "
+                            f"Ошибка: {err.__class__.__name__}: {str(err)}"
+                        )
+                    raise
 
-                if retry_count > 0:
-                    wait_time = self.backoff(attempt.retry_state)
+                if self.logger is not None:
                     self.logger.warning(
-                        f"Попытка #{retry_count} для {method} {url}"
-                        f"после {wait_time:.2f}с ожидания. "
-                        f"Последняя ошибка: {last_exception.__class__.__name__}: {str(last_exception)}"
+                        f"Запрос {method} {url} неуспешен "
+                        f"(попытка {attempt}/{self.retry_count + 1}) "
+                        f"за {elapsed:.2f}с. Следующая попытка через {delay:.2f}с. "
+                        f"Ошибка: {err.__class__.__name__}: {str(err)}"
                     )
 
-                try:
-                    response = await self._execute_request(method, url, **kwargs)
+                await asyncio.sleep(delay)
+                attempt += 1
+                continue
 
-                    elapsed = (datetime.now() - start_time).total_seconds()
-                    if retry_count > 0:
-                        self.logger.info(
-                            f"Запрос {method} {url} выполнен успешно "
-                            f"после {retry_count} попыток в течение {elapsed:.2f}с "
-                            f"(status: {response.status_code})"
-                        )
+            if attempt > 1 and self.logger is not None:
+                self.logger.info(
+                    f"Запрос {method} {url} выполнен успешно "
+                    f"после {attempt} попыток в течение {time.monotonic() - started_at:.2f}с "
+                    f"(status: {response.status_code})"
+                )
 
-                    return response
+            return response
 
-                except Exception as e:
-                    last_exception = e
-                    elapsed = (datetime.now() - start_time).total_seconds()
+    def _retry_delay(
+            self,
+            method: str,
+            err: Exception,
+            attempt: int,
+            deadline_at: float = None
+    ) -> float | None:
+        if attempt > self.retry_count or not self.retry_policy.should_retry(method, err):
+            return None
+
+        delay = self.backoff(attempt)
+        if deadline_at is not None and time.monotonic() + delay >= deadline_at:
+            return None
+
+        if not self.retry_budget.withdraw():
+            if self._retry_counter is not None:
+                self._retry_counter.add(1, attributes={"name": self.base_url, "outcome": "budget_exhausted"})
+            return None
+
+        if self._retry_counter is not None:
+            self._retry_counter.add(1, attributes={"name": self.base_url, "outcome": "retried"})
+        return delay
+
+    async def _attempt(
+            self,
+            method: str,
+            url: str,
+            deadline_at: float = None,
+            **kwargs
+    ) -> httpx.Response:
+        execute = self._execute_request
+        if self._latency is not None and method in HEDGE_METHODS:
+            execute = self._execute_hedged
 
-                    if retry_count < self.retry_count - 1:  # Есть еще попытки
-                        next_delay = self.backoff(attempt.retry_state)
-                        self.logger.warning(
-                            f"Запрос {method} {url} неуспешен "
-                            f"(попытка {retry_count + 1}/{self.retry_count}) "
-                            f"за {elapsed:.2f}с. Следующая попытка через {next_delay:.2f}с. "
-                            f"Ошибка: {e.__class__.__name__}: {str(e)}"
-                        )
-                    else:
-                        self.logger.error(
-                            f"Запрос {method} {url} окончательно провален "
-                            f"после {retry_count + 1} попыток за {elapsed:.2f}с. "
-                            f"Ошибка: {e.__class__.__name__}: {str(e)}"
-                        )
+        if deadline_at is None:
+            return await execute(method, url, **kwargs)
 
-                    raise
-        return None
+        remaining = deadline_at - time.monotonic()
+        if remaining <= 0:
+            raise DeadlineExceededError(f"Дедлайн запроса {method} {url} истек")
+
+        timeout = kwargs.get('timeout', self.timeout)
+        if isinstance(timeout, (int, float)):
+            kwargs['timeout'] = min(timeout, remaining)
+
+        try:
+            return await asyncio.wait_for(execute(method, url, **kwargs), remaining)
+        except asyncio.TimeoutError:
+            raise DeadlineExceededError(f"Дедлайн запроса {method} {url} истек")
+
+    async def _execute_hedged(
+            self,
+            method: str,
+            url: str,
+            **kwargs
+    ) -> httpx.Response:
+        route = f"{method} {url}"
+        self._hedge_budget.deposit()
+
+        threshold = self._latency.threshold(route)
+        if threshold is None:
+            return await self._execute_request(method, url, **kwargs)
+
+        started_at = time.monotonic()
+        primary = asyncio.ensure_future(self._execute_request(method, url, **kwargs))
+        tasks = [primary]
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=max(threshold, self.hedge_min_delay))
+            if not done and self._hedge_budget.withdraw():
+                tasks.append(asyncio.ensure_future(self._execute_request(method, url, **kwargs)))
+                if self._hedge_counter is not None:
+                    self._hedge_counter.add(1, attributes={"name": self.base_url})
+
+            # Берем первый успешный ответ: ошибка одной копии не отменяет вторую
+            pending = set(tasks)
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if task is not primary:
+                            self._on_hedge_won(route, primary, started_at)
+                        return task.result()
+
+            return primary.result()
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+                elif not task.cancelled():
+                    # Ошибку проигравшей копии забираем, чтобы asyncio не ругался на нее в логах
+                    task.exception()
+
+    def _on_hedge_won(self, route: str, primary: asyncio.Future, started_at: float):
+        if self._hedge_won_counter is not None:
+            self._hedge_won_counter.add(1, attributes={"name": self.base_url})
+
+        # Отмененный оригинал в окно сам не попадет, а без медленных ответов квантиль занижается
+        # и дублирование срабатывает все чаще. Его длительность не меньше прошедшего времени
+        if not primary.done():
+            self._latency.record(route, time.monotonic() - started_at)
 
     async def get(self, url: str, **kwargs) -> httpx.Response:
-        return await self._request_with_retry('GET', url, **kwargs)
+        key = self._singleflight_key(url, kwargs)
+        if key is None:
+            return await self._request_with_retry('GET', url, **kwargs)
+
+        return await self._singleflight.do(key, lambda: self._request_with_retry('GET', url, **kwargs))
+
+    def _singleflight_key(self, url: str, kwargs: dict) -> Hashable | None:
+        # Запросы с телом, таймаутом и прочими особыми опциями не склеиваем
+        if self._singleflight is None or not kwargs.keys() <= {"params", "headers", "cookies"}:
+            return None
+
+        headers = {name.lower(): value for name, value in (kwargs.get("headers") or {}).items()}
+        cookies = kwargs.get("cookies") or {}
+
+        return (
+            url,
+            str(httpx.QueryParams(kwargs.get("params") or {})),
+            tuple(headers.get(name) for name in self.singleflight_headers),
+            tuple(cookies.get(name) for name in self.singleflight_cookies),
+        )
 
     async def post(self, url: str, **kwargs) -> httpx.Response:
         return await self._request_with_retry('POST', url, **kwargs)
@@ -19,6 +19,7 @@ class NameAuthorizationClient(interface.INameAuthorizationClient):
             prefix="/api/authorization",
             use_tracing=True,
             logger=logger,
+            meter=tel.meter(),
         )
         self.tracer = tel.tracer()
 
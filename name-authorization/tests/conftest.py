@@ -0,0 +1,40 @@
+import pytest
+from opentelemetry import metrics, trace
+
+from internal import interface
+
+
+class FakeLogger(interface.IOtelLogger):
+    def __init__(self):
+        self.records: list[tuple[str, str, dict]] = []
+
+    def debug(self, message: str, fields: dict = None) -> None:
+        self.records.append(("debug", message, fields or {}))
+
+    def info(self, message: str, fields: dict = None) -> None:
+        self.records.append(("info", message, fields or {}))
+
+    def warning(self, message: str, fields: dict = None) -> None:
+        self.records.append(("warning", message, fields or {}))
+
+    def error(self, message: str, fields: dict = None) -> None:
+        self.records.append(("error", message, fields or {}))
+
+
+class FakeTelemetry(interface.ITelemetry):
+    def __init__(self):
+        self._logger = FakeLogger()
+
+    def tracer(self) -> trace.Tracer:
+        return trace.NoOpTracer()
+
+    def meter(self) -> metrics.Meter:
+        return metrics.NoOpMeter("test")
+
+    def logger(self) -> FakeLogger:
+        return self._logger
+
+
+@pytest.fixture
+def tel() -> FakeTelemetry:
+    return FakeTelemetry()
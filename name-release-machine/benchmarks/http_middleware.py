@@ -0,0 +1,166 @@
+"""Задержка запроса с тремя BaseHTTPMiddleware-слоями против одного ASGI-слоя.
+
+"До" — HttpMiddleware из коммита перед объединением (git show), "после" —
+текущий. Одно и то же FastAPI-приложение с реальными SDK трейсинга, метрик и
+логов (без экспорта) обслуживается uvicorn и, отдельно, вызывается в процессе
+через httpx.ASGITransport — так видна стоимость самого middleware без сети.
+Запуск из каталога сервиса:
+
+    python -m benchmarks.http_middleware
+"""
+import argparse
+import asyncio
+import logging
+import statistics
+import subprocess
+import time
+import types
+
+import httpx
+import uvicorn
+from fastapi import FastAPI, Request
+from opentelemetry import metrics, trace
+from opentelemetry.sdk._logs import LoggerProvider
+from opentelemetry.sdk.metrics import MeterProvider
+from opentelemetry.sdk.metrics.export import InMemoryMetricReader
+from opentelemetry.sdk.trace import ReadableSpan, SpanProcessor, TracerProvider
+
+from infrastructure.telemetry.logger import OtelLogger
+from internal import interface
+from internal.controller.http.middlerware import middleware as current_middleware
+
+_MIDDLEWARE_PATH = "internal/controller/http/middlerware/middleware.py"
+_BEFORE_REV = "7f16d74^"
+_PREFIX = "/api/release"
+
+
+class _CountingProcessor(SpanProcessor):
+    def __init__(self):
+        self.spans = 0
+
+    def on_end(self, span: ReadableSpan) -> None:
+        self.spans += 1
+
+
+class _Telemetry(interface.ITelemetry):
+    def __init__(self):
+        self.spans = _CountingProcessor()
+        tracer_provider = TracerProvider()
+        tracer_provider.add_span_processor(self.spans)
+
+        self._tracer = tracer_provider.get_tracer("benchmark")
+        self._meter = MeterProvider(metric_readers=[InMemoryMetricReader()]).get_meter("benchmark")
+        # Каждый OtelLogger вешает обработчик на общий logging.getLogger("main")
+        logging.getLogger("main").handlers.clear()
+        self._logger = OtelLogger(None, LoggerProvider(), "benchmark", "INFO")
+
+    def tracer(self) -> trace.Tracer:
+        return self._tracer
+
+    def meter(self) -> metrics.Meter:
+        return self._meter
+
+    def logger(self) -> OtelLogger:
+        return self._logger
+
+
+def _load_before(rev: str) -> types.ModuleType:
+    prefix = subprocess.run(["git", "rev-parse", "--show-prefix"], check=True, capture_output=True, text=True).stdout
+    source = subprocess.run(
+        ["git", "show", f"{rev}:{prefix.strip()}{_MIDDLEWARE_PATH}"],
+        check=True, capture_output=True, text=True,
+    ).stdout
+
+    module = types.ModuleType("internal.controller.http.middlerware._middleware_before")
+    exec(compile(source, f"{rev}:{_MIDDLEWARE_PATH}", "exec"), module.__dict__)
+    # Старый класс не реализует нынешний IHttpMiddleware, но для замера это не важно
+    module.HttpMiddleware.__abstractmethods__ = frozenset()
+    return module
+
+
+async def _release(request: Request) -> dict:
+    return {"trace_id": request.state.trace_id}
+
+
+def _app(version: str, before: types.ModuleType, tel: _Telemetry) -> FastAPI:
+    app = FastAPI()
+    app.add_api_route(_PREFIX + "/{release_id}", _release, methods=["GET"])
+
+    if version == "до":
+        http_middleware = before.HttpMiddleware(tel, _PREFIX)
+        # Порядок регистрации как в прежнем include_middleware: трейсинг — внешний слой
+        http_middleware.logger_middleware03(app)
+        http_middleware.metrics_middleware02(app)
+        http_middleware.trace_middleware01(app)
+    else:
+        current_middleware.HttpMiddleware(tel, _PREFIX).instrumentation_middleware01(app)
+    return app
+
+
+async def _load(client: httpx.AsyncClient, requests: int, concurrency: int) -> tuple[float, list[float]]:
+    latencies: list[float] = []
+    counter = iter(range(requests))
+
+    async def worker():
+        for i in counter:
+            started_at = time.perf_counter()
+            response = await client.get(f"{_PREFIX}/{i}")
+            response.raise_for_status()
+            latencies.append(time.perf_counter() - started_at)
+
+    started_at = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return requests / (time.perf_counter() - started_at), latencies
+
+
+async def _uvicorn(app: FastAPI, requests: int, concurrency: int) -> tuple[float, list[float]]:
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=0, log_level="warning", access_log=False))
+    serve_task = asyncio.create_task(server.serve())
+    while not server.started:
+        await asyncio.sleep(0.01)
+
+    port = server.servers[0].sockets[0].getsockname()[1]
+    try:
+        async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{port}") as client:
+            await _load(client, concurrency, concurrency)
+            return await _load(client, requests, concurrency)
+    finally:
+        server.should_exit = True
+        await serve_task
+
+
+async def _in_process(app: FastAPI, requests: int, concurrency: int) -> tuple[float, list[float]]:
+    async with httpx.AsyncClient(base_url="http://benchmark", transport=httpx.ASGITransport(app)) as client:
+        await _load(client, concurrency, concurrency)
+        return await _load(client, requests, concurrency)
+
+
+def _report(name: str, rps: float, latencies: list[float], spans: float):
+    latencies.sort()
+    p99 = latencies[min(int(len(latencies) * 0.99), len(latencies) - 1)]
+    print(
+        f"{name:<22} {rps:8,.0f} запросов/с  p50 {statistics.median(latencies) * 1e3:6.2f} мс  "
+        f"p99 {p99 * 1e3:6.2f} мс  {spans:.0f} спанов/запрос"
+    )
+
+
+async def main(requests: int, concurrency: int, rev: str):
+    before = _load_before(rev)
+
+    for transport, run in (("uvicorn", _uvicorn), ("в процессе", _in_process)):
+        for version in ("до", "после"):
+            tel = _Telemetry()
+            rps, latencies = await run(_app(version, before, tel), requests, concurrency)
+            _report(f"{transport}, {version}", rps, latencies, tel.spans.spans / (requests + concurrency))
+
+    logging.getLogger("main").handlers.clear()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=3000)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--before", default=_BEFORE_REV, help="ревизия со стековыми middleware")
+    args = parser.parse_args()
+
+    asyncio.run(main(args.requests, args.concurrency, args.before))
@@ -0,0 +1,95 @@
+"""Стоимость трассировки запроса при разных режимах сэмплинга.
+
+Запрос имитируется деревом спанов, как в сервисах: серверный спан
+middleware, контроллер, сервис с двумя приватными хелперами, репозиторий
+и два PG-запроса. Экспорт заменен счетчиком, поэтому замер показывает
+создание и запись спанов, а число экспортируемых спанов — нагрузку на
+экспорт. Запуск из каталога сервиса:
+
+    python -m benchmarks.sampling
+"""
+import argparse
+import time
+
+from opentelemetry.sdk.trace import ReadableSpan, SpanProcessor, TracerProvider
+from opentelemetry.sdk.trace.sampling import ALWAYS_ON, ParentBased, TraceIdRatioBased
+from opentelemetry.trace import SpanKind, Status, StatusCode
+
+from infrastructure.telemetry.sampling import SuppressingSampler, TailSamplingSpanProcessor
+
+_SUPPRESSED_SPANS = ["*.__*"]
+
+
+class _CountingProcessor(SpanProcessor):
+    def __init__(self):
+        self.exported = 0
+
+    def on_end(self, span: ReadableSpan) -> None:
+        self.exported += 1
+
+
+def _tracer_provider(ratio: float, tail: bool, suppress: bool) -> tuple[TracerProvider, _CountingProcessor]:
+    # Повторяет Telemetry._setup_tracing без OTLP-экспортера
+    sampler = ParentBased(ALWAYS_ON) if tail or ratio >= 1 else ParentBased(TraceIdRatioBased(ratio))
+    if suppress:
+        sampler = SuppressingSampler(sampler, _SUPPRESSED_SPANS)
+
+    counter = _CountingProcessor()
+    processor = TailSamplingSpanProcessor(counter, ratio, slow_threshold=1.0) if tail else counter
+
+    tracer_provider = TracerProvider(sampler=sampler)
+    tracer_provider.add_span_processor(processor)
+    return tracer_provider, counter
+
+
+def _request(tracer, failed: bool):
+    with tracer.start_as_current_span("POST /api/account/login", kind=SpanKind.SERVER) as root:
+        with tracer.start_as_current_span("AccountController.login"):
+            with tracer.start_as_current_span("AccountService.login"):
+                with tracer.start_as_current_span("AccountService.__verify_password"):
+                    pass
+                with tracer.start_as_current_span("AccountService.__verify_two_fa"):
+                    pass
+                with tracer.start_as_current_span("AccountRepo.account_by_login"):
+                    with tracer.start_as_current_span("PG.select", kind=SpanKind.CLIENT):
+                        pass
+                    with tracer.start_as_current_span("PG.update", kind=SpanKind.CLIENT) as span:
+                        if failed:
+                            span.set_status(Status(StatusCode.ERROR, "deadlock"))
+        root.set_status(Status(StatusCode.OK))
+
+
+def main(requests: int, ratio: float, error_every: int):
+    modes = [
+        ("ALWAYS_ON, все спаны (как было)", 1.0, False, False),
+        ("ALWAYS_ON, без приватных спанов", 1.0, False, True),
+        (f"head ratio {ratio:g}", ratio, False, True),
+        (f"tail ratio {ratio:g} + ошибки и медленные", ratio, True, True),
+    ]
+
+    baseline = None
+    for name, mode_ratio, tail, suppress in modes:
+        tracer_provider, counter = _tracer_provider(mode_ratio, tail, suppress)
+        tracer = tracer_provider.get_tracer("benchmark")
+
+        started_at = time.perf_counter()
+        for i in range(requests):
+            _request(tracer, failed=error_every > 0 and i % error_every == 0)
+        per_request = (time.perf_counter() - started_at) / requests
+        baseline = baseline or per_request
+
+        print(
+            f"{name:<42} {per_request * 1e6:7.1f} мкс/запрос ({per_request / baseline:4.0%}), "
+            f"экспорт {counter.exported / requests:4.2f} спанов/запрос"
+        )
+        tracer_provider.shutdown()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=20_000)
+    parser.add_argument("--ratio", type=float, default=0.1)
+    parser.add_argument("--error-every", type=int, default=100, help="каждый N-й запрос завершается ошибкой, 0 — без ошибок")
+    args = parser.parse_args()
+
+    main(args.requests, args.ratio, args.error_every)
@@ -0,0 +1,149 @@
+import asyncio
+from typing import Awaitable, Callable
+
+import asyncpg
+from opentelemetry.trace import Status, StatusCode, SpanKind
+
+from internal import interface
+
+
+class PGListener(interface.IDBListener):
+    """Выделенное asyncpg-соединение для LISTEN/NOTIFY вне пула SQLAlchemy"""
+
+    def __init__(
+            self,
+            tel: interface.ITelemetry,
+            db_user,
+            db_pass,
+            db_host,
+            db_port,
+            db_name,
+            reconnect_interval: float = 5,
+            health_check_interval: float = 30,
+            health_check_timeout: float = 5,
+    ):
+        self.tracer = tel.tracer()
+        self.logger = tel.logger()
+
+        self.db_user = db_user
+        self.db_pass = db_pass
+        self.db_host = db_host
+        self.db_port = db_port
+        self.db_name = db_name
+        self.reconnect_interval = reconnect_interval
+        # Без трафика полуоткрытое соединение не замечается, поэтому его периодически проверяет SELECT 1
+        self.health_check_interval = health_check_interval
+        self.health_check_timeout = health_check_timeout
+
+        self.handlers: dict[str, Callable[[str], Awaitable[None]]] = {}
+        self._task: asyncio.Task | None = None
+        self._handler_tasks: set[asyncio.Task] = set()
+
+    def listen(self, channel: str, handler: Callable[[str], Awaitable[None]]) -> None:
+        self.handlers[channel] = handler
+
+    async def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                conn = await asyncpg.connect(
+                    user=self.db_user,
+                    password=self.db_pass,
+                    host=self.db_host,
+                    port=self.db_port,
+                    database=self.db_name,
+                )
+            except asyncio.CancelledError:
+                raise
+            except Exception as err:
+                self.logger.warning(
+                    "Не удалось подключиться к PostgreSQL для LISTEN",
+                    {"error": str(err)}
+                )
+                await asyncio.sleep(self.reconnect_interval)
+                continue
+
+            closed = asyncio.Event()
+            conn.add_termination_listener(lambda _: closed.set())
+
+            try:
+                for channel in self.handlers:
+                    await conn.add_listener(channel, self._on_notification)
+
+                self.logger.info(f"Подписка на каналы PostgreSQL: {', '.join(self.handlers)}")
+                await self._watch(conn, closed)
+
+            except asyncio.CancelledError:
+                raise
+            except Exception as err:
+                self.logger.warning(
+                    "Ошибка соединения LISTEN с PostgreSQL",
+                    {"error": str(err)}
+                )
+            finally:
+                # Зависшее соединение не ответит на штатное закрытие
+                if not conn.is_closed():
+                    conn.terminate()
+
+            await asyncio.sleep(self.reconnect_interval)
+
+    async def _watch(self, conn: asyncpg.Connection, closed: asyncio.Event) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(closed.wait(), timeout=self.health_check_interval)
+                self.logger.warning("Соединение LISTEN с PostgreSQL разорвано, переподключаемся")
+                return
+            except asyncio.TimeoutError:
+                pass
+
+            try:
+                await asyncio.wait_for(conn.fetchval("SELECT 1"), timeout=self.health_check_timeout)
+            except asyncio.CancelledError:
+                raise
+            except Exception as err:
+                self.logger.warning(
+                    "Соединение LISTEN с PostgreSQL не отвечает, переподключаемся",
+                    {"error": str(err) or type(err).__name__}
+                )
+                return
+
+    def _on_notification(self, conn, pid: int, channel: str, payload: str) -> None:
+        handler = self.handlers.get(channel)
+        if handler is None:
+            return
+
+        # asyncpg вызывает колбэк синхронно, обработку выносим в отдельную задачу
+        task = asyncio.create_task(self._handle(channel, handler, payload))
+        self._handler_tasks.add(task)
+        task.add_done_callback(self._handler_tasks.discard)
+
+    async def _handle(self, channel: str, handler: Callable[[str], Awaitable[None]], payload: str) -> None:
+        with self.tracer.start_as_current_span(
+                "PGListener.handle",
+                kind=SpanKind.CONSUMER,
+                attributes={
+                    "db.notification.channel": channel,
+                }
+        ) as span:
+            try:
+                await handler(payload)
+                span.set_status(Status(StatusCode.OK))
+            except Exception as err:
+                span.record_exception(err)
+                span.set_status(Status(StatusCode.ERROR, str(err)))
+                self.logger.error(
+                    f"Ошибка обработки уведомления из канала {channel}",
+                    {"error": str(err), "payload": payload}
+                )
@@ -1,7 +1,7 @@
 import logging
-
-import inspect
-from typing import Union
+import sys
+from functools import lru_cache
+from types import CodeType
 
 from opentelemetry import trace
 from opentelemetry.sdk._logs import LoggerProvider, LoggingHandler
@@ -11,6 +11,26 @@ from internal import interface
 
 from .alertmanger import AlertManager
 
+_LEVELS = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARN": logging.WARNING,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+}
+
+
+@lru_cache(maxsize=4096)
+def _caller_info(code: CodeType, line_number: int) -> str:
+    # Место вызова повторяется от запроса к запросу, строку собираем один раз
+    return f"{code.co_filename}:{line_number}"
+
+
+@lru_cache(maxsize=1024)
+def _hex_ids(trace_id: int, span_id: int) -> tuple[str, str]:
+    # Все записи в пределах одного спана переиспользуют уже отформатированные id
+    return format(trace_id, '032x'), format(span_id, '016x')
+
 
 class OtelLogger(interface.IOtelLogger):
     def __init__(
@@ -18,92 +38,67 @@ class OtelLogger(interface.IOtelLogger):
             alert_manger: AlertManager | None,
             logger_provider: LoggerProvider,
             service_name: str,
+            log_level: str = "DEBUG",
     ):
+        self.level = _LEVELS.get(log_level.upper(), logging.INFO)
+
         self.handler = LoggingHandler(
-            level=logging.DEBUG,
+            level=self.level,
             logger_provider=logger_provider
         )
         self.service_name = service_name
+        self.prefix = service_name + " | "
         self.logger = logging.getLogger("main")
-        self.logger.setLevel(logging.DEBUG)
+        self.logger.setLevel(self.level)
         self.logger.addHandler(self.handler)
         self.logger.propagate = False
 
         self.alert_manger = alert_manger
 
     def log(self, level: str, message: str, fields: dict = None) -> None:
-        file_info = self._get_caller_info(3)
-        attributes: dict = {common.FILE_KEY: file_info}
-
-        if fields:
-            extra_fields = self._extract_extra_params(fields)
-            if extra_fields:
-                # attributes[common.EXTRA_LOG_FIELDS_KEY] = extra_fields
-                attributes.update(extra_fields)
+        self._log(_LEVELS.get(level.upper(), logging.INFO), message, fields)
 
-        current_span = trace.get_current_span()
-        if current_span and current_span.get_span_context().is_valid:
-            span_context = current_span.get_span_context()
+    def _log(self, level: int, message: str, fields: dict = None) -> None:
+        # Отброшенная по уровню запись не должна стоить ничего, кроме сравнения
+        if level < self.level:
+            return
 
-            trace_id = format(span_context.trace_id, '032x')
-            span_id = format(span_context.span_id, '016x')
+        # _log вызывается напрямую из debug/info/warning/error и из log — вызывающий код на 2 кадра выше
+        frame = sys._getframe(2)
+        attributes: dict = {common.FILE_KEY: _caller_info(frame.f_code, frame.f_lineno)}
 
-            attributes[common.TRACE_ID_KEY] =trace_id
-            attributes[common.SPAN_ID_KEY] =span_id
-
-            if level == "ERROR":
-                if self.alert_manger is not None:
-                    self.alert_manger.send_error_alert(
-                        trace_id,
-                        span_id,
-                        attributes.get(common.TRACEBACK_KEY, "")
-                    )
-
-        log_level = getattr(logging, level.upper(), logging.INFO)
-        self.logger.log(log_level, self.service_name + " | " + message, extra=attributes)
-
-
-
-    def _extract_extra_params(self, fields: dict) -> dict:
-        extra_attrs = {}
-        for key, value in fields.items():
-            if value is None:
-                value = ""
-
-            extra_attrs[key] = self._convert_value(value)
-        return extra_attrs
-
-    def _convert_value(self, value) -> Union[str, int, float, bool]:
-        if isinstance(value, (str, int, float, bool)):
-            return value
-        return str(value)
+        if fields:
+            for key, value in fields.items():
+                if value is None:
+                    value = ""
+                elif not isinstance(value, (str, int, float, bool)):
+                    value = str(value)
+                attributes[key] = value
 
-    def _get_caller_info(self, skip: int) -> str:
-        try:
-            frame = inspect.currentframe()
-            for _ in range(skip):
-                if frame is None:
-                    break
-                frame = frame.f_back
+        span_context = trace.get_current_span().get_span_context()
+        if span_context.is_valid:
+            trace_id, span_id = _hex_ids(span_context.trace_id, span_context.span_id)
 
-            if frame is None:
-                return "unknown:0"
+            attributes[common.TRACE_ID_KEY] = trace_id
+            attributes[common.SPAN_ID_KEY] = span_id
 
-            filename = frame.f_code.co_filename
-            line_number = frame.f_lineno
+            if level >= logging.ERROR and self.alert_manger is not None:
+                self.alert_manger.send_error_alert(
+                    trace_id,
+                    span_id,
+                    attributes.get(common.TRACEBACK_KEY, "")
+                )
 
-            return f"{filename}:{line_number}"
-        except Exception:
-            return "unknown:0"
+        self.logger.log(level, self.prefix + message, extra=attributes)
 
     def debug(self, message: str, fields: dict = None) -> None:
-        self.log("DEBUG", message, fields)
+        self._log(logging.DEBUG, message, fields)
 
     def info(self, message: str, fields: dict = None) -> None:
-        self.log("INFO", message, fields)
+        self._log(logging.INFO, message, fields)
 
     def warning(self, message: str, fields: dict = None) -> None:
-        self.log("WARN", message, fields)
+        self._log(logging.WARNING, message, fields)
 
     def error(self, message: str, fields: dict = None) -> None:
-        self.log("ERROR", message, fields)
+        self._log(logging.ERROR, message, fields)
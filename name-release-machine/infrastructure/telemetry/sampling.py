@@ -0,0 +1,121 @@
+import threading
+from collections import OrderedDict
+from fnmatch import fnmatchcase
+from typing import Optional, Sequence
+
+from opentelemetry import trace
+from opentelemetry.context import Context
+from opentelemetry.sdk.trace import ReadableSpan, SpanProcessor
+from opentelemetry.sdk.trace.sampling import Decision, Sampler, SamplingResult, TraceIdRatioBased
+from opentelemetry.trace import Link, SpanKind, StatusCode
+from opentelemetry.trace.span import TraceState
+from opentelemetry.util.types import Attributes
+
+
+class SuppressingSampler(Sampler):
+    """Не записывает служебные спаны с именами по шаблонам, остальные решает вложенный сэмплер"""
+
+    def __init__(self, delegate: Sampler, patterns: Sequence[str]):
+        self.delegate = delegate
+        self.patterns = tuple(patterns)
+        # Имен спанов конечное число, fnmatch на каждое считаем один раз
+        self._suppressed: dict[str, bool] = {}
+
+    def should_sample(
+            self,
+            parent_context: Optional[Context],
+            trace_id: int,
+            name: str,
+            kind: SpanKind = None,
+            attributes: Attributes = None,
+            links: Sequence[Link] = None,
+            trace_state: TraceState = None,
+    ) -> SamplingResult:
+        suppressed = self._suppressed.get(name)
+        if suppressed is None:
+            suppressed = self._suppressed[name] = any(fnmatchcase(name, pattern) for pattern in self.patterns)
+
+        if suppressed:
+            parent_span_context = trace.get_current_span(parent_context).get_span_context()
+            return SamplingResult(Decision.DROP, None, parent_span_context.trace_state)
+
+        return self.delegate.should_sample(parent_context, trace_id, name, kind, attributes, links, trace_state)
+
+    def get_description(self) -> str:
+        return f"SuppressingSampler{{{self.delegate.get_description()}}}"
+
+
+class TailSamplingSpanProcessor(SpanProcessor):
+    """Копит спаны трейса до завершения локального корня и только тогда решает, экспортировать ли
+    трейс: ошибки и медленные трейсы сохраняются всегда, остальные — с долей ratio по trace_id"""
+
+    def __init__(
+            self,
+            delegate: SpanProcessor,
+            ratio: float,
+            slow_threshold: float,
+            max_traces: int = 10000,
+            max_spans_per_trace: int = 512,
+    ):
+        self.delegate = delegate
+        # Та же граница, что у TraceIdRatioBased: решение по трейсу совпадает с head-сэмплингом соседей
+        self.bound = TraceIdRatioBased.get_bound_for_rate(ratio)
+        self.slow_threshold_ns = int(slow_threshold * 1e9)
+        self.max_traces = max_traces
+        self.max_spans_per_trace = max_spans_per_trace
+
+        self._traces: OrderedDict[int, list[ReadableSpan]] = OrderedDict()
+        # Решения по уже закрытым трейсам — для спанов, завершившихся после корня
+        self._decisions: OrderedDict[int, bool] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def on_start(self, span, parent_context: Optional[Context] = None) -> None:
+        self.delegate.on_start(span, parent_context=parent_context)
+
+    def on_end(self, span: ReadableSpan) -> None:
+        trace_id = span.context.trace_id
+        is_local_root = span.parent is None or span.parent.is_remote
+
+        with self._lock:
+            keep = self._decisions.get(trace_id)
+            if keep is not None:
+                spans = [span] if keep else []
+            else:
+                spans = self._traces.get(trace_id)
+                if spans is None:
+                    spans = self._traces[trace_id] = []
+                    while len(self._traces) > self.max_traces:
+                        self._traces.popitem(last=False)
+
+                if len(spans) < self.max_spans_per_trace:
+                    spans.append(span)
+
+                if not is_local_root:
+                    return
+
+                del self._traces[trace_id]
+                keep = self._should_keep(trace_id, span, spans)
+                self._decisions[trace_id] = keep
+                while len(self._decisions) > self.max_traces:
+                    self._decisions.popitem(last=False)
+
+                if not keep:
+                    spans = []
+
+        for kept_span in spans:
+            self.delegate.on_end(kept_span)
+
+    def _should_keep(self, trace_id: int, root: ReadableSpan, spans: list[ReadableSpan]) -> bool:
+        if any(span.status.status_code == StatusCode.ERROR for span in spans):
+            return True
+
+        if root.end_time - root.start_time >= self.slow_threshold_ns:
+            return True
+
+        return trace_id & TraceIdRatioBased.TRACE_ID_LIMIT < self.bound
+
+    def shutdown(self) -> None:
+        self.delegate.shutdown()
+
+    def force_flush(self, timeout_millis: int = 30000) -> bool:
+        return self.delegate.force_flush(timeout_millis)
@@ -1,10 +1,14 @@
 from fastapi import FastAPI
+from fastapi.responses import JSONResponse
 
 from internal import model, interface
 
 
 def NewServer(
         db: interface.IDB,
+        db_listener: interface.IDBListener,
+        release_reconciler: interface.IReleaseReconciler,
+        readiness_service: interface.IReadinessService,
         http_middleware: interface.IHttpMiddleware,
         tg_webhook_controller: interface.ITelegramWebhookController,
         release_controller: interface.IReleaseController,
@@ -16,8 +20,11 @@ def NewServer(
         redoc_url=prefix + "/redoc",
     )
     include_http_middleware(app, http_middleware)
+    include_db_listener(app, db_listener)
+    include_release_reconciler(app, release_reconciler)
 
     include_db_handler(app, db, prefix)
+    include_readiness_handler(app, readiness_service, prefix)
     include_tg_webhook(app, tg_webhook_controller, prefix)
     include_release_handlers(app, release_controller, prefix)
 
@@ -28,9 +35,23 @@ def include_http_middleware(
         app: FastAPI,
         http_middleware: interface.IHttpMiddleware
 ):
-    http_middleware.logger_middleware03(app)
-    http_middleware.metrics_middleware02(app)
-    http_middleware.trace_middleware01(app)
+    http_middleware.instrumentation_middleware01(app)
+
+
+def include_db_listener(
+        app: FastAPI,
+        db_listener: interface.IDBListener
+):
+    app.add_event_handler("startup", db_listener.start)
+    app.add_event_handler("shutdown", db_listener.stop)
+
+
+def include_release_reconciler(
+        app: FastAPI,
+        release_reconciler: interface.IReleaseReconciler
+):
+    app.add_event_handler("startup", release_reconciler.start)
+    app.add_event_handler("shutdown", release_reconciler.stop)
 
 
 def include_tg_webhook(
@@ -72,11 +93,49 @@ def include_release_handlers(
         description="Обновляет статус существующего релиза"
     )
 
+    # Аналитика релизного процесса
+    app.add_api_route(
+        prefix + "/release/analytics",
+        release_controller.get_dora_metrics,
+        methods=["GET"],
+        summary="DORA-метрики релизов",
+        description="Частота деплоев, lead time, доля неудачных изменений и время восстановления по сервисам"
+    )
+
+    # Одновременный откат нескольких сервисов
+    app.add_api_route(
+        prefix + "/release/rollback",
+        release_controller.rollback_batch,
+        methods=["POST"],
+        status_code=202,
+        summary="Пакетный откат сервисов",
+        description="Запускает параллельный откат нескольких сервисов на указанные или предыдущие версии"
+    )
+
 
 def include_db_handler(app: FastAPI, db: interface.IDB, prefix):
     app.add_api_route(prefix + "/table/create", create_table_handler(db), methods=["GET"])
     app.add_api_route(prefix + "/table/drop", drop_table_handler(db), methods=["GET"])
-    app.add_api_route(prefix + "/health", heath_check_handler(), methods=["GET"])
+
+
+def include_readiness_handler(app: FastAPI, readiness_service: interface.IReadinessService, prefix: str):
+    # Прогрев в startup завершается до того, как uvicorn начнет принимать соединения
+    app.add_event_handler("startup", readiness_service.warmup)
+    app.add_api_route(prefix + "/ready", ready_check_handler(readiness_service), methods=["GET"])
+    # /health опрашивают деплой и мониторинг: он отдает тот же кешированный результат, что и /ready,
+    # чтобы частые пробы не ходили в зависимости каждая сама по себе
+    app.add_api_route(prefix + "/health", ready_check_handler(readiness_service), methods=["GET"])
+
+
+def ready_check_handler(readiness_service: interface.IReadinessService):
+    async def ready_check():
+        ready, checks = await readiness_service.check()
+        return JSONResponse(
+            status_code=200 if ready else 503,
+            content={"status": "ok" if ready else "unavailable", **checks},
+        )
+
+    return ready_check
 
 
 def create_table_handler(db: interface.IDB):
@@ -89,13 +148,6 @@ def create_table_handler(db: interface.IDB):
     return create_table
 
 
-def heath_check_handler():
-    async def heath_check():
-        return "ok"
-
-    return heath_check
-
-
 def drop_table_handler(db: interface.IDB):
     async def delete_table():
         try:
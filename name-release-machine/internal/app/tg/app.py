@@ -8,6 +8,7 @@ from internal import interface
 def NewTg(
         dp: Dispatcher,
         command_controller: interface.ICommandController,
+        release_notify_service: interface.IReleaseNotifyService,
         main_menu_dialog: interface.IMainMenuDialog,
         active_release_dialog: interface.IActiveReleaseDialog,
         successful_releases_dialog: interface.ISuccessfulReleasesDialog,
@@ -25,6 +26,9 @@ def NewTg(
         failed_releases_dialog
     )
 
+    # Push-обновления статусов релизов перерисовывают открытые диалоги через фоновые менеджеры
+    release_notify_service.set_bg_factory(dialog_bg_factory)
+
     return dialog_bg_factory
 
 
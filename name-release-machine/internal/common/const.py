@@ -12,6 +12,8 @@ TRACEBACK_KEY = "traceback"
 HTTP_METHOD_KEY = "http.request.method"
 HTTP_STATUS_KEY = "http.response.status_code"
 HTTP_ROUTE_KEY = "http.route"
+HTTP_STATUS_CLASS_KEY = "http.response.status_class"
+METRIC_OVERFLOW_KEY = "otel.metric.overflow"
 HTTP_REQUEST_DURATION_KEY = "http.server.request.duration"
 
 CRM_SYSTEM_NAME_KEY = "crm.system.name"
@@ -40,6 +42,19 @@ ERROR_JOIN_CHAT_TOTAL_METRIC = "telegram.server.error.join_chat.total"
 MESSAGE_DURATION_METRIC = "telegram.server.message.duration"
 ACTIVE_MESSAGES_METRIC = "telegram.server.active_messages"
 
+RELEASE_CACHE_HIT_TOTAL_METRIC = "release.cache.hit.total"
+RELEASE_CACHE_MISS_TOTAL_METRIC = "release.cache.miss.total"
+
+DEPLOY_STEP_DURATION_METRIC = "deploy.step.duration"
+DEPLOY_STEP_TOTAL_METRIC = "deploy.step.total"
+
+RELEASE_RECONCILED_TOTAL_METRIC = "release.reconciled.total"
+
+RELEASE_CHANGED_CHANNEL = "release_changed"
+
+# Самый длинный период DORA-аналитики в днях
+DORA_METRICS_MAX_DAYS = 365
+
 TRACE_ID_HEADER = "X-Trace-ID"
 SPAN_ID_HEADER = "X-Span-ID"
 
@@ -1,3 +1,19 @@
 class ValidationError(Exception):
     """Ошибка валидации пользовательского ввода"""
     pass
+
+
+class RollbackInProgressError(ValidationError):
+    """Сервис уже откатывается, второй откат того же сервиса запрещен"""
+
+    def __init__(self, service_name: str):
+        self.service_name = service_name
+        super().__init__(f"Сервис {service_name} уже откатывается")
+
+
+class GitHubRateLimitError(Exception):
+    """Квота GitHub API исчерпана дольше, чем готов ждать вызывающий"""
+
+    def __init__(self, retry_in: float):
+        self.retry_in = retry_in
+        super().__init__(f"Квота GitHub API исчерпана, повтор через {retry_in:.0f}с")
@@ -16,9 +16,32 @@ class Config:
         self.prod_host: str = os.environ.get("PROD_HOST")
         self.prod_password: str = os.environ.get("PROD_PASSWORD")
         self.prod_domain: str = os.environ.get("PROD_DOMAIN")
+        self.prod_ssh_max_sessions = int(os.getenv("PROD_SSH_MAX_SESSIONS", "8"))
+        self.prod_ssh_keepalive_interval = float(os.getenv("PROD_SSH_KEEPALIVE_INTERVAL", "15"))
+        self.rollback_log_tail_lines = int(os.getenv("NAME_RELEASE_TG_BOT_ROLLBACK_LOG_TAIL_LINES", "30"))
+        # Telegram ограничивает частоту редактирования сообщений, чаще раза в пару секунд обновлять не стоит
+        self.rollback_log_flush_interval = float(os.getenv("NAME_RELEASE_TG_BOT_ROLLBACK_LOG_FLUSH_INTERVAL", "3"))
+        # Сколько сервисов пакетного отката выполняются одновременно, не больше PROD_SSH_MAX_SESSIONS
+        self.rollback_concurrency = int(os.getenv("NAME_RELEASE_TG_BOT_ROLLBACK_CONCURRENCY", "3"))
 
         self.required_approve_list = ["gommgo"]
         self.admins = ["gommgo"]
+        # Токен заголовка X-Rollback-Token для POST /release/rollback; пустой выключает эндпоинт
+        self.rollback_api_token = os.getenv("NAME_RELEASE_TG_BOT_ROLLBACK_API_TOKEN", "")
+        self.release_page_size = int(os.getenv("NAME_RELEASE_TG_BOT_RELEASE_PAGE_SIZE", "10"))
+        # Допустимая устаревшность кеша релизов в секундах, 0 отключает кеш
+        self.release_cache_ttl = float(os.getenv("NAME_RELEASE_TG_BOT_RELEASE_CACHE_TTL", "5"))
+        self.release_analytics_cache_ttl = float(os.getenv("NAME_RELEASE_TG_BOT_RELEASE_ANALYTICS_CACHE_TTL", "300"))
+        self.release_cache_max_size = int(os.getenv("NAME_RELEASE_TG_BOT_RELEASE_CACHE_MAX_SIZE", "256"))
+        # Через сколько секунд без открытия списков релизов пользователь перестает получать push-обновления
+        self.release_notify_subscription_ttl = float(os.getenv("NAME_RELEASE_TG_BOT_RELEASE_NOTIFY_TTL", "1800"))
+        # Минимальный интервал в секундах между push-обновлениями окна одного пользователя
+        self.release_notify_update_interval = float(os.getenv("NAME_RELEASE_TG_BOT_RELEASE_NOTIFY_INTERVAL", "1"))
+        # Сверка активных релизов с GitHub Actions: период в секундах (0 отключает), параллельность запросов
+        # и сколько секунд после завершения запуска ждать финального PATCH от самого workflow
+        self.release_reconcile_interval = float(os.getenv("NAME_RELEASE_TG_BOT_RELEASE_RECONCILE_INTERVAL", "60"))
+        self.release_reconcile_concurrency = int(os.getenv("NAME_RELEASE_TG_BOT_RELEASE_RECONCILE_CONCURRENCY", "5"))
+        self.release_reconcile_grace_period = float(os.getenv("NAME_RELEASE_TG_BOT_RELEASE_RECONCILE_GRACE", "120"))
 
         self.service_port_map = {
             os.getenv("NAME_TG_BOT_CONTAINER_NAME"): int(os.getenv("NAME_TG_BOT_PORT")),
@@ -61,4 +84,31 @@ class Config:
 
         # Настройки OpenTelemetry
         self.otlp_host = os.getenv("NAME_OTEL_COLLECTOR_CONTAINER_NAME", "name-otel-collector")
-        self.otlp_port = int(os.getenv("NAME_OTEL_COLLECTOR_GRPC_PORT", "4317"))
\ No newline at end of file
+        self.otlp_port = int(os.getenv("NAME_OTEL_COLLECTOR_GRPC_PORT", "4317"))
+        # Экспорт телеметрии из отдельного потока через кольцевой буфер; при переполнении
+        # drop_oldest вытесняет старые записи, sample прореживает новые (ошибки сохраняются)
+        self.otel_export_worker = os.getenv("NAME_OTEL_EXPORT_WORKER", "false").lower() == "true"
+        self.otel_export_queue_size = int(os.getenv("NAME_OTEL_EXPORT_QUEUE_SIZE", "8192"))
+        self.otel_export_overflow_policy = os.getenv("NAME_OTEL_EXPORT_OVERFLOW_POLICY", "drop_oldest")
+        # Доля сохраняемых трейсов: на prod по умолчанию 10%, в остальных окружениях все.
+        # Решение принимается в начале трейса (head) и передается соседним сервисам в traceparent.
+        # Хвостовой сэмплинг включается явно: он дополнительно сохраняет трейсы с ошибками и дольше
+        # порога в секундах, но записывает и держит в памяти все спаны до завершения корня
+        self.otel_trace_sample_ratio = float(os.getenv(
+            "NAME_OTEL_TRACE_SAMPLE_RATIO",
+            "0.1" if self.environment == "prod" else "1.0"
+        ))
+        self.otel_tail_sampling = os.getenv(
+            "NAME_OTEL_TAIL_SAMPLING",
+            "false"
+        ).lower() == "true"
+        self.otel_slow_trace_threshold = float(os.getenv("NAME_OTEL_SLOW_TRACE_THRESHOLD", "1.0"))
+        # Шаблоны имен служебных спанов, которые не записываются; по умолчанию приватные хелперы Class.__method
+        self.otel_suppressed_spans = [
+            pattern.strip()
+            for pattern in os.getenv("NAME_OTEL_SUPPRESSED_SPANS", "*.__*").split(",")
+            if pattern.strip()
+        ]
+
+        # Предел числа серий HTTP метрик; новые комбинации атрибутов сверх него уходят в overflow-серию
+        self.http_metrics_max_series = int(os.getenv("NAME_HTTP_METRICS_MAX_SERIES", "1000"))
@@ -1,19 +1,32 @@
+import asyncio
+import hmac
+from typing import Annotated
+
+from fastapi import Header
 from fastapi.responses import JSONResponse
 from opentelemetry.trace import SpanKind, Status, StatusCode
 
-from internal import interface
-from internal.controller.http.handler.release.model import CreateReleaseBody, UpdateReleaseBody
+from internal import interface, model, common
+from internal.controller.http.handler.release.model import CreateReleaseBody, UpdateReleaseBody, RollbackBatchBody
 
 
 class ReleaseController(interface.IReleaseController):
     def __init__(
             self,
             tel: interface.ITelemetry,
-            release_service: interface.IReleaseService
+            release_service: interface.IReleaseService,
+            admins: list[str],
+            rollback_api_token: str,
     ):
         self.tracer = tel.tracer()
         self.logger = tel.logger()
         self.release_service = release_service
+        self.admins = admins
+        # Пустой токен выключает пакетный откат через HTTP
+        self.rollback_api_token = rollback_api_token
+
+        # Пакетный откат идет минутами, поэтому HTTP-запрос его только запускает
+        self.rollback_tasks: set[asyncio.Task] = set()
 
     async def create_release(self, body: CreateReleaseBody) -> JSONResponse:
         with self.tracer.start_as_current_span(
@@ -82,4 +95,109 @@ class ReleaseController(interface.IReleaseController):
             except Exception as err:
                 span.record_exception(err)
                 span.set_status(Status(StatusCode.ERROR, str(err)))
-                raise
\ No newline at end of file
+                raise
+
+    async def get_dora_metrics(self, days: int = 30) -> JSONResponse:
+        with self.tracer.start_as_current_span(
+                "ReleaseController.get_dora_metrics",
+                kind=SpanKind.INTERNAL,
+                attributes={
+                    "days": days,
+                }
+        ) as span:
+            try:
+                # Слишком длинный период сканирует всю историю событий и переполняет timedelta
+                if not 0 < days <= common.DORA_METRICS_MAX_DAYS:
+                    span.set_status(Status(StatusCode.OK))
+                    return JSONResponse(
+                        status_code=400,
+                        content={"message": f"days must be between 1 and {common.DORA_METRICS_MAX_DAYS}"},
+                    )
+
+                metrics = await self.release_service.get_dora_metrics(days)
+
+                span.set_status(Status(StatusCode.OK))
+                return JSONResponse(
+                    status_code=200,
+                    content={
+                        "days": days,
+                        "services": [service_metrics.to_dict() for service_metrics in metrics],
+                    },
+                )
+
+            except Exception as err:
+                span.record_exception(err)
+                span.set_status(Status(StatusCode.ERROR, str(err)))
+                raise
+
+    async def rollback_batch(
+            self,
+            body: RollbackBatchBody,
+            x_rollback_token: Annotated[str | None, Header()] = None
+    ) -> JSONResponse:
+        with self.tracer.start_as_current_span(
+                "ReleaseController.rollback_batch",
+                kind=SpanKind.INTERNAL,
+                attributes={
+                    "services": ",".join(target.service_name for target in body.targets),
+                    "initiated_by": body.initiated_by,
+                }
+        ) as span:
+            try:
+                if not self.rollback_api_token or not hmac.compare_digest(
+                        (x_rollback_token or "").encode(),
+                        self.rollback_api_token.encode()
+                ):
+                    self.logger.warning("Отклонен запрос на пакетный откат с неверным токеном")
+                    span.set_status(Status(StatusCode.OK))
+                    return JSONResponse(
+                        status_code=401,
+                        content={"message": "invalid rollback token"},
+                    )
+
+                # Та же проверка, что и у кнопки отката в Telegram
+                if body.initiated_by not in self.admins:
+                    self.logger.warning(f"Пакетный откат запрошен не администратором: {body.initiated_by}")
+                    span.set_status(Status(StatusCode.OK))
+                    return JSONResponse(
+                        status_code=403,
+                        content={"message": "rollback is allowed only for admins"},
+                    )
+
+                self.logger.info(
+                    f"Получен запрос на пакетный откат сервисов: {', '.join(target.service_name for target in body.targets)}"
+                )
+
+                try:
+                    plan = await self.release_service.plan_rollback_batch([
+                        model.RollbackTarget(service_name=target.service_name, target_tag=target.target_tag)
+                        for target in body.targets
+                    ])
+                except common.RollbackInProgressError as err:
+                    span.set_status(Status(StatusCode.OK))
+                    return JSONResponse(
+                        status_code=409,
+                        content={"message": str(err)},
+                    )
+                except common.ValidationError as err:
+                    span.set_status(Status(StatusCode.OK))
+                    return JSONResponse(
+                        status_code=400,
+                        content={"message": str(err)},
+                    )
+
+                # Ход отката виден по статусам и rollback_log релизов из ответа
+                task = asyncio.create_task(self.release_service.rollback_batch(plan))
+                self.rollback_tasks.add(task)
+                task.add_done_callback(self.rollback_tasks.discard)
+
+                span.set_status(Status(StatusCode.OK))
+                return JSONResponse(
+                    status_code=202,
+                    content={"rollbacks": [progress.to_dict() for progress in plan]},
+                )
+
+            except Exception as err:
+                span.record_exception(err)
+                span.set_status(Status(StatusCode.ERROR, str(err)))
+                raise
@@ -16,4 +16,12 @@ class UpdateReleaseBody(BaseModel):
     release_id: int
     status: model.ReleaseStatus = None
     github_run_id: str = None
-    github_action_link: str = None
\ No newline at end of file
+    github_action_link: str = None
+
+class RollbackTargetBody(BaseModel):
+    service_name: str
+    target_tag: str = None
+
+class RollbackBatchBody(BaseModel):
+    targets: list[RollbackTargetBody]
+    initiated_by: str
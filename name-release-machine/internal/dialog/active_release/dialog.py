@@ -32,6 +32,8 @@ class ActiveReleaseDialog(interface.IActiveReleaseDialog):
                 Case(
                     {
                         True: Multi(
+                            Format("🗓️ <i>{period_text}</i><br>"),
+                            Format("{services_text}<br>"),
                             Format("📦 <b>{service_name}</b><br>"),
                             Case(
                                 {
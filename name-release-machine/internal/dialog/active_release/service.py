@@ -12,12 +12,14 @@ class ActiveReleaseService(interface.IActiveReleaseService):
             self,
             tel: interface.ITelemetry,
             release_service: interface.IReleaseService,
+            release_notify_service: interface.IReleaseNotifyService,
             github_client: interface.IGitHubClient,
             required_approve_list: list[str]
     ):
         self.tracer = tel.tracer()
         self.logger = tel.logger()
         self.release_service = release_service
+        self.release_notify_service = release_notify_service
         self.github_client = github_client
         self.required_approve_list = required_approve_list
 
@@ -34,13 +36,13 @@ class ActiveReleaseService(interface.IActiveReleaseService):
         ) as span:
             try:
                 current_index = dialog_manager.dialog_data.get("current_index", 0)
-                releases_list = dialog_manager.dialog_data.get("releases_list", [])
+                total_count = dialog_manager.dialog_data.get("total_count", 0)
 
                 # Определяем направление навигации
                 if button.widget_id == "prev_release":
                     new_index = max(0, current_index - 1)
                 else:  # next_release
-                    new_index = min(len(releases_list) - 1, current_index + 1)
+                    new_index = min(total_count - 1, current_index + 1)
 
                 if new_index == current_index:
                     await callback.answer()
@@ -78,7 +80,8 @@ class ActiveReleaseService(interface.IActiveReleaseService):
                 dialog_manager.dialog_data["current_index"] = 0
 
                 # Очищаем кешированные данные
-                dialog_manager.dialog_data.pop("releases_list", None)
+                dialog_manager.dialog_data.pop("page_cursors", None)
+                dialog_manager.dialog_data.pop("total_count", None)
                 dialog_manager.dialog_data.pop("current_release", None)
 
                 await callback.answer("✅ Данные обновлены")
@@ -109,6 +112,9 @@ class ActiveReleaseService(interface.IActiveReleaseService):
                 # Очищаем данные диалога
                 dialog_manager.dialog_data.clear()
 
+                # Вне списков релизов push-обновления не нужны
+                self.release_notify_service.unsubscribe(callback.from_user.id, callback.message.chat.id)
+
                 await dialog_manager.start(model.MainMenuStates.main_menu)
 
                 self.logger.info("Возврат в главное меню")
@@ -261,18 +267,16 @@ class ActiveReleaseService(interface.IActiveReleaseService):
                 raise err
 
     async def _remove_current_release_from_list(self, dialog_manager: DialogManager) -> None:
-        """Удаляет текущий релиз из списка и корректирует индекс"""
-        releases_list = dialog_manager.dialog_data.get("releases_list", [])
+        """Убирает текущий релиз из навигации и корректирует индекс"""
+        # Релиз больше не активен: страница перезагрузится по тому же курсору уже без него
+        total_count = max(0, dialog_manager.dialog_data.get("total_count", 0) - 1)
         current_index = dialog_manager.dialog_data.get("current_index", 0)
 
-        if releases_list and current_index < len(releases_list):
-            releases_list.pop(current_index)
+        dialog_manager.dialog_data["total_count"] = total_count
 
-            # Корректируем индекс если нужно
-            if current_index >= len(releases_list) and releases_list:
-                dialog_manager.dialog_data["current_index"] = len(releases_list) - 1
-            elif not releases_list:
-                dialog_manager.dialog_data["current_index"] = 0
+        # Корректируем индекс если нужно
+        if current_index >= total_count:
+            dialog_manager.dialog_data["current_index"] = max(0, total_count - 1)
 
-            # Очищаем данные текущего релиза
-            dialog_manager.dialog_data.pop("current_release", None)
\ No newline at end of file
+        # Очищаем данные текущего релиза
+        dialog_manager.dialog_data.pop("current_release", None)
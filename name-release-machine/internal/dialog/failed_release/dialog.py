@@ -31,6 +31,7 @@ class FailedReleasesDialog(interface.IFailedReleasesDialog):
                 Case(
                     {
                         True: Multi(
+                            Format("{services_text}<br>"),
                             Format("📦 <b>{service_name}</b><br>"),
                             Case(
                                 {
@@ -9,11 +9,15 @@ class FailedReleasesGetter(interface.IFailedReleasesGetter):
     def __init__(
             self,
             tel: interface.ITelemetry,
-            release_repo: interface.IReleaseRepo
+            release_repo: interface.IReleaseRepo,
+            release_notify_service: interface.IReleaseNotifyService,
+            page_size: int
     ):
         self.tracer = tel.tracer()
         self.logger = tel.logger()
         self.release_repo = release_repo
+        self.release_notify_service = release_notify_service
+        self.page_size = page_size
 
     async def get_releases_data(
             self,
@@ -25,21 +29,23 @@ class FailedReleasesGetter(interface.IFailedReleasesGetter):
                 kind=SpanKind.INTERNAL
         ) as span:
             try:
-                # Получаем провальные релизы
-                releases = await self.release_repo.get_failed_releases()
+                # Подписываем пользователя на push-обновления статусов релизов
+                self.release_notify_service.subscribe(
+                    dialog_manager.middleware_data["event_from_user"].id,
+                    dialog_manager.middleware_data["event_chat"].id,
+                )
 
-                if not releases:
+                # Считаем релизы отдельным запросом, чтобы не выгружать всю историю
+                stats = await self.release_repo.get_releases_stats(model.FAILED_RELEASE_STATUSES)
+                total_count = stats.total_count
+
+                if not total_count:
                     return {
                         "has_releases": False,
                         "total_count": 0,
                     }
 
-                # Сохраняем список для навигации
-                releases_list = []
-                for release in releases:
-                    releases_list.append(release.to_dict())
-
-                dialog_manager.dialog_data["releases_list"] = releases_list
+                dialog_manager.dialog_data["total_count"] = total_count
 
                 # Устанавливаем текущий индекс (0 если не был установлен)
                 if "current_index" not in dialog_manager.dialog_data:
@@ -48,11 +54,22 @@ class FailedReleasesGetter(interface.IFailedReleasesGetter):
                 current_index = dialog_manager.dialog_data["current_index"]
 
                 # Корректируем индекс если он выходит за границы
-                if current_index >= len(releases):
-                    current_index = len(releases) - 1
-                    dialog_manager.dialog_data["current_index"] = current_index
+                if current_index >= total_count:
+                    current_index = total_count - 1
+
+                # Загружаем только страницу с текущим релизом
+                releases, current_index = await self._load_page(dialog_manager, current_index)
+
+                if not releases:
+                    return {
+                        "has_releases": False,
+                        "total_count": 0,
+                    }
 
-                current_release = releases[current_index]
+                dialog_manager.dialog_data["current_index"] = current_index
+
+                page_index = min(current_index % self.page_size, len(releases) - 1)
+                current_release = releases[page_index]
 
                 # Форматируем данные релиза
                 release_data = {
@@ -68,10 +85,11 @@ class FailedReleasesGetter(interface.IFailedReleasesGetter):
 
                 data = {
                     "has_releases": True,
-                    "total_count": len(releases),
+                    "total_count": total_count,
+                    "services_text": self._format_services_text(stats),
                     "current_index": current_index + 1,
                     "has_prev": current_index > 0,
-                    "has_next": current_index < len(releases) - 1,
+                    "has_next": current_index < total_count - 1,
                     **release_data,
                 }
 
@@ -85,6 +103,43 @@ class FailedReleasesGetter(interface.IFailedReleasesGetter):
                 span.set_status(Status(StatusCode.ERROR, str(err)))
                 raise err
 
+    async def _load_page(
+            self,
+            dialog_manager: DialogManager,
+            current_index: int
+    ) -> tuple[list[model.Release], int]:
+        """Загружает страницу релизов, на которой находится текущий индекс"""
+        # Курсор страницы — (created_at, id) последнего релиза предыдущей страницы
+        page_cursors = dialog_manager.dialog_data.get("page_cursors") or [None]
+        page_number = current_index // self.page_size
+
+        # Навигация идет по одному релизу, поэтому курсор нужной страницы уже известен,
+        # иначе возвращаемся на начало последней известной страницы
+        if page_number >= len(page_cursors):
+            page_number = len(page_cursors) - 1
+            current_index = page_number * self.page_size
+
+        cursor = page_cursors[page_number]
+        releases = await self.release_repo.get_releases_page(
+            statuses=model.FAILED_RELEASE_STATUSES,
+            limit=self.page_size,
+            cursor_created_at=datetime.fromisoformat(cursor[0]) if cursor else None,
+            cursor_id=cursor[1] if cursor else None,
+        )
+
+        # Релизы могли сменить статус — начинаем навигацию заново
+        if not releases and page_number > 0:
+            dialog_manager.dialog_data["page_cursors"] = [None]
+            return await self._load_page(dialog_manager, 0)
+
+        page_cursors = page_cursors[:page_number + 1]
+        if len(releases) == self.page_size:
+            last_release = releases[-1]
+            page_cursors.append([last_release.created_at.isoformat(), last_release.id])
+
+        dialog_manager.dialog_data["page_cursors"] = page_cursors
+        return releases, current_index
+
     def _format_status(self, status: model.ReleaseStatus) -> str:
         """Форматирует статус релиза с эмодзи"""
         status_map = {
@@ -109,6 +164,14 @@ class FailedReleasesGetter(interface.IFailedReleasesGetter):
         }
         return status_map.get(status, status.value if hasattr(status, 'value') else str(status))
 
+    def _format_services_text(self, stats: model.ReleaseStats) -> str:
+        """Форматирует разбивку количества релизов по сервисам"""
+        services_text = ""
+        for service_stats in stats.by_service:
+            services_text += f"{service_stats.service_name}: {service_stats.total_count}<br>"
+
+        return services_text
+
     def _format_datetime(self, dt: datetime) -> str:
         """Форматирует дату и время"""
         if not dt:
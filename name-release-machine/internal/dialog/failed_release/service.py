@@ -12,11 +12,13 @@ class FailedReleasesService(interface.IFailedReleasesService):
             self,
             tel: interface.ITelemetry,
             release_service: interface.IReleaseService,
+            release_notify_service: interface.IReleaseNotifyService,
             admins: list[str],
     ):
         self.tracer = tel.tracer()
         self.logger = tel.logger()
         self.release_service = release_service
+        self.release_notify_service = release_notify_service
         self.admins = admins
 
     async def handle_navigate_release(
@@ -32,13 +34,13 @@ class FailedReleasesService(interface.IFailedReleasesService):
         ) as span:
             try:
                 current_index = dialog_manager.dialog_data.get("current_index", 0)
-                releases_list = dialog_manager.dialog_data.get("releases_list", [])
+                total_count = dialog_manager.dialog_data.get("total_count", 0)
 
                 # Определяем направление навигации
                 if button.widget_id == "prev_release":
                     new_index = max(0, current_index - 1)
                 else:  # next_release
-                    new_index = min(len(releases_list) - 1, current_index + 1)
+                    new_index = min(total_count - 1, current_index + 1)
 
                 if new_index == current_index:
                     await callback.answer()
@@ -76,7 +78,8 @@ class FailedReleasesService(interface.IFailedReleasesService):
                 dialog_manager.dialog_data["current_index"] = 0
 
                 # Очищаем кешированные данные
-                dialog_manager.dialog_data.pop("releases_list", None)
+                dialog_manager.dialog_data.pop("page_cursors", None)
+                dialog_manager.dialog_data.pop("total_count", None)
 
                 await callback.answer("✅ Данные обновлены")
 
@@ -106,6 +109,9 @@ class FailedReleasesService(interface.IFailedReleasesService):
                 # Очищаем данные диалога
                 dialog_manager.dialog_data.clear()
 
+                # Вне списков релизов push-обновления не нужны
+                self.release_notify_service.unsubscribe(callback.from_user.id, callback.message.chat.id)
+
                 await dialog_manager.start(model.MainMenuStates.main_menu)
 
                 self.logger.info("Возврат в главное меню из провальных релизов")
@@ -1,6 +1,6 @@
 from aiogram_dialog import Window, Dialog
-from aiogram_dialog.widgets.text import Const, Format
-from aiogram_dialog.widgets.kbd import Button, Column
+from aiogram_dialog.widgets.text import Const, Format, Case, Multi
+from aiogram_dialog.widgets.kbd import Button, Column, Row
 from sulguk import SULGUK_PARSE_MODE
 
 from internal import interface, model
@@ -21,6 +21,7 @@ class MainMenuDialog(interface.IMainMenuDialog):
     def get_dialog(self) -> Dialog:
         return Dialog(
             self.get_main_menu_window(),
+            self.get_analytics_window(),
         )
 
     def get_main_menu_window(self) -> Window:
@@ -46,8 +47,56 @@ class MainMenuDialog(interface.IMainMenuDialog):
                     id="failed_releases",
                     on_click=self.main_menu_service.handle_go_to_failed_releases,
                 ),
+                Button(
+                    Const("📈 Аналитика релизов"),
+                    id="analytics",
+                    on_click=self.main_menu_service.handle_go_to_analytics,
+                ),
             ),
             state=model.MainMenuStates.main_menu,
             getter=self.main_menu_getter.get_main_menu_data,
             parse_mode=SULGUK_PARSE_MODE,
+        )
+
+    def get_analytics_window(self) -> Window:
+        return Window(
+            Multi(
+                Format("📈 <b>Аналитика релизов за {days} дн.</b><br><br>"),
+                Case(
+                    {
+                        True: Format("{services_text}"),
+                        False: Const("📭 <b>Нет данных о релизах за период</b>"),
+                    },
+                    selector="has_metrics"
+                ),
+                sep="",
+            ),
+
+            Row(
+                Button(
+                    Const("7 дн."),
+                    id="analytics_7",
+                    on_click=self.main_menu_service.handle_select_analytics_period,
+                ),
+                Button(
+                    Const("30 дн."),
+                    id="analytics_30",
+                    on_click=self.main_menu_service.handle_select_analytics_period,
+                ),
+                Button(
+                    Const("90 дн."),
+                    id="analytics_90",
+                    on_click=self.main_menu_service.handle_select_analytics_period,
+                ),
+            ),
+
+            Button(
+                Const("⬅️ Назад в меню"),
+                id="back_to_menu",
+                on_click=lambda c, b, d: d.switch_to(model.MainMenuStates.main_menu),
+            ),
+
+            state=model.MainMenuStates.analytics,
+            getter=self.main_menu_getter.get_analytics_data,
+            parse_mode=SULGUK_PARSE_MODE,
         )
\ No newline at end of file
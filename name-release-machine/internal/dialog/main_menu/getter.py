@@ -8,9 +8,11 @@ class MainMenuGetter(interface.IMainMenuGetter):
     def __init__(
             self,
             tel: interface.ITelemetry,
+            release_service: interface.IReleaseService,
     ):
         self.tracer = tel.tracer()
         self.logger = tel.logger()
+        self.release_service = release_service
 
     async def get_main_menu_data(
             self,
@@ -34,4 +36,66 @@ class MainMenuGetter(interface.IMainMenuGetter):
             except Exception as err:
                 span.record_exception(err)
                 span.set_status(Status(StatusCode.ERROR, str(err)))
-                raise err
\ No newline at end of file
+                raise err
+
+    async def get_analytics_data(
+            self,
+            dialog_manager: DialogManager,
+            **kwargs
+    ) -> dict:
+        with self.tracer.start_as_current_span(
+                "MainMenuGetter.get_analytics_data",
+                kind=SpanKind.INTERNAL
+        ) as span:
+            try:
+                days = dialog_manager.dialog_data.get("analytics_days", 30)
+
+                metrics = await self.release_service.get_dora_metrics(days)
+
+                services_text = ""
+                for service_metrics in metrics:
+                    services_text += (
+                        f"📦 <b>{service_metrics.service_name}</b><br>"
+                        f"🚀 Деплоев: {service_metrics.deployments_count} "
+                        f"({service_metrics.deployment_frequency_per_day:.2f} в день)<br>"
+                        f"⏱️ Lead time: {self._format_duration(service_metrics.lead_time_seconds)}<br>"
+                        f"❌ Доля неудачных изменений: {self._format_rate(service_metrics.change_failure_rate)}<br>"
+                        f"🛠️ Время восстановления: {self._format_duration(service_metrics.mean_time_to_restore_seconds)}<br><br>"
+                    )
+
+                data = {
+                    "days": days,
+                    "has_metrics": bool(metrics),
+                    "services_text": services_text,
+                }
+
+                span.set_status(Status(StatusCode.OK))
+                return data
+
+            except Exception as err:
+                span.record_exception(err)
+                span.set_status(Status(StatusCode.ERROR, str(err)))
+                raise err
+
+    def _format_duration(self, seconds: float | None) -> str:
+        """Форматирует длительность в часы и минуты"""
+        if seconds is None:
+            return "—"
+
+        minutes = int(seconds // 60)
+        if minutes < 60:
+            return f"{minutes} мин"
+
+        hours, minutes = divmod(minutes, 60)
+        if hours < 24:
+            return f"{hours} ч {minutes} мин"
+
+        days, hours = divmod(hours, 24)
+        return f"{days} дн {hours} ч"
+
+    def _format_rate(self, rate: float | None) -> str:
+        """Форматирует долю в процентах"""
+        if rate is None:
+            return "—"
+
+        return f"{rate * 100:.0f}%"
@@ -91,4 +91,52 @@ class MainMenuService(interface.IMainMenuService):
                 span.record_exception(err)
                 span.set_status(Status(StatusCode.ERROR, str(err)))
                 await callback.answer("Ошибка при переходе к провальным релизам", show_alert=True)
-                raise err
\ No newline at end of file
+                raise err
+
+    async def handle_go_to_analytics(
+            self,
+            callback: CallbackQuery,
+            button: Any,
+            dialog_manager: DialogManager
+    ) -> None:
+        with self.tracer.start_as_current_span(
+                "MainMenuService.handle_go_to_analytics",
+                kind=SpanKind.INTERNAL
+        ) as span:
+            try:
+                await dialog_manager.switch_to(model.MainMenuStates.analytics)
+
+                self.logger.info("Переход к аналитике релизов")
+
+                span.set_status(Status(StatusCode.OK))
+
+            except Exception as err:
+                span.record_exception(err)
+                span.set_status(Status(StatusCode.ERROR, str(err)))
+                await callback.answer("Ошибка при переходе к аналитике", show_alert=True)
+                raise err
+
+    async def handle_select_analytics_period(
+            self,
+            callback: CallbackQuery,
+            button: Any,
+            dialog_manager: DialogManager
+    ) -> None:
+        with self.tracer.start_as_current_span(
+                "MainMenuService.handle_select_analytics_period",
+                kind=SpanKind.INTERNAL
+        ) as span:
+            try:
+                # id кнопки имеет вид analytics_<дни>
+                days = int(button.widget_id.split("_")[-1])
+                dialog_manager.dialog_data["analytics_days"] = days
+
+                await callback.answer()
+
+                span.set_status(Status(StatusCode.OK))
+
+            except Exception as err:
+                span.record_exception(err)
+                span.set_status(Status(StatusCode.ERROR, str(err)))
+                await callback.answer("Ошибка при выборе периода", show_alert=True)
+                raise err
@@ -1,7 +1,7 @@
 from aiogram import F
 from aiogram_dialog import Window, Dialog
 from aiogram_dialog.widgets.text import Const, Format, Case, Multi
-from aiogram_dialog.widgets.kbd import Button, Column, Row, Select, Group
+from aiogram_dialog.widgets.kbd import Button, Column, Row, Select, Group, Multiselect
 from sulguk import SULGUK_PARSE_MODE
 
 from internal import interface, model
@@ -24,6 +24,8 @@ class SuccessfulReleasesDialog(interface.ISuccessfulReleasesDialog):
             self.get_view_successful_releases_window(),
             self.get_select_rollback_tag_window(),
             self.get_confirm_rollback_window(),
+            self.get_select_batch_rollback_window(),
+            self.get_confirm_batch_rollback_window(),
         )
 
     def get_view_successful_releases_window(self) -> Window:
@@ -33,6 +35,7 @@ class SuccessfulReleasesDialog(interface.ISuccessfulReleasesDialog):
                 Case(
                     {
                         True: Multi(
+                            Format("{services_text}<br>"),
                             Format("📦 <b>{service_name}</b><br>"),
                             Case(
                                 {
@@ -90,6 +93,12 @@ class SuccessfulReleasesDialog(interface.ISuccessfulReleasesDialog):
                     on_click=self.successful_releases_service.handle_rollback_click,
                     when=~F["has_rollback"],
                 ),
+                Button(
+                    Const("⏪ Откатить несколько сервисов"),
+                    id="batch_rollback",
+                    on_click=self.successful_releases_service.handle_batch_rollback_click,
+                    when="has_releases",
+                ),
                 Button(
                     Const("🔄 Обновить"),
                     id="refresh",
@@ -155,7 +164,16 @@ class SuccessfulReleasesDialog(interface.ISuccessfulReleasesDialog):
                         Const("⚠️ <i>Убедитесь, что откат действительно необходим!</i>"),
                         sep="",
                     ),
-                    "run": Const("Выполняю откат"),
+                    "run": Multi(
+                        Format("⏳ <b>Выполняю откат</b> <code>{service_name}</code> на <code>{target_tag}</code><br><br>"),
+                        Case(
+                            {
+                                True: Format("<pre>{rollback_log}</pre>"),
+                                False: Const("<i>Ожидаю вывод скрипта...</i>"),
+                            },
+                            selector="has_rollback_log"
+                        ),
+                    ),
                     "done":  Multi(
                         Format("📦 <b>Сервис:</b> <code>{service_name}</code><br>"),
                         Format("🏷️ <b>Прошлый tag:</b> <code>{old_tag}</code><br>"),
@@ -185,3 +203,86 @@ class SuccessfulReleasesDialog(interface.ISuccessfulReleasesDialog):
             getter=self.successful_releases_getter.get_rollback_confirm_data,
             parse_mode=SULGUK_PARSE_MODE,
         )
+
+    def get_select_batch_rollback_window(self) -> Window:
+        return Window(
+            Multi(
+                Const("⏪ <b>Пакетный откат</b><br><br>"),
+                Case(
+                    {
+                        True: Const("📋 <b>Выберите сервисы, которые нужно откатить на предыдущую версию:</b>"),
+                        False: Const("📭 <b>Нет сервисов с успешными релизами</b>"),
+                    },
+                    selector="has_services"
+                ),
+                sep="",
+            ),
+
+            Group(
+                Multiselect(
+                    Format("✅ {item[service_name]}"),
+                    Format("▫️ {item[service_name]}"),
+                    id="batch_services_select",
+                    items="services",
+                    item_id_getter=lambda item: item["service_name"],
+                ),
+                width=1,
+            ),
+
+            Column(
+                Button(
+                    Const("➡️ Далее"),
+                    id="batch_services_selected",
+                    on_click=self.successful_releases_service.handle_batch_services_selected,
+                    when="has_services",
+                ),
+                Button(
+                    Const("Назад"),
+                    id="cancel_batch_rollback",
+                    on_click=lambda c, b, d: d.switch_to(model.SuccessfulReleasesStates.view_releases),
+                ),
+            ),
+
+            state=model.SuccessfulReleasesStates.select_batch_rollback,
+            getter=self.successful_releases_getter.get_batch_services_data,
+            parse_mode=SULGUK_PARSE_MODE,
+        )
+
+    def get_confirm_batch_rollback_window(self) -> Window:
+        return Window(
+            Multi(
+                Case(
+                    {
+                        "not_run": Multi(
+                            Const("⚠️ <b>Подтверждение пакетного отката</b><br><br>"),
+                            Const("❗ <b>ВНИМАНИЕ!</b> Сервисы будут откачены одновременно!<br><br>"),
+                        ),
+                        "run": Format("⏳ <b>Выполняю откат:</b> {finished_count}/{total_count}<br><br>"),
+                        "done": Format("🏁 <b>Откат завершен:</b> {finished_count}/{total_count}<br><br>"),
+                        "error": Const("❌ <b>Ошибка пакетного отката</b><br><br>"),
+                    },
+                    selector="batch_status"
+                ),
+                Format("{batch_text}"),
+                sep="",
+            ),
+
+            Row(
+                Button(
+                    Const("✅ Да, откатить"),
+                    id="confirm_batch_rollback_yes",
+                    on_click=self.successful_releases_service.handle_confirm_batch_rollback,
+                    when=F["batch_status"] == "not_run",
+                ),
+                Button(
+                    Const("Назад"),
+                    id="cancel_batch_rollback_confirm",
+                    on_click=lambda c, b, d: d.switch_to(model.SuccessfulReleasesStates.view_releases),
+                    when=~F["has_run_batch_rollback"]
+                ),
+            ),
+
+            state=model.SuccessfulReleasesStates.confirm_batch_rollback,
+            getter=self.successful_releases_getter.get_batch_rollback_data,
+            parse_mode=SULGUK_PARSE_MODE,
+        )
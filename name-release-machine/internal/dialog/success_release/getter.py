@@ -1,3 +1,4 @@
+import html
 from datetime import datetime
 from aiogram_dialog import DialogManager
 from opentelemetry.trace import SpanKind, Status, StatusCode
@@ -9,11 +10,15 @@ class SuccessfulReleasesGetter(interface.ISuccessfulReleasesGetter):
     def __init__(
             self,
             tel: interface.ITelemetry,
-            release_repo: interface.IReleaseRepo
+            release_repo: interface.IReleaseRepo,
+            release_notify_service: interface.IReleaseNotifyService,
+            page_size: int
     ):
         self.tracer = tel.tracer()
         self.logger = tel.logger()
         self.release_repo = release_repo
+        self.release_notify_service = release_notify_service
+        self.page_size = page_size
 
     async def get_releases_data(
             self,
@@ -25,21 +30,23 @@ class SuccessfulReleasesGetter(interface.ISuccessfulReleasesGetter):
                 kind=SpanKind.INTERNAL
         ) as span:
             try:
-                # Получаем успешные релизы
-                releases = await self.release_repo.get_successful_releases()
+                # Подписываем пользователя на push-обновления статусов релизов
+                self.release_notify_service.subscribe(
+                    dialog_manager.middleware_data["event_from_user"].id,
+                    dialog_manager.middleware_data["event_chat"].id,
+                )
 
-                if not releases:
+                # Считаем релизы отдельным запросом, чтобы не выгружать всю историю
+                stats = await self.release_repo.get_releases_stats(model.SUCCESSFUL_RELEASE_STATUSES)
+                total_count = stats.total_count
+
+                if not total_count:
                     return {
                         "has_releases": False,
                         "total_count": 0,
                     }
 
-                # Сохраняем список для навигации
-                releases_list = []
-                for release in releases:
-                    releases_list.append(release.to_dict())
-
-                dialog_manager.dialog_data["releases_list"] = releases_list
+                dialog_manager.dialog_data["total_count"] = total_count
 
                 # Устанавливаем текущий индекс (0 если не был установлен)
                 if "current_index" not in dialog_manager.dialog_data:
@@ -48,11 +55,22 @@ class SuccessfulReleasesGetter(interface.ISuccessfulReleasesGetter):
                 current_index = dialog_manager.dialog_data["current_index"]
 
                 # Корректируем индекс если он выходит за границы
-                if current_index >= len(releases):
-                    current_index = len(releases) - 1
-                    dialog_manager.dialog_data["current_index"] = current_index
+                if current_index >= total_count:
+                    current_index = total_count - 1
 
-                current_release = releases[current_index]
+                # Загружаем только страницу с текущим релизом
+                releases, current_index = await self._load_page(dialog_manager, current_index)
+
+                if not releases:
+                    return {
+                        "has_releases": False,
+                        "total_count": 0,
+                    }
+
+                dialog_manager.dialog_data["current_index"] = current_index
+
+                page_index = min(current_index % self.page_size, len(releases) - 1)
+                current_release = releases[page_index]
 
                 # Форматируем данные релиза
                 release_data = {
@@ -68,14 +86,18 @@ class SuccessfulReleasesGetter(interface.ISuccessfulReleasesGetter):
 
                 data = {
                     "has_releases": True,
-                    "total_count": len(releases),
+                    "total_count": total_count,
+                    "services_text": self._format_services_text(stats),
                     "current_index": current_index + 1,
                     "has_prev": current_index > 0,
-                    "has_next": current_index < len(releases) - 1,
+                    "has_next": current_index < total_count - 1,
                     "has_rollback": bool(current_release.rollback_to_tag),
                     **release_data,
                 }
 
+                # Сохраняем данные текущего релиза для отката
+                dialog_manager.dialog_data["current_release"] = current_release.to_dict()
+
                 self.logger.info("Список успешных релизов загружен")
 
                 span.set_status(Status(StatusCode.OK))
@@ -100,7 +122,6 @@ class SuccessfulReleasesGetter(interface.ISuccessfulReleasesGetter):
                 # Получаем текущий релиз
                 current_release = dialog_manager.dialog_data.get("rollback_current_release", {})
                 service_name = current_release.get("service_name")
-                current_release_id = current_release.get("id")
 
                 if not service_name:
                     self.logger.warning("Не указано имя сервиса для отката")
@@ -111,33 +132,23 @@ class SuccessfulReleasesGetter(interface.ISuccessfulReleasesGetter):
                         "has_releases": False,
                     }
 
-                # Получаем все успешные релизы для данного сервиса
-                all_releases = await self.release_repo.get_successful_releases()
-
-                # Фильтруем по имени сервиса и исключаем текущий релиз
-                service_releases = [
-                    release for release in all_releases
-                    if release.service_name == service_name and
-                       release.id != current_release_id and
-                       release.release_tag != current_release.get("release_tag")
-                ]
-
-                # Берем только один предыдущий релиз (самый последний перед текущим)
-                available_releases = dialog_manager.dialog_data.get("available_rollback_release", {})
+                # Предыдущие версии сервиса подобраны при нажатии на кнопку отката
+                available_releases = dialog_manager.dialog_data.get("available_rollback_releases", [])
 
                 # Форматируем данные версий для отображения
-
-                formatted_release = {
-                    "id": available_releases.get("id"),
-                    "release_tag": available_releases.get("release_tag"),
-                    "deployed_at_formatted": self._format_datetime(available_releases.get("completed_at")),
-                    "initiated_by": available_releases.get("initiated_by"),
-                }
+                formatted_releases = []
+                for release in available_releases:
+                    formatted_releases.append({
+                        "id": release.get("id"),
+                        "release_tag": release.get("release_tag"),
+                        "deployed_at_formatted": self._format_datetime(release.get("completed_at")),
+                        "initiated_by": release.get("initiated_by"),
+                    })
 
                 data = {
                     "service_name": service_name,
                     "current_tag": current_release.get("release_tag", "Неизвестно"),
-                    "available_releases": [formatted_release],
+                    "available_releases": formatted_releases,
                 }
 
                 self.logger.info(
@@ -177,6 +188,9 @@ class SuccessfulReleasesGetter(interface.ISuccessfulReleasesGetter):
                     "has_run_rollback": dialog_manager.dialog_data.get("has_run_rollback", False),
                     "old_tag": dialog_manager.dialog_data.get("old_tag", "Неизвестно"),
                     "new_tag": dialog_manager.dialog_data.get("new_tag", "Неизвестно"),
+                    # Хвост лога обрезаем под лимит длины сообщения Telegram
+                    "rollback_log": html.escape(dialog_manager.dialog_data.get("rollback_log", "")[-3000:]),
+                    "has_rollback_log": bool(dialog_manager.dialog_data.get("rollback_log")),
                 }
 
                 self.logger.info(
@@ -193,6 +207,116 @@ class SuccessfulReleasesGetter(interface.ISuccessfulReleasesGetter):
                 self.logger.error(f"Ошибка при получении данных для подтверждения отката: {str(err)}")
                 raise err
 
+    async def get_batch_services_data(
+            self,
+            dialog_manager: DialogManager,
+            **kwargs
+    ) -> dict:
+        """Получает сервисы, которые можно откатить пакетно"""
+        with self.tracer.start_as_current_span(
+                "SuccessfulReleasesGetter.get_batch_services_data",
+                kind=SpanKind.INTERNAL
+        ) as span:
+            try:
+                stats = await self.release_repo.get_releases_stats(model.SUCCESSFUL_RELEASE_STATUSES)
+
+                services = [
+                    {"service_name": service_stats.service_name}
+                    for service_stats in stats.by_service
+                ]
+
+                span.set_status(Status(StatusCode.OK))
+                return {
+                    "services": services,
+                    "has_services": bool(services),
+                }
+
+            except Exception as err:
+                span.record_exception(err)
+                span.set_status(Status(StatusCode.ERROR, str(err)))
+                raise err
+
+    async def get_batch_rollback_data(
+            self,
+            dialog_manager: DialogManager,
+            **kwargs
+    ) -> dict:
+        """Получает план и прогресс пакетного отката"""
+        with self.tracer.start_as_current_span(
+                "SuccessfulReleasesGetter.get_batch_rollback_data",
+                kind=SpanKind.INTERNAL
+        ) as span:
+            try:
+                plan = dialog_manager.dialog_data.get("batch_plan", [])
+
+                lines = []
+                finished_count = 0
+                for progress in plan:
+                    status = model.ReleaseStatus(progress["status"]) if progress.get("status") else None
+                    if status in (model.ReleaseStatus.ROLLBACK_DONE, model.ReleaseStatus.ROLLBACK_FAILED):
+                        finished_count += 1
+
+                    status_text = self._format_status(status) if status else "🕓 В очереди"
+                    line = (
+                        f"📦 <b>{progress['service_name']}</b>: "
+                        f"<code>{progress['release_tag']}</code> → <code>{progress['target_tag']}</code><br>"
+                        f"{status_text}"
+                    )
+                    if progress.get("error"):
+                        line += f"<br><i>{html.escape(progress['error'])}</i>"
+                    lines.append(line)
+
+                span.set_status(Status(StatusCode.OK))
+                return {
+                    "batch_text": "<br><br>".join(lines),
+                    "finished_count": finished_count,
+                    "total_count": len(plan),
+                    "batch_status": dialog_manager.dialog_data.get("batch_status", "not_run"),
+                    "has_run_batch_rollback": dialog_manager.dialog_data.get("has_run_batch_rollback", False),
+                }
+
+            except Exception as err:
+                span.record_exception(err)
+                span.set_status(Status(StatusCode.ERROR, str(err)))
+                raise err
+
+    async def _load_page(
+            self,
+            dialog_manager: DialogManager,
+            current_index: int
+    ) -> tuple[list[model.Release], int]:
+        """Загружает страницу релизов, на которой находится текущий индекс"""
+        # Курсор страницы — (created_at, id) последнего релиза предыдущей страницы
+        page_cursors = dialog_manager.dialog_data.get("page_cursors") or [None]
+        page_number = current_index // self.page_size
+
+        # Навигация идет по одному релизу, поэтому курсор нужной страницы уже известен,
+        # иначе возвращаемся на начало последней известной страницы
+        if page_number >= len(page_cursors):
+            page_number = len(page_cursors) - 1
+            current_index = page_number * self.page_size
+
+        cursor = page_cursors[page_number]
+        releases = await self.release_repo.get_releases_page(
+            statuses=model.SUCCESSFUL_RELEASE_STATUSES,
+            limit=self.page_size,
+            cursor_created_at=datetime.fromisoformat(cursor[0]) if cursor else None,
+            cursor_id=cursor[1] if cursor else None,
+        )
+
+        # Релизы могли сменить статус — начинаем навигацию заново
+        if not releases and page_number > 0:
+            dialog_manager.dialog_data["page_cursors"] = [None]
+            return await self._load_page(dialog_manager, 0)
+
+        page_cursors = page_cursors[:page_number + 1]
+        if len(releases) == self.page_size:
+            last_release = releases[-1]
+            page_cursors.append([last_release.created_at.isoformat(), last_release.id])
+
+        dialog_manager.dialog_data["page_cursors"] = page_cursors
+        return releases, current_index
+
     def _format_status(self, status: model.ReleaseStatus) -> str:
         """Форматирует статус релиза с эмодзи"""
         status_map = {
@@ -217,6 +341,14 @@ class SuccessfulReleasesGetter(interface.ISuccessfulReleasesGetter):
         }
         return status_map.get(status, status.value if hasattr(status, 'value') else str(status))
 
+    def _format_services_text(self, stats: model.ReleaseStats) -> str:
+        """Форматирует разбивку количества релизов по сервисам"""
+        services_text = ""
+        for service_stats in stats.by_service:
+            services_text += f"{service_stats.service_name}: {service_stats.total_count}<br>"
+
+        return services_text
+
     def _format_datetime(self, dt: datetime) -> str:
         """Форматирует дату и время"""
         if not dt:
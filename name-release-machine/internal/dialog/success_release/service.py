@@ -1,10 +1,12 @@
+import asyncio
+from datetime import datetime
 from typing import Any
 
 from aiogram.types import CallbackQuery
-from aiogram_dialog import DialogManager, ShowMode
+from aiogram_dialog import DialogManager, ShowMode, BaseDialogManager
 from opentelemetry.trace import SpanKind, Status, StatusCode
 
-from internal import interface, model
+from internal import interface, model, common
 
 
 class SuccessfulReleasesService(interface.ISuccessfulReleasesService):
@@ -12,13 +14,18 @@ class SuccessfulReleasesService(interface.ISuccessfulReleasesService):
             self,
             tel: interface.ITelemetry,
             release_service: interface.IReleaseService,
+            release_notify_service: interface.IReleaseNotifyService,
             admins: list[str],
     ):
         self.tracer = tel.tracer()
         self.logger = tel.logger()
         self.release_service = release_service
+        self.release_notify_service = release_notify_service
         self.admins = admins
 
+        # Ссылки на фоновые откаты, чтобы задачи не собрал сборщик мусора
+        self.rollback_tasks: set[asyncio.Task] = set()
+
     async def handle_navigate_release(
             self,
             callback: CallbackQuery,
@@ -32,13 +39,13 @@ class SuccessfulReleasesService(interface.ISuccessfulReleasesService):
         ) as span:
             try:
                 current_index = dialog_manager.dialog_data.get("current_index", 0)
-                releases_list = dialog_manager.dialog_data.get("releases_list", [])
+                total_count = dialog_manager.dialog_data.get("total_count", 0)
 
                 # Определяем направление навигации
                 if button.widget_id == "prev_release":
                     new_index = max(0, current_index - 1)
                 else:  # next_release
-                    new_index = min(len(releases_list) - 1, current_index + 1)
+                    new_index = min(total_count - 1, current_index + 1)
 
                 if new_index == current_index:
                     await callback.answer()
@@ -76,7 +83,8 @@ class SuccessfulReleasesService(interface.ISuccessfulReleasesService):
                 dialog_manager.dialog_data["current_index"] = 0
 
                 # Очищаем кешированные данные
-                dialog_manager.dialog_data.pop("releases_list", None)
+                dialog_manager.dialog_data.pop("page_cursors", None)
+                dialog_manager.dialog_data.pop("total_count", None)
 
                 await callback.answer("✅ Данные обновлены")
 
@@ -106,6 +114,9 @@ class SuccessfulReleasesService(interface.ISuccessfulReleasesService):
                 # Очищаем данные диалога
                 dialog_manager.dialog_data.clear()
 
+                # Вне списков релизов push-обновления не нужны
+                self.release_notify_service.unsubscribe(callback.from_user.id, callback.message.chat.id)
+
                 await dialog_manager.start(model.MainMenuStates.main_menu)
 
                 self.logger.info("Возврат в главное меню из успешных релизов")
@@ -137,31 +148,31 @@ class SuccessfulReleasesService(interface.ISuccessfulReleasesService):
 
                 dialog_manager.dialog_data["rollback_status"] = "not_run"
 
-                # Получаем текущий релиз из списка
-                current_index = dialog_manager.dialog_data.get("current_index", 0)
-                releases_list = dialog_manager.dialog_data.get("releases_list", [])
+                # Получаем текущий релиз, сохраненный геттером
+                current_release = dialog_manager.dialog_data.get("current_release")
 
-                if not releases_list or current_index >= len(releases_list):
+                if not current_release:
                     await callback.answer("❌ Ошибка получения данных релиза", show_alert=True)
                     return
 
-                current_release = releases_list[current_index]
-
                 # Сохраняем информацию о текущем релизе для отката
                 dialog_manager.dialog_data["rollback_current_release"] = current_release
 
-                # Получаем последние 3 успешных релиза для этого сервиса
                 service_name = current_release.get("service_name")
 
-                # Загружаем все успешные релизы для этого сервиса
-                all_successful_releases = await self.release_service.get_successful_releases()
+                # Загружаем только несколько успешных релизов сервиса, предшествующих текущему
+                previous_releases = await self.release_service.get_releases_page(
+                    statuses=model.SUCCESSFUL_RELEASE_STATUSES,
+                    limit=3,
+                    cursor_created_at=datetime.fromisoformat(current_release["created_at"]),
+                    cursor_id=current_release["id"],
+                    service_name=service_name,
+                )
 
-                # Фильтруем по сервису и берем последние 3 (исключая текущий)
+                # Исключаем версии с тем же тегом, что и текущая
                 service_releases = [
-                    release for release in all_successful_releases
-                    if release.service_name == service_name and
-                       release.id != current_release.get("id") and
-                       release.release_tag != current_release.get("release_tag")
+                    release for release in previous_releases
+                    if release.release_tag != current_release.get("release_tag")
                 ]
 
                 if not service_releases:
@@ -172,7 +183,7 @@ class SuccessfulReleasesService(interface.ISuccessfulReleasesService):
                     return
 
                 # Сохраняем доступные версии для отката
-                dialog_manager.dialog_data["available_rollback_releases"] = service_releases[0].to_dict()
+                dialog_manager.dialog_data["available_rollback_releases"] = [service_releases[0].to_dict()]
 
                 # Переходим к выбору версии
                 await dialog_manager.switch_to(model.SuccessfulReleasesStates.select_rollback_tag)
@@ -257,11 +268,18 @@ class SuccessfulReleasesService(interface.ISuccessfulReleasesService):
                 service_name = current_release.get("service_name")
                 target_tag = target_release.get("release_tag")
 
+                # Второй откат того же сервиса запустил бы параллельный деплой поверх первого
+                if await self.release_service.is_rollback_running(service_name):
+                    await callback.answer(f"⏳ Сервис {service_name} уже откатывается", show_alert=True)
+                    span.set_status(Status(StatusCode.OK))
+                    return
+
                 self.logger.info(f"Начинаем откат сервиса {service_name} на версию {target_tag}")
 
                 dialog_manager.dialog_data["has_run_rollback"] = True
                 dialog_manager.dialog_data["rollback_status"] = "run"
                 dialog_manager.dialog_data["service_name"] = current_release.get("service_name")
+                dialog_manager.dialog_data["rollback_log"] = ""
 
                 await callback.answer(
                     f"✅ Откат на версию {target_tag} запущен!\n"
@@ -275,24 +293,204 @@ class SuccessfulReleasesService(interface.ISuccessfulReleasesService):
                     rollback_to_tag=target_tag
                 )
 
-                await self.release_service.rollback_to_tag(
+                # Откат идет минутами, поэтому выполняем его в фоне и обновляем окно через bg-менеджер
+                task = asyncio.create_task(self._run_rollback(
+                    dialog_manager.bg(),
                     release_id=current_release.get("id"),
                     service_name=service_name,
-                    target_tag=target_tag
+                    old_tag=current_release.get("release_tag"),
+                    target_tag=target_tag,
+                ))
+                self.rollback_tasks.add(task)
+                task.add_done_callback(self.rollback_tasks.discard)
+
+                self.logger.info(f"Откат сервиса {service_name} на версию {target_tag} запущен")
+                span.set_status(Status(StatusCode.OK))
+
+            except Exception as err:
+                span.record_exception(err)
+                span.set_status(Status(StatusCode.ERROR, str(err)))
+
+                await callback.answer("Ошибка", show_alert=True)
+                raise err
+
+    async def _run_rollback(
+            self,
+            bg_manager: BaseDialogManager,
+            release_id: int,
+            service_name: str,
+            old_tag: str,
+            target_tag: str,
+    ) -> None:
+        with self.tracer.start_as_current_span(
+                "SuccessfulReleasesService._run_rollback",
+                kind=SpanKind.INTERNAL,
+                attributes={
+                    "release_id": release_id,
+                }
+        ) as span:
+            try:
+                async def on_log(rollback_log: str) -> None:
+                    await bg_manager.update({"rollback_log": rollback_log}, show_mode=ShowMode.EDIT)
+
+                succeeded = await self.release_service.rollback_to_tag(
+                    release_id=release_id,
+                    service_name=service_name,
+                    target_tag=target_tag,
+                    on_log=on_log,
+                )
+                if not succeeded:
+                    raise Exception("Шаг отката завершился ошибкой")
+
+                await bg_manager.update(
+                    {
+                        "has_run_rollback": False,
+                        "rollback_status": "done",
+                        "old_tag": old_tag,
+                        "new_tag": target_tag,
+                    },
+                    show_mode=ShowMode.EDIT
+                )
+
+                self.logger.info(f"Откат сервиса {service_name} на версию {target_tag} завершен")
+                span.set_status(Status(StatusCode.OK))
+
+            except Exception as err:
+                span.record_exception(err)
+                span.set_status(Status(StatusCode.ERROR, str(err)))
+                self.logger.error(
+                    f"Ошибка отката сервиса {service_name} на версию {target_tag}",
+                    {"error": str(err)}
+                )
+                await bg_manager.update(
+                    {
+                        "has_run_rollback": False,
+                        "rollback_status": "error",
+                    },
+                    show_mode=ShowMode.EDIT
                 )
 
-                dialog_manager.dialog_data["has_run_rollback"] = False
-                dialog_manager.dialog_data["rollback_status"] = "done"
-                dialog_manager.dialog_data["new_tag"] = target_tag
-                dialog_manager.dialog_data["old_tag"] = current_release.get("tag")
+    async def handle_batch_rollback_click(
+            self,
+            callback: CallbackQuery,
+            button: Any,
+            dialog_manager: DialogManager
+    ) -> None:
+        """Обработка нажатия кнопки пакетного отката"""
+        with self.tracer.start_as_current_span(
+                "SuccessfulReleasesService.handle_batch_rollback_click",
+                kind=SpanKind.INTERNAL
+        ) as span:
+            try:
+                dialog_manager.show_mode = ShowMode.EDIT
+
+                if callback.from_user.username not in self.admins:
+                    await callback.answer("У вас нет прав", show_alert=True)
+                    return
+
+                dialog_manager.dialog_data.pop("batch_plan", None)
+                dialog_manager.dialog_data["batch_status"] = "not_run"
+                dialog_manager.dialog_data["has_run_batch_rollback"] = False
+
+                await dialog_manager.switch_to(model.SuccessfulReleasesStates.select_batch_rollback)
+
+                span.set_status(Status(StatusCode.OK))
+
+            except Exception as err:
+                span.record_exception(err)
+                span.set_status(Status(StatusCode.ERROR, str(err)))
+                await callback.answer("❌ Ошибка при инициализации отката", show_alert=True)
+                raise err
+
+    async def handle_batch_services_selected(
+            self,
+            callback: CallbackQuery,
+            button: Any,
+            dialog_manager: DialogManager
+    ) -> None:
+        """Подбирает версии для отката выбранных сервисов"""
+        with self.tracer.start_as_current_span(
+                "SuccessfulReleasesService.handle_batch_services_selected",
+                kind=SpanKind.INTERNAL
+        ) as span:
+            try:
+                dialog_manager.show_mode = ShowMode.EDIT
+
+                service_names = dialog_manager.find("batch_services_select").get_checked()
+
+                # Каждый сервис откатывается на свою предыдущую успешную версию
+                try:
+                    plan = await self.release_service.plan_rollback_batch([
+                        model.RollbackTarget(service_name=service_name)
+                        for service_name in service_names
+                    ])
+                except common.ValidationError as err:
+                    await callback.answer(f"❌ {err}", show_alert=True)
+                    span.set_status(Status(StatusCode.OK))
+                    return
+
+                dialog_manager.dialog_data["batch_plan"] = [progress.to_dict() for progress in plan]
+
+                await dialog_manager.switch_to(model.SuccessfulReleasesStates.confirm_batch_rollback)
+
+                self.logger.info(f"Подготовлен пакетный откат сервисов: {', '.join(service_names)}")
+                span.set_status(Status(StatusCode.OK))
+
+            except Exception as err:
+                span.record_exception(err)
+                span.set_status(Status(StatusCode.ERROR, str(err)))
+                await callback.answer("❌ Ошибка при подборе версий", show_alert=True)
+                raise err
+
+    async def handle_confirm_batch_rollback(
+            self,
+            callback: CallbackQuery,
+            button: Any,
+            dialog_manager: DialogManager
+    ) -> None:
+        """Запускает пакетный откат в фоне"""
+        with self.tracer.start_as_current_span(
+                "SuccessfulReleasesService.handle_confirm_batch_rollback",
+                kind=SpanKind.INTERNAL
+        ) as span:
+            try:
+                dialog_manager.show_mode = ShowMode.EDIT
+
+                if callback.from_user.username not in self.admins:
+                    await callback.answer("У вас нет прав", show_alert=True)
+                    return
+
+                plan = [
+                    model.RollbackProgress(
+                        release_id=progress["release_id"],
+                        service_name=progress["service_name"],
+                        release_tag=progress["release_tag"],
+                        target_tag=progress["target_tag"],
+                    )
+                    for progress in dialog_manager.dialog_data.get("batch_plan", [])
+                ]
+
+                if not plan:
+                    await callback.answer("❌ Ошибка получения данных для отката", show_alert=True)
+                    return
+
+                dialog_manager.dialog_data["has_run_batch_rollback"] = True
+                dialog_manager.dialog_data["batch_status"] = "run"
 
-                # Очищаем данные отката
-                dialog_manager.dialog_data.pop("rollback_current_release", None)
-                dialog_manager.dialog_data.pop("rollback_target_release", None)
-                dialog_manager.dialog_data.pop("available_rollback_releases", None)
+                await callback.answer(
+                    f"✅ Откат {len(plan)} сервисов запущен!\n"
+                    f"Процесс может занять несколько минут.",
+                    show_alert=True
+                )
                 await dialog_manager.show()
 
-                self.logger.info(f"Откат сервиса {service_name} на версию {target_tag} успешно инициирован")
+                task = asyncio.create_task(self._run_batch_rollback(dialog_manager.bg(), plan))
+                self.rollback_tasks.add(task)
+                task.add_done_callback(self.rollback_tasks.discard)
+
+                self.logger.info(
+                    f"Пакетный откат запущен: {', '.join(progress.service_name for progress in plan)}"
+                )
                 span.set_status(Status(StatusCode.OK))
 
             except Exception as err:
@@ -300,4 +498,45 @@ class SuccessfulReleasesService(interface.ISuccessfulReleasesService):
                 span.set_status(Status(StatusCode.ERROR, str(err)))
 
                 await callback.answer("Ошибка", show_alert=True)
-                raise err
\ No newline at end of file
+                raise err
+
+    async def _run_batch_rollback(
+            self,
+            bg_manager: BaseDialogManager,
+            plan: list[model.RollbackProgress],
+    ) -> None:
+        with self.tracer.start_as_current_span(
+                "SuccessfulReleasesService._run_batch_rollback",
+                kind=SpanKind.INTERNAL
+        ) as span:
+            try:
+                async def on_progress(progress_list: list[model.RollbackProgress]) -> None:
+                    await bg_manager.update(
+                        {"batch_plan": [progress.to_dict() for progress in progress_list]},
+                        show_mode=ShowMode.EDIT
+                    )
+
+                plan = await self.release_service.rollback_batch(plan, on_progress=on_progress)
+
+                await bg_manager.update(
+                    {
+                        "has_run_batch_rollback": False,
+                        "batch_status": "done",
+                        "batch_plan": [progress.to_dict() for progress in plan],
+                    },
+                    show_mode=ShowMode.EDIT
+                )
+
+                span.set_status(Status(StatusCode.OK))
+
+            except Exception as err:
+                span.record_exception(err)
+                span.set_status(Status(StatusCode.ERROR, str(err)))
+                self.logger.error("Ошибка пакетного отката", {"error": str(err)})
+                await bg_manager.update(
+                    {
+                        "has_run_batch_rollback": False,
+                        "batch_status": "error",
+                    },
+                    show_mode=ShowMode.EDIT
+                )
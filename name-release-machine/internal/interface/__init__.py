@@ -1,8 +1,10 @@
 from internal.interface.release import *
 from internal.interface.general import *
+from internal.interface.deploy import *
 
 from internal.interface.dialog.main_menu import *
 from internal.interface.dialog.active_release import *
 from internal.interface.dialog.success_release import *
 from internal.interface.dialog.failed_release import *
 from internal.interface.client.github import *
+from internal.interface.client.ssh import *
@@ -1,6 +1,8 @@
 from abc import abstractmethod
 from typing import Protocol
 
+from internal import model
+
 
 class IGitHubClient(Protocol):
     @abstractmethod
@@ -12,3 +14,31 @@ class IGitHubClient(Protocol):
             ref: str = "main",
             inputs: dict = None
     ) -> None: pass
+
+    @abstractmethod
+    async def get_workflow_run(
+            self,
+            owner: str,
+            repo: str,
+            run_id: int
+    ) -> model.GitHubWorkflowRun: pass
+
+    @abstractmethod
+    async def list_workflow_runs(
+            self,
+            owner: str,
+            repo: str,
+            workflow_id: str = None,
+            branch: str = None,
+            event: str = None,
+            status: str = None,
+            per_page: int = 20
+    ) -> list[model.GitHubWorkflowRun]: pass
+
+    @abstractmethod
+    async def list_workflow_run_jobs(
+            self,
+            owner: str,
+            repo: str,
+            run_id: int
+    ) -> list[model.GitHubWorkflowJob]: pass
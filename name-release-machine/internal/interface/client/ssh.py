@@ -0,0 +1,21 @@
+from abc import abstractmethod
+from typing import Protocol, AsyncContextManager
+
+import asyncssh
+
+
+class ISSHClient(Protocol):
+    @abstractmethod
+    def connection(self) -> AsyncContextManager[asyncssh.SSHClientConnection]: pass
+
+    @abstractmethod
+    async def run(self, command: str, timeout: float = None) -> asyncssh.SSHCompletedProcess: pass
+
+    @abstractmethod
+    async def upload(self, remote_path: str, content: str) -> None: pass
+
+    @abstractmethod
+    async def health_check(self) -> bool: pass
+
+    @abstractmethod
+    async def close(self) -> None: pass
@@ -0,0 +1,25 @@
+from abc import abstractmethod
+from typing import Protocol, Callable, Awaitable
+
+from internal import model
+
+
+class IDeployEngine(Protocol):
+    @abstractmethod
+    async def run(
+            self,
+            steps: list[model.DeployStep],
+            on_output: Callable[[str], Awaitable[None]] = None,
+    ) -> list[model.DeployStepResult]: pass
+
+
+class IHealthProber(Protocol):
+    @abstractmethod
+    async def probe(
+            self,
+            url: str,
+            deadline: float,
+            initial_interval: float = None,
+            max_interval: float = None,
+            on_attempt: Callable[[int, int], Awaitable[None]] = None,
+    ) -> model.HealthProbeResult: pass
@@ -13,6 +13,10 @@ class IMainMenuDialog(Protocol):
     def get_main_menu_window(self) -> Window:
         pass
 
+    @abstractmethod
+    def get_analytics_window(self) -> Window:
+        pass
+
 
 class IMainMenuService(Protocol):
     @abstractmethod
@@ -42,6 +46,24 @@ class IMainMenuService(Protocol):
     ) -> None:
         pass
 
+    @abstractmethod
+    async def handle_go_to_analytics(
+            self,
+            callback: CallbackQuery,
+            button: Any,
+            dialog_manager: DialogManager
+    ) -> None:
+        pass
+
+    @abstractmethod
+    async def handle_select_analytics_period(
+            self,
+            callback: CallbackQuery,
+            button: Any,
+            dialog_manager: DialogManager
+    ) -> None:
+        pass
+
 
 class IMainMenuGetter(Protocol):
     @abstractmethod
@@ -49,4 +71,11 @@ class IMainMenuGetter(Protocol):
             self,
             dialog_manager: DialogManager,
     ) -> dict:
-        pass
\ No newline at end of file
+        pass
+
+    @abstractmethod
+    async def get_analytics_data(
+            self,
+            dialog_manager: DialogManager,
+    ) -> dict:
+        pass
@@ -21,6 +21,14 @@ class ISuccessfulReleasesDialog(Protocol):
     def get_confirm_rollback_window(self) -> Window:
         pass
 
+    @abstractmethod
+    def get_select_batch_rollback_window(self) -> Window:
+        pass
+
+    @abstractmethod
+    def get_confirm_batch_rollback_window(self) -> Window:
+        pass
+
 
 class ISuccessfulReleasesService(Protocol):
     @abstractmethod
@@ -78,6 +86,33 @@ class ISuccessfulReleasesService(Protocol):
     ) -> None:
         pass
 
+    @abstractmethod
+    async def handle_batch_rollback_click(
+            self,
+            callback: CallbackQuery,
+            button: Any,
+            dialog_manager: DialogManager
+    ) -> None:
+        pass
+
+    @abstractmethod
+    async def handle_batch_services_selected(
+            self,
+            callback: CallbackQuery,
+            button: Any,
+            dialog_manager: DialogManager
+    ) -> None:
+        pass
+
+    @abstractmethod
+    async def handle_confirm_batch_rollback(
+            self,
+            callback: CallbackQuery,
+            button: Any,
+            dialog_manager: DialogManager
+    ) -> None:
+        pass
+
 
 class ISuccessfulReleasesGetter(Protocol):
     @abstractmethod
@@ -99,4 +134,18 @@ class ISuccessfulReleasesGetter(Protocol):
             self,
             dialog_manager: DialogManager,
     ) -> dict:
-        pass
\ No newline at end of file
+        pass
+
+    @abstractmethod
+    async def get_batch_services_data(
+            self,
+            dialog_manager: DialogManager,
+    ) -> dict:
+        pass
+
+    @abstractmethod
+    async def get_batch_rollback_data(
+            self,
+            dialog_manager: DialogManager,
+    ) -> dict:
+        pass
@@ -63,13 +63,7 @@ class ITelegramWebhookController(Protocol):
 
 class IHttpMiddleware(Protocol):
     @abstractmethod
-    def trace_middleware01(self, app: FastAPI): pass
-
-    @abstractmethod
-    def metrics_middleware02(self, app: FastAPI): pass
-
-    @abstractmethod
-    def logger_middleware03(self, app: FastAPI): pass
+    def instrumentation_middleware01(self, app: FastAPI): pass
 
 
 class IOtelLogger(Protocol):
@@ -127,3 +121,22 @@ class IDB(Protocol):
 
     @abstractmethod
     async def multi_query(self, queries: list[str]) -> None: pass
+
+
+class IDBListener(Protocol):
+    @abstractmethod
+    def listen(self, channel: str, handler: Callable[[str], Awaitable[None]]) -> None: pass
+
+    @abstractmethod
+    async def start(self) -> None: pass
+
+    @abstractmethod
+    async def stop(self) -> None: pass
+
+
+class IReadinessService(Protocol):
+    @abstractmethod
+    async def warmup(self) -> None: pass
+
+    @abstractmethod
+    async def check(self) -> tuple[bool, dict[str, str]]: pass
@@ -1,6 +1,9 @@
 from abc import abstractmethod
-from typing import Protocol
+from datetime import datetime
+from typing import Protocol, Callable, Awaitable, Annotated
 
+from aiogram_dialog import BgManagerFactory
+from fastapi import Header
 from fastapi.responses import JSONResponse
 
 from internal.controller.http.handler.release.model import *
@@ -15,6 +18,18 @@ class IReleaseController(Protocol):
     async def update_release(self, body: UpdateReleaseBody) -> JSONResponse:
         pass
 
+    @abstractmethod
+    async def get_dora_metrics(self, days: int = 30) -> JSONResponse:
+        pass
+
+    @abstractmethod
+    async def rollback_batch(
+            self,
+            body: RollbackBatchBody,
+            x_rollback_token: Annotated[str | None, Header()] = None
+    ) -> JSONResponse:
+        pass
+
 
 class IReleaseService(Protocol):
     @abstractmethod
@@ -44,6 +59,15 @@ class IReleaseService(Protocol):
     @abstractmethod
     async def get_release_by_id(self, release_id: int) -> model.Release: pass
 
+    @abstractmethod
+    async def get_releases_by_ids(self, release_ids: list[int]) -> list[model.Release]: pass
+
+    @abstractmethod
+    async def get_release_events(self, release_ids: list[int]) -> list[model.ReleaseEvent]: pass
+
+    @abstractmethod
+    async def get_dora_metrics(self, days: int) -> list[model.ServiceDoraMetrics]: pass
+
     @abstractmethod
     async def get_active_release(self) -> list[model.Release]: pass
 
@@ -53,13 +77,37 @@ class IReleaseService(Protocol):
     @abstractmethod
     async def get_failed_releases(self) -> list[model.Release]: pass
 
+    @abstractmethod
+    async def get_releases_page(
+            self,
+            statuses: list[model.ReleaseStatus],
+            limit: int,
+            cursor_created_at: datetime = None,
+            cursor_id: int = None,
+            service_name: str = None,
+    ) -> list[model.Release]: pass
+
     @abstractmethod
     async def rollback_to_tag(
             self,
             release_id: int,
             service_name: str,
             target_tag: str,
-    ): pass
+            on_log: Callable[[str], Awaitable[None]] = None,
+    ) -> bool: pass
+
+    @abstractmethod
+    async def is_rollback_running(self, service_name: str) -> bool: pass
+
+    @abstractmethod
+    async def plan_rollback_batch(self, targets: list[model.RollbackTarget]) -> list[model.RollbackProgress]: pass
+
+    @abstractmethod
+    async def rollback_batch(
+            self,
+            plan: list[model.RollbackProgress],
+            on_progress: Callable[[list[model.RollbackProgress]], Awaitable[None]] = None,
+    ) -> list[model.RollbackProgress]: pass
 
 
 class IReleaseRepo(Protocol):
@@ -88,9 +136,15 @@ class IReleaseRepo(Protocol):
     ) -> None:
         pass
 
+    @abstractmethod
+    async def update_rollback_log(self, release_id: int, rollback_log: str) -> None: pass
+
     @abstractmethod
     async def get_release_by_id(self, release_id: int) -> list[model.Release]: pass
 
+    @abstractmethod
+    async def get_releases_by_ids(self, release_ids: list[int]) -> list[model.Release]: pass
+
     @abstractmethod
     async def get_active_release(self) -> list[model.Release]: pass
 
@@ -98,4 +152,60 @@ class IReleaseRepo(Protocol):
     async def get_successful_releases(self) -> list[model.Release]: pass
 
     @abstractmethod
-    async def get_failed_releases(self) -> list[model.Release]: pass
\ No newline at end of file
+    async def get_failed_releases(self) -> list[model.Release]: pass
+
+    @abstractmethod
+    async def get_releases_page(
+            self,
+            statuses: list[model.ReleaseStatus],
+            limit: int,
+            cursor_created_at: datetime = None,
+            cursor_id: int = None,
+            service_name: str = None,
+    ) -> list[model.Release]: pass
+
+    @abstractmethod
+    async def get_releases_stats(
+            self,
+            statuses: list[model.ReleaseStatus],
+            service_name: str = None,
+    ) -> model.ReleaseStats: pass
+
+    @abstractmethod
+    async def get_release_events(self, release_ids: list[int]) -> list[model.ReleaseEvent]: pass
+
+    @abstractmethod
+    async def get_dora_metrics(self, since: datetime, until: datetime) -> list[model.ServiceDoraMetrics]: pass
+
+
+class IReleaseCache(Protocol):
+    @abstractmethod
+    def invalidate_release(self, release_id: int, status: model.ReleaseStatus = None) -> None: pass
+
+
+class IReleaseNotifyService(Protocol):
+    @abstractmethod
+    def set_bg_factory(self, bg_factory: BgManagerFactory) -> None: pass
+
+    @abstractmethod
+    def subscribe(self, user_id: int, chat_id: int) -> None: pass
+
+    @abstractmethod
+    def unsubscribe(self, user_id: int, chat_id: int) -> None: pass
+
+    @abstractmethod
+    async def handle_release_changed(self, payload: str) -> None: pass
+
+
+class IReleaseReconciler(Protocol):
+    @abstractmethod
+    async def start(self) -> None: pass
+
+    @abstractmethod
+    async def stop(self) -> None: pass
+
+    @abstractmethod
+    async def reconcile(self) -> int: pass
+
+    @abstractmethod
+    async def fail_interrupted_rollbacks(self) -> int: pass
@@ -1,5 +1,7 @@
 from internal.model.sql_model import *
 from internal.model.release import *
+from internal.model.deploy import *
+from internal.model.github import *
 
 from internal.model.dialog_states.main_menu import *
 from internal.model.dialog_states.active_release import *
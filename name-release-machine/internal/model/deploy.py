@@ -0,0 +1,63 @@
+from dataclasses import dataclass, field
+from enum import Enum
+
+
+class DeployStepStatus(Enum):
+    PENDING = "pending"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+    SKIPPED = "skipped"
+
+
+@dataclass
+class DeployStep:
+    name: str
+    command: str
+    timeout: float
+    # Шаг стартует, когда завершены все зависимости; шаги без общей зависимости идут параллельно
+    depends_on: list[str] = field(default_factory=list)
+    # Ошибка некритичного шага не останавливает зависящие от него шаги
+    critical: bool = True
+    # Диагностическая команда, вывод которой попадает в лог при ошибке шага
+    on_failure: str = None
+    # Адрес /health превращает шаг в пробу готовности вместо команды:
+    # опрос идет с растущей паузой от poll_interval до max_poll_interval, пока не истечет timeout
+    health_url: str = None
+    poll_interval: float = 0
+    max_poll_interval: float = 0
+
+
+@dataclass
+class DeployStepResult:
+    name: str
+    status: DeployStepStatus
+    critical: bool
+    duration_seconds: float = 0
+    attempts: int = 0
+    error: str = ""
+
+    @property
+    def is_failed(self) -> bool:
+        return self.critical and self.status in (DeployStepStatus.FAILED, DeployStepStatus.SKIPPED)
+
+    def to_dict(self) -> dict:
+        return {
+            'name': self.name,
+            'status': self.status.value,
+            'critical': self.critical,
+            'duration_seconds': self.duration_seconds,
+            'attempts': self.attempts,
+            'error': self.error,
+        }
+
+
+@dataclass
+class HealthProbeResult:
+    # up — сервис вообще ответил по HTTP, ready — ответил 200 на /health
+    up: bool
+    ready: bool
+    attempts: int
+    elapsed_seconds: float
+    # 0 — ответа не было: соединение отклонено или таймаут
+    last_status_code: int
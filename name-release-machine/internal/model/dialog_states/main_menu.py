@@ -1,4 +1,5 @@
 from aiogram.fsm.state import StatesGroup, State
 
 class MainMenuStates(StatesGroup):
-    main_menu = State()
\ No newline at end of file
+    main_menu = State()
+    analytics = State()
\ No newline at end of file
@@ -4,4 +4,6 @@ from aiogram.fsm.state import StatesGroup, State
 class SuccessfulReleasesStates(StatesGroup):
     view_releases = State()
     select_rollback_tag = State()
-    confirm_rollback = State()
\ No newline at end of file
+    confirm_rollback = State()
+    select_batch_rollback = State()
+    confirm_batch_rollback = State()
\ No newline at end of file
@@ -0,0 +1,104 @@
+from dataclasses import dataclass
+from datetime import datetime
+
+
+def _parse_datetime(value: str | None) -> datetime | None:
+    if not value:
+        return None
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+@dataclass
+class GitHubWorkflowRun:
+    id: int
+    name: str
+    workflow_id: int
+    # queued, in_progress, completed...
+    status: str
+    # success, failure, cancelled... — только у завершенных запусков
+    conclusion: str | None
+    event: str
+    head_branch: str
+    head_sha: str
+    run_attempt: int
+    html_url: str
+
+    created_at: datetime
+    updated_at: datetime
+
+    @classmethod
+    def serialize(cls, items: list[dict]) -> list:
+        return [
+            cls(
+                id=item["id"],
+                name=item.get("name") or "",
+                workflow_id=item.get("workflow_id"),
+                status=item.get("status"),
+                conclusion=item.get("conclusion"),
+                event=item.get("event"),
+                head_branch=item.get("head_branch") or "",
+                head_sha=item.get("head_sha") or "",
+                run_attempt=item.get("run_attempt") or 1,
+                html_url=item.get("html_url") or "",
+                created_at=_parse_datetime(item.get("created_at")),
+                updated_at=_parse_datetime(item.get("updated_at")),
+            )
+            for item in items
+        ]
+
+    def to_dict(self) -> dict:
+        return {
+            'id': self.id,
+            'name': self.name,
+            'workflow_id': self.workflow_id,
+            'status': self.status,
+            'conclusion': self.conclusion,
+            'event': self.event,
+            'head_branch': self.head_branch,
+            'head_sha': self.head_sha,
+            'run_attempt': self.run_attempt,
+            'html_url': self.html_url,
+            'created_at': self.created_at.isoformat() if self.created_at else None,
+            'updated_at': self.updated_at.isoformat() if self.updated_at else None,
+        }
+
+
+@dataclass
+class GitHubWorkflowJob:
+    id: int
+    run_id: int
+    name: str
+    status: str
+    conclusion: str | None
+    html_url: str
+
+    started_at: datetime
+    completed_at: datetime
+
+    @classmethod
+    def serialize(cls, items: list[dict]) -> list:
+        return [
+            cls(
+                id=item["id"],
+                run_id=item.get("run_id"),
+                name=item.get("name") or "",
+                status=item.get("status"),
+                conclusion=item.get("conclusion"),
+                html_url=item.get("html_url") or "",
+                started_at=_parse_datetime(item.get("started_at")),
+                completed_at=_parse_datetime(item.get("completed_at")),
+            )
+            for item in items
+        ]
+
+    def to_dict(self) -> dict:
+        return {
+            'id': self.id,
+            'run_id': self.run_id,
+            'name': self.name,
+            'status': self.status,
+            'conclusion': self.conclusion,
+            'html_url': self.html_url,
+            'started_at': self.started_at.isoformat() if self.started_at else None,
+            'completed_at': self.completed_at.isoformat() if self.completed_at else None,
+        }
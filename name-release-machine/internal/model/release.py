@@ -25,6 +25,30 @@ class ReleaseStatus(Enum):
     ROLLBACK_DONE = "rollback_done"
 
 
+ACTIVE_RELEASE_STATUSES = [
+    ReleaseStatus.INITIATED,
+    ReleaseStatus.STAGE_BUILDING,
+    ReleaseStatus.STAGE_TEST_ROLLBACK,
+    ReleaseStatus.MANUAL_TESTING,
+    ReleaseStatus.MANUAL_TEST_PASSED,
+    ReleaseStatus.DEPLOYING,
+    ReleaseStatus.ROLLBACK,
+]
+
+SUCCESSFUL_RELEASE_STATUSES = [
+    ReleaseStatus.DEPLOYED,
+    ReleaseStatus.ROLLBACK_DONE,
+]
+
+FAILED_RELEASE_STATUSES = [
+    ReleaseStatus.STAGE_BUILDING_FAILED,
+    ReleaseStatus.STAGE_ROLLBACK_TEST_FAILED,
+    ReleaseStatus.MANUAL_TEST_FAILED,
+    ReleaseStatus.PRODUCTION_FAILED,
+    ReleaseStatus.ROLLBACK_FAILED,
+]
+
+
 @dataclass
 class Release:
     id: int
@@ -38,6 +62,7 @@ class Release:
     github_action_link: str
     github_ref: str
     approved_list: list[str]
+    rollback_log: str
 
     created_at: datetime
     started_at: datetime
@@ -57,6 +82,7 @@ class Release:
                 github_action_link=row.github_action_link,
                 github_ref=row.github_ref,
                 approved_list=json.loads(row.approved_list),
+                rollback_log=row.rollback_log or "",
                 created_at=row.created_at,
                 started_at=row.started_at,
                 completed_at=row.completed_at,
@@ -64,6 +90,13 @@ class Release:
             for row in rows
         ]
 
+    @property
+    def running_tag(self) -> str:
+        # После отката на проде работает версия, на которую откатили, а не release_tag
+        if self.status == ReleaseStatus.ROLLBACK_DONE and self.rollback_to_tag:
+            return self.rollback_to_tag
+        return self.release_tag
+
     def to_dict(self) -> dict:
         return {
             'id': self.id,
@@ -76,7 +109,136 @@ class Release:
             'github_action_link': self.github_action_link,
             'github_ref': self.github_ref,
             'approved_list': self.approved_list,
+            'rollback_log': self.rollback_log,
             'created_at': self.created_at.isoformat() if self.created_at else None,
             'started_at': self.started_at.isoformat() if self.started_at else None,
             'completed_at': self.completed_at.isoformat() if self.completed_at else None,
-        }
\ No newline at end of file
+        }
+
+
+@dataclass
+class ReleaseEvent:
+    id: int
+    release_id: int
+    status: ReleaseStatus
+    created_at: datetime
+
+    @classmethod
+    def serialize(cls, rows) -> list:
+        return [
+            cls(
+                id=row.id,
+                release_id=row.release_id,
+                status=ReleaseStatus(row.status),
+                created_at=row.created_at,
+            )
+            for row in rows
+        ]
+
+    def to_dict(self) -> dict:
+        return {
+            'id': self.id,
+            'release_id': self.release_id,
+            'status': self.status.value,
+            'created_at': self.created_at.isoformat() if self.created_at else None,
+        }
+
+
+@dataclass
+class ServiceReleaseStats:
+    service_name: str
+    total_count: int
+    oldest_created_at: datetime
+
+
+@dataclass
+class ReleaseStats:
+    total_count: int
+    oldest_created_at: datetime
+    by_service: list[ServiceReleaseStats]
+
+    @classmethod
+    def serialize(cls, rows) -> "ReleaseStats":
+        by_service = [
+            ServiceReleaseStats(
+                service_name=row.service_name,
+                total_count=row.total_count,
+                oldest_created_at=row.oldest_created_at,
+            )
+            for row in rows
+        ]
+        return cls(
+            total_count=sum(stats.total_count for stats in by_service),
+            oldest_created_at=min(
+                (stats.oldest_created_at for stats in by_service if stats.oldest_created_at),
+                default=None
+            ),
+            by_service=by_service,
+        )
+
+
+@dataclass
+class ServiceDoraMetrics:
+    service_name: str
+    deployments_count: int
+    deployment_frequency_per_day: float
+    lead_time_seconds: float | None
+    change_failure_rate: float | None
+    mean_time_to_restore_seconds: float | None
+
+    @classmethod
+    def serialize(cls, rows) -> list:
+        return [
+            cls(
+                service_name=row.service_name,
+                deployments_count=row.deployments_count,
+                deployment_frequency_per_day=float(row.deployment_frequency_per_day),
+                lead_time_seconds=float(row.lead_time_seconds) if row.lead_time_seconds is not None else None,
+                change_failure_rate=row.change_failure_rate,
+                mean_time_to_restore_seconds=float(row.mean_time_to_restore_seconds)
+                if row.mean_time_to_restore_seconds is not None else None,
+            )
+            for row in rows
+        ]
+
+    def to_dict(self) -> dict:
+        return {
+            'service_name': self.service_name,
+            'deployments_count': self.deployments_count,
+            'deployment_frequency_per_day': self.deployment_frequency_per_day,
+            'lead_time_seconds': self.lead_time_seconds,
+            'change_failure_rate': self.change_failure_rate,
+            'mean_time_to_restore_seconds': self.mean_time_to_restore_seconds,
+        }
+
+
+@dataclass
+class RollbackTarget:
+    service_name: str
+    # Пустой тег — откат на предыдущую успешную версию сервиса
+    target_tag: str = None
+
+
+@dataclass
+class RollbackProgress:
+    release_id: int
+    service_name: str
+    release_tag: str
+    target_tag: str
+    # None — откат сервиса ждет своей очереди
+    status: ReleaseStatus | None = None
+    error: str = ""
+
+    @property
+    def is_finished(self) -> bool:
+        return self.status in (ReleaseStatus.ROLLBACK_DONE, ReleaseStatus.ROLLBACK_FAILED)
+
+    def to_dict(self) -> dict:
+        return {
+            'release_id': self.release_id,
+            'service_name': self.service_name,
+            'release_tag': self.release_tag,
+            'target_tag': self.target_tag,
+            'status': self.status.value if self.status else None,
+            'error': self.error,
+        }
@@ -11,6 +11,7 @@ CREATE TABLE IF NOT EXISTS releases (
     github_action_link TEXT NOT NULL,
     github_ref TEXT NOT NULL,
     approved_list TEXT DEFAULT '[]',
+    rollback_log TEXT DEFAULT '',
     
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     started_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
@@ -18,10 +19,82 @@ CREATE TABLE IF NOT EXISTS releases (
 );
 """
 
+add_release_rollback_log_column = """
+ALTER TABLE releases ADD COLUMN IF NOT EXISTS rollback_log TEXT DEFAULT '';
+"""
+
+create_release_status_created_at_index = """
+CREATE INDEX IF NOT EXISTS idx_releases_status_created_at
+ON releases (status, created_at DESC, id DESC);
+"""
+
+create_release_service_status_created_at_index = """
+CREATE INDEX IF NOT EXISTS idx_releases_service_status_created_at
+ON releases (service_name, status, created_at DESC, id DESC);
+"""
+
+create_release_events_table = """
+CREATE TABLE IF NOT EXISTS release_events (
+    id SERIAL PRIMARY KEY,
+    release_id INTEGER NOT NULL REFERENCES releases (id) ON DELETE CASCADE,
+    status TEXT NOT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+"""
+
+create_release_events_release_id_index = """
+CREATE INDEX IF NOT EXISTS idx_release_events_release_id_created_at
+ON release_events (release_id, created_at, id);
+"""
+
+create_release_notify_function = """
+CREATE OR REPLACE FUNCTION notify_release_changed() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'UPDATE' AND OLD.status IS NOT DISTINCT FROM NEW.status THEN
+        RETURN NEW;
+    END IF;
+
+    PERFORM pg_notify(
+        'release_changed',
+        CAST(json_build_object('id', NEW.id, 'status', NEW.status) AS TEXT)
+    );
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+drop_release_notify_trigger = """
+DROP TRIGGER IF EXISTS releases_notify_changed ON releases;
+"""
+
+create_release_notify_trigger = """
+CREATE TRIGGER releases_notify_changed
+AFTER INSERT OR UPDATE ON releases
+FOR EACH ROW EXECUTE FUNCTION notify_release_changed();
+"""
+
+drop_release_events_table = """
+DROP TABLE IF EXISTS release_events;
+"""
+
 drop_release_table = """
 DROP TABLE IF EXISTS releases;
 """
 
+drop_release_notify_function = """
+DROP FUNCTION IF EXISTS notify_release_changed();
+"""
+
 # Обновить существующие списки:
-create_queries = [create_release_table]
-drop_queries = [drop_release_table]
\ No newline at end of file
+create_queries = [
+    create_release_table,
+    add_release_rollback_log_column,
+    create_release_status_created_at_index,
+    create_release_service_status_created_at_index,
+    create_release_events_table,
+    create_release_events_release_id_index,
+    create_release_notify_function,
+    drop_release_notify_trigger,
+    create_release_notify_trigger,
+]
+drop_queries = [drop_release_events_table, drop_release_table, drop_release_notify_function]
\ No newline at end of file
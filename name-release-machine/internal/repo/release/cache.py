@@ -0,0 +1,290 @@
+import copy
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Awaitable, Callable
+
+from opentelemetry.trace import SpanKind, StatusCode
+
+from internal import interface, model, common
+
+
+@dataclass
+class _CacheEntry:
+    value: Any
+    expires_at: float
+    statuses: frozenset[model.ReleaseStatus]
+    release_ids: frozenset[int]
+    is_stats: bool = False
+
+
+class CachedReleaseRepo(interface.IReleaseRepo, interface.IReleaseCache):
+    """TTL+LRU кеш чтений поверх ReleaseRepo с точечной инвалидацией при записи"""
+
+    def __init__(
+            self,
+            tel: interface.ITelemetry,
+            release_repo: interface.IReleaseRepo,
+            ttl: float,
+            analytics_ttl: float,
+            max_size: int,
+    ):
+        self.tracer = tel.tracer()
+        self.meter = tel.meter()
+        self.logger = tel.logger()
+        self.release_repo = release_repo
+
+        # ttl — допустимая устаревшность данных в секундах, 0 отключает кеш
+        self.ttl = ttl
+        # Аналитика за период дорогая и меняется медленно, поэтому живет дольше
+        self.analytics_ttl = analytics_ttl
+        self.max_size = max_size
+
+        self._entries: OrderedDict[tuple, _CacheEntry] = OrderedDict()
+        # Счетчик записей: чтение, начатое до записи, не должно попасть в кеш
+        self._generation = 0
+
+        self.hit_counter = self.meter.create_counter(
+            name=common.RELEASE_CACHE_HIT_TOTAL_METRIC,
+            description="Total count of release cache hits",
+            unit="1"
+        )
+
+        self.miss_counter = self.meter.create_counter(
+            name=common.RELEASE_CACHE_MISS_TOTAL_METRIC,
+            description="Total count of release cache misses",
+            unit="1"
+        )
+
+    async def create_release(
+            self,
+            service_name: str,
+            release_tag: str,
+            status: model.ReleaseStatus,
+            initiated_by: str,
+            github_run_id: str,
+            github_action_link: str,
+            github_ref: str
+    ) -> int:
+        try:
+            return await self.release_repo.create_release(
+                service_name=service_name,
+                release_tag=release_tag,
+                status=status,
+                initiated_by=initiated_by,
+                github_run_id=github_run_id,
+                github_action_link=github_action_link,
+                github_ref=github_ref,
+            )
+        finally:
+            # Новый релиз попадает только в выборки со своим статусом
+            self._invalidate(lambda entry: status in entry.statuses)
+
+    async def update_release(
+            self,
+            release_id: int,
+            status: model.ReleaseStatus = None,
+            github_run_id: str = None,
+            github_action_link: str = None,
+            rollback_to_tag: str = None,
+            approved_list: list[str] = None,
+    ) -> None:
+        try:
+            await self.release_repo.update_release(
+                release_id=release_id,
+                status=status,
+                github_run_id=github_run_id,
+                github_action_link=github_action_link,
+                rollback_to_tag=rollback_to_tag,
+                approved_list=approved_list,
+            )
+        finally:
+            self.invalidate_release(release_id, status)
+
+    async def update_rollback_log(self, release_id: int, rollback_log: str) -> None:
+        try:
+            await self.release_repo.update_rollback_log(release_id, rollback_log)
+        finally:
+            self.invalidate_release(release_id)
+
+    def invalidate_release(self, release_id: int, status: model.ReleaseStatus = None) -> None:
+        if status is None:
+            # Статус не менялся — устарели только выборки, содержащие сам релиз
+            self._invalidate(lambda entry: release_id in entry.release_ids)
+        else:
+            # Прежний статус неизвестен, поэтому сбрасываем все счетчики
+            self._invalidate(
+                lambda entry: release_id in entry.release_ids or
+                              status in entry.statuses or
+                              entry.is_stats
+            )
+
+    async def get_release_by_id(self, release_id: int) -> list[model.Release]:
+        return await self._cached(
+            key=("get_release_by_id", release_id),
+            load=lambda: self.release_repo.get_release_by_id(release_id),
+            release_ids=frozenset([release_id]),
+        )
+
+    async def get_releases_by_ids(self, release_ids: list[int]) -> list[model.Release]:
+        return await self._cached(
+            key=("get_releases_by_ids", tuple(sorted(release_ids))),
+            load=lambda: self.release_repo.get_releases_by_ids(release_ids),
+            release_ids=frozenset(release_ids),
+        )
+
+    async def get_active_release(self) -> list[model.Release]:
+        return await self._cached(
+            key=("get_active_release",),
+            load=self.release_repo.get_active_release,
+            statuses=frozenset(model.ACTIVE_RELEASE_STATUSES),
+        )
+
+    async def get_successful_releases(self) -> list[model.Release]:
+        return await self._cached(
+            key=("get_successful_releases",),
+            load=self.release_repo.get_successful_releases,
+            statuses=frozenset(model.SUCCESSFUL_RELEASE_STATUSES),
+        )
+
+    async def get_failed_releases(self) -> list[model.Release]:
+        return await self._cached(
+            key=("get_failed_releases",),
+            load=self.release_repo.get_failed_releases,
+            statuses=frozenset(model.FAILED_RELEASE_STATUSES),
+        )
+
+    async def get_releases_page(
+            self,
+            statuses: list[model.ReleaseStatus],
+            limit: int,
+            cursor_created_at: datetime = None,
+            cursor_id: int = None,
+            service_name: str = None,
+    ) -> list[model.Release]:
+        # Keyset-страница меняется, только если релиз в нее входил или в нее попадает новый статус
+        return await self._cached(
+            key=(
+                "get_releases_page",
+                tuple(status.value for status in statuses),
+                limit,
+                cursor_created_at.isoformat() if cursor_created_at else None,
+                cursor_id,
+                service_name,
+            ),
+            load=lambda: self.release_repo.get_releases_page(
+                statuses=statuses,
+                limit=limit,
+                cursor_created_at=cursor_created_at,
+                cursor_id=cursor_id,
+                service_name=service_name,
+            ),
+            statuses=frozenset(statuses),
+        )
+
+    async def get_releases_stats(
+            self,
+            statuses: list[model.ReleaseStatus],
+            service_name: str = None,
+    ) -> model.ReleaseStats:
+        return await self._cached(
+            key=(
+                "get_releases_stats",
+                tuple(status.value for status in statuses),
+                service_name,
+            ),
+            load=lambda: self.release_repo.get_releases_stats(
+                statuses=statuses,
+                service_name=service_name,
+            ),
+            statuses=frozenset(statuses),
+            is_stats=True,
+        )
+
+    async def get_release_events(self, release_ids: list[int]) -> list[model.ReleaseEvent]:
+        # История дописывается только при смене статуса, а она сбрасывает записи с этим релизом
+        return await self._cached(
+            key=("get_release_events", tuple(sorted(release_ids))),
+            load=lambda: self.release_repo.get_release_events(release_ids),
+            release_ids=frozenset(release_ids),
+        )
+
+    async def get_dora_metrics(self, since: datetime, until: datetime) -> list[model.ServiceDoraMetrics]:
+        return await self._cached(
+            key=("get_dora_metrics", since.isoformat(), until.isoformat()),
+            load=lambda: self.release_repo.get_dora_metrics(since, until),
+            is_stats=True,
+            ttl=self.analytics_ttl,
+        )
+
+    async def _cached(
+            self,
+            key: tuple,
+            load: Callable[[], Awaitable[Any]],
+            statuses: frozenset[model.ReleaseStatus] = frozenset(),
+            release_ids: frozenset[int] = frozenset(),
+            is_stats: bool = False,
+            ttl: float = None,
+    ) -> Any:
+        with self.tracer.start_as_current_span(
+                "CachedReleaseRepo._cached",
+                kind=SpanKind.INTERNAL,
+                attributes={
+                    "cache.method": key[0],
+                }
+        ) as span:
+            try:
+                attributes = {"method": key[0]}
+
+                entry = self._entries.get(key)
+                if entry is not None and entry.expires_at > time.monotonic():
+                    self._entries.move_to_end(key)
+                    self.hit_counter.add(1, attributes=attributes)
+                    span.set_attribute("cache.hit", True)
+                    span.set_status(StatusCode.OK)
+                    # Вызывающие меняют полученные релизы (например, approved_list), поэтому отдаем копию
+                    return copy.deepcopy(entry.value)
+
+                self.miss_counter.add(1, attributes=attributes)
+                span.set_attribute("cache.hit", False)
+
+                generation = self._generation
+                value = await load()
+
+                ttl = self.ttl if ttl is None else ttl
+                if ttl > 0 and generation == self._generation:
+                    if isinstance(value, list):
+                        release_ids = release_ids | frozenset(
+                            release.id for release in value if isinstance(release, model.Release)
+                        )
+
+                    self._entries[key] = _CacheEntry(
+                        value=copy.deepcopy(value),
+                        expires_at=time.monotonic() + ttl,
+                        statuses=statuses,
+                        release_ids=release_ids,
+                        is_stats=is_stats,
+                    )
+                    self._entries.move_to_end(key)
+
+                    while len(self._entries) > self.max_size:
+                        self._entries.popitem(last=False)
+
+                span.set_status(StatusCode.OK)
+                return value
+
+            except Exception as err:
+                span.record_exception(err)
+                span.set_status(StatusCode.ERROR, str(err))
+                raise
+
+    def _invalidate(self, predicate: Callable[[_CacheEntry], bool]) -> None:
+        self._generation += 1
+
+        stale_keys = [key for key, entry in self._entries.items() if predicate(entry)]
+        for key in stale_keys:
+            del self._entries[key]
+
+        if stale_keys:
+            self.logger.debug(f"Из кеша релизов удалено записей: {len(stale_keys)}")
@@ -1,28 +1,67 @@
 create_release = """
-INSERT INTO releases (
-    service_name, 
-    release_tag, 
-    status, 
-    initiated_by, 
-    github_run_id, 
-    github_action_link, 
-    github_ref
+WITH created_release AS (
+    INSERT INTO releases (
+        service_name, 
+        release_tag, 
+        status, 
+        initiated_by, 
+        github_run_id, 
+        github_action_link, 
+        github_ref
+    )
+    VALUES (
+        :service_name, 
+        :release_tag, 
+        :status, 
+        :initiated_by, 
+        :github_run_id, 
+        :github_action_link, 
+        :github_ref
+    )
+    RETURNING id, status, created_at
 )
-VALUES (
-    :service_name, 
-    :release_tag, 
-    :status, 
-    :initiated_by, 
-    :github_run_id, 
-    :github_action_link, 
-    :github_ref
+INSERT INTO release_events (release_id, status, created_at)
+SELECT id, status, created_at FROM created_release
+RETURNING release_id;
+"""
+
+# Обновление релиза и запись перехода статуса выполняются одним запросом, то есть в одной транзакции.
+# Строка блокируется до обновления, чтобы сравнить новый статус с прежним: повтор того же статуса
+# не является переходом и в историю не пишется
+update_release_with_event = """
+WITH previous_release AS (
+    SELECT id AS release_id, status AS previous_status
+    FROM releases
+    WHERE id = :release_id
+    FOR UPDATE
+),
+updated_release AS (
+    UPDATE releases
+    SET {update_fields}
+    FROM previous_release
+    WHERE releases.id = previous_release.release_id
+    RETURNING releases.id, releases.status, previous_release.previous_status
 )
-RETURNING id;
+INSERT INTO release_events (release_id, status)
+SELECT id, status FROM updated_release
+WHERE status IS DISTINCT FROM previous_status;
+"""
+
+update_release_rollback_log = """
+UPDATE releases
+SET rollback_log = :rollback_log
+WHERE id = :release_id;
 """
 
 get_release_by_id = """
 SELECT * FROM releases
-WHERE id = :release_id
+WHERE id = :release_id;
+"""
+
+get_releases_by_ids = """
+SELECT * FROM releases
+WHERE id = ANY(:release_ids)
+ORDER BY created_at DESC, id DESC;
 """
 
 get_active_releases = """
@@ -59,4 +98,91 @@ WHERE status IN (
     'rollback_failed'
 )
 ORDER BY created_at DESC;
-"""
\ No newline at end of file
+"""
+
+get_releases_page = """
+SELECT * FROM releases
+WHERE status = ANY(:statuses)
+{filters}
+ORDER BY created_at DESC, id DESC
+LIMIT :limit;
+"""
+
+get_releases_stats = """
+SELECT
+    service_name,
+    COUNT(*) AS total_count,
+    MIN(created_at) AS oldest_created_at
+FROM releases
+WHERE status = ANY(:statuses)
+{filters}
+GROUP BY service_name
+ORDER BY total_count DESC, service_name;
+"""
+
+get_release_events_by_release_ids = """
+SELECT * FROM release_events
+WHERE release_id = ANY(:release_ids)
+ORDER BY release_id, created_at, id;
+"""
+
+get_dora_metrics = """
+WITH range_events AS (
+    SELECT
+        releases.service_name,
+        releases.created_at AS initiated_at,
+        release_events.id,
+        release_events.release_id,
+        release_events.status,
+        release_events.created_at
+    FROM release_events
+    JOIN releases ON releases.id = release_events.release_id
+    WHERE release_events.created_at >= CAST(:since AS TIMESTAMP)
+      AND release_events.created_at < CAST(:until AS TIMESTAMP)
+),
+timeline AS (
+    SELECT
+        range_events.*,
+        -- Первый выход релиза на prod, от него считается lead time
+        MIN(created_at) FILTER (WHERE status = 'deployed') OVER (
+            PARTITION BY release_id
+        ) AS deployed_at,
+        -- Ближайшее после события восстановление сервиса: деплой или успешный откат
+        MIN(created_at) FILTER (WHERE status IN ('deployed', 'rollback_done')) OVER (
+            PARTITION BY service_name
+            ORDER BY created_at, id
+            ROWS BETWEEN 1 FOLLOWING AND UNBOUNDED FOLLOWING
+        ) AS restored_at
+    FROM range_events
+),
+service_metrics AS (
+    SELECT
+        service_name,
+        COUNT(DISTINCT release_id) FILTER (WHERE status = 'deployed') AS deployments_count,
+        COUNT(DISTINCT release_id) FILTER (
+            WHERE status IN ('deployed', 'production_failed')
+        ) AS production_changes_count,
+        COUNT(DISTINCT release_id) FILTER (
+            WHERE status IN ('production_failed', 'production_rollback')
+        ) AS failed_changes_count,
+        AVG(EXTRACT(EPOCH FROM (deployed_at - initiated_at))) FILTER (
+            WHERE status = 'deployed'
+        ) AS lead_time_seconds,
+        AVG(EXTRACT(EPOCH FROM (restored_at - created_at))) FILTER (
+            WHERE status IN ('production_failed', 'production_rollback') AND restored_at IS NOT NULL
+        ) AS mean_time_to_restore_seconds
+    FROM timeline
+    GROUP BY service_name
+)
+SELECT
+    service_name,
+    deployments_count,
+    CAST(deployments_count AS FLOAT) / GREATEST(
+        EXTRACT(EPOCH FROM (CAST(:until AS TIMESTAMP) - CAST(:since AS TIMESTAMP))) / 86400, 1
+    ) AS deployment_frequency_per_day,
+    lead_time_seconds,
+    CAST(failed_changes_count AS FLOAT) / NULLIF(production_changes_count, 0) AS change_failure_rate,
+    mean_time_to_restore_seconds
+FROM service_metrics
+ORDER BY service_name;
+"""
@@ -1,4 +1,5 @@
 import json
+from datetime import datetime
 
 from opentelemetry.trace import SpanKind, Status, StatusCode
 
@@ -70,6 +71,10 @@ class ReleaseRepo(interface.IReleaseRepo):
                     update_fields.append("status = :status")
                     args['status'] = status.value
 
+                    # Финальный статус фиксирует время завершения релиза
+                    if status in model.SUCCESSFUL_RELEASE_STATUSES or status in model.FAILED_RELEASE_STATUSES:
+                        update_fields.append("completed_at = CURRENT_TIMESTAMP")
+
                 if github_run_id is not None:
                     update_fields.append("github_run_id = :github_run_id")
                     args['github_run_id'] = github_run_id
@@ -90,11 +95,15 @@ class ReleaseRepo(interface.IReleaseRepo):
                     span.set_status(Status(StatusCode.OK))
                     return
 
-                query = f"""
-                UPDATE releases 
-                SET {', '.join(update_fields)}
-                WHERE id = :release_id;
-                """
+                if status is not None:
+                    # Смена статуса пишется в историю release_events тем же запросом, повтор прежнего статуса — нет
+                    query = update_release_with_event.format(update_fields=', '.join(update_fields))
+                else:
+                    query = f"""
+                    UPDATE releases 
+                    SET {', '.join(update_fields)}
+                    WHERE id = :release_id;
+                    """
 
                 await self.db.update(query, args)
                 span.set_status(StatusCode.OK)
@@ -104,6 +113,24 @@ class ReleaseRepo(interface.IReleaseRepo):
                 span.set_status(StatusCode.ERROR, str(err))
                 raise
 
+    async def update_rollback_log(self, release_id: int, rollback_log: str) -> None:
+        with self.tracer.start_as_current_span(
+                "ReleaseRepo.update_rollback_log",
+                kind=SpanKind.INTERNAL,
+                attributes={
+                    "release_id": release_id,
+                }
+        ) as span:
+            try:
+                args = {'release_id': release_id, 'rollback_log': rollback_log}
+                await self.db.update(update_release_rollback_log, args)
+                span.set_status(StatusCode.OK)
+
+            except Exception as err:
+                span.record_exception(err)
+                span.set_status(StatusCode.ERROR, str(err))
+                raise
+
     async def get_active_release(self) -> list[model.Release]:
         with self.tracer.start_as_current_span(
                 "ReleaseRepo.get_active_release",
@@ -128,7 +155,32 @@ class ReleaseRepo(interface.IReleaseRepo):
         ) as span:
             try:
                 args = {'release_id': release_id}
-                rows = await self.db.select(get_active_releases, args)
+                rows = await self.db.select(get_release_by_id, args)
+                if rows:
+                    rows = model.Release.serialize(rows)
+                span.set_status(StatusCode.OK)
+                return rows
+
+            except Exception as err:
+                span.record_exception(err)
+                span.set_status(StatusCode.ERROR, str(err))
+                raise
+
+    async def get_releases_by_ids(self, release_ids: list[int]) -> list[model.Release]:
+        with self.tracer.start_as_current_span(
+                "ReleaseRepo.get_releases_by_ids",
+                kind=SpanKind.INTERNAL,
+                attributes={
+                    "release_count": len(release_ids),
+                }
+        ) as span:
+            try:
+                if not release_ids:
+                    span.set_status(StatusCode.OK)
+                    return []
+
+                args = {'release_ids': list(release_ids)}
+                rows = await self.db.select(get_releases_by_ids, args)
                 if rows:
                     rows = model.Release.serialize(rows)
                 span.set_status(StatusCode.OK)
@@ -171,4 +223,125 @@ class ReleaseRepo(interface.IReleaseRepo):
             except Exception as err:
                 span.record_exception(err)
                 span.set_status(StatusCode.ERROR, str(err))
-                raise
\ No newline at end of file
+                raise
+
+    async def get_releases_page(
+            self,
+            statuses: list[model.ReleaseStatus],
+            limit: int,
+            cursor_created_at: datetime = None,
+            cursor_id: int = None,
+            service_name: str = None,
+    ) -> list[model.Release]:
+        with self.tracer.start_as_current_span(
+                "ReleaseRepo.get_releases_page",
+                kind=SpanKind.INTERNAL,
+                attributes={
+                    "limit": limit,
+                }
+        ) as span:
+            try:
+                filters = []
+                args: dict = {
+                    'statuses': [status.value for status in statuses],
+                    'limit': limit,
+                }
+
+                if service_name is not None:
+                    filters.append("AND service_name = :service_name")
+                    args['service_name'] = service_name
+
+                # Keyset-пагинация: следующая страница начинается строго после курсора
+                if cursor_created_at is not None and cursor_id is not None:
+                    filters.append("AND (created_at, id) < (:cursor_created_at, :cursor_id)")
+                    args['cursor_created_at'] = cursor_created_at
+                    args['cursor_id'] = cursor_id
+
+                query = get_releases_page.format(filters="\n".join(filters))
+
+                rows = await self.db.select(query, args)
+                if rows:
+                    rows = model.Release.serialize(rows)
+                span.set_status(StatusCode.OK)
+                return rows
+
+            except Exception as err:
+                span.record_exception(err)
+                span.set_status(StatusCode.ERROR, str(err))
+                raise
+
+    async def get_releases_stats(
+            self,
+            statuses: list[model.ReleaseStatus],
+            service_name: str = None,
+    ) -> model.ReleaseStats:
+        with self.tracer.start_as_current_span(
+                "ReleaseRepo.get_releases_stats",
+                kind=SpanKind.INTERNAL
+        ) as span:
+            try:
+                filters = []
+                args: dict = {'statuses': [status.value for status in statuses]}
+
+                if service_name is not None:
+                    filters.append("AND service_name = :service_name")
+                    args['service_name'] = service_name
+
+                query = get_releases_stats.format(filters="\n".join(filters))
+
+                rows = await self.db.select(query, args)
+                stats = model.ReleaseStats.serialize(rows)
+                span.set_status(StatusCode.OK)
+                return stats
+
+            except Exception as err:
+                span.record_exception(err)
+                span.set_status(StatusCode.ERROR, str(err))
+                raise
+
+    async def get_release_events(self, release_ids: list[int]) -> list[model.ReleaseEvent]:
+        with self.tracer.start_as_current_span(
+                "ReleaseRepo.get_release_events",
+                kind=SpanKind.INTERNAL,
+                attributes={
+                    "release_count": len(release_ids),
+                }
+        ) as span:
+            try:
+                if not release_ids:
+                    span.set_status(StatusCode.OK)
+                    return []
+
+                args = {'release_ids': list(release_ids)}
+                rows = await self.db.select(get_release_events_by_release_ids, args)
+                if rows:
+                    rows = model.ReleaseEvent.serialize(rows)
+                span.set_status(StatusCode.OK)
+                return rows
+
+            except Exception as err:
+                span.record_exception(err)
+                span.set_status(StatusCode.ERROR, str(err))
+                raise
+
+    async def get_dora_metrics(self, since: datetime, until: datetime) -> list[model.ServiceDoraMetrics]:
+        with self.tracer.start_as_current_span(
+                "ReleaseRepo.get_dora_metrics",
+                kind=SpanKind.INTERNAL,
+                attributes={
+                    "since": since.isoformat(),
+                    "until": until.isoformat(),
+                }
+        ) as span:
+            try:
+                args = {'since': since, 'until': until}
+                rows = await self.db.select(get_dora_metrics, args)
+                if rows:
+                    rows = model.ServiceDoraMetrics.serialize(rows)
+                span.set_status(StatusCode.OK)
+                return rows
+
+            except Exception as err:
+                span.record_exception(err)
+                span.set_status(StatusCode.ERROR, str(err))
+                raise
@@ -0,0 +1,310 @@
+import asyncio
+import shlex
+import time
+from typing import Awaitable, Callable
+
+import asyncssh
+from opentelemetry.trace import SpanKind, Status, StatusCode
+
+from internal import interface, model, common
+
+# Сколько удаленный процесс может завершаться после TERM, прежде чем timeout пришлет KILL
+_KILL_AFTER = 10
+# Запас локального ожидания сверх удаленного таймаута: remote timeout должен сработать первым
+_LOCAL_TIMEOUT_GRACE = 15
+# Коды выхода GNU timeout: 124 — команда остановлена по TERM, 137 — добита KILL
+_TIMEOUT_EXIT_STATUSES = (124, 137)
+# Код выхода, если отсоединенный процесс исчез, не записав свой код
+_LOST_EXIT_STATUS = 255
+# Пауза перед повторным подключением к логу шага после обрыва SSH
+_REATTACH_INTERVAL = 1
+# Ошибки SSH-канала, после которых процесс шага продолжает работать на хосте
+_CHANNEL_ERRORS = (asyncssh.Error, OSError)
+
+
+class DeployEngine(interface.IDeployEngine):
+    """Выполняет декларативные шаги выкатки на prod через пул SSH-соединений"""
+
+    def __init__(
+            self,
+            tel: interface.ITelemetry,
+            ssh: interface.ISSHClient,
+            health_prober: interface.IHealthProber,
+    ):
+        self.tracer = tel.tracer()
+        self.meter = tel.meter()
+        self.logger = tel.logger()
+        self.ssh = ssh
+        self.health_prober = health_prober
+
+        self.step_duration = self.meter.create_histogram(
+            name=common.DEPLOY_STEP_DURATION_METRIC,
+            description="Duration of deploy steps",
+            unit="s"
+        )
+
+        self.step_counter = self.meter.create_counter(
+            name=common.DEPLOY_STEP_TOTAL_METRIC,
+            description="Total count of deploy steps by result",
+            unit="1"
+        )
+
+    async def run(
+            self,
+            steps: list[model.DeployStep],
+            on_output: Callable[[str], Awaitable[None]] = None,
+    ) -> list[model.DeployStepResult]:
+        with self.tracer.start_as_current_span(
+                "DeployEngine.run",
+                kind=SpanKind.INTERNAL,
+                attributes={
+                    "steps": ",".join(step.name for step in steps),
+                }
+        ) as span:
+            try:
+                self._validate(steps)
+
+                results = {
+                    step.name: model.DeployStepResult(
+                        name=step.name,
+                        status=model.DeployStepStatus.PENDING,
+                        critical=step.critical,
+                    )
+                    for step in steps
+                }
+                finished = {step.name: asyncio.Event() for step in steps}
+
+                async def output(line: str) -> None:
+                    if on_output is not None:
+                        await on_output(line)
+
+                async def run_when_ready(step: model.DeployStep) -> None:
+                    try:
+                        for dependency in step.depends_on:
+                            await finished[dependency].wait()
+
+                        # Упавший критичный шаг отменяет всю ветку, которая от него зависит
+                        blocked_by = [
+                            dependency for dependency in step.depends_on
+                            if results[dependency].is_failed
+                        ]
+                        if blocked_by:
+                            results[step.name].status = model.DeployStepStatus.SKIPPED
+                            results[step.name].error = f"Пропущен из-за {', '.join(blocked_by)}"
+                            await output(f"⏭️ {step.name}: пропущен")
+                            return
+
+                        await self._run_step(step, results[step.name], output)
+                    finally:
+                        finished[step.name].set()
+
+                await asyncio.gather(*(run_when_ready(step) for step in steps))
+
+                ordered_results = [results[step.name] for step in steps]
+                failed_steps = [result.name for result in ordered_results if result.is_failed]
+
+                span.set_attribute("failed_steps", ",".join(failed_steps))
+                span.set_status(Status(StatusCode.OK))
+                return ordered_results
+
+            except Exception as err:
+                span.record_exception(err)
+                span.set_status(Status(StatusCode.ERROR, str(err)))
+                raise err
+
+    async def _run_step(
+            self,
+            step: model.DeployStep,
+            result: model.DeployStepResult,
+            output: Callable[[str], Awaitable[None]],
+    ) -> None:
+        with self.tracer.start_as_current_span(
+                "DeployEngine.run_step",
+                kind=SpanKind.INTERNAL,
+                attributes={
+                    "step": step.name,
+                    "timeout": step.timeout,
+                }
+        ) as span:
+            result.status = model.DeployStepStatus.RUNNING
+            started_at = time.monotonic()
+            await output(f"▶️ {step.name}")
+
+            try:
+                if step.health_url:
+                    # Дедлайн проба соблюдает сама, поэтому без wait_for
+                    await self._probe(step, result, output)
+                else:
+                    result.attempts = 1
+                    exit_status = await asyncio.wait_for(
+                        self._execute(step.name, step.command, output, step.timeout),
+                        timeout=step.timeout + _KILL_AFTER + _LOCAL_TIMEOUT_GRACE
+                    )
+                    if exit_status in _TIMEOUT_EXIT_STATUSES:
+                        raise asyncio.TimeoutError()
+                    if exit_status != 0:
+                        raise Exception(f"Команда завершилась с кодом {exit_status}")
+
+                result.status = model.DeployStepStatus.DONE
+
+            except asyncio.TimeoutError:
+                result.status = model.DeployStepStatus.FAILED
+                result.error = f"Превышен таймаут {step.timeout:.0f}с"
+            except Exception as err:
+                result.status = model.DeployStepStatus.FAILED
+                result.error = str(err)
+
+            result.duration_seconds = round(time.monotonic() - started_at, 1)
+
+            attributes = {"step": step.name, "status": result.status.value}
+            self.step_duration.record(result.duration_seconds, attributes=attributes)
+            self.step_counter.add(1, attributes=attributes)
+            span.set_attribute("attempts", result.attempts)
+
+            if result.status == model.DeployStepStatus.DONE:
+                await output(f"✅ {step.name} за {result.duration_seconds}с")
+                span.set_status(Status(StatusCode.OK))
+                return
+
+            await output(f"❌ {step.name}: {result.error}")
+            self.logger.warning(f"Шаг выкатки {step.name} завершился ошибкой", {"error": result.error})
+            span.set_status(Status(StatusCode.ERROR, result.error))
+
+            if step.on_failure:
+                try:
+                    await asyncio.wait_for(
+                        self._execute(step.name, step.on_failure, output, step.timeout),
+                        timeout=step.timeout + _KILL_AFTER + _LOCAL_TIMEOUT_GRACE
+                    )
+                except Exception as err:
+                    self.logger.warning(f"Не удалось собрать диагностику шага {step.name}", {"error": str(err)})
+
+    async def _probe(
+            self,
+            step: model.DeployStep,
+            result: model.DeployStepResult,
+            output: Callable[[str], Awaitable[None]],
+    ) -> None:
+        async def on_attempt(attempt: int, status_code: int) -> None:
+            response = f"HTTP {status_code}" if status_code else "нет ответа"
+            await output(f"⏳ {step.name}: попытка {attempt}, {response}")
+
+        probe = await self.health_prober.probe(
+            url=step.health_url,
+            deadline=step.timeout,
+            initial_interval=step.poll_interval or None,
+            max_interval=step.max_poll_interval or None,
+            on_attempt=on_attempt,
+        )
+        result.attempts = probe.attempts
+
+        if not probe.ready:
+            if probe.up:
+                raise Exception(f"Процесс запущен, но не готов: HTTP {probe.last_status_code}")
+            raise Exception("Сервис не отвечает")
+
+    async def _execute(
+            self,
+            step_name: str,
+            command: str,
+            output: Callable[[str], Awaitable[None]],
+            timeout: float,
+    ) -> int:
+        # Команда запускается отсоединенной от SSH-канала (setsid nohup): обрыв соединения посреди
+        # migrate или compose up не убивает ее на полпути. Вывод пишется в лог на хосте, код
+        # выхода — в файл exit, а таймаут соблюдает сам хост: timeout шлет TERM всей группе
+        # процессов команды, а через _KILL_AFTER — KILL
+        run_dir = await self._launch(command, timeout)
+
+        # Лог читается tail -f до завершения процесса; после обрыва SSH подключаемся заново
+        # и продолжаем со следующей непрочитанной строки
+        lines_read = 0
+        while True:
+            partial_line = ""
+            try:
+                async with self.ssh.connection() as conn:
+                    async with conn.create_process(
+                            self._follow_command(run_dir, lines_read),
+                            stderr=asyncssh.STDOUT,
+                    ) as process:
+                        async for line in process.stdout:
+                            # Строка, оборванная вместе с каналом, будет перечитана целиком
+                            if not line.endswith("\n"):
+                                partial_line = line
+                                continue
+
+                            lines_read += 1
+                            await output(f"[{step_name}] {line.rstrip()}")
+
+                        completed = await process.wait()
+
+                if completed.exit_status is not None:
+                    if partial_line:
+                        await output(f"[{step_name}] {partial_line.rstrip()}")
+
+                    await self._cleanup(run_dir)
+                    return completed.exit_status
+
+                # asyncssh не бросает исключение при обрыве посреди команды, а возвращает пустой результат
+                raise asyncssh.ConnectionLost("Канал чтения лога шага закрыт без кода выхода")
+
+            except _CHANNEL_ERRORS as err:
+                self.logger.warning(
+                    f"SSH-канал шага {step_name} оборвался, процесс продолжает работу на хосте",
+                    {"error": str(err), "run_dir": run_dir}
+                )
+                await asyncio.sleep(_REATTACH_INTERVAL)
+
+    async def _launch(self, command: str, timeout: float) -> str:
+        detached_command = (
+            f"timeout --signal=TERM --kill-after={_KILL_AFTER} {max(timeout, 1):g} "
+            f"bash -c {shlex.quote(command)} >> \"$0/log\" 2>&1; "
+            f"echo $? > \"$0/exit.tmp\" && mv \"$0/exit.tmp\" \"$0/exit\""
+        )
+        launch_command = (
+            "run_dir=$(mktemp -d /tmp/deploy-step.XXXXXXXX) && : > \"$run_dir/log\" && "
+            f"{{ setsid nohup bash -c {shlex.quote(detached_command)} \"$run_dir\" "
+            "< /dev/null > /dev/null 2>&1 & echo $! > \"$run_dir/pid\"; } && echo \"$run_dir\""
+        )
+
+        # Запуск короткий и до старта команды безопасен для повтора, поэтому идет через обычный run
+        result = await self.ssh.run(launch_command, timeout=_LOCAL_TIMEOUT_GRACE)
+        run_dir = (result.stdout or "").strip()
+        if result.exit_status != 0 or not run_dir:
+            raise Exception(f"Не удалось запустить команду на хосте: {(result.stdout or '').strip()}")
+        return run_dir
+
+    def _follow_command(self, run_dir: str, lines_read: int) -> str:
+        run_dir = shlex.quote(run_dir)
+        return (
+            f"tail -n +{lines_read + 1} -s 0.2 -f --pid=\"$(cat {run_dir}/pid)\" {run_dir}/log; "
+            f"exit \"$(cat {run_dir}/exit 2>/dev/null || echo {_LOST_EXIT_STATUS})\""
+        )
+
+    async def _cleanup(self, run_dir: str) -> None:
+        # Каталог удаляется отдельно: tail из оборванной сессии может еще дочитывать лог
+        try:
+            await self.ssh.run(f"rm -rf {shlex.quote(run_dir)}", timeout=_LOCAL_TIMEOUT_GRACE)
+        except Exception as err:
+            self.logger.warning(f"Не удалось удалить {run_dir} на хосте", {"error": str(err)})
+
+    def _validate(self, steps: list[model.DeployStep]) -> None:
+        names = [step.name for step in steps]
+        if len(set(names)) != len(names):
+            raise ValueError("Имена шагов выкатки должны быть уникальны")
+
+        steps_by_name = {step.name: step for step in steps}
+        for step in steps:
+            unknown = [dependency for dependency in step.depends_on if dependency not in steps_by_name]
+            if unknown:
+                raise ValueError(f"Шаг {step.name} зависит от неизвестных шагов: {', '.join(unknown)}")
+
+        # Цикл в зависимостях подвесил бы выкатку навсегда
+        resolved = set()
+        remaining = list(steps)
+        while remaining:
+            ready = [step for step in remaining if all(dep in resolved for dep in step.depends_on)]
+            if not ready:
+                raise ValueError(f"Циклическая зависимость шагов: {', '.join(step.name for step in remaining)}")
+            resolved.update(step.name for step in ready)
+            remaining = [step for step in remaining if step.name not in resolved]
@@ -0,0 +1,104 @@
+import asyncio
+import random
+import time
+from typing import Awaitable, Callable
+
+from opentelemetry.trace import SpanKind, Status, StatusCode
+
+from internal import interface, model
+
+
+class HealthProber(interface.IHealthProber):
+    """Опрашивает /health сервиса с prod-хоста: частые первые попытки,
+    дальше экспоненциальная пауза с джиттером и общий дедлайн"""
+
+    def __init__(
+            self,
+            tel: interface.ITelemetry,
+            ssh: interface.ISSHClient,
+            initial_interval: float = 1,
+            max_interval: float = 10,
+            backoff: float = 1.5,
+            request_timeout: float = 5,
+    ):
+        self.tracer = tel.tracer()
+        self.logger = tel.logger()
+        self.ssh = ssh
+
+        self.initial_interval = initial_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.request_timeout = request_timeout
+
+    async def probe(
+            self,
+            url: str,
+            deadline: float,
+            initial_interval: float = None,
+            max_interval: float = None,
+            on_attempt: Callable[[int, int], Awaitable[None]] = None,
+    ) -> model.HealthProbeResult:
+        with self.tracer.start_as_current_span(
+                "HealthProber.probe",
+                kind=SpanKind.INTERNAL,
+                attributes={
+                    "url": url,
+                    "deadline": deadline,
+                }
+        ) as span:
+            try:
+                started_at = time.monotonic()
+                deadline_at = started_at + deadline
+                interval = initial_interval or self.initial_interval
+                max_interval = max_interval or self.max_interval
+
+                attempts = 0
+                up = False
+                while True:
+                    attempts += 1
+                    remaining = deadline_at - time.monotonic()
+                    status_code = await self._status_code(url, min(self.request_timeout, max(remaining, 1)))
+                    up = up or status_code > 0
+
+                    if status_code == 200:
+                        break
+
+                    if on_attempt is not None:
+                        await on_attempt(attempts, status_code)
+
+                    remaining = deadline_at - time.monotonic()
+                    if remaining <= 0:
+                        break
+
+                    # Джиттер разводит пробы параллельных откатов во времени
+                    await asyncio.sleep(min(random.uniform(interval / 2, interval), remaining))
+                    interval = min(interval * self.backoff, max_interval)
+
+                result = model.HealthProbeResult(
+                    up=up,
+                    ready=status_code == 200,
+                    attempts=attempts,
+                    elapsed_seconds=round(time.monotonic() - started_at, 1),
+                    last_status_code=status_code,
+                )
+
+                span.set_attribute("ready", result.ready)
+                span.set_attribute("attempts", attempts)
+                span.set_status(Status(StatusCode.OK))
+                return result
+
+            except Exception as err:
+                span.record_exception(err)
+                span.set_status(Status(StatusCode.ERROR, str(err)))
+                raise err
+
+    async def _status_code(self, url: str, timeout: float) -> int:
+        # Запрос идет с prod-хоста, как и у трафика через домен
+        command = f"curl -s -o /dev/null --max-time {timeout:.0f} -w '%{{http_code}}' {url}"
+        try:
+            result = await self.ssh.run(command, timeout=timeout + 5)
+            status_code = result.stdout.strip()
+            return int(status_code) if status_code.isdigit() else 0
+        except Exception as err:
+            self.logger.warning(f"Не удалось выполнить health-пробу {url}", {"error": str(err)})
+            return 0
@@ -1,9 +1,13 @@
+import asyncio
+import shlex
 import time
+from collections import deque
+from datetime import datetime, timedelta, timezone
+from typing import Awaitable, Callable
 
-import asyncssh
 from opentelemetry.trace import SpanKind, Status, StatusCode
 
-from internal import interface, model
+from internal import interface, model, common
 
 
 class ReleaseService(interface.IReleaseService):
@@ -11,20 +15,29 @@ class ReleaseService(interface.IReleaseService):
             self,
             tel: interface.ITelemetry,
             release_repo: interface.IReleaseRepo,
-            prod_host: str,
-            prod_password: str,
+            deploy_engine: interface.IDeployEngine,
             prod_domain: str,
             service_port_map: dict[str, int],
             service_prefix_map: dict[str, str],
+            rollback_log_tail_lines: int,
+            rollback_log_flush_interval: float,
+            rollback_concurrency: int,
+            migration_image: str = "python:3.11-slim",
     ):
         self.tracer = tel.tracer()
         self.logger = tel.logger()
         self.release_repo = release_repo
-        self.prod_host = prod_host
-        self.prod_password = prod_password
+        self.deploy_engine = deploy_engine
         self.prod_domain = prod_domain
         self.service_port_map = service_port_map
         self.service_prefix_map = service_prefix_map
+        self.rollback_log_tail_lines = rollback_log_tail_lines
+        self.rollback_log_flush_interval = rollback_log_flush_interval
+        self.rollback_concurrency = rollback_concurrency
+        self.migration_image = migration_image
+
+        # Два отката одного сервиса одновременно перетирали бы друг другу код и миграции
+        self._rollback_locks: dict[str, asyncio.Lock] = {}
 
     async def create_release(
             self,
@@ -138,6 +151,62 @@ class ReleaseService(interface.IReleaseService):
                 span.set_status(Status(StatusCode.ERROR, str(err)))
                 raise err
 
+    async def get_releases_by_ids(self, release_ids: list[int]) -> list[model.Release]:
+        with self.tracer.start_as_current_span(
+                "ReleaseService.get_releases_by_ids",
+                kind=SpanKind.INTERNAL
+        ) as span:
+            try:
+                releases = await self.release_repo.get_releases_by_ids(release_ids)
+
+                span.set_status(Status(StatusCode.OK))
+                return releases
+
+            except Exception as err:
+                span.record_exception(err)
+                span.set_status(Status(StatusCode.ERROR, str(err)))
+                raise err
+
+    async def get_release_events(self, release_ids: list[int]) -> list[model.ReleaseEvent]:
+        with self.tracer.start_as_current_span(
+                "ReleaseService.get_release_events",
+                kind=SpanKind.INTERNAL
+        ) as span:
+            try:
+                events = await self.release_repo.get_release_events(release_ids)
+
+                span.set_status(Status(StatusCode.OK))
+                return events
+
+            except Exception as err:
+                span.record_exception(err)
+                span.set_status(Status(StatusCode.ERROR, str(err)))
+                raise err
+
+    async def get_dora_metrics(self, days: int) -> list[model.ServiceDoraMetrics]:
+        with self.tracer.start_as_current_span(
+                "ReleaseService.get_dora_metrics",
+                kind=SpanKind.INTERNAL,
+                attributes={
+                    "days": days,
+                }
+        ) as span:
+            try:
+                # Границы округляем до минуты, чтобы повторные запросы попадали в кеш периода.
+                # created_at хранится как TIMESTAMP без зоны в UTC
+                until = datetime.now(timezone.utc).replace(tzinfo=None, second=0, microsecond=0) + timedelta(minutes=1)
+                since = until - timedelta(days=days)
+
+                metrics = await self.release_repo.get_dora_metrics(since, until)
+
+                span.set_status(Status(StatusCode.OK))
+                return metrics
+
+            except Exception as err:
+                span.record_exception(err)
+                span.set_status(Status(StatusCode.ERROR, str(err)))
+                raise err
+
     async def get_successful_releases(self) -> list[model.Release]:
         with self.tracer.start_as_current_span(
                 "ReleaseService.get_successful_releases",
@@ -170,216 +239,362 @@ class ReleaseService(interface.IReleaseService):
                 span.set_status(Status(StatusCode.ERROR, str(err)))
                 raise err
 
+    async def get_releases_page(
+            self,
+            statuses: list[model.ReleaseStatus],
+            limit: int,
+            cursor_created_at: datetime = None,
+            cursor_id: int = None,
+            service_name: str = None,
+    ) -> list[model.Release]:
+        with self.tracer.start_as_current_span(
+                "ReleaseService.get_releases_page",
+                kind=SpanKind.INTERNAL
+        ) as span:
+            try:
+                releases = await self.release_repo.get_releases_page(
+                    statuses=statuses,
+                    limit=limit,
+                    cursor_created_at=cursor_created_at,
+                    cursor_id=cursor_id,
+                    service_name=service_name,
+                )
+
+                span.set_status(Status(StatusCode.OK))
+                return releases
+
+            except Exception as err:
+                span.record_exception(err)
+                span.set_status(Status(StatusCode.ERROR, str(err)))
+                raise err
+
     async def rollback_to_tag(
             self,
             release_id: int,
             service_name: str,
             target_tag: str,
-    ):
-        async with asyncssh.connect(
-                host=self.prod_host,
-                username="root",
-                password=self.prod_password,
-                connect_timeout=30,
-                known_hosts=None
-        ) as conn:
-            script_file = f"/tmp/rollback_{service_name}_{target_tag}.sh"
-
-            rollback_script = self._generate_prod_rollback_command(
-                release_id=release_id,
-                service_name=service_name,
-                target_tag=target_tag,
-                system_repo="name-system"
-            )
-
-            # Upload the script to the server
-            async with conn.start_sftp_client() as sftp:
-                async with sftp.open(script_file, 'w') as remote_file:
-                    await remote_file.write(rollback_script)
-
-            # Делаем скрипт исполняемым и запускаем в фоне
-            command = f"chmod +x {script_file} && nohup bash {script_file} > /dev/null 2>&1 & echo $!"
-
-            await conn.run(command, check=False)
-
-    def _generate_prod_rollback_command(
+            on_log: Callable[[str], Awaitable[None]] = None,
+    ) -> bool:
+        with self.tracer.start_as_current_span(
+                "ReleaseService.rollback_to_tag",
+                kind=SpanKind.INTERNAL,
+                attributes={
+                    "release_id": release_id,
+                    "service_name": service_name,
+                    "target_tag": target_tag,
+                }
+        ) as span:
+            log_tail = deque(maxlen=self.rollback_log_tail_lines)
+            last_flush_at = 0.0
+
+            async def flush():
+                rollback_log = "\n".join(log_tail)
+                await self.release_repo.update_rollback_log(release_id, rollback_log)
+                if on_log is not None:
+                    await on_log(rollback_log)
+
+            async def on_output(line: str):
+                nonlocal last_flush_at
+                log_tail.append(line)
+
+                # Частота обновлений ограничена лимитами Telegram на редактирование сообщений
+                if time.monotonic() - last_flush_at >= self.rollback_log_flush_interval:
+                    await flush()
+                    last_flush_at = time.monotonic()
+
+            # Отказ до начала отката: статус релиза принадлежит уже идущему откату
+            rollback_lock = self._rollback_lock(service_name)
+            if rollback_lock.locked():
+                raise common.RollbackInProgressError(service_name)
+
+            try:
+                async with rollback_lock:
+                    await self.release_repo.update_release(
+                        release_id=release_id,
+                        status=model.ReleaseStatus.ROLLBACK,
+                    )
+
+                    results = await self.deploy_engine.run(
+                        self._rollback_steps(service_name, target_tag, system_repo="name-system"),
+                        on_output=on_output,
+                    )
+                    succeeded = not any(result.is_failed for result in results)
+
+                    await flush()
+                    await self.release_repo.update_release(
+                        release_id=release_id,
+                        status=model.ReleaseStatus.ROLLBACK_DONE if succeeded else model.ReleaseStatus.ROLLBACK_FAILED,
+                    )
+
+                span.set_attribute("succeeded", succeeded)
+                span.set_status(Status(StatusCode.OK))
+                return succeeded
+
+            except Exception as err:
+                span.record_exception(err)
+                span.set_status(Status(StatusCode.ERROR, str(err)))
+
+                try:
+                    await self.release_repo.update_release(
+                        release_id=release_id,
+                        status=model.ReleaseStatus.ROLLBACK_FAILED,
+                    )
+                except Exception as update_err:
+                    self.logger.error(
+                        f"Не удалось отметить откат релиза {release_id} как неудачный",
+                        {"error": str(update_err)}
+                    )
+                raise err
+
+    async def plan_rollback_batch(self, targets: list[model.RollbackTarget]) -> list[model.RollbackProgress]:
+        with self.tracer.start_as_current_span(
+                "ReleaseService.plan_rollback_batch",
+                kind=SpanKind.INTERNAL,
+                attributes={
+                    "services": ",".join(target.service_name for target in targets),
+                }
+        ) as span:
+            try:
+                if not targets:
+                    raise common.ValidationError("Не выбрано ни одного сервиса для отката")
+
+                service_names = [target.service_name for target in targets]
+                if len(set(service_names)) != len(service_names):
+                    raise common.ValidationError("Сервис не может откатываться дважды в одной пачке")
+
+                plan = []
+                for target in targets:
+                    if target.service_name not in self.service_port_map:
+                        raise common.ValidationError(f"Неизвестный сервис {target.service_name}")
+
+                    if await self.is_rollback_running(target.service_name):
+                        raise common.RollbackInProgressError(target.service_name)
+
+                    # Текущая версия сервиса берется из его последнего успешного релиза
+                    current_releases = await self.release_repo.get_releases_page(
+                        statuses=model.SUCCESSFUL_RELEASE_STATUSES,
+                        limit=1,
+                        service_name=target.service_name,
+                    )
+                    if not current_releases:
+                        raise common.ValidationError(f"У сервиса {target.service_name} нет успешных релизов")
+                    current_release = current_releases[0]
+                    current_tag = current_release.running_tag
+
+                    target_tag = target.target_tag
+                    if not target_tag:
+                        # Релизы ROLLBACK_DONE — версии, с которых уже откатывались, целью по умолчанию они не бывают
+                        previous_releases = await self.release_repo.get_releases_page(
+                            statuses=[model.ReleaseStatus.DEPLOYED],
+                            limit=10,
+                            cursor_created_at=current_release.created_at,
+                            cursor_id=current_release.id,
+                            service_name=target.service_name,
+                        )
+                        previous_tags = [
+                            release.release_tag for release in previous_releases
+                            if release.release_tag != current_tag
+                        ]
+                        if not previous_tags:
+                            raise common.ValidationError(f"У сервиса {target.service_name} нет версий для отката")
+                        target_tag = previous_tags[0]
+
+                    if target_tag == current_tag:
+                        raise common.ValidationError(f"Сервис {target.service_name} уже работает на версии {target_tag}")
+
+                    plan.append(model.RollbackProgress(
+                        release_id=current_release.id,
+                        service_name=target.service_name,
+                        release_tag=current_tag,
+                        target_tag=target_tag,
+                    ))
+
+                span.set_status(Status(StatusCode.OK))
+                return plan
+
+            except Exception as err:
+                span.record_exception(err)
+                span.set_status(Status(StatusCode.ERROR, str(err)))
+                raise err
+
+    async def rollback_batch(
+            self,
+            plan: list[model.RollbackProgress],
+            on_progress: Callable[[list[model.RollbackProgress]], Awaitable[None]] = None,
+    ) -> list[model.RollbackProgress]:
+        with self.tracer.start_as_current_span(
+                "ReleaseService.rollback_batch",
+                kind=SpanKind.INTERNAL,
+                attributes={
+                    "services": ",".join(progress.service_name for progress in plan),
+                    "concurrency": self.rollback_concurrency,
+                }
+        ) as span:
+            try:
+                # Откаты независимы, поэтому общее время — самый долгий из них, а не сумма
+                semaphore = asyncio.Semaphore(self.rollback_concurrency)
+
+                async def report():
+                    finished_count = sum(1 for progress in plan if progress.is_finished)
+                    self.logger.info(f"Пакетный откат: завершено {finished_count} из {len(plan)}")
+
+                    if on_progress is None:
+                        return
+                    try:
+                        await on_progress(plan)
+                    except Exception as err:
+                        # Ошибка отображения прогресса не должна прерывать сам откат
+                        self.logger.warning("Не удалось передать прогресс пакетного отката", {"error": str(err)})
+
+                async def rollback_one(progress: model.RollbackProgress):
+                    async with semaphore:
+                        progress.status = model.ReleaseStatus.ROLLBACK
+                        await report()
+
+                        try:
+                            # Откат мог начаться после планирования — цель чужого отката не перезаписываем
+                            if self._rollback_lock(progress.service_name).locked():
+                                raise common.RollbackInProgressError(progress.service_name)
+
+                            await self.release_repo.update_release(
+                                release_id=progress.release_id,
+                                rollback_to_tag=progress.target_tag,
+                            )
+
+                            succeeded = await self.rollback_to_tag(
+                                release_id=progress.release_id,
+                                service_name=progress.service_name,
+                                target_tag=progress.target_tag,
+                            )
+
+                            # Итоговый статус в releases выставляет rollback_to_tag
+                            if succeeded:
+                                progress.status = model.ReleaseStatus.ROLLBACK_DONE
+                            else:
+                                progress.status = model.ReleaseStatus.ROLLBACK_FAILED
+                                progress.error = "Шаг отката завершился ошибкой, подробности в логе релиза"
+
+                        except Exception as err:
+                            self.logger.error(
+                                f"Ошибка отката сервиса {progress.service_name} на версию {progress.target_tag}",
+                                {"error": str(err)}
+                            )
+                            progress.status = model.ReleaseStatus.ROLLBACK_FAILED
+                            progress.error = str(err)
+
+                    await report()
+
+                await asyncio.gather(*(rollback_one(progress) for progress in plan))
+
+                failed_count = sum(1 for progress in plan if progress.status == model.ReleaseStatus.ROLLBACK_FAILED)
+                span.set_attribute("failed_count", failed_count)
+                span.set_status(Status(StatusCode.OK))
+                return plan
+
+            except Exception as err:
+                span.record_exception(err)
+                span.set_status(Status(StatusCode.ERROR, str(err)))
+                raise err
+
+    async def is_rollback_running(self, service_name: str) -> bool:
+        # Блокировка видит откаты этого процесса, статус ROLLBACK в базе — начатые кем угодно
+        if self._rollback_lock(service_name).locked():
+            return True
+
+        rollback_releases = await self.release_repo.get_releases_page(
+            statuses=[model.ReleaseStatus.ROLLBACK],
+            limit=1,
+            service_name=service_name,
+        )
+        return bool(rollback_releases)
+
+    def _rollback_lock(self, service_name: str) -> asyncio.Lock:
+        return self._rollback_locks.setdefault(service_name, asyncio.Lock())
+
+    def _rollback_steps(
             self,
-            release_id: int,
             service_name: str,
             target_tag: str,
             system_repo: str
-    ) -> str:
-        prefix = self.service_prefix_map[service_name]
-        port = self.service_port_map[service_name]
-        release_tg_bot_url = f"{self.prod_domain}{self.service_prefix_map["name-release-tg-bot"]}"
-
-        rollback_commands = f"""# Откат сервиса {service_name} на версию {target_tag}
-curl -s -X PATCH \
--H "Content-Type: application/json" \
--d '{{
-    "release_id": {release_id},
-    "status": "rollback"
-}}' \
-"{release_tg_bot_url}/release"
-                      
-set -e
-
-# Создаем директорию для логов если её нет
-mkdir -p /var/log/deployments/rollback/{service_name}
-
-# Создаем файл лога с именем версии для отката
-LOG_FILE="/var/log/deployments/rollback/{service_name}/{target_tag}-rollback.log"
-
-# Функция для логирования
-log_message() {{
-    local message="$1"
-    echo "$(date '+%Y-%m-%d %H:%M:%S') - $message" | tee -a "$LOG_FILE"
-}}
-
-log_message "🔄 Начинаем откат сервиса {service_name} на версию {target_tag}"
-
-# 1. Переходим в директорию сервиса
-cd name/{service_name}
-
-# 2. Сохраняем текущее состояние для проверки
-CURRENT_REF=$(git symbolic-ref --short HEAD 2>/dev/null || git describe --tags --exact-match 2>/dev/null || git rev-parse --short HEAD)
-log_message "🔍 Текущее состояние до отката: $CURRENT_REF"
-
-docker run --rm \
-    --network net \
-    -v ./:/app \
-    -w /app \
-    -e PREVIOUS_TAG={target_tag} \
-    --env-file ../{system_repo}/env/.env.app \
-    --env-file ../{system_repo}/env/.env.db \
-    --env-file ../{system_repo}/env/.env.monitoring \
-    python:3.11-slim \
-    bash -c '
-      echo "📦 Установка зависимостей..."
-      cd .github && pip install -r requirements.txt && cd ..
-      
-      echo "✅ Зависимости установлены"
-      echo "🚀 Запуск откачивания миграции..."
-      
-      python internal/migration/run.py prod --command down --version $PREVIOUS_TAG
-    ' 2>&1 | tee -a "$LOG_FILE"
-
-# 3. Обновляем репозиторий и версии
-log_message "📥 Обновляем репозиторий и теги для отката..."
-
-if git tag -l | grep -q "^{target_tag}$"; then
-    log_message "🏷️ Локальный тег {target_tag} уже существует, удаляем для обновления"
-    git tag -d {target_tag} 2>&1 | tee -a "$LOG_FILE"
-fi
-
-log_message "📥 Получаем обновления из удаленного репозитория"
-git fetch origin 2>&1 | tee -a "$LOG_FILE"
-
-log_message "📥 Принудительно обновляем теги"
-git fetch origin --tags --force 2>&1 | tee -a "$LOG_FILE"
-
-# 4. Проверяем наличие целевого тега
-if ! git tag -l | grep -q "^{target_tag}$"; then
-    log_message "❌ Тег {target_tag} не найден в репозитории после обновления!"
-    log_message "📋 Доступные теги:"
-    git tag -l | tail -10 | tee -a "$LOG_FILE"
-    exit 1
-fi
-
-log_message "✅ Тег {target_tag} найден и готов к использованию для отката"
-
-# 5. Переключаемся на целевой тег
-log_message "🔄 Переключаемся на тег {target_tag} для отката..."
-git checkout {target_tag} 2>&1 | tee -a "$LOG_FILE"
-
-# Очищаем старые ветки (кроме main/master)
-log_message "🧹 Очищаем старые ветки"
-git for-each-ref --format='%(refname:short)' refs/heads | grep -v -E "^(main|master)$" | xargs -r git branch -D 2>&1 | tee -a "$LOG_FILE"
-
-# Очищаем удаленные ветки
-log_message "🧹 Очищаем удаленные ветки"
-git remote prune origin 2>&1 | tee -a "$LOG_FILE"
-
-log_message "✅ Переключение на тег {target_tag} для отката завершено"
-
-# 6. Переходим в директорию системы
-cd ../{system_repo}
-
-# 7. Загружаем переменные окружения
-export $(cat env/.env.app env/.env.db env/.env.monitoring | xargs)
-
-log_message "🔨 Начинаем пересборку контейнера для отката на тег {target_tag}..."
-
-log_message "🔧 Запускаем контейнер с откаченной версией..."
-docker compose -f ./docker-compose/app.yaml up -d --build {service_name} 2>&1 | tee -a "$LOG_FILE"
-
-# Показываем информацию о созданных образах
-log_message "📋 Созданные образы после отката:"
-docker images | grep {service_name} | tee -a "$LOG_FILE"
-
-# 8. Проверяем здоровье сервиса после отката
-check_health() {{
-    # Если есть HTTP endpoint
-    if curl -f -s -o /dev/null -w "%{{http_code}}" {self.prod_domain}{prefix}/health | grep -q "200"; then
-        return 0
-    else
-        return 1
-    fi
-}}
-
-MAX_ATTEMPTS=5
-ATTEMPT=1
-SUCCESS=false
-
-log_message "⏳ Ждем запуска сервиса после отката..."
-sleep 15
-
-while [ $ATTEMPT -le $MAX_ATTEMPTS ]; do
-    log_message "🔍 Проверка health после отката (попытка $ATTEMPT из $MAX_ATTEMPTS)..."
-
-    if check_health; then
-        log_message "✅ Health check пройден после отката!"
-        SUCCESS=true
-        break
-    else
-        log_message "⏳ Health check не пройден, ждем..."
-        sleep 20
-    fi
-
-    ATTEMPT=$((ATTEMPT + 1))
-done
-
-if [ "$SUCCESS" = false ]; then
-    log_message "❌ Health check не пройден после $MAX_ATTEMPTS попыток"
-    log_message "📋 Логи контейнера:"
-    docker logs --tail 100 {service_name} 2>&1 | tee -a "$LOG_FILE"
-    curl -s -X PATCH \
-    -H "Content-Type: application/json" \
-    -d '{{
-        "release_id": {release_id},
-        "status": "rollback_failed"
-    }}' \
-    "{release_tg_bot_url}/release"
-    exit 1
-fi
-
-curl -s -X PATCH \
--H "Content-Type: application/json" \
--d '{{
-    "release_id": {release_id},
-    "status": "rollback_done"
-}}' \
-"{release_tg_bot_url}/release"
-
-log_message "🎉 Откат на тег {target_tag} завершен успешно! Сервис работает!"
-log_message "📊 Сервис: {service_name}"
-log_message "🏷️ Версия: {target_tag}"
-log_message "✅ Статус: Успешно откачен"
-log_message "📁 Лог отката сохранен в: $LOG_FILE"
-
-# Выводим последние строки лога
-echo "📋 Последние строки лога отката:"
-tail -20 "$LOG_FILE" 
-"""
-
-        return rollback_commands
+    ) -> list[model.DeployStep]:
+        service_dir = f"name/{service_name}"
+        system_dir = f"name/{system_repo}"
+        tag = shlex.quote(target_tag)
+        health_url = f"{self.prod_domain}{self.service_prefix_map[service_name]}/health"
+        env_files = " ".join(
+            f"--env-file ../{system_repo}/env/{env_file}"
+            for env_file in (".env.app", ".env.db", ".env.monitoring")
+        )
+
+        return [
+            # Один fetch с --tags --force обновляет и ветки, и перезаписывает локальные теги
+            model.DeployStep(
+                name="git_fetch",
+                command=(
+                    f"cd {service_dir} && git fetch origin --tags --force && "
+                    f"(git rev-parse --verify --quiet refs/tags/{tag} > /dev/null || "
+                    f"(echo 'Тег {target_tag} не найден, последние теги:'; git tag -l | tail -10; exit 1))"
+                ),
+                timeout=120,
+            ),
+            # Образ для миграций подтягивается параллельно с fetch и только если его нет
+            model.DeployStep(
+                name="migration_image",
+                command=f"docker image inspect {self.migration_image} > /dev/null 2>&1 || docker pull -q {self.migration_image}",
+                timeout=300,
+            ),
+            # Тег проверен до отката миграций, чтобы не откатить схему без кода под нее.
+            # Кеш pip живет в volume, поэтому зависимости не скачиваются заново каждый раз
+            model.DeployStep(
+                name="migrate_down",
+                command=(
+                    f"cd {service_dir} && docker run --rm --network net -v ./:/app -w /app "
+                    f"-v name-migration-pip-cache:/root/.cache/pip -e PREVIOUS_TAG={tag} {env_files} "
+                    f"{self.migration_image} bash -c '"
+                    f"pip install -q --disable-pip-version-check -r .github/requirements.txt && "
+                    f"python internal/migration/run.py prod --command down --version \"$PREVIOUS_TAG\"'"
+                ),
+                timeout=600,
+                depends_on=["git_fetch", "migration_image"],
+            ),
+            model.DeployStep(
+                name="git_checkout",
+                command=f"cd {service_dir} && git checkout {tag}",
+                timeout=60,
+                depends_on=["migrate_down"],
+            ),
+            # Уборка веток не влияет на рабочее дерево и идет параллельно со сборкой
+            model.DeployStep(
+                name="git_cleanup",
+                command=(
+                    f"cd {service_dir} && "
+                    f"git for-each-ref --format='%(refname:short)' refs/heads | "
+                    f"grep -v -E '^(main|master)$' | xargs -r git branch -D; "
+                    f"git remote prune origin"
+                ),
+                timeout=60,
+                depends_on=["git_checkout"],
+                critical=False,
+            ),
+            model.DeployStep(
+                name="compose_up",
+                command=(
+                    f"cd {system_dir} && "
+                    f"export $(cat env/.env.app env/.env.db env/.env.monitoring | xargs) && "
+                    f"docker compose -f ./docker-compose/app.yaml up -d --build {service_name}"
+                ),
+                timeout=900,
+                depends_on=["git_checkout"],
+            ),
+            # Частые проверки сразу после старта, дальше пауза с джиттером растет до max_poll_interval
+            model.DeployStep(
+                name="health_probe",
+                command="",
+                health_url=health_url,
+                timeout=180,
+                depends_on=["compose_up"],
+                on_failure=f"docker logs --tail 100 {service_name}",
+                poll_interval=1,
+                max_poll_interval=10,
+            ),
+        ]
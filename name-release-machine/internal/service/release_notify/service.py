@@ -0,0 +1,119 @@
+import asyncio
+import json
+import time
+
+from aiogram import Bot
+from aiogram_dialog import BgManagerFactory, ShowMode
+from opentelemetry.trace import SpanKind, Status, StatusCode
+
+from internal import interface, model
+
+
+class ReleaseNotifyService(interface.IReleaseNotifyService):
+    def __init__(
+            self,
+            tel: interface.ITelemetry,
+            bot: Bot,
+            release_cache: interface.IReleaseCache,
+            subscription_ttl: float,
+            update_interval: float = 1,
+    ):
+        self.tracer = tel.tracer()
+        self.logger = tel.logger()
+        self.bot = bot
+        self.release_cache = release_cache
+        self.subscription_ttl = subscription_ttl
+        # Не чаще одного перерисовывания окна подписчика за update_interval секунд
+        self.update_interval = update_interval
+
+        self.bg_factory: BgManagerFactory | None = None
+
+        # (user_id, chat_id) -> время последнего показа списка релизов
+        self.subscribers: dict[tuple[int, int], float] = {}
+        # Время последнего обновления окна и запланированные обновления подписчиков
+        self._last_update: dict[tuple[int, int], float] = {}
+        self._pending_updates: dict[tuple[int, int], asyncio.Task] = {}
+
+    def set_bg_factory(self, bg_factory: BgManagerFactory) -> None:
+        self.bg_factory = bg_factory
+
+    def subscribe(self, user_id: int, chat_id: int) -> None:
+        self.subscribers[(user_id, chat_id)] = time.monotonic()
+
+    def unsubscribe(self, user_id: int, chat_id: int) -> None:
+        self.subscribers.pop((user_id, chat_id), None)
+        self._last_update.pop((user_id, chat_id), None)
+
+        task = self._pending_updates.pop((user_id, chat_id), None)
+        if task is not None and task is not asyncio.current_task():
+            task.cancel()
+
+    async def handle_release_changed(self, payload: str) -> None:
+        with self.tracer.start_as_current_span(
+                "ReleaseNotifyService.handle_release_changed",
+                kind=SpanKind.INTERNAL
+        ) as span:
+            try:
+                event = json.loads(payload)
+                release_id = event["id"]
+                status = model.ReleaseStatus(event["status"])
+
+                span.set_attribute("release_id", release_id)
+                span.set_attribute("status", status.value)
+
+                # Запись могла прийти не через этот процесс — сбрасываем кеш сами
+                self.release_cache.invalidate_release(release_id, status)
+
+                if self.bg_factory is None:
+                    span.set_status(Status(StatusCode.OK))
+                    return
+
+                # Забываем пользователей, которые давно не открывали списки релизов
+                expired_before = time.monotonic() - self.subscription_ttl
+                for (user_id, chat_id), last_seen in list(self.subscribers.items()):
+                    if last_seen < expired_before:
+                        self.unsubscribe(user_id, chat_id)
+
+                for subscriber in list(self.subscribers):
+                    # Уже запланированное обновление перечитает данные и покажет последний статус
+                    if subscriber in self._pending_updates:
+                        continue
+
+                    delay = self._last_update.get(subscriber, float("-inf")) + self.update_interval - time.monotonic()
+                    self._pending_updates[subscriber] = asyncio.create_task(
+                        self._update_dialog(subscriber, max(delay, 0))
+                    )
+
+                self.logger.info(f"Релиз {release_id} перешел в статус {status.value}")
+
+                span.set_status(Status(StatusCode.OK))
+
+            except Exception as err:
+                span.record_exception(err)
+                span.set_status(Status(StatusCode.ERROR, str(err)))
+                raise err
+
+    async def _update_dialog(self, subscriber: tuple[int, int], delay: float) -> None:
+        user_id, chat_id = subscriber
+        try:
+            await asyncio.sleep(delay)
+
+            # Перед отправкой снимаем отметку: уведомления во время запроса запланируют следующее обновление
+            self._pending_updates.pop(subscriber, None)
+            self._last_update[subscriber] = time.monotonic()
+
+            bg_manager = self.bg_factory.bg(
+                bot=self.bot,
+                user_id=user_id,
+                chat_id=chat_id,
+            )
+            # Пустое обновление перерисовывает окно, геттер заново читает данные
+            await bg_manager.update({}, show_mode=ShowMode.EDIT)
+        except asyncio.CancelledError:
+            raise
+        except Exception as err:
+            self.unsubscribe(user_id, chat_id)
+            self.logger.warning(
+                f"Не удалось обновить диалог пользователя {user_id}",
+                {"error": str(err)}
+            )
@@ -0,0 +1,253 @@
+import asyncio
+import re
+from datetime import datetime, timezone, timedelta
+
+from opentelemetry.trace import SpanKind, Status, StatusCode
+
+from internal import interface, model, common
+
+_ACTION_LINK_PATTERN = re.compile(r"github\.com/([^/]+)/([^/]+)/actions/runs/")
+
+# Статусы, которые выставляет сам workflow: (успешное завершение, неуспешное завершение).
+# MANUAL_TESTING и MANUAL_TEST_PASSED ждут людей, ROLLBACK ведет сам бот — их не трогаем
+_RUN_OUTCOME_STATUSES = {
+    model.ReleaseStatus.INITIATED: (
+        model.ReleaseStatus.MANUAL_TESTING,
+        model.ReleaseStatus.STAGE_BUILDING_FAILED,
+    ),
+    model.ReleaseStatus.STAGE_BUILDING: (
+        model.ReleaseStatus.MANUAL_TESTING,
+        model.ReleaseStatus.STAGE_BUILDING_FAILED,
+    ),
+    model.ReleaseStatus.STAGE_TEST_ROLLBACK: (
+        model.ReleaseStatus.MANUAL_TESTING,
+        model.ReleaseStatus.STAGE_ROLLBACK_TEST_FAILED,
+    ),
+    model.ReleaseStatus.DEPLOYING: (
+        model.ReleaseStatus.DEPLOYED,
+        model.ReleaseStatus.PRODUCTION_FAILED,
+    ),
+}
+
+
+class ReleaseReconciler(interface.IReleaseReconciler):
+    """Периодически сверяет активные релизы с их запусками в GitHub Actions и
+    завершает те, чей workflow закончился, а PATCH /release так и не пришел"""
+
+    def __init__(
+            self,
+            tel: interface.ITelemetry,
+            release_repo: interface.IReleaseRepo,
+            github_client: interface.IGitHubClient,
+            interval: float = 60,
+            concurrency: int = 5,
+            grace_period: float = 120,
+    ):
+        self.tracer = tel.tracer()
+        self.meter = tel.meter()
+        self.logger = tel.logger()
+        self.release_repo = release_repo
+        self.github_client = github_client
+
+        self.interval = interval
+        self.concurrency = concurrency
+        # Workflow сам шлет финальный PATCH — даем ему время, прежде чем вмешиваться
+        self.grace_period = grace_period
+
+        self._task: asyncio.Task | None = None
+
+        self.reconciled_counter = self.meter.create_counter(
+            name=common.RELEASE_RECONCILED_TOTAL_METRIC,
+            description="Total count of releases finalized by reconciler",
+            unit="1"
+        )
+
+    async def start(self) -> None:
+        # Откаты ведет сам процесс бота, поэтому после перезапуска их уже некому завершить
+        try:
+            failed = await self.fail_interrupted_rollbacks()
+            if failed:
+                self.logger.warning(f"Откаты, прерванные перезапуском, помечены неудачными: {failed}")
+        except Exception as err:
+            self.logger.warning("Не удалось завершить прерванные откаты", {"error": str(err)})
+
+        if self._task is None and self.interval > 0:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def reconcile(self) -> int:
+        with self.tracer.start_as_current_span(
+                "ReleaseReconciler.reconcile",
+                kind=SpanKind.INTERNAL
+        ) as span:
+            try:
+                releases_by_repo: dict[tuple[str, str], list[model.Release]] = {}
+                for release in await self.release_repo.get_active_release():
+                    if release.status not in _RUN_OUTCOME_STATUSES or not release.github_run_id:
+                        continue
+
+                    match = _ACTION_LINK_PATTERN.search(release.github_action_link or "")
+                    if match is None:
+                        continue
+
+                    releases_by_repo.setdefault((match.group(1), match.group(2)), []).append(release)
+
+                span.set_attribute("releases_count", sum(len(releases) for releases in releases_by_repo.values()))
+
+                semaphore = asyncio.Semaphore(self.concurrency)
+                results = await asyncio.gather(
+                    *(
+                        self._reconcile_repo(owner, repo, releases, semaphore)
+                        for (owner, repo), releases in releases_by_repo.items()
+                    ),
+                    return_exceptions=True
+                )
+
+                reconciled = 0
+                for (owner, repo), result in zip(releases_by_repo, results):
+                    if isinstance(result, Exception):
+                        self.logger.warning(
+                            f"Не удалось сверить релизы репозитория {owner}/{repo} с GitHub",
+                            {"error": str(result)}
+                        )
+                        continue
+                    reconciled += result
+
+                span.set_attribute("reconciled_count", reconciled)
+                span.set_status(Status(StatusCode.OK))
+                return reconciled
+
+            except Exception as err:
+                span.record_exception(err)
+                span.set_status(Status(StatusCode.ERROR, str(err)))
+                raise err
+
+    async def fail_interrupted_rollbacks(self) -> int:
+        with self.tracer.start_as_current_span(
+                "ReleaseReconciler.fail_interrupted_rollbacks",
+                kind=SpanKind.INTERNAL
+        ) as span:
+            try:
+                # Вызывается до того, как бот примет первый запрос, поэтому каждый ROLLBACK — чужой
+                # и завершенный вместе с прежним процессом. Шаг отката на хосте мог и доработать,
+                # но его результат уже не проверить — решение о повторе остается за человеком
+                failed = 0
+                while True:
+                    releases = await self.release_repo.get_releases_page(
+                        statuses=[model.ReleaseStatus.ROLLBACK],
+                        limit=100,
+                    )
+                    if not releases:
+                        break
+
+                    for release in releases:
+                        rollback_log = "\n".join(filter(None, [
+                            release.rollback_log,
+                            "Откат прерван перезапуском бота, проверьте версию сервиса на хосте",
+                        ]))
+                        await self.release_repo.update_rollback_log(release.id, rollback_log)
+                        await self.release_repo.update_release(release.id, status=model.ReleaseStatus.ROLLBACK_FAILED)
+                        failed += 1
+
+                        self.reconciled_counter.add(1, attributes={"status": model.ReleaseStatus.ROLLBACK_FAILED.value})
+
+                span.set_attribute("failed_count", failed)
+                span.set_status(Status(StatusCode.OK))
+                return failed
+
+            except Exception as err:
+                span.record_exception(err)
+                span.set_status(Status(StatusCode.ERROR, str(err)))
+                raise err
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                reconciled = await self.reconcile()
+                if reconciled:
+                    self.logger.info(f"Сверка с GitHub завершила зависшие релизы: {reconciled}")
+            except asyncio.CancelledError:
+                raise
+            except Exception as err:
+                self.logger.warning("Ошибка сверки релизов с GitHub", {"error": str(err)})
+
+            await asyncio.sleep(self.interval)
+
+    async def _reconcile_repo(
+            self,
+            owner: str,
+            repo: str,
+            releases: list[model.Release],
+            semaphore: asyncio.Semaphore,
+    ) -> int:
+        # Одним запросом забираем последние завершенные запуски репозитория,
+        # по отдельности запрашиваем только те, что в эту страницу не попали
+        async with semaphore:
+            completed_runs = await self.github_client.list_workflow_runs(
+                owner,
+                repo,
+                status="completed",
+                per_page=100
+            )
+        runs = {str(run.id): run for run in completed_runs}
+
+        async def fetch_run(run_id: str) -> model.GitHubWorkflowRun | None:
+            async with semaphore:
+                try:
+                    return await self.github_client.get_workflow_run(owner, repo, int(run_id))
+                except Exception as err:
+                    self.logger.warning(
+                        f"Не удалось получить запуск {run_id} в {owner}/{repo}",
+                        {"error": str(err)}
+                    )
+                    return None
+
+        missing_run_ids = list({release.github_run_id for release in releases} - runs.keys())
+        for run_id, run in zip(missing_run_ids, await asyncio.gather(*map(fetch_run, missing_run_ids))):
+            if run is not None:
+                runs[run_id] = run
+
+        reconciled = 0
+        for release in releases:
+            run = runs.get(release.github_run_id)
+            status = self._terminal_status(release, run)
+            if status is None:
+                continue
+
+            await self.release_repo.update_release(release.id, status=status)
+            reconciled += 1
+
+            self.reconciled_counter.add(1, attributes={"status": status.value})
+            self.logger.warning(
+                f"Релиз {release.id} ({release.service_name} {release.release_tag}) завершен по данным GitHub",
+                {
+                    "from_status": release.status.value,
+                    "to_status": status.value,
+                    "run_id": release.github_run_id,
+                    "conclusion": run.conclusion,
+                }
+            )
+
+        return reconciled
+
+    def _terminal_status(
+            self,
+            release: model.Release,
+            run: model.GitHubWorkflowRun | None,
+    ) -> model.ReleaseStatus | None:
+        if run is None or run.status != "completed":
+            return None
+
+        if run.updated_at and datetime.now(timezone.utc) - run.updated_at < timedelta(seconds=self.grace_period):
+            return None
+
+        succeeded_status, failed_status = _RUN_OUTCOME_STATUSES[release.status]
+        return succeeded_status if run.conclusion == "success" else failed_status
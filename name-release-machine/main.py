@@ -6,8 +6,10 @@ from aiogram.fsm.storage.redis import RedisStorage
 from sulguk import AiogramSulgukMiddleware
 
 from infrastructure.pg.pg import PG
+from infrastructure.pg.listener import PGListener
 from infrastructure.telemetry.telemetry import Telemetry, AlertManager
 from pkg.client.external.github.client import GitHubClient
+from pkg.client.ssh.client import SSHClient
 
 from internal.controller.http.middlerware.middleware import HttpMiddleware
 from internal.controller.tg.middleware.middleware import TgMiddleware
@@ -22,6 +24,11 @@ from internal.dialog.success_release.dialog import SuccessfulReleasesDialog
 from internal.dialog.failed_release.dialog import FailedReleasesDialog
 
 from internal.service.release.service import ReleaseService
+from internal.service.release_notify.service import ReleaseNotifyService
+from internal.service.deploy.service import DeployEngine
+from internal.service.health_probe.service import HealthProber
+from internal.service.readiness.service import ReadinessService
+from internal.service.release_reconciler.service import ReleaseReconciler
 from internal.dialog.main_menu.service import MainMenuService
 from internal.dialog.active_release.service import ActiveReleaseService
 from internal.dialog.success_release.service import SuccessfulReleasesService
@@ -33,11 +40,13 @@ from internal.dialog.success_release.getter import SuccessfulReleasesGetter
 from internal.dialog.failed_release.getter import FailedReleasesGetter
 
 from internal.repo.release.repo import ReleaseRepo
+from internal.repo.release.cache import CachedReleaseRepo
 
 from internal.app.tg.app import NewTg
 from internal.app.server.app import NewServer
 
 from internal.config.config import Config
+from internal import common
 
 cfg = Config()
 
@@ -62,7 +71,14 @@ tel = Telemetry(
     cfg.service_version,
     cfg.otlp_host,
     cfg.otlp_port,
-    alert_manager
+    alert_manager,
+    cfg.otel_export_worker,
+    cfg.otel_export_queue_size,
+    cfg.otel_export_overflow_policy,
+    cfg.otel_trace_sample_ratio,
+    cfg.otel_tail_sampling,
+    cfg.otel_slow_trace_threshold,
+    cfg.otel_suppressed_spans,
 )
 
 redis_client = redis.Redis(
@@ -82,44 +98,106 @@ bot.session.middleware(AiogramSulgukMiddleware())
 
 # Инициализация клиентов
 db = PG(tel, cfg.db_user, cfg.db_pass, cfg.db_host, cfg.db_port, cfg.db_name)
+db_listener = PGListener(tel, cfg.db_user, cfg.db_pass, cfg.db_host, cfg.db_port, cfg.db_name)
+
+readiness_service = ReadinessService(
+    tel,
+    {
+        "db": lambda: db.select("SELECT 1", {}),
+        "redis": redis_client.ping,
+    },
+)
 
 github_client = GitHubClient(
     tel,
     cfg.github_token
 )
 
-release_repo = ReleaseRepo(tel, db)
+prod_ssh_client = SSHClient(
+    tel,
+    cfg.prod_host,
+    "root",
+    cfg.prod_password,
+    max_sessions=cfg.prod_ssh_max_sessions,
+    keepalive_interval=cfg.prod_ssh_keepalive_interval,
+)
 
-main_menu_getter = MainMenuGetter(
-    tel
+release_repo = CachedReleaseRepo(
+    tel,
+    ReleaseRepo(tel, db),
+    cfg.release_cache_ttl,
+    cfg.release_analytics_cache_ttl,
+    cfg.release_cache_max_size
 )
 
-active_release_getter = ActiveReleaseGetter(
+release_notify_service = ReleaseNotifyService(
     tel,
+    bot,
     release_repo,
-    cfg.required_approve_list
+    cfg.release_notify_subscription_ttl,
+    cfg.release_notify_update_interval
 )
 
-successful_releases_getter = SuccessfulReleasesGetter(
+# Инициализация сервисов
+health_prober = HealthProber(
     tel,
-    release_repo
+    prod_ssh_client
 )
 
-failed_releases_getter = FailedReleasesGetter(
+deploy_engine = DeployEngine(
     tel,
-    release_repo
+    prod_ssh_client,
+    health_prober
 )
 
-# Инициализация сервисов
 release_service = ReleaseService(
     tel,
     release_repo,
-    cfg.prod_host,
-    cfg.prod_password,
+    deploy_engine,
     cfg.prod_domain,
     cfg.service_port_map,
     cfg.service_prefix_map,
+    cfg.rollback_log_tail_lines,
+    cfg.rollback_log_flush_interval,
+    cfg.rollback_concurrency,
+)
+
+release_reconciler = ReleaseReconciler(
+    tel,
+    release_repo,
+    github_client,
+    cfg.release_reconcile_interval,
+    cfg.release_reconcile_concurrency,
+    cfg.release_reconcile_grace_period,
+)
+
+main_menu_getter = MainMenuGetter(
+    tel,
+    release_service
+)
+
+active_release_getter = ActiveReleaseGetter(
+    tel,
+    release_repo,
+    release_notify_service,
+    cfg.required_approve_list,
+    cfg.release_page_size
+)
+
+successful_releases_getter = SuccessfulReleasesGetter(
+    tel,
+    release_repo,
+    release_notify_service,
+    cfg.release_page_size
 )
+
+failed_releases_getter = FailedReleasesGetter(
+    tel,
+    release_repo,
+    release_notify_service,
+    cfg.release_page_size
+)
+
 main_menu_service = MainMenuService(
     tel,
 )
@@ -127,6 +205,7 @@ main_menu_service = MainMenuService(
 active_release_service = ActiveReleaseService(
     tel,
     release_service,
+    release_notify_service,
     github_client,
     cfg.required_approve_list
 )
@@ -134,12 +213,14 @@ active_release_service = ActiveReleaseService(
 successful_releases_service = SuccessfulReleasesService(
     tel,
     release_service,
+    release_notify_service,
     cfg.admins
 )
 
 failed_releases_service = FailedReleasesService(
     tel,
     release_service,
+    release_notify_service,
     cfg.admins
 )
 
@@ -172,12 +253,15 @@ command_controller = CommandController(tel)
 dialog_bg_factory = NewTg(
     dp,
     command_controller,
+    release_notify_service,
     main_menu_dialog,
     active_release_dialog,
     successful_releases_dialog,
     failed_releases_dialog
 )
 
+db_listener.listen(common.RELEASE_CHANGED_CHANNEL, release_notify_service.handle_release_changed)
+
 # Инициализация middleware
 tg_middleware = TgMiddleware(
     tel,
@@ -186,6 +270,7 @@ tg_middleware = TgMiddleware(
 http_middleware = HttpMiddleware(
     tel,
     cfg.prefix,
+    cfg.http_metrics_max_series,
 )
 tg_webhook_controller = TelegramWebhookController(
     tel,
@@ -198,11 +283,16 @@ tg_webhook_controller = TelegramWebhookController(
 release_controller = ReleaseController(
     tel,
     release_service,
+    cfg.admins,
+    cfg.rollback_api_token,
 )
 
 if __name__ == "__main__":
     app = NewServer(
         db,
+        db_listener,
+        release_reconciler,
+        readiness_service,
         http_middleware,
         tg_webhook_controller,
         release_controller,
@@ -1,26 +1,109 @@
+import asyncio
+import time
+from collections import OrderedDict
+
+import httpx
 from opentelemetry.trace import Status, StatusCode, SpanKind
 from typing import Dict, Optional
 
-from internal import interface
+from internal import interface, model, common
 from pkg.client.client import AsyncHTTPClient
 
 
+class GitHubRateLimiter:
+    """Токен-бакет по заголовкам X-RateLimit-*: каждый запрос расходует остаток квоты,
+    фоновые опросы не трогают резерв, который остается для действий пользователя"""
+
+    def __init__(self, reserve: int = 50, max_wait: float = 60):
+        self.reserve = reserve
+        self.max_wait = max_wait
+
+        # None — квота неизвестна до первого ответа или после сброса окна
+        self.remaining: int | None = None
+        self.reset_at = 0.0
+        self.blocked_until = 0.0
+
+    async def acquire(self, background: bool = False) -> None:
+        # Без блокировки: проверка и списание токена идут без await, то есть атомарно для event loop,
+        # а спят ожидающие каждый сам по себе. Иначе фоновый опрос, ждущий у порога резерва,
+        # держал бы в очереди за собой запуски workflow, ради которых резерв и оставлен
+        deadline = time.time() + self.max_wait
+        while True:
+            now = time.time()
+            if self.remaining is not None and self.reset_at <= now:
+                self.remaining = None
+
+            wait = self._wait_seconds(now, background)
+            if wait <= 0:
+                if self.remaining is not None:
+                    self.remaining -= 1
+                return
+
+            if now + wait > deadline:
+                raise common.GitHubRateLimitError(wait)
+
+            await asyncio.sleep(wait)
+
+    def update(self, response: httpx.Response) -> None:
+        now = time.time()
+        headers = response.headers
+
+        remaining = headers.get("X-RateLimit-Remaining")
+        if remaining is not None and remaining.isdigit():
+            self.remaining = int(remaining)
+
+        reset = headers.get("X-RateLimit-Reset")
+        if reset is not None and reset.isdigit():
+            self.reset_at = float(reset)
+
+        # Retry-After приходит при вторичном лимите, остаток квоты при этом может быть ненулевым
+        retry_after = headers.get("Retry-After")
+        if retry_after is not None and retry_after.isdigit():
+            self.blocked_until = max(self.blocked_until, now + int(retry_after))
+        elif response.status_code in (403, 429) and self.remaining == 0:
+            self.blocked_until = max(self.blocked_until, self.reset_at)
+
+    def is_limited(self, response: httpx.Response) -> bool:
+        return response.status_code in (403, 429) and (
+                "Retry-After" in response.headers or
+                response.headers.get("X-RateLimit-Remaining") == "0"
+        )
+
+    def _wait_seconds(self, now: float, background: bool) -> float:
+        if self.blocked_until > now:
+            return self.blocked_until - now
+
+        if self.remaining is not None and self.reset_at > now:
+            threshold = self.reserve if background else 0
+            if self.remaining <= threshold:
+                return self.reset_at - now
+
+        return 0
+
+
 class GitHubClient(interface.IGitHubClient):
     def __init__(
             self,
             tel: interface.ITelemetry,
             token: str,
             host: str = "api.github.com",
-            port: int = 443
+            port: int = 443,
+            rate_limit_reserve: int = 50,
+            rate_limit_max_wait: float = 60,
+            etag_cache_size: int = 256,
+            use_https: bool = True,
     ):
         self.client = AsyncHTTPClient(
             host,
             port,
             prefix="",
             use_tracing=True,
-            use_https=True,
+            use_https=use_https,
+            logger=tel.logger(),
+            meter=tel.meter(),
         )
         self.tracer = tel.tracer()
+        self.logger = tel.logger()
         self.token = token
         self._default_headers = {
             "Accept": "application/vnd.github+json",
@@ -28,6 +111,15 @@ class GitHubClient(interface.IGitHubClient):
             "X-GitHub-Api-Version": "2022-11-28",
         }
 
+        self.rate_limiter = GitHubRateLimiter(
+            reserve=rate_limit_reserve,
+            max_wait=rate_limit_max_wait,
+        )
+
+        # Ответ 304 на запрос с If-None-Match не расходует квоту GitHub
+        self.etag_cache_size = etag_cache_size
+        self._etag_cache: OrderedDict[str, tuple[str, dict]] = OrderedDict()
+
     async def trigger_workflow(
             self,
             owner: str,
@@ -53,14 +145,169 @@ class GitHubClient(interface.IGitHubClient):
                 }
 
                 url = f"/repos/{owner}/{repo}/actions/workflows/{workflow_id}/dispatches"
-                await self.client.post(url, json=body, headers=self._default_headers)
+                await self._request("POST", url, json=body)
+
+                span.set_status(Status(StatusCode.OK))
+
+            except Exception as e:
+                span.record_exception(e)
+                span.set_status(Status(StatusCode.ERROR, str(e)))
+                raise
+
+    async def get_workflow_run(
+            self,
+            owner: str,
+            repo: str,
+            run_id: int
+    ) -> model.GitHubWorkflowRun:
+        with self.tracer.start_as_current_span(
+                "GitHubClient.get_workflow_run",
+                kind=SpanKind.CLIENT,
+                attributes={
+                    "owner": owner,
+                    "repo": repo,
+                    "run_id": run_id
+                }
+        ) as span:
+            try:
+                url = f"/repos/{owner}/{repo}/actions/runs/{run_id}"
+                data = await self._conditional_get(url)
+
+                run = model.GitHubWorkflowRun.serialize([data])[0]
+
+                span.set_attribute("status", run.status)
+                span.set_status(Status(StatusCode.OK))
+                return run
+
+            except Exception as e:
+                span.record_exception(e)
+                span.set_status(Status(StatusCode.ERROR, str(e)))
+                raise
+
+    async def list_workflow_runs(
+            self,
+            owner: str,
+            repo: str,
+            workflow_id: str = None,
+            branch: str = None,
+            event: str = None,
+            status: str = None,
+            per_page: int = 20
+    ) -> list[model.GitHubWorkflowRun]:
+        with self.tracer.start_as_current_span(
+                "GitHubClient.list_workflow_runs",
+                kind=SpanKind.CLIENT,
+                attributes={
+                    "owner": owner,
+                    "repo": repo,
+                    "workflow_id": workflow_id or ""
+                }
+        ) as span:
+            try:
+                if workflow_id:
+                    url = f"/repos/{owner}/{repo}/actions/workflows/{workflow_id}/runs"
+                else:
+                    url = f"/repos/{owner}/{repo}/actions/runs"
+
+                params = {"per_page": per_page}
+                if branch:
+                    params["branch"] = branch
+                if event:
+                    params["event"] = event
+                if status:
+                    params["status"] = status
+
+                data = await self._conditional_get(url, params)
+                runs = model.GitHubWorkflowRun.serialize(data.get("workflow_runs", []))
+
+                span.set_status(Status(StatusCode.OK))
+                return runs
+
+            except Exception as e:
+                span.record_exception(e)
+                span.set_status(Status(StatusCode.ERROR, str(e)))
+                raise
+
+    async def list_workflow_run_jobs(
+            self,
+            owner: str,
+            repo: str,
+            run_id: int
+    ) -> list[model.GitHubWorkflowJob]:
+        with self.tracer.start_as_current_span(
+                "GitHubClient.list_workflow_run_jobs",
+                kind=SpanKind.CLIENT,
+                attributes={
+                    "owner": owner,
+                    "repo": repo,
+                    "run_id": run_id
+                }
+        ) as span:
+            try:
+                url = f"/repos/{owner}/{repo}/actions/runs/{run_id}/jobs"
+                data = await self._conditional_get(url, {"per_page": 100})
+
+                jobs = model.GitHubWorkflowJob.serialize(data.get("jobs", []))
 
                 span.set_status(Status(StatusCode.OK))
+                return jobs
 
             except Exception as e:
                 span.record_exception(e)
                 span.set_status(Status(StatusCode.ERROR, str(e)))
                 raise
 
+    async def _conditional_get(self, url: str, params: dict = None) -> dict:
+        cache_key = str(httpx.URL(url, params=params or {}))
+        cached = self._etag_cache.get(cache_key)
+
+        headers = {}
+        if cached is not None:
+            headers["If-None-Match"] = cached[0]
+
+        # Статусы запусков опрашиваются в фоне и не должны съедать резерв квоты
+        response = await self._request("GET", url, params=params, headers=headers, background=True)
+
+        if response.status_code == 304 and cached is not None:
+            self._etag_cache.move_to_end(cache_key)
+            return cached[1]
+
+        data = response.json()
+
+        etag = response.headers.get("ETag")
+        if etag:
+            self._etag_cache[cache_key] = (etag, data)
+            self._etag_cache.move_to_end(cache_key)
+            while len(self._etag_cache) > self.etag_cache_size:
+                self._etag_cache.popitem(last=False)
+
+        return data
+
+    async def _request(
+            self,
+            method: str,
+            url: str,
+            headers: dict = None,
+            background: bool = False,
+            **kwargs
+    ) -> httpx.Response:
+        headers = {**self._default_headers, **(headers or {})}
+
+        # Одна повторная попытка после ожидания окна, которое назвал сам GitHub
+        for attempt in range(2):
+            await self.rate_limiter.acquire(background)
+            try:
+                send = getattr(self.client, method.lower())
+                response = await send(url, headers=headers, **kwargs)
+                self.rate_limiter.update(response)
+                return response
 
+            except httpx.HTTPStatusError as err:
+                self.rate_limiter.update(err.response)
+                if attempt == 1 or not self.rate_limiter.is_limited(err.response):
+                    raise err
 
+                self.logger.warning(
+                    f"GitHub API ограничил запросы, ждем окна квоты: {method} {url}",
+                    {"status_code": err.response.status_code}
+                )
@@ -0,0 +1,174 @@
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+import asyncssh
+from opentelemetry.trace import Status, StatusCode, SpanKind
+
+from internal import interface
+
+# Только реальная потеря соединения. Таймаут команды (asyncssh.TimeoutError — тоже OSError)
+# и отказ в канале по MaxSessions касаются одной операции и не должны рвать общее соединение
+_CONNECTION_ERRORS = (
+    asyncssh.ConnectionLost,
+    asyncssh.DisconnectError,
+    ConnectionResetError,
+)
+
+
+class SSHClient(interface.ISSHClient):
+    """Пул SSH для одного хоста: одно keep-alive соединение, каналы которого
+    мультиплексируются между операциями с ограничением max_sessions"""
+
+    def __init__(
+            self,
+            tel: interface.ITelemetry,
+            host: str,
+            username: str,
+            password: str,
+            port: int = 22,
+            max_sessions: int = 8,
+            connect_timeout: float = 30,
+            keepalive_interval: float = 15,
+            keepalive_count_max: int = 3,
+            health_check_interval: float = 60,
+            known_hosts=None,
+    ):
+        self.tracer = tel.tracer()
+        self.logger = tel.logger()
+
+        self.host = host
+        self.port = port
+        self.username = username
+        self.password = password
+        self.connect_timeout = connect_timeout
+        self.keepalive_interval = keepalive_interval
+        self.keepalive_count_max = keepalive_count_max
+        self.health_check_interval = health_check_interval
+        self.known_hosts = known_hosts
+
+        self._conn: asyncssh.SSHClientConnection | None = None
+        self._last_checked_at = 0.0
+        self._lock = asyncio.Lock()
+        # OpenSSH по умолчанию разрешает 10 сессий на соединение (MaxSessions)
+        self._sessions = asyncio.Semaphore(max_sessions)
+
+    @asynccontextmanager
+    async def connection(self) -> AsyncIterator[asyncssh.SSHClientConnection]:
+        async with self._sessions:
+            conn = await self._get_connection()
+            try:
+                yield conn
+            except _CONNECTION_ERRORS:
+                await self._drop_connection(conn)
+                raise
+
+    async def run(self, command: str, timeout: float = None) -> asyncssh.SSHCompletedProcess:
+        with self.tracer.start_as_current_span(
+                "SSHClient.run",
+                kind=SpanKind.CLIENT,
+                attributes={
+                    "ssh.host": self.host,
+                }
+        ) as span:
+            try:
+                async with self.connection() as conn:
+                    result = await conn.run(command, check=False, timeout=timeout)
+                    if result.exit_status is None and result.exit_signal is None and conn.is_closed():
+                        # asyncssh не бросает исключение при обрыве посреди команды, а возвращает пустой результат
+                        raise asyncssh.ConnectionLost(f"Соединение с {self.host} оборвалось во время выполнения команды")
+
+                span.set_attribute("ssh.exit_status", result.exit_status if result.exit_status is not None else -1)
+                span.set_status(Status(StatusCode.OK))
+                return result
+
+            except Exception as err:
+                span.record_exception(err)
+                span.set_status(Status(StatusCode.ERROR, str(err)))
+                raise err
+
+    async def upload(self, remote_path: str, content: str) -> None:
+        with self.tracer.start_as_current_span(
+                "SSHClient.upload",
+                kind=SpanKind.CLIENT,
+                attributes={
+                    "ssh.host": self.host,
+                    "ssh.remote_path": remote_path,
+                }
+        ) as span:
+            try:
+                async with self.connection() as conn:
+                    async with conn.start_sftp_client() as sftp:
+                        async with sftp.open(remote_path, 'w') as remote_file:
+                            await remote_file.write(content)
+
+                span.set_status(Status(StatusCode.OK))
+
+            except Exception as err:
+                span.record_exception(err)
+                span.set_status(Status(StatusCode.ERROR, str(err)))
+                raise err
+
+    async def health_check(self) -> bool:
+        try:
+            async with self.connection() as conn:
+                result = await conn.run("true", check=False, timeout=self.connect_timeout)
+                return result.exit_status == 0
+        except Exception as err:
+            self.logger.warning(
+                f"SSH соединение с {self.host} не прошло проверку",
+                {"error": str(err)}
+            )
+            return False
+
+    async def close(self) -> None:
+        async with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                await self._conn.wait_closed()
+                self._conn = None
+
+    async def _get_connection(self) -> asyncssh.SSHClientConnection:
+        async with self._lock:
+            # Соединение, закрытое сервером во время простоя, пересоздается до отправки команды.
+            # Повтора уже отправленной команды нет: migrate или compose up могут быть неидемпотентны
+            if self._conn is not None and self._conn.is_closed():
+                self.logger.warning(f"SSH соединение с {self.host} закрыто, переподключаемся")
+                self._conn = None
+
+            if self._conn is not None and time.monotonic() - self._last_checked_at > self.health_check_interval:
+                if not await self._is_alive(self._conn):
+                    self._conn.close()
+                    self._conn = None
+
+            if self._conn is None:
+                self._conn = await asyncssh.connect(
+                    host=self.host,
+                    port=self.port,
+                    username=self.username,
+                    password=self.password,
+                    connect_timeout=self.connect_timeout,
+                    keepalive_interval=self.keepalive_interval,
+                    keepalive_count_max=self.keepalive_count_max,
+                    known_hosts=self.known_hosts,
+                )
+                self._last_checked_at = time.monotonic()
+                self.logger.info(f"Открыто SSH соединение с {self.host}")
+
+            return self._conn
+
+    async def _is_alive(self, conn: asyncssh.SSHClientConnection) -> bool:
+        try:
+            result = await conn.run("true", check=False, timeout=self.connect_timeout)
+            self._last_checked_at = time.monotonic()
+            return result.exit_status == 0
+        except Exception:
+            return False
+
+    async def _drop_connection(self, conn: asyncssh.SSHClientConnection) -> None:
+        async with self._lock:
+            if self._conn is conn:
+                conn.close()
+                self._conn = None
+                self.logger.warning(f"SSH соединение с {self.host} потеряно")
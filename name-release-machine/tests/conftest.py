@@ -0,0 +1,186 @@
+import asyncio
+import os
+from contextlib import asynccontextmanager
+
+import asyncssh
+import pytest
+from opentelemetry import metrics, trace
+from sqlalchemy.engine import URL, make_url
+
+from infrastructure.pg.pg import PG
+from internal import interface
+from internal.model import sql_model
+from pkg.client.ssh.client import SSHClient
+
+SSH_USERNAME = "deploy"
+SSH_PASSWORD = "secret"
+
+# Тесты репозиториев идут на настоящем Postgres и пропускаются, если DSN не задан
+TEST_PG_DSN_ENV = "NAME_RELEASE_TEST_PG_DSN"
+
+
+class _ServerState:
+    def __init__(self, exec_locally: bool):
+        self.connections: list[asyncssh.SSHServerConnection] = []
+        self.commands: list[str] = []
+        self.reject_sessions = False
+        self.exec_locally = exec_locally
+
+    async def handle(self, process: asyncssh.SSHServerProcess) -> None:
+        command = process.command
+        self.commands.append(command)
+
+        if self.exec_locally:
+            # Команда действительно выполняется локальным shell, как на prod-хосте
+            local = await asyncio.create_subprocess_shell(
+                command,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.STDOUT,
+            )
+            async for line in local.stdout:
+                process.stdout.write(line.decode())
+            process.exit(await local.wait())
+            return
+
+        if command.startswith("sleep "):
+            await asyncio.sleep(float(command.split()[1]))
+        elif command == "drop":
+            # Обрыв соединения посреди выполнения команды
+            process.channel.get_connection().abort()
+            return
+
+        process.stdout.write(f"{command}\n")
+        process.exit(0)
+
+
+class _Server(asyncssh.SSHServer):
+    def __init__(self, state: _ServerState):
+        self.state = state
+
+    def connection_made(self, conn: asyncssh.SSHServerConnection) -> None:
+        self.state.connections.append(conn)
+
+    def begin_auth(self, username: str) -> bool:
+        return True
+
+    def password_auth_supported(self) -> bool:
+        return True
+
+    def validate_password(self, username: str, password: str) -> bool:
+        return username == SSH_USERNAME and password == SSH_PASSWORD
+
+    def session_requested(self):
+        # Отказ в канале — так сервер отвечает при исчерпании MaxSessions
+        if self.state.reject_sessions:
+            return False
+        return asyncssh.SSHServerProcess(self.state.handle, None, 0, False)
+
+
+@asynccontextmanager
+async def _ssh_server(exec_locally: bool = False):
+    state = _ServerState(exec_locally)
+    server = await asyncssh.listen(
+        "127.0.0.1",
+        0,
+        server_host_keys=[asyncssh.generate_private_key("ssh-ed25519")],
+        server_factory=lambda: _Server(state),
+    )
+    try:
+        yield server.sockets[0].getsockname()[1], state
+    finally:
+        server.close()
+        await server.wait_closed()
+
+
+@asynccontextmanager
+async def _pg_db(url: URL, tel: interface.ITelemetry):
+    db = PG(tel, url.username, url.password or "", url.host, url.port or 5432, url.database)
+
+    # Каждый тест начинает с чистой схемы
+    await db.multi_query(sql_model.drop_queries)
+    await db.multi_query(sql_model.create_queries)
+    try:
+        yield db
+    finally:
+        await db.multi_query(sql_model.drop_queries)
+        await db.pool.kw["bind"].dispose()
+
+
+class FakeLogger(interface.IOtelLogger):
+    def __init__(self):
+        self.records: list[tuple[str, str, dict]] = []
+
+    def debug(self, message: str, fields: dict = None) -> None:
+        self.records.append(("debug", message, fields or {}))
+
+    def info(self, message: str, fields: dict = None) -> None:
+        self.records.append(("info", message, fields or {}))
+
+    def warning(self, message: str, fields: dict = None) -> None:
+        self.records.append(("warning", message, fields or {}))
+
+    def error(self, message: str, fields: dict = None) -> None:
+        self.records.append(("error", message, fields or {}))
+
+
+class FakeTelemetry(interface.ITelemetry):
+    def __init__(self, tracer: trace.Tracer = None, meter: metrics.Meter = None):
+        self._tracer = tracer or trace.NoOpTracer()
+        self._meter = meter or metrics.NoOpMeter("test")
+        self._logger = FakeLogger()
+
+    def tracer(self) -> trace.Tracer:
+        return self._tracer
+
+    def meter(self) -> metrics.Meter:
+        return self._meter
+
+    def logger(self) -> FakeLogger:
+        return self._logger
+
+
+@pytest.fixture
+def tel() -> FakeTelemetry:
+    return FakeTelemetry()
+
+
+@pytest.fixture
+def make_tel():
+    """FakeTelemetry с настоящими tracer и meter, когда тесту нужны записанные спаны или метрики"""
+    return FakeTelemetry
+
+
+@pytest.fixture
+def ssh_server():
+    """Локальный SSH-сервер: по умолчанию эхо команд, exec_locally=True выполняет их в shell"""
+    return _ssh_server
+
+
+@pytest.fixture
+def pg_url() -> URL:
+    dsn = os.getenv(TEST_PG_DSN_ENV)
+    if not dsn:
+        pytest.skip(f"{TEST_PG_DSN_ENV} не задан")
+
+    return make_url(dsn)
+
+
+@pytest.fixture
+def pg_db(tel, pg_url):
+    """Postgres из NAME_RELEASE_TEST_PG_DSN со свежей схемой releases/release_events"""
+    return lambda: _pg_db(pg_url, tel)
+
+
+@pytest.fixture
+def ssh_client(tel):
+    def create(port: int) -> SSHClient:
+        return SSHClient(
+            tel,
+            host="127.0.0.1",
+            username=SSH_USERNAME,
+            password=SSH_PASSWORD,
+            port=port,
+            known_hosts=None,
+        )
+
+    return create
@@ -0,0 +1,93 @@
+import asyncio
+
+from internal import model
+from internal.service.deploy.service import DeployEngine
+
+
+def test_step_timeout_stops_remote_process(tel, ssh_server, ssh_client, tmp_path):
+    marker = tmp_path / "finished"
+
+    async def scenario():
+        async with ssh_server(exec_locally=True) as (port, state):
+            ssh = ssh_client(port)
+            engine = DeployEngine(tel, ssh, health_prober=None)
+            try:
+                results = await engine.run([
+                    model.DeployStep(name="migrate", command=f"sleep 3 && touch {marker}", timeout=1),
+                ])
+            finally:
+                await ssh.close()
+
+            # Удаленный процесс должен умереть вместе с шагом, а не доработать в фоне
+            await asyncio.sleep(3)
+            return results
+
+    results = asyncio.run(scenario())
+
+    assert results[0].status == model.DeployStepStatus.FAILED
+    assert "таймаут" in results[0].error
+    assert not marker.exists()
+
+
+def test_step_command_keeps_shell_semantics(tel, ssh_server, ssh_client):
+    async def scenario():
+        async with ssh_server(exec_locally=True) as (port, state):
+            ssh = ssh_client(port)
+            engine = DeployEngine(tel, ssh, health_prober=None)
+            lines = []
+
+            async def on_output(line: str) -> None:
+                lines.append(line)
+
+            try:
+                results = await engine.run([
+                    model.DeployStep(name="ok", command="echo \"it's $((1 + 1))\"", timeout=5),
+                    model.DeployStep(name="fail", command="exit 3", timeout=5, depends_on=["ok"]),
+                ], on_output=on_output)
+            finally:
+                await ssh.close()
+            return results, lines
+
+    results, lines = asyncio.run(scenario())
+
+    assert results[0].status == model.DeployStepStatus.DONE
+    assert "[ok] it's 2" in lines
+    assert results[1].status == model.DeployStepStatus.FAILED
+    assert "кодом 3" in results[1].error
+
+
+def test_step_survives_ssh_disconnect(tel, ssh_server, ssh_client, tmp_path):
+    marker = tmp_path / "migrated"
+
+    async def scenario():
+        async with ssh_server(exec_locally=True) as (port, state):
+            ssh = ssh_client(port)
+            engine = DeployEngine(tel, ssh, health_prober=None)
+            lines = []
+
+            async def on_output(line: str) -> None:
+                lines.append(line)
+                # Соединение рвется, когда команда уже идет на хосте
+                if line == "[migrate] started":
+                    for conn in state.connections:
+                        conn.abort()
+
+            try:
+                results = await engine.run([
+                    model.DeployStep(
+                        name="migrate",
+                        command=f"echo started; sleep 1.5; touch {marker}; echo finished; exit 0",
+                        timeout=10,
+                    ),
+                ], on_output=on_output)
+            finally:
+                await ssh.close()
+            return results, lines
+
+    results, lines = asyncio.run(scenario())
+
+    # Процесс доработал без SSH-канала, а лог дочитан после переподключения без повторов
+    assert results[0].status == model.DeployStepStatus.DONE
+    assert marker.exists()
+    assert [line for line in lines if line.startswith("[migrate]")] == ["[migrate] started", "[migrate] finished"]
+    assert any("оборвался" in record[1] for record in tel.logger().records)
@@ -0,0 +1,160 @@
+import asyncio
+import json
+from datetime import datetime, timedelta
+
+import pytest
+
+from internal import model, common
+from internal.controller.http.handler.release.handler import ReleaseController
+from internal.repo.release.repo import ReleaseRepo
+
+_SINCE = datetime(2026, 1, 1)
+_UNTIL = datetime(2026, 1, 11)
+
+
+async def _seed_release(
+        db,
+        service_name: str,
+        created_at: datetime,
+        events: list[tuple[model.ReleaseStatus, datetime]],
+) -> int:
+    release_id = await db.insert(
+        """
+        INSERT INTO releases (
+            service_name, release_tag, status, initiated_by,
+            github_run_id, github_action_link, github_ref, created_at
+        )
+        VALUES (:service_name, 'v1.0.0', :status, 'gommgo', '', '', '', :created_at)
+        RETURNING id;
+        """,
+        {"service_name": service_name, "status": events[-1][0].value, "created_at": created_at},
+    )
+    for status, event_at in events:
+        await db.insert(
+            """
+            INSERT INTO release_events (release_id, status, created_at)
+            VALUES (:release_id, :status, :created_at)
+            RETURNING id;
+            """,
+            {"release_id": release_id, "status": status.value, "created_at": event_at},
+        )
+    return release_id
+
+
+def _at(day: int, hour: int, minute: int = 0) -> datetime:
+    return datetime(2026, 1, day, hour, minute)
+
+
+def test_dora_metrics_from_release_events(tel, pg_db):
+    async def scenario():
+        async with pg_db() as db:
+            # name-account: три деплоя, два неудачных изменения из четырех
+            await _seed_release(db, "name-account", _at(1, 0), [
+                # Событие ровно на нижней границе периода учитывается
+                (model.ReleaseStatus.INITIATED, _SINCE),
+                (model.ReleaseStatus.DEPLOYED, _at(1, 2)),
+            ])
+            await _seed_release(db, "name-account", _at(2, 0), [
+                (model.ReleaseStatus.INITIATED, _at(2, 0)),
+                (model.ReleaseStatus.PRODUCTION_FAILED, _at(2, 3)),
+            ])
+            # Деплой следующего релиза восстанавливает сервис через 2 часа после сбоя
+            await _seed_release(db, "name-account", _at(2, 1), [
+                (model.ReleaseStatus.INITIATED, _at(2, 1)),
+                (model.ReleaseStatus.DEPLOYED, _at(2, 5)),
+            ])
+            # Откат выкаченного релиза восстанавливает сервис через 20 минут
+            await _seed_release(db, "name-account", _at(5, 0), [
+                (model.ReleaseStatus.INITIATED, _at(5, 0)),
+                (model.ReleaseStatus.DEPLOYED, _at(5, 0, 30)),
+                (model.ReleaseStatus.ROLLBACK, _at(5, 1, 10)),
+                (model.ReleaseStatus.ROLLBACK_DONE, _at(5, 1, 30)),
+            ])
+            # Деплой до начала периода не учитывается
+            await _seed_release(db, "name-account", _SINCE - timedelta(hours=4), [
+                (model.ReleaseStatus.INITIATED, _SINCE - timedelta(hours=4)),
+                (model.ReleaseStatus.DEPLOYED, _SINCE - timedelta(seconds=1)),
+            ])
+
+            # name-authorization: релиз инициирован до периода, а выкачен ровно на его начале
+            await _seed_release(db, "name-authorization", _SINCE - timedelta(hours=2), [
+                (model.ReleaseStatus.INITIATED, _SINCE - timedelta(hours=2)),
+                (model.ReleaseStatus.DEPLOYED, _SINCE),
+            ])
+            await _seed_release(db, "name-authorization", _at(10, 20), [
+                (model.ReleaseStatus.INITIATED, _at(10, 20)),
+                (model.ReleaseStatus.PRODUCTION_FAILED, _at(10, 23)),
+            ])
+            # Восстановление ровно на верхней границе уже вне периода, поэтому MTTR неизвестен
+            await _seed_release(db, "name-authorization", _at(10, 22), [
+                (model.ReleaseStatus.INITIATED, _at(10, 22)),
+                (model.ReleaseStatus.DEPLOYED, _UNTIL),
+            ])
+
+            metrics = await ReleaseRepo(tel, db).get_dora_metrics(_SINCE, _UNTIL)
+
+            assert metrics == [
+                model.ServiceDoraMetrics(
+                    service_name="name-account",
+                    deployments_count=3,
+                    deployment_frequency_per_day=0.3,
+                    lead_time_seconds=(2 + 4 + 0.5) * 3600 / 3,
+                    change_failure_rate=0.5,
+                    mean_time_to_restore_seconds=(2 * 3600 + 20 * 60) / 2,
+                ),
+                model.ServiceDoraMetrics(
+                    service_name="name-authorization",
+                    deployments_count=1,
+                    deployment_frequency_per_day=0.1,
+                    lead_time_seconds=2 * 3600,
+                    change_failure_rate=0.5,
+                    mean_time_to_restore_seconds=None,
+                ),
+            ]
+
+    asyncio.run(scenario())
+
+
+def test_dora_metrics_for_empty_period(tel, pg_db):
+    async def scenario():
+        async with pg_db() as db:
+            await _seed_release(db, "name-account", _UNTIL, [
+                (model.ReleaseStatus.INITIATED, _UNTIL),
+                (model.ReleaseStatus.DEPLOYED, _UNTIL + timedelta(hours=1)),
+            ])
+
+            assert await ReleaseRepo(tel, db).get_dora_metrics(_SINCE, _UNTIL) == []
+
+    asyncio.run(scenario())
+
+
+class _FakeReleaseService:
+    def __init__(self):
+        self.requested_days: list[int] = []
+
+    async def get_dora_metrics(self, days: int) -> list[model.ServiceDoraMetrics]:
+        self.requested_days.append(days)
+        return []
+
+
+@pytest.mark.parametrize("days", [0, -1, common.DORA_METRICS_MAX_DAYS + 1, 10 ** 9])
+def test_dora_metrics_rejects_days_out_of_range(tel, days):
+    release_service = _FakeReleaseService()
+    controller = ReleaseController(tel, release_service, admins=[], rollback_api_token="")
+
+    response = asyncio.run(controller.get_dora_metrics(days))
+
+    assert response.status_code == 400
+    assert release_service.requested_days == []
+
+
+@pytest.mark.parametrize("days", [1, common.DORA_METRICS_MAX_DAYS])
+def test_dora_metrics_accepts_days_in_range(tel, days):
+    release_service = _FakeReleaseService()
+    controller = ReleaseController(tel, release_service, admins=[], rollback_api_token="")
+
+    response = asyncio.run(controller.get_dora_metrics(days))
+
+    assert response.status_code == 200
+    assert json.loads(response.body) == {"days": days, "services": []}
+    assert release_service.requested_days == [days]
@@ -0,0 +1,156 @@
+import logging
+import threading
+import time
+from concurrent import futures
+from contextlib import contextmanager
+
+import grpc
+import pytest
+from opentelemetry.exporter.otlp.proto.grpc._log_exporter import OTLPLogExporter
+from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import OTLPSpanExporter
+from opentelemetry.proto.collector.logs.v1 import logs_service_pb2, logs_service_pb2_grpc
+from opentelemetry.proto.collector.trace.v1 import trace_service_pb2, trace_service_pb2_grpc
+from opentelemetry.sdk._logs import LoggerProvider, LoggingHandler
+from opentelemetry.sdk.trace import TracerProvider
+
+from infrastructure.telemetry.export import (
+    DROP_OLDEST_POLICY,
+    SAMPLE_POLICY,
+    ExportWorker,
+    WorkerLogRecordProcessor,
+    WorkerSpanProcessor,
+)
+
+
+class _Collector(logs_service_pb2_grpc.LogsServiceServicer, trace_service_pb2_grpc.TraceServiceServicer):
+    """OTLP gRPC коллектор в памяти; delay имитирует медленный экспорт"""
+
+    def __init__(self, delay: float = 0):
+        self.delay = delay
+        self.log_bodies: list[str] = []
+        self.span_names: list[str] = []
+
+    def Export(self, request, context):
+        time.sleep(self.delay)
+
+        if isinstance(request, logs_service_pb2.ExportLogsServiceRequest):
+            for resource_logs in request.resource_logs:
+                for scope_logs in resource_logs.scope_logs:
+                    self.log_bodies.extend(record.body.string_value for record in scope_logs.log_records)
+            return logs_service_pb2.ExportLogsServiceResponse()
+
+        for resource_spans in request.resource_spans:
+            for scope_spans in resource_spans.scope_spans:
+                self.span_names.extend(span.name for span in scope_spans.spans)
+        return trace_service_pb2.ExportTraceServiceResponse()
+
+
+@contextmanager
+def _otlp_collector(delay: float = 0):
+    collector = _Collector(delay)
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=4))
+    logs_service_pb2_grpc.add_LogsServiceServicer_to_server(collector, server)
+    trace_service_pb2_grpc.add_TraceServiceServicer_to_server(collector, server)
+    port = server.add_insecure_port("127.0.0.1:0")
+    server.start()
+    try:
+        yield collector, f"http://127.0.0.1:{port}"
+    finally:
+        server.stop(None)
+
+
+def test_logs_reach_collector_through_worker():
+    with _otlp_collector(delay=0.3) as (collector, endpoint):
+        exporter = OTLPLogExporter(endpoint=endpoint, insecure=True)
+        worker = ExportWorker("logs", exporter.export, exporter.shutdown, interval=0.05)
+
+        logger_provider = LoggerProvider()
+        logger_provider.add_log_record_processor(WorkerLogRecordProcessor(worker))
+        logger = logging.getLogger("test_export_worker")
+        logger.propagate = False
+        handler = LoggingHandler(logger_provider=logger_provider)
+        logger.addHandler(handler)
+
+        for i in range(10):
+            logger.warning(f"record {i}")
+
+        # Пачка уже забрана из буфера и висит в медленном экспорте — flush обязан ее дождаться
+        time.sleep(0.1)
+        assert worker.force_flush(5000)
+        assert collector.log_bodies == [f"record {i}" for i in range(10)]
+
+        logger.removeHandler(handler)
+        logger_provider.shutdown()
+
+
+def test_spans_reach_collector_through_worker():
+    with _otlp_collector() as (collector, endpoint):
+        exporter = OTLPSpanExporter(endpoint=endpoint, insecure=True)
+        worker = ExportWorker("spans", exporter.export, exporter.shutdown, interval=0.05)
+
+        tracer_provider = TracerProvider()
+        tracer_provider.add_span_processor(WorkerSpanProcessor(worker))
+        tracer = tracer_provider.get_tracer("test")
+
+        for name in ("first", "second"):
+            with tracer.start_as_current_span(name):
+                pass
+
+        assert tracer_provider.force_flush(5000)
+        assert sorted(collector.span_names) == ["first", "second"]
+
+        tracer_provider.shutdown()
+
+
+def _blocked_worker(policy: str, capacity: int) -> tuple[ExportWorker, threading.Event]:
+    release = threading.Event()
+    worker = ExportWorker(
+        "test",
+        lambda batch: release.wait(5),
+        lambda: None,
+        capacity=capacity,
+        policy=policy,
+        max_batch_size=1,
+        interval=0.01,
+    )
+    # Поток экспорта занят первой записью, остальные копятся в буфере
+    worker.submit("busy")
+    while worker.queue_size():
+        time.sleep(0.01)
+    return worker, release
+
+
+def test_sample_policy_counts_evictions_under_its_own_label():
+    worker, release = _blocked_worker(SAMPLE_POLICY, capacity=4)
+    try:
+        for i in range(10):
+            worker.submit(i, important=True)
+    finally:
+        release.set()
+        worker.shutdown()
+
+    assert worker.dropped == {DROP_OLDEST_POLICY: 0, SAMPLE_POLICY: 6}
+
+
+def test_drop_oldest_policy_keeps_newest_items():
+    worker, release = _blocked_worker(DROP_OLDEST_POLICY, capacity=4)
+    try:
+        for i in range(10):
+            worker.submit(i)
+
+        assert list(worker._buffer) == [6, 7, 8, 9]
+    finally:
+        release.set()
+        worker.shutdown()
+
+    assert worker.dropped == {DROP_OLDEST_POLICY: 6, SAMPLE_POLICY: 0}
+
+
+def test_unknown_policy_is_rejected_on_init():
+    threads = threading.active_count()
+
+    with pytest.raises(ValueError, match="drop-oldest"):
+        ExportWorker("logs", export=lambda batch: None, shutdown=lambda: None, policy="drop-oldest")
+
+    # Поток экспорта для отвергнутой конфигурации не запускается
+    assert threading.active_count() == threads
@@ -0,0 +1,182 @@
+import asyncio
+import time
+from contextlib import asynccontextmanager
+
+import pytest
+import uvicorn
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response
+from starlette.routing import Route
+
+from internal import common
+from pkg.client.external.github.client import GitHubClient, GitHubRateLimiter
+
+_RUN = {
+    "id": 42,
+    "name": "deploy",
+    "workflow_id": 7,
+    "status": "completed",
+    "conclusion": "success",
+    "event": "workflow_dispatch",
+    "head_branch": "main",
+    "head_sha": "abc",
+    "run_attempt": 1,
+    "html_url": "https://github.com/owner/repo/actions/runs/42",
+    "created_at": "2026-01-01T00:00:00Z",
+    "updated_at": "2026-01-01T00:05:00Z",
+}
+
+
+class _FakeGitHub:
+    """Минимальный GitHub API: ETag у запусков, квота в X-RateLimit-* и вторичный лимит через Retry-After"""
+
+    def __init__(self):
+        self.remaining = 5000
+        self.full_responses = 0
+        self.not_modified_responses = 0
+        self.dispatches: list[dict] = []
+        self.limited_requests = 0
+
+        self.app = Starlette(routes=[
+            Route("/repos/{owner}/{repo}/actions/runs/{run_id:int}", self.get_run),
+            Route("/repos/{owner}/{repo}/actions/runs", self.list_runs),
+            Route("/repos/{owner}/{repo}/actions/workflows/{workflow_id}/dispatches", self.dispatch, methods=["POST"]),
+        ])
+
+    def _quota_headers(self) -> dict:
+        return {
+            "X-RateLimit-Remaining": str(self.remaining),
+            "X-RateLimit-Reset": str(int(time.time()) + 3600),
+        }
+
+    async def get_run(self, request: Request) -> Response:
+        etag = f'"run-{request.path_params["run_id"]}"'
+        if request.headers.get("If-None-Match") == etag:
+            # 304 не расходует квоту
+            self.not_modified_responses += 1
+            return Response(status_code=304, headers={"ETag": etag, **self._quota_headers()})
+
+        self.remaining -= 1
+        self.full_responses += 1
+        return JSONResponse(_RUN, headers={"ETag": etag, **self._quota_headers()})
+
+    async def list_runs(self, request: Request) -> Response:
+        self.remaining -= 1
+        runs = [run for run in [_RUN] if run["status"] == request.query_params.get("status", run["status"])]
+        return JSONResponse({"total_count": len(runs), "workflow_runs": runs}, headers=self._quota_headers())
+
+    async def dispatch(self, request: Request) -> Response:
+        if self.limited_requests > 0:
+            self.limited_requests -= 1
+            return JSONResponse(
+                {"message": "You have exceeded a secondary rate limit"},
+                status_code=429,
+                headers={"Retry-After": "1", **self._quota_headers()},
+            )
+
+        self.remaining -= 1
+        self.dispatches.append(await request.json())
+        return Response(status_code=204, headers=self._quota_headers())
+
+
+@asynccontextmanager
+async def _fake_github():
+    github = _FakeGitHub()
+    server = uvicorn.Server(uvicorn.Config(github.app, host="127.0.0.1", port=0, log_level="warning"))
+    serve_task = asyncio.create_task(server.serve())
+    while not server.started:
+        await asyncio.sleep(0.01)
+
+    port = server.servers[0].sockets[0].getsockname()[1]
+    try:
+        yield github, port
+    finally:
+        server.should_exit = True
+        await serve_task
+
+
+def _github_client(tel, port: int) -> GitHubClient:
+    return GitHubClient(tel, "token", host="127.0.0.1", port=port, use_https=False)
+
+
+def test_workflow_run_is_revalidated_with_etag(tel):
+    async def scenario():
+        async with _fake_github() as (github, port):
+            client = _github_client(tel, port)
+
+            first = await client.get_workflow_run("owner", "repo", 42)
+            second = await client.get_workflow_run("owner", "repo", 42)
+
+            assert first == second
+            assert first.conclusion == "success"
+            assert github.full_responses == 1
+            assert github.not_modified_responses == 1
+            assert client.rate_limiter.remaining == github.remaining
+
+    asyncio.run(scenario())
+
+
+def test_list_workflow_runs_passes_filters(tel):
+    async def scenario():
+        async with _fake_github() as (github, port):
+            client = _github_client(tel, port)
+
+            completed = await client.list_workflow_runs("owner", "repo", status="completed")
+            queued = await client.list_workflow_runs("owner", "repo", status="queued")
+
+            assert [run.id for run in completed] == [42]
+            assert queued == []
+
+    asyncio.run(scenario())
+
+
+def test_trigger_workflow_waits_out_retry_after(tel):
+    async def scenario():
+        async with _fake_github() as (github, port):
+            client = _github_client(tel, port)
+            github.limited_requests = 1
+
+            started_at = time.monotonic()
+            await client.trigger_workflow("owner", "repo", "deploy.yml", inputs={"tag": "v1"})
+
+            assert time.monotonic() - started_at >= 0.9
+            assert github.dispatches == [{"ref": "main", "inputs": {"tag": "v1"}}]
+
+    asyncio.run(scenario())
+
+
+def test_foreground_acquire_does_not_queue_behind_background_sleeper():
+    async def scenario():
+        limiter = GitHubRateLimiter(reserve=50, max_wait=60)
+        limiter.remaining = 50
+        limiter.reset_at = time.time() + 2
+
+        background = asyncio.create_task(limiter.acquire(background=True))
+        await asyncio.sleep(0.05)
+
+        started_at = time.monotonic()
+        await limiter.acquire(background=False)
+        foreground_wait = time.monotonic() - started_at
+
+        assert not background.done()
+        background.cancel()
+        return foreground_wait
+
+    assert asyncio.run(scenario()) < 0.1
+
+
+def test_background_acquire_beyond_max_wait_fails_fast():
+    async def scenario():
+        limiter = GitHubRateLimiter(reserve=50, max_wait=1)
+        limiter.remaining = 10
+        limiter.reset_at = time.time() + 600
+
+        with pytest.raises(common.GitHubRateLimitError):
+            await limiter.acquire(background=True)
+
+        # Пользовательскому запросу резерв по-прежнему доступен
+        await limiter.acquire(background=False)
+        assert limiter.remaining == 9
+
+    asyncio.run(scenario())
@@ -0,0 +1,126 @@
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from opentelemetry.sdk.metrics import MeterProvider, TraceBasedExemplarFilter
+from opentelemetry.sdk.metrics.export import InMemoryMetricReader
+from opentelemetry.sdk.trace import TracerProvider
+
+from internal import common, interface
+from internal.controller.http.middlerware.middleware import HttpMiddleware, _CardinalityLimiter
+
+_PREFIX = "/api/release"
+
+
+def _instrumented_app(make_tel, metrics_max_series: int = 1000) -> tuple[TestClient, InMemoryMetricReader, interface.ITelemetry]:
+    reader = InMemoryMetricReader()
+    meter = MeterProvider(metric_readers=[reader], exemplar_filter=TraceBasedExemplarFilter()).get_meter("test")
+    tel = make_tel(tracer=TracerProvider().get_tracer("test"), meter=meter)
+
+    app = FastAPI()
+
+    @app.get(_PREFIX + "/{release_id}")
+    async def get_release(release_id: int) -> dict:
+        return {"id": release_id}
+
+    @app.post(_PREFIX + "/{release_id}/approve")
+    async def approve_release(release_id: int) -> dict:
+        return {"id": release_id}
+
+    HttpMiddleware(tel, _PREFIX, metrics_max_series).instrumentation_middleware01(app)
+    return TestClient(app), reader, tel
+
+
+def _series(reader: InMemoryMetricReader) -> dict[str, list]:
+    series = {}
+    for resource_metrics in reader.get_metrics_data().resource_metrics:
+        for scope_metrics in resource_metrics.scope_metrics:
+            for metric in scope_metrics.metrics:
+                series[metric.name] = list(metric.data.data_points)
+    return series
+
+
+def _series_count(reader: InMemoryMetricReader) -> dict[str, int]:
+    return {name: len(points) for name, points in _series(reader).items()}
+
+
+def _send(client: TestClient, i: int):
+    # Каждый запрос уникален по пути, а часть еще и по методу, статусу и маршруту
+    match i % 4:
+        case 0:
+            client.get(f"{_PREFIX}/{i}")
+        case 1:
+            client.post(f"{_PREFIX}/{i}/approve")
+        case 2:
+            client.get(f"{_PREFIX}/not-a-number-{i}")
+        case 3:
+            client.get(f"{_PREFIX}/{i}/unknown/{i}")
+
+
+def test_series_count_stays_constant_over_distinct_requests(make_tel):
+    client, reader, _ = _instrumented_app(make_tel)
+
+    with client:
+        for i in range(1000):
+            _send(client, i)
+        warmed_up = _series_count(reader)
+
+        for i in range(1000, 100_000):
+            _send(client, i)
+        after = _series_count(reader)
+
+    assert warmed_up == after
+    assert after[common.REQUEST_DURATION_METRIC] == 4
+
+    durations = _series(reader)[common.REQUEST_DURATION_METRIC]
+    assert sum(point.count for point in durations) == 100_000
+    assert {point.attributes[common.HTTP_ROUTE_KEY] for point in durations} == {
+        _PREFIX + "/{release_id}",
+        _PREFIX + "/{release_id}/approve",
+        "_OTHER",
+    }
+
+
+def test_exemplars_carry_trace_id_instead_of_attributes(make_tel):
+    client, reader, _ = _instrumented_app(make_tel)
+
+    with client:
+        response = client.get(f"{_PREFIX}/1")
+
+    point = _series(reader)[common.REQUEST_DURATION_METRIC][0]
+    assert common.TRACE_ID_KEY not in point.attributes
+    assert [format(exemplar.trace_id, "032x") for exemplar in point.exemplars] == [
+        response.headers[common.TRACE_ID_HEADER]
+    ]
+
+
+def test_series_over_limit_collapse_into_overflow_series(make_tel):
+    client, reader, tel = _instrumented_app(make_tel, metrics_max_series=2)
+
+    with client:
+        client.get(f"{_PREFIX}/1")
+        client.post(f"{_PREFIX}/1/approve")
+        for i in range(100):
+            client.get(f"{_PREFIX}/bad-{i}")
+
+    attributes = [point.attributes for point in _series(reader)[common.REQUEST_DURATION_METRIC]]
+    assert len(attributes) == 3
+    assert {common.METRIC_OVERFLOW_KEY: True} in attributes
+
+    warnings = [record for record in tel.logger().records if record[0] == "warning" and "overflow" in record[1]]
+    assert len(warnings) == 1
+
+
+def test_cardinality_limiter_keeps_known_series_after_overflow(tel):
+    logger = tel.logger()
+    limiter = _CardinalityLimiter(logger, max_series=2)
+
+    first = {"route": "/a"}
+    second = {"route": "/b"}
+    assert limiter.limit(first) == first
+    assert limiter.limit(second) == second
+
+    overflow = {common.METRIC_OVERFLOW_KEY: True}
+    assert limiter.limit({"route": "/c"}) == overflow
+    assert limiter.limit({"route": "/d"}) == overflow
+    assert limiter.limit(first) == first
+
+    assert len(logger.records) == 1
@@ -0,0 +1,137 @@
+import asyncio
+import time
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from internal.app.server.app import include_readiness_handler
+from internal.service.readiness.service import ReadinessService
+
+
+class _Dependency:
+    """Проверка зависимости, которая считает вызовы и одновременные запросы"""
+
+    def __init__(self, delay: float = 0, error: Exception = None):
+        self.delay = delay
+        self.error = error
+        self.calls = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def __call__(self) -> None:
+        self.calls += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+            if self.error is not None:
+                raise self.error
+        finally:
+            self.in_flight -= 1
+
+
+def test_not_ready_until_warmup(tel):
+    db = _Dependency()
+    readiness_service = ReadinessService(tel, {"db": db})
+
+    ready, checks = asyncio.run(readiness_service.check())
+
+    assert not ready
+    assert checks == {"warmup": "in progress"}
+    assert db.calls == 0
+
+
+def test_warmup_opens_concurrent_connections(tel):
+    db = _Dependency(delay=0.01)
+    broken = _Dependency(error=ConnectionRefusedError("connection refused"))
+    readiness_service = ReadinessService(tel, {"db": db, "broken": broken}, warmup_concurrency=4)
+
+    asyncio.run(readiness_service.warmup())
+
+    # Одновременные проверки заставляют пул открыть несколько соединений заранее
+    assert db.calls == 4
+    assert db.max_in_flight == 4
+    # Упавшая зависимость не блокирует старт, а попадает в лог и в /ready
+    assert readiness_service.warmed_up
+    assert any(level == "warning" and "broken" in message for level, message, _ in tel.logger().records)
+
+
+def test_check_is_cached_for_ttl(tel):
+    db = _Dependency()
+    readiness_service = ReadinessService(tel, {"db": db}, cache_ttl=0.2, warmup_concurrency=1)
+
+    async def scenario():
+        await readiness_service.warmup()
+        db.calls = 0
+
+        for _ in range(5):
+            assert await readiness_service.check() == (True, {"db": "ok"})
+        assert db.calls == 1
+
+        await asyncio.sleep(0.25)
+        await readiness_service.check()
+        assert db.calls == 2
+
+    asyncio.run(scenario())
+
+
+def test_concurrent_checks_share_one_probe(tel):
+    db = _Dependency(delay=0.05)
+    readiness_service = ReadinessService(tel, {"db": db}, cache_ttl=10, warmup_concurrency=1)
+
+    async def scenario():
+        await readiness_service.warmup()
+        db.calls = 0
+
+        results = await asyncio.gather(*(readiness_service.check() for _ in range(20)))
+
+        assert db.calls == 1
+        assert all(result == (True, {"db": "ok"}) for result in results)
+
+    asyncio.run(scenario())
+
+
+def test_check_reports_failed_and_hanging_dependencies(tel):
+    db = _Dependency()
+    hanging = _Dependency(delay=10)
+    broken = _Dependency(error=ConnectionRefusedError("connection refused"))
+    readiness_service = ReadinessService(
+        tel,
+        {"db": db, "hanging": hanging, "broken": broken},
+        cache_ttl=0,
+        check_timeout=0.05,
+        warmup_concurrency=1,
+    )
+
+    async def scenario():
+        await readiness_service.warmup()
+        started_at = time.monotonic()
+        result = await readiness_service.check()
+        return result, time.monotonic() - started_at
+
+    (ready, checks), elapsed = asyncio.run(scenario())
+
+    assert not ready
+    assert checks == {"db": "ok", "hanging": "TimeoutError", "broken": "connection refused"}
+    assert elapsed < 1
+
+
+def test_health_uses_cached_readiness(tel):
+    db = _Dependency()
+    readiness_service = ReadinessService(tel, {"db": db}, cache_ttl=60, warmup_concurrency=1)
+    app = FastAPI()
+    include_readiness_handler(app, readiness_service, "/api/test")
+
+    # Без startup прогрев не выполнен — деплой не должен считать сервис готовым
+    client = TestClient(app)
+    assert client.get("/api/test/health").status_code == 503
+
+    with TestClient(app) as client:
+        db.calls = 0
+        for _ in range(10):
+            response = client.get("/api/test/health")
+            assert response.status_code == 200
+            assert response.json() == {"status": "ok", "db": "ok"}
+        assert client.get("/api/test/ready").status_code == 200
+
+    assert db.calls == 1
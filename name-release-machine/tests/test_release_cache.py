@@ -0,0 +1,218 @@
+import asyncio
+from collections import Counter
+from datetime import datetime, timedelta
+
+from internal import model
+from internal.repo.release.cache import CachedReleaseRepo
+
+_STARTED_AT = datetime(2026, 1, 1)
+
+
+class _FakeReleaseRepo:
+    def __init__(self):
+        self.releases: dict[int, model.Release] = {}
+        self.loads = Counter()
+        # Пока gate не открыт, чтения висят — так моделируется запрос, пересекшийся с записью
+        self.gate: asyncio.Event = None
+
+    async def create_release(
+            self,
+            service_name: str,
+            release_tag: str,
+            status: model.ReleaseStatus,
+            initiated_by: str,
+            github_run_id: str,
+            github_action_link: str,
+            github_ref: str
+    ) -> int:
+        release_id = len(self.releases) + 1
+        self.releases[release_id] = model.Release(
+            id=release_id,
+            service_name=service_name,
+            release_tag=release_tag,
+            rollback_to_tag="",
+            status=status,
+            initiated_by=initiated_by,
+            github_run_id=github_run_id,
+            github_action_link=github_action_link,
+            github_ref=github_ref,
+            approved_list=[],
+            rollback_log="",
+            created_at=_STARTED_AT + timedelta(minutes=release_id),
+            started_at=None,
+            completed_at=None,
+        )
+        return release_id
+
+    async def update_release(
+            self,
+            release_id: int,
+            status: model.ReleaseStatus = None,
+            github_run_id: str = None,
+            github_action_link: str = None,
+            rollback_to_tag: str = None,
+            approved_list: list[str] = None,
+    ) -> None:
+        release = self.releases[release_id]
+        if status is not None:
+            release.status = status
+        if approved_list is not None:
+            release.approved_list = list(approved_list)
+
+    async def get_release_by_id(self, release_id: int) -> list[model.Release]:
+        await self._load("get_release_by_id")
+        return [self._copy(self.releases[release_id])]
+
+    async def get_releases_page(
+            self,
+            statuses: list[model.ReleaseStatus],
+            limit: int,
+            cursor_created_at: datetime = None,
+            cursor_id: int = None,
+            service_name: str = None,
+    ) -> list[model.Release]:
+        await self._load("get_releases_page")
+        releases = [
+            self._copy(release) for release in self.releases.values()
+            if release.status in statuses
+        ]
+        return sorted(releases, key=lambda release: release.id, reverse=True)[:limit]
+
+    async def get_releases_stats(
+            self,
+            statuses: list[model.ReleaseStatus],
+            service_name: str = None,
+    ) -> model.ReleaseStats:
+        await self._load("get_releases_stats")
+        count = sum(1 for release in self.releases.values() if release.status in statuses)
+        return model.ReleaseStats(total_count=count, oldest_created_at=None, by_service=[])
+
+    async def _load(self, method: str) -> None:
+        self.loads[method] += 1
+        if self.gate is not None:
+            await self.gate.wait()
+
+    def _copy(self, release: model.Release) -> model.Release:
+        return model.Release(**{**release.__dict__, "approved_list": list(release.approved_list)})
+
+
+def _cache(tel) -> tuple[CachedReleaseRepo, _FakeReleaseRepo]:
+    release_repo = _FakeReleaseRepo()
+    return CachedReleaseRepo(tel, release_repo, ttl=60, analytics_ttl=60, max_size=16), release_repo
+
+
+async def _create(cache: CachedReleaseRepo, status: model.ReleaseStatus = model.ReleaseStatus.MANUAL_TESTING) -> int:
+    return await cache.create_release(
+        service_name="name-account",
+        release_tag="v1.0.0",
+        status=status,
+        initiated_by="gommgo",
+        github_run_id="",
+        github_action_link="",
+        github_ref="",
+    )
+
+
+def _active_page(cache: CachedReleaseRepo):
+    return cache.get_releases_page(statuses=model.ACTIVE_RELEASE_STATUSES, limit=10)
+
+
+def test_cache_hands_out_copies(tel):
+    async def scenario():
+        cache, release_repo = _cache(tel)
+        release_id = await _create(cache)
+
+        # Ни изменение результата промаха, ни изменение результата попадания не портят кеш
+        [release] = await cache.get_release_by_id(release_id)
+        release.approved_list.append("gommgo")
+
+        [release] = await cache.get_release_by_id(release_id)
+        assert release.approved_list == []
+        release.status = model.ReleaseStatus.DEPLOYED
+
+        [release] = await cache.get_release_by_id(release_id)
+        assert release.status == model.ReleaseStatus.MANUAL_TESTING
+        assert release_repo.loads["get_release_by_id"] == 1
+
+    asyncio.run(scenario())
+
+
+def test_create_invalidates_only_matching_statuses(tel):
+    async def scenario():
+        cache, release_repo = _cache(tel)
+        await _create(cache)
+        await _active_page(cache)
+        await cache.get_releases_page(statuses=model.SUCCESSFUL_RELEASE_STATUSES, limit=10)
+
+        await _create(cache)
+
+        assert len(await _active_page(cache)) == 2
+        await cache.get_releases_page(statuses=model.SUCCESSFUL_RELEASE_STATUSES, limit=10)
+        assert release_repo.loads["get_releases_page"] == 3
+
+    asyncio.run(scenario())
+
+
+def test_update_without_status_invalidates_entries_with_release(tel):
+    async def scenario():
+        cache, release_repo = _cache(tel)
+        first_id = await _create(cache)
+        second_id = await _create(cache)
+        await cache.get_release_by_id(first_id)
+        await cache.get_release_by_id(second_id)
+        await cache.get_releases_stats(model.ACTIVE_RELEASE_STATUSES)
+
+        await cache.update_release(first_id, approved_list=["gommgo"])
+
+        [release] = await cache.get_release_by_id(first_id)
+        assert release.approved_list == ["gommgo"]
+        await cache.get_release_by_id(second_id)
+        await cache.get_releases_stats(model.ACTIVE_RELEASE_STATUSES)
+        assert release_repo.loads["get_release_by_id"] == 3
+        assert release_repo.loads["get_releases_stats"] == 1
+
+    asyncio.run(scenario())
+
+
+def test_status_change_invalidates_old_and_new_status_entries(tel):
+    async def scenario():
+        cache, release_repo = _cache(tel)
+        release_id = await _create(cache)
+        await _active_page(cache)
+        await cache.get_releases_page(statuses=model.SUCCESSFUL_RELEASE_STATUSES, limit=10)
+        await cache.get_releases_page(statuses=model.FAILED_RELEASE_STATUSES, limit=10)
+        await cache.get_releases_stats(model.FAILED_RELEASE_STATUSES)
+
+        await cache.update_release(release_id, status=model.ReleaseStatus.DEPLOYED)
+
+        # Страница со старым статусом содержала релиз, с новым — может его получить
+        assert await _active_page(cache) == []
+        assert len(await cache.get_releases_page(statuses=model.SUCCESSFUL_RELEASE_STATUSES, limit=10)) == 1
+        await cache.get_releases_page(statuses=model.FAILED_RELEASE_STATUSES, limit=10)
+        assert release_repo.loads["get_releases_page"] == 5
+        # Прежний статус неизвестен, поэтому счетчики сбрасываются целиком
+        await cache.get_releases_stats(model.FAILED_RELEASE_STATUSES)
+        assert release_repo.loads["get_releases_stats"] == 2
+
+    asyncio.run(scenario())
+
+
+def test_stale_fill_is_not_cached(tel):
+    async def scenario():
+        cache, release_repo = _cache(tel)
+        release_id = await _create(cache)
+
+        # Чтение началось до записи и вернет старый статус
+        release_repo.gate = asyncio.Event()
+        read = asyncio.create_task(_active_page(cache))
+        await asyncio.sleep(0)
+
+        await cache.update_release(release_id, status=model.ReleaseStatus.DEPLOYED)
+        release_repo.gate.set()
+        await read
+        release_repo.gate = None
+
+        assert await _active_page(cache) == []
+        assert release_repo.loads["get_releases_page"] == 2
+
+    asyncio.run(scenario())
@@ -0,0 +1,294 @@
+import asyncio
+import json
+import time
+
+from infrastructure.pg.listener import PGListener
+from internal import common, model
+from internal.repo.release.repo import ReleaseRepo
+from internal.service.release_notify.service import ReleaseNotifyService
+
+
+class _FakeBgManager:
+    def __init__(self, factory: "_FakeBgFactory", user_id: int):
+        self.factory = factory
+        self.user_id = user_id
+
+    async def update(self, data: dict, show_mode=None) -> None:
+        if self.user_id in self.factory.failing_users:
+            raise RuntimeError("chat not found")
+        self.factory.updates.append((self.user_id, time.monotonic()))
+
+
+class _FakeBgFactory:
+    def __init__(self):
+        self.updates: list[tuple[int, float]] = []
+        self.failing_users: set[int] = set()
+
+    def bg(self, bot, user_id: int, chat_id: int) -> _FakeBgManager:
+        return _FakeBgManager(self, user_id)
+
+    def user_updates(self, user_id: int) -> list[float]:
+        return [updated_at for updated_user_id, updated_at in self.updates if updated_user_id == user_id]
+
+
+class _FakeReleaseCache:
+    def __init__(self):
+        self.invalidated: list[tuple[int, model.ReleaseStatus]] = []
+
+    def invalidate_release(self, release_id: int, status: model.ReleaseStatus = None) -> None:
+        self.invalidated.append((release_id, status))
+
+
+def _notify_service(tel, update_interval: float) -> tuple[ReleaseNotifyService, _FakeBgFactory, _FakeReleaseCache]:
+    release_cache = _FakeReleaseCache()
+    bg_factory = _FakeBgFactory()
+    release_notify_service = ReleaseNotifyService(
+        tel,
+        bot=None,
+        release_cache=release_cache,
+        subscription_ttl=60,
+        update_interval=update_interval,
+    )
+    release_notify_service.set_bg_factory(bg_factory)
+    return release_notify_service, bg_factory, release_cache
+
+
+def _payload(release_id: int, status: model.ReleaseStatus) -> str:
+    return json.dumps({"id": release_id, "status": status.value})
+
+
+async def _wait_for(predicate, timeout: float = 5) -> None:
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "условие не выполнилось вовремя"
+        await asyncio.sleep(0.01)
+
+
+def test_release_changed_burst_is_debounced_per_subscriber(tel):
+    update_interval = 0.1
+
+    async def scenario():
+        release_notify_service, bg_factory, release_cache = _notify_service(tel, update_interval)
+        release_notify_service.subscribe(1, 1)
+        release_notify_service.subscribe(2, 2)
+
+        started_at = time.monotonic()
+        for _ in range(30):
+            await release_notify_service.handle_release_changed(_payload(1, model.ReleaseStatus.DEPLOYING))
+            await asyncio.sleep(0.01)
+        last_notified_at = time.monotonic()
+        await asyncio.sleep(update_interval * 2)
+
+        # Кеш сбрасывается на каждое уведомление, окна — не чаще раза в интервал
+        assert len(release_cache.invalidated) == 30
+        for user_id in (1, 2):
+            updates = bg_factory.user_updates(user_id)
+            assert 2 <= len(updates) <= (last_notified_at - started_at) / update_interval + 2
+            assert all(
+                later - earlier >= update_interval * 0.9
+                for earlier, later in zip(updates, updates[1:])
+            )
+            # Последнее обновление идет после последнего уведомления и показывает актуальное состояние
+            assert updates[-1] >= last_notified_at - update_interval
+
+    asyncio.run(scenario())
+
+
+def test_first_release_change_updates_immediately(tel):
+    async def scenario():
+        release_notify_service, bg_factory, _ = _notify_service(tel, update_interval=10)
+        release_notify_service.subscribe(1, 1)
+
+        await release_notify_service.handle_release_changed(_payload(1, model.ReleaseStatus.DEPLOYED))
+        await _wait_for(lambda: bg_factory.updates)
+
+    asyncio.run(scenario())
+
+
+def test_failing_subscriber_is_unsubscribed(tel):
+    async def scenario():
+        release_notify_service, bg_factory, _ = _notify_service(tel, update_interval=0.05)
+        release_notify_service.subscribe(1, 1)
+        release_notify_service.subscribe(2, 2)
+        bg_factory.failing_users.add(2)
+
+        await release_notify_service.handle_release_changed(_payload(1, model.ReleaseStatus.DEPLOYED))
+        await _wait_for(lambda: bg_factory.updates)
+        await asyncio.sleep(0.01)
+
+        assert list(release_notify_service.subscribers) == [(1, 1)]
+        assert not release_notify_service._pending_updates
+
+    asyncio.run(scenario())
+
+
+class _StallingProxy:
+    """TCP-прокси до Postgres, умеющий молча перестать пересылать трафик уже открытых соединений"""
+
+    def __init__(self, host: str, port: int):
+        self.host = host
+        self.port = port
+        self.server: asyncio.Server = None
+        self._stalled: list[asyncio.Event] = []
+        self._tasks: set[asyncio.Task] = set()
+
+    async def start(self) -> int:
+        self.server = await asyncio.start_server(self._accept, "127.0.0.1", 0)
+        return self.server.sockets[0].getsockname()[1]
+
+    def stall(self) -> None:
+        for stalled in self._stalled:
+            stalled.set()
+
+    async def close(self) -> None:
+        self.server.close()
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    async def _accept(self, client_reader: asyncio.StreamReader, client_writer: asyncio.StreamWriter) -> None:
+        upstream_reader, upstream_writer = await asyncio.open_connection(self.host, self.port)
+        stalled = asyncio.Event()
+        self._stalled.append(stalled)
+        for reader, writer in ((client_reader, upstream_writer), (upstream_reader, client_writer)):
+            task = asyncio.create_task(self._pump(reader, writer, stalled))
+            self._tasks.add(task)
+
+    async def _pump(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter, stalled: asyncio.Event) -> None:
+        try:
+            while data := await reader.read(65536):
+                if stalled.is_set():
+                    # Соединение не закрывается, ответы просто не приходят — как при обрыве сети
+                    await asyncio.Event().wait()
+                writer.write(data)
+                await writer.drain()
+        finally:
+            writer.close()
+
+
+def _listener(tel, pg_url, port: int = None) -> PGListener:
+    return PGListener(
+        tel,
+        pg_url.username,
+        pg_url.password or "",
+        pg_url.host,
+        port or pg_url.port or 5432,
+        pg_url.database,
+        reconnect_interval=0.05,
+        health_check_interval=0.1,
+        health_check_timeout=0.1,
+    )
+
+
+async def _create_release(repo: ReleaseRepo) -> int:
+    return await repo.create_release(
+        service_name="name-account",
+        release_tag="v1.0.0",
+        status=model.ReleaseStatus.INITIATED,
+        initiated_by="gommgo",
+        github_run_id="",
+        github_action_link="",
+        github_ref="",
+    )
+
+
+def test_listener_delivers_release_changes(tel, pg_db, pg_url):
+    async def scenario():
+        async with pg_db() as db:
+            payloads = []
+
+            async def handler(payload: str) -> None:
+                payloads.append(json.loads(payload))
+
+            listener = _listener(tel, pg_url)
+            listener.listen(common.RELEASE_CHANGED_CHANNEL, handler)
+            await listener.start()
+            try:
+                await _wait_for(lambda: any("Подписка" in record[1] for record in tel.logger().records))
+
+                repo = ReleaseRepo(tel, db)
+                release_id = await _create_release(repo)
+                await repo.update_release(release_id, status=model.ReleaseStatus.STAGE_BUILDING)
+                # Без смены статуса триггер молчит
+                await repo.update_release(release_id, github_run_id="42")
+
+                await _wait_for(lambda: len(payloads) == 2)
+                await asyncio.sleep(0.05)
+                assert payloads == [
+                    {"id": release_id, "status": "initiated"},
+                    {"id": release_id, "status": "stage_building"},
+                ]
+            finally:
+                await listener.stop()
+
+    asyncio.run(scenario())
+
+
+def test_listener_reconnects_after_backend_termination(tel, pg_db, pg_url):
+    async def scenario():
+        async with pg_db() as db:
+            payloads = []
+
+            async def handler(payload: str) -> None:
+                payloads.append(payload)
+
+            listener = _listener(tel, pg_url)
+            listener.listen(common.RELEASE_CHANGED_CHANNEL, handler)
+            await listener.start()
+            try:
+                await _wait_for(lambda: any("Подписка" in record[1] for record in tel.logger().records))
+                await db.select(
+                    "SELECT pg_terminate_backend(pid) FROM pg_stat_activity "
+                    "WHERE pid <> pg_backend_pid() AND query ILIKE 'LISTEN%'",
+                    {},
+                )
+                await _wait_for(lambda: any("разорвано" in record[1] for record in tel.logger().records))
+
+                repo = ReleaseRepo(tel, db)
+
+                # Уведомления до повторной подписки теряются, поэтому шлем, пока не дойдет
+                async def notify_until_delivered():
+                    while not payloads:
+                        await _create_release(repo)
+                        await asyncio.sleep(0.05)
+
+                await asyncio.wait_for(notify_until_delivered(), timeout=5)
+            finally:
+                await listener.stop()
+
+    asyncio.run(scenario())
+
+
+def test_listener_health_check_reconnects_stalled_connection(tel, pg_db, pg_url):
+    async def scenario():
+        async with pg_db() as db:
+            proxy = _StallingProxy(pg_url.host, pg_url.port or 5432)
+            port = await proxy.start()
+            payloads = []
+
+            async def handler(payload: str) -> None:
+                payloads.append(payload)
+
+            listener = _listener(tel, pg_url, port=port)
+            listener.listen(common.RELEASE_CHANGED_CHANNEL, handler)
+            await listener.start()
+            try:
+                await _wait_for(lambda: any("Подписка" in record[1] for record in tel.logger().records))
+
+                # Соединение живо для TCP, но Postgres за ним не отвечает — заметить это может только SELECT 1
+                proxy.stall()
+                await _wait_for(lambda: any("не отвечает" in record[1] for record in tel.logger().records))
+
+                repo = ReleaseRepo(tel, db)
+
+                async def notify_until_delivered():
+                    while not payloads:
+                        await _create_release(repo)
+                        await asyncio.sleep(0.05)
+
+                await asyncio.wait_for(notify_until_delivered(), timeout=5)
+            finally:
+                await listener.stop()
+                await proxy.close()
+
+    asyncio.run(scenario())
@@ -0,0 +1,237 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from internal import model
+from internal.service.release_reconciler.service import ReleaseReconciler
+
+_STARTED_AT = datetime(2026, 1, 1)
+
+
+class _FakeReleaseRepo:
+    def __init__(self, releases: list[model.Release]):
+        self.releases = releases
+
+    async def get_active_release(self) -> list[model.Release]:
+        return [release for release in self.releases if release.status in model.ACTIVE_RELEASE_STATUSES]
+
+    async def get_releases_page(
+            self,
+            statuses: list[model.ReleaseStatus],
+            limit: int,
+            cursor_created_at: datetime = None,
+            cursor_id: int = None,
+            service_name: str = None,
+    ) -> list[model.Release]:
+        releases = sorted(self.releases, key=lambda release: (release.created_at, release.id), reverse=True)
+        return [release for release in releases if release.status in statuses][:limit]
+
+    async def update_release(
+            self,
+            release_id: int,
+            status: model.ReleaseStatus = None,
+            github_run_id: str = None,
+            github_action_link: str = None,
+            rollback_to_tag: str = None,
+            approved_list: list[str] = None,
+    ) -> None:
+        release = self._release(release_id)
+        if status is not None:
+            release.status = status
+
+    async def update_rollback_log(self, release_id: int, rollback_log: str) -> None:
+        self._release(release_id).rollback_log = rollback_log
+
+    def _release(self, release_id: int) -> model.Release:
+        return next(release for release in self.releases if release.id == release_id)
+
+
+class _FakeGitHubClient:
+    def __init__(self, runs: list[model.GitHubWorkflowRun], listed: bool = True):
+        self.runs = {run.id: run for run in runs}
+        # listed=False — запуски не попали в страницу списка и запрашиваются по одному
+        self.listed = listed
+        self.requested_run_ids: list[int] = []
+
+    async def list_workflow_runs(
+            self,
+            owner: str,
+            repo: str,
+            workflow_id: str = None,
+            branch: str = None,
+            event: str = None,
+            status: str = None,
+            per_page: int = 20
+    ) -> list[model.GitHubWorkflowRun]:
+        if not self.listed:
+            return []
+        return [run for run in self.runs.values() if status is None or run.status == status]
+
+    async def get_workflow_run(self, owner: str, repo: str, run_id: int) -> model.GitHubWorkflowRun:
+        self.requested_run_ids.append(run_id)
+        return self.runs[run_id]
+
+
+def _run(
+        run_id: int,
+        conclusion: str | None,
+        status: str = "completed",
+        updated_ago: float = 600,
+) -> model.GitHubWorkflowRun:
+    now = datetime.now(timezone.utc)
+    return model.GitHubWorkflowRun(
+        id=run_id,
+        name="release",
+        workflow_id=1,
+        status=status,
+        conclusion=conclusion,
+        event="push",
+        head_branch="main",
+        head_sha="",
+        run_attempt=1,
+        html_url=f"https://github.com/name/name-account/actions/runs/{run_id}",
+        created_at=now - timedelta(hours=1),
+        updated_at=now - timedelta(seconds=updated_ago),
+    )
+
+
+def _release(
+        release_id: int,
+        status: model.ReleaseStatus,
+        github_run_id: str = "",
+        github_action_link: str = "",
+        rollback_log: str = "",
+) -> model.Release:
+    return model.Release(
+        id=release_id,
+        service_name="name-account",
+        release_tag=f"v1.0.{release_id}",
+        rollback_to_tag="",
+        status=status,
+        initiated_by="gommgo",
+        github_run_id=github_run_id,
+        github_action_link=github_action_link,
+        github_ref="",
+        approved_list=[],
+        rollback_log=rollback_log,
+        created_at=_STARTED_AT + timedelta(minutes=release_id),
+        started_at=None,
+        completed_at=None,
+    )
+
+
+def test_start_fails_rollbacks_interrupted_by_restart(tel):
+    releases = [
+        _release(1, model.ReleaseStatus.ROLLBACK, rollback_log="▶️ git_fetch"),
+        _release(2, model.ReleaseStatus.ROLLBACK),
+        _release(3, model.ReleaseStatus.DEPLOYED),
+        _release(4, model.ReleaseStatus.MANUAL_TESTING),
+    ]
+    # interval=0 выключает периодическую сверку, восстановление при старте работает все равно
+    reconciler = ReleaseReconciler(tel, _FakeReleaseRepo(releases), github_client=None, interval=0)
+
+    async def scenario():
+        await reconciler.start()
+        await reconciler.stop()
+
+    asyncio.run(scenario())
+
+    assert [release.status for release in releases] == [
+        model.ReleaseStatus.ROLLBACK_FAILED,
+        model.ReleaseStatus.ROLLBACK_FAILED,
+        model.ReleaseStatus.DEPLOYED,
+        model.ReleaseStatus.MANUAL_TESTING,
+    ]
+    assert releases[0].rollback_log.startswith("▶️ git_fetch\nОткат прерван перезапуском")
+    assert releases[1].rollback_log.startswith("Откат прерван перезапуском")
+
+
+def _tracked_release(release_id: int, status: model.ReleaseStatus) -> model.Release:
+    return _release(
+        release_id,
+        status,
+        github_run_id=str(release_id),
+        github_action_link=f"https://github.com/name/name-account/actions/runs/{release_id}",
+    )
+
+
+def _reconcile(tel, releases: list[model.Release], github_client: _FakeGitHubClient, grace_period: float = 120) -> int:
+    reconciler = ReleaseReconciler(
+        tel,
+        _FakeReleaseRepo(releases),
+        github_client,
+        interval=0,
+        grace_period=grace_period,
+    )
+    return asyncio.run(reconciler.reconcile())
+
+
+@pytest.mark.parametrize("status, conclusion, expected", [
+    (model.ReleaseStatus.INITIATED, "success", model.ReleaseStatus.MANUAL_TESTING),
+    (model.ReleaseStatus.INITIATED, "failure", model.ReleaseStatus.STAGE_BUILDING_FAILED),
+    (model.ReleaseStatus.INITIATED, "cancelled", model.ReleaseStatus.STAGE_BUILDING_FAILED),
+    (model.ReleaseStatus.STAGE_BUILDING, "success", model.ReleaseStatus.MANUAL_TESTING),
+    (model.ReleaseStatus.STAGE_BUILDING, "failure", model.ReleaseStatus.STAGE_BUILDING_FAILED),
+    (model.ReleaseStatus.STAGE_BUILDING, "cancelled", model.ReleaseStatus.STAGE_BUILDING_FAILED),
+    (model.ReleaseStatus.STAGE_TEST_ROLLBACK, "success", model.ReleaseStatus.MANUAL_TESTING),
+    (model.ReleaseStatus.STAGE_TEST_ROLLBACK, "failure", model.ReleaseStatus.STAGE_ROLLBACK_TEST_FAILED),
+    (model.ReleaseStatus.STAGE_TEST_ROLLBACK, "cancelled", model.ReleaseStatus.STAGE_ROLLBACK_TEST_FAILED),
+    (model.ReleaseStatus.DEPLOYING, "success", model.ReleaseStatus.DEPLOYED),
+    (model.ReleaseStatus.DEPLOYING, "failure", model.ReleaseStatus.PRODUCTION_FAILED),
+    (model.ReleaseStatus.DEPLOYING, "cancelled", model.ReleaseStatus.PRODUCTION_FAILED),
+])
+@pytest.mark.parametrize("listed", [True, False], ids=["listed", "fetched"])
+def test_run_conclusion_maps_to_release_status(tel, status, conclusion, expected, listed):
+    releases = [_tracked_release(1, status)]
+    github_client = _FakeGitHubClient([_run(1, conclusion)], listed=listed)
+
+    assert _reconcile(tel, releases, github_client) == 1
+    assert releases[0].status == expected
+    # Запуск из страницы списка повторно не запрашивается
+    assert github_client.requested_run_ids == ([] if listed else [1])
+
+
+@pytest.mark.parametrize("updated_ago, grace_period, reconciled", [
+    (10, 120, False),
+    (119, 120, False),
+    (121, 120, True),
+    (10, 0, True),
+])
+def test_grace_period_waits_for_workflow_patch(tel, updated_ago, grace_period, reconciled):
+    releases = [_tracked_release(1, model.ReleaseStatus.DEPLOYING)]
+    github_client = _FakeGitHubClient([_run(1, "success", updated_ago=updated_ago)])
+
+    assert _reconcile(tel, releases, github_client, grace_period=grace_period) == int(reconciled)
+    assert releases[0].status == (model.ReleaseStatus.DEPLOYED if reconciled else model.ReleaseStatus.DEPLOYING)
+
+
+@pytest.mark.parametrize("run_status", ["queued", "in_progress"])
+def test_unfinished_run_is_left_alone(tel, run_status):
+    releases = [_tracked_release(1, model.ReleaseStatus.STAGE_BUILDING)]
+    github_client = _FakeGitHubClient([_run(1, None, status=run_status)], listed=False)
+
+    assert _reconcile(tel, releases, github_client) == 0
+    assert releases[0].status == model.ReleaseStatus.STAGE_BUILDING
+
+
+@pytest.mark.parametrize("status", [
+    model.ReleaseStatus.ROLLBACK,
+    model.ReleaseStatus.MANUAL_TESTING,
+    model.ReleaseStatus.MANUAL_TEST_PASSED,
+])
+def test_bot_and_human_driven_statuses_are_skipped(tel, status):
+    releases = [_tracked_release(1, status)]
+    github_client = _FakeGitHubClient([_run(1, "failure")], listed=False)
+
+    assert _reconcile(tel, releases, github_client) == 0
+    assert releases[0].status == status
+    assert github_client.requested_run_ids == []
+
+
+def test_release_without_run_link_is_skipped(tel):
+    releases = [_release(1, model.ReleaseStatus.DEPLOYING, github_run_id="1", github_action_link="")]
+    github_client = _FakeGitHubClient([_run(1, "failure")], listed=False)
+
+    assert _reconcile(tel, releases, github_client) == 0
+    assert releases[0].status == model.ReleaseStatus.DEPLOYING
@@ -0,0 +1,268 @@
+import asyncio
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+from sqlalchemy import text
+
+from internal import model
+from internal.dialog.active_release.getter import ActiveReleaseGetter
+from internal.repo.release import query
+from internal.repo.release.repo import ReleaseRepo
+
+_STARTED_AT = datetime(2026, 1, 1)
+
+
+async def _create_releases(
+        repo: ReleaseRepo,
+        count: int,
+        service_name: str = "name-account",
+        status: model.ReleaseStatus = model.ReleaseStatus.MANUAL_TESTING,
+) -> list[int]:
+    release_ids = []
+    for number in range(count):
+        release_ids.append(await repo.create_release(
+            service_name=service_name,
+            release_tag=f"v1.0.{number}",
+            status=status,
+            initiated_by="gommgo",
+            github_run_id="",
+            github_action_link="",
+            github_ref="",
+        ))
+    return release_ids
+
+
+async def _set_created_at(db, created_at: dict[int, datetime]) -> None:
+    for release_id, value in created_at.items():
+        await db.update("UPDATE releases SET created_at = :created_at WHERE id = :release_id", {
+            "created_at": value,
+            "release_id": release_id,
+        })
+
+
+async def _walk_pages(repo: ReleaseRepo, limit: int) -> list[list[int]]:
+    pages = []
+    cursor_created_at, cursor_id = None, None
+    while True:
+        releases = await repo.get_releases_page(
+            statuses=model.ACTIVE_RELEASE_STATUSES,
+            limit=limit,
+            cursor_created_at=cursor_created_at,
+            cursor_id=cursor_id,
+        )
+        if not releases:
+            return pages
+
+        pages.append([release.id for release in releases])
+        cursor_created_at, cursor_id = releases[-1].created_at, releases[-1].id
+
+
+def test_releases_page_boundary(tel, pg_db):
+    async def scenario():
+        async with pg_db() as db:
+            repo = ReleaseRepo(tel, db)
+            release_ids = await _create_releases(repo, 5)
+            await _set_created_at(db, {
+                release_id: _STARTED_AT + timedelta(minutes=number)
+                for number, release_id in enumerate(release_ids)
+            })
+
+            # Ровно заполненная последняя страница отдает пустую следующую
+            assert await _walk_pages(repo, limit=5) == [release_ids[::-1]]
+
+            newest_first = release_ids[::-1]
+            assert await _walk_pages(repo, limit=2) == [newest_first[0:2], newest_first[2:4], newest_first[4:]]
+
+    asyncio.run(scenario())
+
+
+def test_releases_page_breaks_created_at_ties_by_id(tel, pg_db):
+    async def scenario():
+        async with pg_db() as db:
+            repo = ReleaseRepo(tel, db)
+            release_ids = await _create_releases(repo, 5)
+            # Четыре релиза с одинаковым created_at, граница страницы попадает внутрь группы
+            await _set_created_at(db, {release_id: _STARTED_AT for release_id in release_ids[:4]})
+            await _set_created_at(db, {release_ids[4]: _STARTED_AT - timedelta(minutes=1)})
+
+            pages = await _walk_pages(repo, limit=3)
+
+            assert pages == [
+                [release_ids[3], release_ids[2], release_ids[1]],
+                [release_ids[0], release_ids[4]],
+            ]
+
+    asyncio.run(scenario())
+
+
+def test_releases_page_filters_by_service_and_status(tel, pg_db):
+    async def scenario():
+        async with pg_db() as db:
+            repo = ReleaseRepo(tel, db)
+            account_ids = await _create_releases(repo, 3, service_name="name-account")
+            await _create_releases(repo, 2, service_name="name-authorization")
+            await _create_releases(repo, 2, status=model.ReleaseStatus.DEPLOYED)
+
+            releases = await repo.get_releases_page(
+                statuses=model.ACTIVE_RELEASE_STATUSES,
+                limit=10,
+                service_name="name-account",
+            )
+
+            assert [release.id for release in releases] == account_ids[::-1]
+
+    asyncio.run(scenario())
+
+
+def test_releases_page_uses_keyset_indexes(tel, pg_db):
+    async def explain(db, service_name: str = None) -> str:
+        filters = ["AND (created_at, id) < (:cursor_created_at, :cursor_id)"]
+        args = {
+            "statuses": [model.ReleaseStatus.MANUAL_TESTING.value],
+            "limit": 10,
+            "cursor_created_at": _STARTED_AT,
+            "cursor_id": 1000,
+        }
+        if service_name is not None:
+            filters.insert(0, "AND service_name = :service_name")
+            args["service_name"] = service_name
+
+        async with db.pool() as session:
+            # На пустой таблице планировщик выбрал бы seq scan
+            await session.execute(text("SET LOCAL enable_seqscan = off"))
+            result = await session.execute(
+                text("EXPLAIN " + query.get_releases_page.format(filters="\n".join(filters))),
+                args,
+            )
+            return "\n".join(row[0] for row in result.all())
+
+    async def scenario():
+        async with pg_db() as db:
+            assert "idx_releases_status_created_at" in await explain(db)
+            assert "idx_releases_service_status_created_at" in await explain(db, service_name="name-account")
+
+    asyncio.run(scenario())
+
+
+def _dialog_manager() -> SimpleNamespace:
+    return SimpleNamespace(dialog_data={})
+
+
+def test_active_release_navigation_follows_page_cursors(tel, pg_db):
+    async def scenario():
+        async with pg_db() as db:
+            repo = ReleaseRepo(tel, db)
+            release_ids = await _create_releases(repo, 5)
+            await _set_created_at(db, {release_id: _STARTED_AT for release_id in release_ids})
+            newest_first = release_ids[::-1]
+
+            getter = ActiveReleaseGetter(
+                tel,
+                repo,
+                release_notify_service=None,
+                required_approve_list=[],
+                page_size=2,
+            )
+            dialog_manager = _dialog_manager()
+
+            # Вперед по одному релизу: каждая новая страница открывается курсором предыдущей
+            for index in range(5):
+                releases, current_index = await getter._load_page(dialog_manager, index)
+                assert current_index == index
+                assert releases[index % 2].id == newest_first[index]
+
+            page_cursors = dialog_manager.dialog_data["page_cursors"]
+            assert page_cursors == [
+                None,
+                [_STARTED_AT.isoformat(), newest_first[1]],
+                [_STARTED_AT.isoformat(), newest_first[3]],
+            ]
+
+            # Назад на предыдущую страницу: курсор берется из сохраненных, лишние отбрасываются
+            releases, current_index = await getter._load_page(dialog_manager, 3)
+            assert [release.id for release in releases] == newest_first[2:4]
+            assert dialog_manager.dialog_data["page_cursors"] == page_cursors
+
+            releases, current_index = await getter._load_page(dialog_manager, 1)
+            assert current_index == 1
+            assert [release.id for release in releases] == newest_first[0:2]
+            assert dialog_manager.dialog_data["page_cursors"] == page_cursors[:2]
+
+    asyncio.run(scenario())
+
+
+def test_active_release_navigation_restarts_when_page_disappears(tel, pg_db):
+    async def scenario():
+        async with pg_db() as db:
+            repo = ReleaseRepo(tel, db)
+            release_ids = await _create_releases(repo, 3)
+            getter = ActiveReleaseGetter(
+                tel,
+                repo,
+                release_notify_service=None,
+                required_approve_list=[],
+                page_size=2,
+            )
+            dialog_manager = _dialog_manager()
+            await getter._load_page(dialog_manager, 0)
+
+            # Единственный релиз второй страницы ушел из активных
+            await repo.update_release(release_ids[0], status=model.ReleaseStatus.DEPLOYED)
+
+            releases, current_index = await getter._load_page(dialog_manager, 2)
+
+            assert current_index == 0
+            assert [release.id for release in releases] == release_ids[:0:-1]
+            assert dialog_manager.dialog_data["page_cursors"][0] is None
+
+    asyncio.run(scenario())
+
+
+def test_active_release_navigation_clamps_to_last_known_page(tel, pg_db):
+    async def scenario():
+        async with pg_db() as db:
+            repo = ReleaseRepo(tel, db)
+            release_ids = await _create_releases(repo, 5)
+            getter = ActiveReleaseGetter(
+                tel,
+                repo,
+                release_notify_service=None,
+                required_approve_list=[],
+                page_size=2,
+            )
+            dialog_manager = _dialog_manager()
+
+            # Курсор третьей страницы еще неизвестен — открывается начало последней известной
+            releases, current_index = await getter._load_page(dialog_manager, 4)
+
+            assert current_index == 0
+            assert [release.id for release in releases] == release_ids[::-1][:2]
+            assert len(dialog_manager.dialog_data["page_cursors"]) == 2
+
+    asyncio.run(scenario())
+
+
+def test_update_release_records_only_status_transitions(tel, pg_db):
+    async def scenario():
+        async with pg_db() as db:
+            repo = ReleaseRepo(tel, db)
+            [release_id] = await _create_releases(repo, 1, status=model.ReleaseStatus.INITIATED)
+
+            await repo.update_release(release_id, status=model.ReleaseStatus.STAGE_BUILDING)
+            # Повтор статуса, например от повторного PATCH из workflow, переходом не считается
+            await repo.update_release(release_id, status=model.ReleaseStatus.STAGE_BUILDING, github_run_id="42")
+            await repo.update_release(release_id, approved_list=["gommgo"])
+            await repo.update_release(release_id, status=model.ReleaseStatus.MANUAL_TESTING)
+
+            events = await repo.get_release_events([release_id])
+
+            assert [event.status for event in events] == [
+                model.ReleaseStatus.INITIATED,
+                model.ReleaseStatus.STAGE_BUILDING,
+                model.ReleaseStatus.MANUAL_TESTING,
+            ]
+            [release] = await repo.get_release_by_id(release_id)
+            assert release.status == model.ReleaseStatus.MANUAL_TESTING
+            assert release.github_run_id == "42"
+
+    asyncio.run(scenario())
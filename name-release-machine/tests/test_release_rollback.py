@@ -0,0 +1,216 @@
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+
+from internal import model, common
+from internal.controller.http.handler.release.handler import ReleaseController
+from internal.controller.http.handler.release.model import RollbackBatchBody, RollbackTargetBody
+from internal.service.release.service import ReleaseService
+
+_SERVICE = "name-account"
+_STARTED_AT = datetime(2026, 1, 1)
+
+
+class _FakeReleaseRepo:
+    def __init__(self, releases: list[model.Release]):
+        self.releases = releases
+
+    async def get_releases_page(
+            self,
+            statuses: list[model.ReleaseStatus],
+            limit: int,
+            cursor_created_at: datetime = None,
+            cursor_id: int = None,
+            service_name: str = None,
+    ) -> list[model.Release]:
+        releases = sorted(self.releases, key=lambda release: (release.created_at, release.id), reverse=True)
+        releases = [
+            release for release in releases
+            if release.status in statuses
+            and (service_name is None or release.service_name == service_name)
+            and (cursor_created_at is None or (release.created_at, release.id) < (cursor_created_at, cursor_id))
+        ]
+        return releases[:limit]
+
+    async def update_release(
+            self,
+            release_id: int,
+            status: model.ReleaseStatus = None,
+            github_run_id: str = None,
+            github_action_link: str = None,
+            rollback_to_tag: str = None,
+            approved_list: list[str] = None,
+    ) -> None:
+        release = next(release for release in self.releases if release.id == release_id)
+        if status is not None:
+            release.status = status
+        if rollback_to_tag is not None:
+            release.rollback_to_tag = rollback_to_tag
+
+    async def update_rollback_log(self, release_id: int, rollback_log: str) -> None:
+        pass
+
+
+class _BlockingDeployEngine:
+    """Шаги отката «выполняются», пока тест не откроет release"""
+
+    def __init__(self):
+        self.started = asyncio.Event()
+        self.release = asyncio.Event()
+
+    async def run(self, steps: list[model.DeployStep], on_output=None) -> list[model.DeployStepResult]:
+        self.started.set()
+        await self.release.wait()
+        return [
+            model.DeployStepResult(name=step.name, status=model.DeployStepStatus.DONE, critical=step.critical)
+            for step in steps
+        ]
+
+
+def _release(release_id: int, release_tag: str, status: model.ReleaseStatus, rollback_to_tag: str = "") -> model.Release:
+    return model.Release(
+        id=release_id,
+        service_name=_SERVICE,
+        release_tag=release_tag,
+        rollback_to_tag=rollback_to_tag,
+        status=status,
+        initiated_by="gommgo",
+        github_run_id="",
+        github_action_link="",
+        github_ref="",
+        approved_list=[],
+        rollback_log="",
+        created_at=_STARTED_AT + timedelta(hours=release_id),
+        started_at=None,
+        completed_at=None,
+    )
+
+
+def _release_service(tel, releases: list[model.Release], deploy_engine=None) -> ReleaseService:
+    return ReleaseService(
+        tel,
+        _FakeReleaseRepo(releases),
+        deploy_engine=deploy_engine,
+        prod_domain="example.com",
+        service_port_map={_SERVICE: 8000},
+        service_prefix_map={_SERVICE: "/api/account"},
+        rollback_log_tail_lines=30,
+        rollback_log_flush_interval=3,
+        rollback_concurrency=3,
+    )
+
+
+def test_plan_uses_rollback_target_as_running_version(tel):
+    release_service = _release_service(tel, [
+        _release(1, "v1.0.0", model.ReleaseStatus.DEPLOYED),
+        _release(2, "v2.0.0", model.ReleaseStatus.DEPLOYED),
+        _release(3, "v3.0.0", model.ReleaseStatus.ROLLBACK_DONE, rollback_to_tag="v2.0.0"),
+    ])
+
+    plan = asyncio.run(release_service.plan_rollback_batch([model.RollbackTarget(service_name=_SERVICE)]))
+
+    assert plan[0].release_tag == "v2.0.0"
+    assert plan[0].target_tag == "v1.0.0"
+
+
+def test_plan_rejects_rollback_to_running_version(tel):
+    release_service = _release_service(tel, [
+        _release(1, "v1.0.0", model.ReleaseStatus.DEPLOYED),
+        _release(2, "v2.0.0", model.ReleaseStatus.ROLLBACK_DONE, rollback_to_tag="v1.0.0"),
+    ])
+
+    with pytest.raises(common.ValidationError):
+        asyncio.run(release_service.plan_rollback_batch([
+            model.RollbackTarget(service_name=_SERVICE, target_tag="v1.0.0")
+        ]))
+
+
+def test_rollback_endpoint_requires_token_and_admin(tel):
+    release_service = _release_service(tel, [
+        _release(1, "v1.0.0", model.ReleaseStatus.DEPLOYED),
+        _release(2, "v2.0.0", model.ReleaseStatus.DEPLOYED),
+    ])
+    body = RollbackBatchBody(targets=[RollbackTargetBody(service_name=_SERVICE)], initiated_by="gommgo")
+
+    disabled = ReleaseController(tel, release_service, ["gommgo"], "")
+    assert asyncio.run(disabled.rollback_batch(body, x_rollback_token="")).status_code == 401
+
+    controller = ReleaseController(tel, release_service, ["gommgo"], "token")
+    assert asyncio.run(controller.rollback_batch(body, x_rollback_token="wrong")).status_code == 401
+    assert asyncio.run(controller.rollback_batch(body)).status_code == 401
+
+    stranger = RollbackBatchBody(targets=body.targets, initiated_by="stranger")
+    assert asyncio.run(controller.rollback_batch(stranger, x_rollback_token="token")).status_code == 403
+
+
+def test_plan_rejects_service_already_rolling_back(tel):
+    # Откат начат другим процессом: в базе релиз уже в статусе ROLLBACK
+    release_service = _release_service(tel, [
+        _release(1, "v1.0.0", model.ReleaseStatus.DEPLOYED),
+        _release(2, "v2.0.0", model.ReleaseStatus.DEPLOYED),
+        _release(3, "v3.0.0", model.ReleaseStatus.ROLLBACK, rollback_to_tag="v2.0.0"),
+    ])
+
+    with pytest.raises(common.RollbackInProgressError):
+        asyncio.run(release_service.plan_rollback_batch([model.RollbackTarget(service_name=_SERVICE)]))
+
+
+def test_second_rollback_of_same_service_is_rejected(tel):
+    deploy_engine = _BlockingDeployEngine()
+    releases = [
+        _release(1, "v1.0.0", model.ReleaseStatus.DEPLOYED),
+        _release(2, "v2.0.0", model.ReleaseStatus.DEPLOYED),
+    ]
+    release_service = _release_service(tel, releases, deploy_engine)
+    controller = ReleaseController(tel, release_service, ["gommgo"], "token")
+    body = RollbackBatchBody(targets=[RollbackTargetBody(service_name=_SERVICE)], initiated_by="gommgo")
+
+    async def scenario():
+        first = asyncio.create_task(release_service.rollback_to_tag(2, _SERVICE, "v1.0.0"))
+        await deploy_engine.started.wait()
+
+        with pytest.raises(common.RollbackInProgressError):
+            await release_service.rollback_to_tag(2, _SERVICE, "v1.0.0")
+        with pytest.raises(common.RollbackInProgressError):
+            await release_service.plan_rollback_batch([model.RollbackTarget(service_name=_SERVICE)])
+
+        response = await controller.rollback_batch(body, x_rollback_token="token")
+        assert response.status_code == 409
+
+        # Отказ не трогает статус идущего отката
+        assert releases[1].status == model.ReleaseStatus.ROLLBACK
+
+        deploy_engine.release.set()
+        assert await first
+        assert releases[1].status == model.ReleaseStatus.ROLLBACK_DONE
+
+        # После завершения сервис снова можно откатывать
+        assert await release_service.is_rollback_running(_SERVICE) is False
+
+    asyncio.run(scenario())
+
+
+def test_batch_skips_service_whose_rollback_started_after_planning(tel):
+    deploy_engine = _BlockingDeployEngine()
+    releases = [
+        _release(1, "v1.0.0", model.ReleaseStatus.DEPLOYED),
+        _release(2, "v2.0.0", model.ReleaseStatus.DEPLOYED),
+    ]
+    release_service = _release_service(tel, releases, deploy_engine)
+
+    async def scenario():
+        plan = await release_service.plan_rollback_batch([model.RollbackTarget(service_name=_SERVICE)])
+
+        first = asyncio.create_task(release_service.rollback_to_tag(2, _SERVICE, "v1.0.0"))
+        await deploy_engine.started.wait()
+
+        [progress] = await release_service.rollback_batch(plan)
+        assert progress.status == model.ReleaseStatus.ROLLBACK_FAILED
+        assert "уже откатывается" in progress.error
+        assert releases[1].status == model.ReleaseStatus.ROLLBACK
+
+        deploy_engine.release.set()
+        assert await first
+
+    asyncio.run(scenario())
@@ -0,0 +1,106 @@
+import asyncio
+
+import asyncssh
+import pytest
+
+
+def test_run_returns_command_output(ssh_server, ssh_client):
+    async def scenario():
+        async with ssh_server() as (port, state):
+            ssh = ssh_client(port)
+            try:
+                result = await ssh.run("echo ok")
+            finally:
+                await ssh.close()
+
+            assert result.exit_status == 0
+            assert result.stdout == "echo ok\n"
+
+    asyncio.run(scenario())
+
+
+def test_command_timeout_keeps_shared_connection(ssh_server, ssh_client):
+    async def scenario():
+        async with ssh_server() as (port, state):
+            ssh = ssh_client(port)
+            try:
+                slow, parallel = await asyncio.gather(
+                    ssh.run("sleep 5", timeout=0.2),
+                    ssh.run("sleep 0.5"),
+                    return_exceptions=True,
+                )
+
+                assert isinstance(slow, asyncssh.TimeoutError)
+                assert parallel.exit_status == 0
+
+                result = await ssh.run("echo after timeout")
+                assert result.exit_status == 0
+            finally:
+                await ssh.close()
+
+            assert len(state.connections) == 1
+
+    asyncio.run(scenario())
+
+
+def test_channel_open_failure_is_surfaced_without_reconnect(ssh_server, ssh_client):
+    async def scenario():
+        async with ssh_server() as (port, state):
+            ssh = ssh_client(port)
+            try:
+                await ssh.run("echo warmup")
+
+                state.reject_sessions = True
+                with pytest.raises(asyncssh.ChannelOpenError):
+                    await ssh.run("echo rejected")
+
+                state.reject_sessions = False
+                result = await ssh.run("echo accepted")
+                assert result.exit_status == 0
+            finally:
+                await ssh.close()
+
+            assert len(state.connections) == 1
+
+    asyncio.run(scenario())
+
+
+def test_connection_loss_is_not_replayed(ssh_server, ssh_client):
+    async def scenario():
+        async with ssh_server() as (port, state):
+            ssh = ssh_client(port)
+            try:
+                with pytest.raises(asyncssh.ConnectionLost):
+                    await ssh.run("drop")
+
+                result = await ssh.run("echo next")
+                assert result.exit_status == 0
+            finally:
+                await ssh.close()
+
+            assert state.commands.count("drop") == 1
+            assert len(state.connections) == 2
+
+    asyncio.run(scenario())
+
+
+def test_idle_connection_closed_by_server_is_reopened_before_command(ssh_server, ssh_client):
+    async def scenario():
+        async with ssh_server() as (port, state):
+            ssh = ssh_client(port)
+            try:
+                await ssh.run("echo first")
+
+                state.connections[0].close()
+                await state.connections[0].wait_closed()
+                await asyncio.sleep(0.1)
+
+                result = await ssh.run("echo second")
+                assert result.exit_status == 0
+            finally:
+                await ssh.close()
+
+            assert state.commands == ["echo first", "echo second"]
+            assert len(state.connections) == 2
+
+    asyncio.run(scenario())